@@ -0,0 +1,52 @@
+"""Throughput of the batch EXI API (common/exi_utils/batch.py) on the sample
+streams of common/EXI_Files, for several pool sizes.
+
+    python -m benchmarks.batch_codec --frames 20000 --workers 0 1 2 4 [--java]
+"""
+import argparse
+import os
+import time
+
+from common.exi.conformance import EXI_FILES, SAMPLES
+from common.exi_utils import batch
+
+
+def load_samples():
+    payloads = []
+    documents = []
+    for xml_name, exi_name in SAMPLES:
+        with open(os.path.join(EXI_FILES, exi_name), 'rb') as f:
+            payloads.append(f.read())
+        with open(os.path.join(EXI_FILES, xml_name), 'rb') as f:
+            documents.append(f.read())
+    return payloads, documents
+
+
+def measure(function, items, **kwargs):
+    start = time.perf_counter()
+    count = sum(1 for _ in function(items, **kwargs))
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--frames', type=int, default=5000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4])
+    parser.add_argument('--chunksize', type=int, default=64)
+    parser.add_argument('--java', action='store_true',
+                        help='use the Java codec worker instead of the Python codec')
+    args = parser.parse_args()
+    payloads, documents = load_samples()
+    payloads = [payloads[i % len(payloads)] for i in range(args.frames)]
+    documents = [documents[i % len(documents)] for i in range(args.frames)]
+    print('{:>8} {:>14} {:>14}'.format('workers', 'decode [1/s]', 'encode [1/s]'))
+    for workers in args.workers:
+        options = dict(workers=workers, chunksize=args.chunksize,
+                       use_python_codec=not args.java)
+        decode_rate = measure(batch.decode_batch, payloads, **options)
+        encode_rate = measure(batch.encode_batch, documents, **options)
+        print('{:>8} {:>14.0f} {:>14.0f}'.format(workers, decode_rate, encode_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Import time of the generateDS bindings: the eager per-namespace modules
+against the lazy common.bindings package, and the cold start of a real
+session. Every scenario runs in a fresh interpreter, the median of --repeat
+runs is reported together with the generated modules the scenario loaded.
+
+The session scenario imports what the SECC and EVCC import and runs one TCP
+DC PnC session between them (benchmarks/session.py, Python codec), so every
+module loaded lazily by the messages of a session is included.
+
+    python -m benchmarks.import_bindings --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+SESSION = '''
+import argparse, asyncio, logging
+from benchmarks import session
+from common import java_caller, log
+from secc import secc_config
+log.configure(level=logging.ERROR)
+java_caller.USE_PYTHON_CODEC = True
+secc_config.IP_ADRESS = '127.0.0.1'
+session.configure('tcp', 'dc', 'pnc', False)
+asyncio.run(session.run([('tcp', 'dc', 'pnc')], argparse.Namespace(sessions=1, warmup=0, verify=False)))
+'''
+
+SCENARIOS = [
+    ('eager msgDef1 + msgbody1 + msgheader1 + msgdatatypes1 + msgxmlschema1',
+     'from common.XML import msgDef1, msgbody1, msgheader1, msgdatatypes1, msgxmlschema1'),
+    ('bindings package only', 'from common import bindings'),
+    ('bindings.appprotocol1',
+     'from common import bindings; bindings.appprotocol1.supportedAppProtocolReq'),
+    ('bindings.SessionSetupReqType (whole MsgDef schema)',
+     'from common import bindings; bindings.SessionSetupReqType'),
+    ('SECC + EVCC, one DC PnC session', SESSION),
+]
+
+TIMER = '''
+import sys
+import time
+start = time.perf_counter()
+{}
+elapsed = time.perf_counter() - start
+print(' '.join(sorted(name[len('common.XML.'):] for name in sys.modules if name.startswith('common.XML.'))))
+print(elapsed)
+'''
+
+
+def measure(statement, repeat):
+    """Median seconds of ``statement`` and the generated modules it loaded"""
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', TIMER.format(statement)],
+                                check=True, capture_output=True, text=True).stdout
+        lines = output.splitlines()
+        timings.append(float(lines[-1]))
+    return statistics.median(timings), lines[-2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    for name, statement in SCENARIOS:
+        seconds, modules = measure(statement, args.repeat)
+        print('{:>9.1f} ms  {}\n              {}'.format(1000 * seconds, name, modules or '-'))
+
+
+if __name__ == "__main__":
+    main()
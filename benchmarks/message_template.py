@@ -0,0 +1,76 @@
+"""Encode time of the charging loop messages: full ObjectEncoder run against
+rendering the precompiled template (common/exi/template.py).
+
+    python -m benchmarks.message_template --number 2000
+"""
+import argparse
+import timeit
+from types import SimpleNamespace
+
+from common.exi.codec import get_codec, ObjectEncoder
+from evcc import evcontroller
+from evcc.evcc_message_sender import EVCCMessageSender
+from secc import evsecontroller
+from secc.secc_message_sender import SECCMessageSender
+
+SESSIONID = 'AB3A3C4CD8AC2B98'
+
+
+def current_demand_req():
+    sender = EVCCMessageSender(SimpleNamespace(controller=evcontroller.EVSimController("DC")))
+    sender.sessionid = SESSIONID
+    return (sender.current_demand_req_template, sender.create_current_demand_req,
+            sender.current_demand_req_values())
+
+
+def current_demand_res():
+    controller = evsecontroller.EVSESimController()
+    controller.set_to_dc_charging()
+    sender = SECCMessageSender(SimpleNamespace(controller=controller))
+    sender.sessionid = SESSIONID
+    request = SimpleNamespace(ChargingComplete=False)
+    message = SimpleNamespace(get_Body=lambda: SimpleNamespace(BodyElement=request))
+    return (sender.current_demand_res_template, sender.create_current_demand_res,
+            sender.current_demand_res_values(message))
+
+
+def charging_status_res():
+    controller = evsecontroller.EVSESimController()
+    controller.set_to_ac_charging()
+    sender = SECCMessageSender(SimpleNamespace(controller=controller))
+    sender.sessionid = SESSIONID
+    return (sender.charging_status_res_template, sender.create_charging_status_res,
+            sender.charging_status_res_values())
+
+
+MESSAGES = [
+    ('CurrentDemandReq', current_demand_req),
+    ('CurrentDemandRes', current_demand_res),
+    ('ChargingStatusRes', charging_status_res),
+]
+
+
+def measure(function, number):
+    """Microseconds per call"""
+    return 1e6 * min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=2000)
+    args = parser.parse_args()
+    codec = get_codec()
+    print('{:<20} {:>7} {:>14} {:>14}'.format('message', 'bytes', 'full [us]', 'template [us]'))
+    for name, setup in MESSAGES:
+        template, create, values = setup()
+        exi = template.render(values)
+        assert exi == ObjectEncoder(codec).document(create(values))
+        timings = [
+            measure(lambda: ObjectEncoder(codec).document(create(values)), args.number),
+            measure(lambda: template.render(values), args.number),
+        ]
+        print('{:<20} {:>7} {:>14.1f} {:>14.1f}'.format(name, len(exi), *timings))
+
+
+if __name__ == "__main__":
+    main()
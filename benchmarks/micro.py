@@ -0,0 +1,259 @@
+"""Micro-benchmarks of the message path: EXI codec per message type
+(exi_utils.v2g_to_EXI/EXI_to_v2g and the raw codec on the samples of
+common/EXI_Files), msgDef1.parse/parseString, export() and
+EXICodec.export_object of large bodies, the securityutils sign_*/verify_*
+functions and add_Header_v2gEXI.
+
+The codec dependent cases run once per backend: 'python' (direct object
+codec), 'python-xml' (Python codec through export_object and parseString) and
+'java' (encode.jar worker, needs a JVM). The exi_utils codec caches are
+disabled unless --cache is given. Results are written as JSON and compared
+with a baseline, by default the reference run of the python backend stored in
+BASELINE:
+
+    python -m benchmarks.micro --backend python python-xml --output micro.json [--baseline old.json]
+"""
+import argparse
+import copy
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+import timeit
+
+from common import bindings
+from common import java_caller
+from common.exi import get_codec
+from common.exi.conformance import EXI_FILES, SAMPLES
+from common.exi_utils import exi_utils
+from common.security import securityutils
+from common.security.keystore import keystore
+from benchmarks.object_codec import (certificate_installation_res,
+                                     charge_parameter_discovery_res, create_v2g_message,
+                                     export_xml)
+
+BACKENDS = ('python', 'python-xml', 'java')
+
+BASELINE = 'benchmarks/baselines/micro_python.json'
+
+OEM_PROV_CERT = 'common/PKI/EVCC/oemProvCert.pem'
+OEM_PROV_KEY = 'common/PKI/EVCC/oemProv.key'
+CONTRACT_CHAIN = 'common/PKI/CPS/moCertChain.p12'
+CPS_SUB_CA2_KEY = 'common/PKI/CPS/cpsSubCA2.key'
+
+# generateDS parse options without the echo and the validation warnings
+QUIET = dict(silence=True, print_warnings=False)
+
+
+def select_backend(backend):
+    java_caller.USE_PYTHON_CODEC = backend != 'java'
+    exi_utils.DIRECT_OBJECT_ENCODE = exi_utils.DIRECT_OBJECT_DECODE = backend == 'python'
+
+
+def disable_codec_caches():
+    for cache in (exi_utils.encode_cache, exi_utils.decode_cache):
+        cache.maxsize = 0
+        cache.clear()
+
+
+def read_sample(name):
+    with open(os.path.join(EXI_FILES, name), 'rb') as f:
+        return f.read()
+
+
+def authorization_req():
+    autreq = bindings.AuthorizationReqType(GenChallenge=bytes(range(16)))
+    autreq.original_tagname_ = 'AuthorizationReq'
+    return securityutils.attach_reference_identifiers(
+        create_v2g_message(autreq, 'AuthorizationReq'))
+
+
+def metering_receipt_req():
+    meterrecreq = bindings.MeteringReceiptReqType(
+        SessionID='AB3A3C4CD8AC2B98', SAScheduleTupleID=1,
+        MeterInfo=bindings.MeterInfoType(MeterID='DE*V2G*METER1', MeterReading=1234,
+                                         TMeter=1699346392))
+    return securityutils.attach_reference_identifiers(
+        create_v2g_message(meterrecreq, 'MeteringReceiptReq'))
+
+
+def certificate_installation_req():
+    oem_prov_cert = keystore.certificate(OEM_PROV_CERT)
+    listofrootcerts = bindings.ListOfRootCertificateIDsType()
+    listofrootcerts.add_RootCertificateID(bindings.X509IssuerSerialType(
+        X509IssuerName=oem_prov_cert.certificate.issuer,
+        X509SerialNumber=oem_prov_cert.certificate.serial_number))
+    certinstreq = bindings.CertificateInstallationReqType(
+        OEMProvisioningCert=oem_prov_cert.certificate_b64,
+        ListOfRootCertificateIDs=listofrootcerts)
+    return securityutils.attach_reference_identifiers(
+        create_v2g_message(certinstreq, 'CertificateInstallationReq'))
+
+
+class Fixtures():
+    """Messages and keys the cases work on. The signed messages are signed
+    once with the current backend, the sign_* cases sign copies
+    """
+    def __init__(self):
+        contract = keystore.key_cert_chain(CONTRACT_CHAIN)
+        self.contract_key = contract.private_key
+        self.contract_cert = contract.certificate
+        self.oem_prov_key = securityutils.load_private_key(OEM_PROV_KEY)
+
+        self.unsigned = {
+            'AuthorizationReq': authorization_req(),
+            'MeteringReceiptReq': metering_receipt_req(),
+            'CertificateInstallationReq': certificate_installation_req(),
+            'CertificateInstallationRes': certificate_installation_res(),
+        }
+        self.signers = {
+            'AuthorizationReq': lambda m: securityutils.sign_authorization_req_message(
+                m, self.contract_key),
+            'MeteringReceiptReq': lambda m: securityutils.sign_metering_receipt_req_message(
+                m, self.contract_key),
+            'CertificateInstallationReq': lambda m: securityutils.sign_certinstallreq_message(
+                m, self.oem_prov_key),
+            'CertificateInstallationRes': lambda m: securityutils.sign_cert_install_res_message(
+                m, CPS_SUB_CA2_KEY),
+        }
+        self.verifiers = {
+            'AuthorizationReq': lambda m: securityutils.verify_authorization_req(
+                m, self.contract_cert),
+            'MeteringReceiptReq': lambda m: securityutils.verify_metering_receipt_req(
+                m, self.contract_cert),
+            'CertificateInstallationReq': securityutils.verify_certificate_installation_req,
+            'CertificateInstallationRes': securityutils.verify_certificate_installation_res,
+        }
+        self.signed = {name: self.signers[name](copy.deepcopy(message))
+                       for name, message in self.unsigned.items()}
+
+        # Complete V2G messages by body type: the samples that are whole
+        # messages, the large bodies and the signed requests
+        self.messages = {}
+        for xml_name, _ in SAMPLES:
+            message = bindings.msgDef1.parseString(read_sample(xml_name), **QUIET)
+            if isinstance(message, bindings.V2G_Message) and message.get_Body() is not None:
+                self.messages[message.get_Body().BodyElement.original_tagname_] = message
+        self.messages['ChargeParameterDiscoveryRes'] = charge_parameter_discovery_res()
+        self.messages.update(self.signed)
+
+
+def codec_cases(fixtures):
+    """(name, function) of the codec dependent cases"""
+    cases = []
+    for name, message in sorted(fixtures.messages.items()):
+        exi = exi_utils.v2g_to_EXI(message)
+        cases.append(('v2g_to_EXI/' + name, lambda m=message: exi_utils.v2g_to_EXI(m)))
+        cases.append(('EXI_to_v2g/' + name, lambda e=exi: exi_utils.EXI_to_v2g(e)))
+    for xml_name, exi_name in SAMPLES:
+        xml_bytes, exi = read_sample(xml_name), read_sample(exi_name)
+        cases.append(('encode/' + xml_name,
+                      lambda x=xml_bytes: java_caller.xml_bytes_to_binary(x)))
+        cases.append(('decode/' + exi_name, lambda e=exi: java_caller.binary_to_xml_bytes(e)))
+    for name, message in fixtures.unsigned.items():
+        sign = fixtures.signers[name]
+        cases.append(('sign/' + name, lambda s=sign, m=message: s(copy.deepcopy(m))))
+    for name, message in fixtures.signed.items():
+        verify = fixtures.verifiers[name]
+        cases.append(('verify/' + name, lambda v=verify, m=message: uncached_verify(v, m)))
+        cases.append(('verify_cached/' + name, lambda v=verify, m=message: v(m)))
+    return cases
+
+
+def uncached_verify(verify, message):
+    securityutils.verified_signatures.clear()
+    verify(message)
+
+
+def common_cases(fixtures):
+    """(name, function) of the cases that do not use the codec"""
+    cases = []
+    for xml_name, _ in SAMPLES:
+        path = os.path.join(EXI_FILES, xml_name)
+        xml_bytes = read_sample(xml_name)
+        cases.append(('parse/' + xml_name, lambda p=path: bindings.msgDef1.parse(p, **QUIET)))
+        cases.append(('parseString/' + xml_name,
+                      lambda x=xml_bytes: bindings.msgDef1.parseString(x, **QUIET)))
+    for name in ('ChargeParameterDiscoveryRes', 'CertificateInstallationRes'):
+        message = fixtures.messages[name]
+        cases.append(('export/' + name, lambda m=message: export_xml(m)))
+        cases.append(('export_object/' + name,
+                      lambda m=message: get_codec().export_object(m)))
+    exi = exi_utils.v2g_to_EXI(fixtures.messages['CertificateInstallationRes'])
+    cases.append(('add_Header_v2gEXI', lambda: exi_utils.add_Header_v2gEXI(exi, 'v2g')))
+    return cases
+
+
+def measure(function, number):
+    """Microseconds per call"""
+    return 1e6 * min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def run_cases(cases, args):
+    results = {}
+    for name, function in cases:
+        if args.filter and not any(text in name for text in args.filter):
+            continue
+        number = max(1, args.number // 20) if name.split('/')[0] in (
+            'sign', 'verify') else args.number
+        results[name] = round(measure(function, number), 2)
+        print('{:<62} {:>12.1f}'.format(name, results[name]))
+    return results
+
+
+def compare(results, baseline):
+    """Prints the cases that changed by more than 5% against the baseline"""
+    print('\nchange against the baseline (> 5%)')
+    for section, timings in results.items():
+        old = baseline.get('results', {}).get(section, {})
+        for name, value in timings.items():
+            if old.get(name) and abs(value / old[name] - 1) > 0.05:
+                print('{:<12} {:<50} {:>+8.1%}'.format(section, name, value / old[name] - 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=200)
+    parser.add_argument('--backend', nargs='+', choices=BACKENDS, default=['python'])
+    parser.add_argument('--filter', nargs='+', help='only cases containing one of the texts')
+    parser.add_argument('--cache', action='store_true', help='keep the codec caches enabled')
+    parser.add_argument('--output', default='micro_benchmark.json')
+    parser.add_argument('--baseline', default=BASELINE,
+                        help='earlier result file to compare with, empty for none')
+    args = parser.parse_args()
+    if not args.cache:
+        disable_codec_caches()
+
+    results = {}
+    fixtures = None
+    for backend in args.backend:
+        if backend == 'java' and shutil.which('java') is None:
+            print('skipping the java backend, no JVM found')
+            continue
+        select_backend(backend)
+        fixtures = Fixtures()
+        print('\n{:<62} {:>12}'.format('[%s]' % backend, 'time [us]'))
+        results[backend] = run_cases(codec_cases(fixtures), args)
+    if fixtures is not None:
+        print('\n{:<62} {:>12}'.format('[common]', 'time [us]'))
+        results['common'] = run_cases(common_cases(fixtures), args)
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'number': args.number,
+        'cache': args.cache,
+        'results': results,
+    }
+    with open(args.output, 'w') as outfile:
+        json.dump(report, outfile, indent=2)
+    if args.baseline:
+        with open(args.baseline) as infile:
+            compare(results, json.load(infile))
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Encode/decode time of the Python EXI codec for SessionSetupRes,
+ChargeParameterDiscoveryRes and CertificateInstallationRes: through XML
+(EXICodec.export_object + encode, decode + parseString) against the direct object
+serializer and builder (common/exi/objects.py).
+
+    python -m benchmarks.object_codec --number 500
+"""
+import argparse
+import io
+import timeit
+
+from common import bindings
+from common.exi.codec import get_codec, ObjectEncoder
+from common.security import securityutils
+
+
+def create_v2g_message(body_element, tag):
+    body_element.original_tagname_ = tag
+    header = bindings.MessageHeaderType(SessionID='AB3A3C4CD8AC2B98')
+    return bindings.V2G_Message(Header=header, Body=bindings.BodyType(body_element))
+
+
+def session_setup_res():
+    return create_v2g_message(bindings.SessionSetupResType(
+        ResponseCode=bindings.responseCodeType.OK__NEW_SESSION_ESTABLISHED,
+        EVSEID='DE*V2G*CLARITY123', EVSETimeStamp=1699346392), 'SessionSetupRes')
+
+
+def charge_parameter_discovery_res():
+    pmaxschedule = bindings.PMaxScheduleType()
+    for start, pmax in ((0, 25), (600, 50)):
+        pmaxschedule.add_PMaxScheduleEntry(bindings.PMaxScheduleEntryType(
+            TimeInterval=bindings.RelativeTimeIntervalType(start),
+            PMax=bindings.PhysicalValueType(3, 'W', pmax)))
+    sascheduletuple = bindings.SAScheduleTupleType(SAScheduleTupleID=1,
+                                                   PMaxSchedule=pmaxschedule)
+    saschedulelist = bindings.SAScheduleListType()
+    saschedulelist.original_tagname_ = 'SAScheduleList'
+    saschedulelist.add_SAScheduleTuple(sascheduletuple)
+
+    evsestatus = bindings.DC_EVSEStatusType(
+        NotificationMaxDelay=0, EVSENotification=bindings.EVSENotificationType.NONE,
+        EVSEIsolationStatus=bindings.isolationLevelType.VALID,
+        EVSEStatusCode=bindings.DC_EVSEStatusCodeType.EVSE__READY)
+    evsestatus.original_tagname_ = 'DC_EVSEStatus'
+    parameter = bindings.DC_EVSEChargeParameterType(DC_EVSEStatus=evsestatus)
+    parameter.original_tagname_ = 'DC_EVSEChargeParameter'
+    for name, unit, value in (('EVSEMaximumCurrentLimit', 'A', 200),
+                              ('EVSEMaximumPowerLimit', 'W', 50000),
+                              ('EVSEMaximumVoltageLimit', 'V', 500),
+                              ('EVSEMinimumCurrentLimit', 'A', 0),
+                              ('EVSEMinimumVoltageLimit', 'V', 200),
+                              ('EVSEPeakCurrentRipple', 'A', 1)):
+        setattr(parameter, name, bindings.PhysicalValueType(0, unit, value))
+
+    return create_v2g_message(bindings.ChargeParameterDiscoveryResType(
+        ResponseCode=bindings.responseCodeType.OK, EVSEProcessing='Finished',
+        SASchedules=saschedulelist, EVSEChargeParameter=parameter),
+        'ChargeParameterDiscoveryRes')
+
+
+def certificate_installation_res():
+    certinstres = securityutils.generate_certificate_installation_res_body()
+    certinstres = securityutils.load_contract_certificates_to_xml(
+        'common/PKI/CPS/moCertChain.p12', certinstres)
+    certinstres = securityutils.load_cps_certificates_to_xml(
+        'common/PKI/CPS/cpsCertChain.p12', certinstres)
+    certinstres = securityutils.generate_dhpublickey_contractsignatureencryptedprivatekey(
+        'common/PKI/EVCC/oemProvCert.pem', 'common/PKI/CPS/contract.key', certinstres)
+    return securityutils.attach_reference_identifiers(
+        create_v2g_message(certinstres, 'CertificateInstallationRes'))
+
+
+MESSAGES = [
+    ('SessionSetupRes', session_setup_res),
+    ('ChargeParameterDiscoveryRes', charge_parameter_discovery_res),
+    ('CertificateInstallationRes', certificate_installation_res),
+]
+
+
+def export_xml(message):
+    """generateDS export() of a message"""
+    buffer = io.StringIO()
+    message.export(outfile=buffer, level=0)
+    return buffer.getvalue().encode('utf-8')
+
+
+def measure(function, number):
+    """Microseconds per call"""
+    return 1e6 * min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--number', type=int, default=500)
+    args = parser.parse_args()
+    codec = get_codec()
+    print('{:<28} {:>7} {:>14} {:>14} {:>14} {:>14}'.format(
+        'message', 'bytes', 'enc xml [us]', 'enc obj [us]', 'dec xml [us]', 'dec obj [us]'))
+    for name, create in MESSAGES:
+        message = create()
+        exi = ObjectEncoder(codec).document(message)
+        timings = [
+            measure(lambda: codec.encode(codec.export_object(message)), args.number),
+            measure(lambda: ObjectEncoder(codec).document(message), args.number),
+            measure(lambda: bindings.msgDef1.parseString(codec.decode(exi), silence=True),
+                    args.number),
+            measure(lambda: codec.decode_object(exi, bindings.msgDef1), args.number),
+        ]
+        print('{:<28} {:>7} {:>14.1f} {:>14.1f} {:>14.1f} {:>14.1f}'.format(
+            name, len(exi), *timings))
+
+
+if __name__ == "__main__":
+    main()
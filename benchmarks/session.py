@@ -0,0 +1,161 @@
+"""End-to-end V2G sessions between an in-process SECC and EVCC over loopback
+(common/network/aio_transport.py), for TCP and TLS, AC and DC, EIM and PnC.
+
+Reports per scenario the sessions per second, the CPU time per session (SECC
+and EVCC together) and the p50/p95/p99 round trip of every message type: from
+sending the request at the EVCC to dispatching the decoded response. The
+results are written as JSON; with --baseline the change against an earlier
+result file is printed.
+
+    python -m benchmarks.session --sessions 20 --output session.json [--baseline old.json]
+
+The test PKI under common/PKI is expired, so the EVCC does not verify the
+SECC certificate unless --verify is given.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import platform
+import sys
+import time
+
+from common import java_caller
+from common import log
+from common.network import aio_transport
+from evcc import evcc_config
+from evcc.evcc import EVCC
+from evcc.loadgen import MODES, PAYMENTS, PERCENTILES, TRANSPORTS, ResponseTimes, percentile
+from secc import secc_config
+
+def configure(transport, mode, payment, verify):
+    evcc_config.TLS = transport == 'tls'
+    evcc_config.CHARGING_MODE, evcc_config.CHARGING = MODES[mode]
+    evcc_config.SELECTEDPAYMENTOPTION = PAYMENTS[payment]
+    evcc_config.VERIFY_SECC_CERTIFICATE = verify
+    evcc_config.ASK_SERVICE_DETAILS = False
+    evcc_config.SLOW_MODE = secc_config.SLOW_MODE = False
+
+
+async def run_session(recorder):
+    """One EVCC session, True if it got to the SessionStopRes"""
+    evcc = EVCC()
+    udpclient = evcc.udpclient
+    recorder.attach(evcc)
+    stops = len(recorder.samples.get('SessionStopRes', ()))
+    try:
+        await aio_transport.run_evcc(evcc)
+    except Exception as error:  # pylint: disable=broad-except
+        logging.getLogger(__name__).error("Session failed: %r", error)
+        return False
+    finally:
+        udpclient.close()
+    return len(recorder.samples.get('SessionStopRes', ())) > stops
+
+
+async def run_scenario(sessions, warmup):
+    """Sessions of the current configuration, returns the results dict"""
+    for _ in range(warmup):
+        await run_session(ResponseTimes())
+    recorder = ResponseTimes()
+    failures = 0
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    for _ in range(sessions):
+        if not await run_session(recorder):
+            failures += 1
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+    messages = {}
+    for message_type, samples in sorted(recorder.samples.items()):
+        samples.sort()
+        messages[message_type] = dict(count=len(samples), **{
+            'p%d_ms' % q: round(1e3 * percentile(samples, q), 3) for q in PERCENTILES})
+    return {
+        'sessions': sessions,
+        'failures': failures,
+        'sessions_per_second': round(sessions / wall, 2),
+        'wall_ms_per_session': round(1e3 * wall / sessions, 3),
+        'cpu_ms_per_session': round(1e3 * cpu / sessions, 3),
+        'messages': messages,
+    }
+
+
+async def run(scenarios, args):
+    secc = aio_transport.AsyncSECC()
+    server = asyncio.ensure_future(secc.serve())
+    await asyncio.sleep(0.2)
+    results = {}
+    try:
+        for transport, mode, payment in scenarios:
+            name = '%s-%s-%s' % (transport, mode, payment)
+            configure(transport, mode, payment, args.verify)
+            results[name] = await run_scenario(args.sessions, args.warmup)
+            result = results[name]
+            print('{:<14} {:>6} {:>8} {:>12.1f} {:>12.2f} {:>12.2f}'.format(
+                name, result['sessions'], result['failures'], result['sessions_per_second'],
+                result['wall_ms_per_session'], result['cpu_ms_per_session']))
+    finally:
+        server.cancel()
+    return results
+
+
+def compare(results, baseline):
+    """Prints the change of the throughput and the median round trips"""
+    print('\nchange against the baseline')
+    for name, result in results.items():
+        old = baseline.get('scenarios', {}).get(name)
+        if not old:
+            continue
+        print('{:<14} sessions/s {:+.1%}  cpu/session {:+.1%}'.format(
+            name, result['sessions_per_second'] / old['sessions_per_second'] - 1,
+            result['cpu_ms_per_session'] / old['cpu_ms_per_session'] - 1))
+        for message_type, stats in result['messages'].items():
+            before = old['messages'].get(message_type)
+            if before and before['p50_ms']:
+                print('    {:<30} p50 {:+.1%}'.format(
+                    message_type, stats['p50_ms'] / before['p50_ms'] - 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--sessions', type=int, default=20, help='sessions per scenario')
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--transport', nargs='+', choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument('--mode', nargs='+', choices=sorted(MODES), default=sorted(MODES))
+    parser.add_argument('--payment', nargs='+', choices=sorted(PAYMENTS),
+                        default=sorted(PAYMENTS))
+    parser.add_argument('--java', action='store_true',
+                        help='use the Java codec instead of the Python codec')
+    parser.add_argument('--verify', action='store_true',
+                        help='verify the SECC certificate in the TLS handshake')
+    parser.add_argument('--output', default='session_benchmark.json')
+    parser.add_argument('--baseline', help='earlier result file to compare with')
+    args = parser.parse_args()
+
+    log.configure(level=logging.WARNING)
+    java_caller.USE_PYTHON_CODEC = not args.java
+    secc_config.IP_ADRESS = '127.0.0.1'
+    scenarios = list(itertools.product(args.transport, args.mode, args.payment))
+
+    print('{:<14} {:>6} {:>8} {:>12} {:>12} {:>12}'.format(
+        'scenario', 'runs', 'failed', 'sessions/s', 'wall [ms]', 'cpu [ms]'))
+    results = asyncio.run(run(scenarios, args))
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'codec': 'java' if args.java else 'python',
+        'scenarios': results,
+    }
+    with open(args.output, 'w') as outfile:
+        json.dump(report, outfile, indent=2)
+    if args.baseline:
+        with open(args.baseline) as infile:
+            compare(results, json.load(infile))
+    if any(result['failures'] for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+/*
+ * Persistent EXI codec server used by common/codec_worker.py.
+ *
+ * Run from the repository root (the grammar path is relative to it):
+ *
+ *     java -cp common/encode.jar common/EXICodecServer.java [xsd]
+ *
+ * The grammars and the EXI factory are built once with the same options as
+ * encode.jar/decode.jar, after which requests are served over stdin/stdout
+ * until stdin is closed.
+ *
+ * Request frame:  1 byte op ('E' encode XML->EXI, 'D' decode EXI->XML)
+ *                 4 byte big-endian payload length, payload
+ * Response frame: 1 byte status (0 ok, 1 error)
+ *                 4 byte big-endian payload length, payload (result or error text)
+ */
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+
+import javax.xml.transform.Transformer;
+import javax.xml.transform.TransformerFactory;
+import javax.xml.transform.stream.StreamResult;
+
+import org.xml.sax.InputSource;
+import org.xml.sax.XMLReader;
+import org.xml.sax.helpers.XMLReaderFactory;
+
+import com.siemens.ct.exi.core.EXIFactory;
+import com.siemens.ct.exi.core.grammars.Grammars;
+import com.siemens.ct.exi.core.helpers.DefaultEXIFactory;
+import com.siemens.ct.exi.grammars.GrammarFactory;
+import com.siemens.ct.exi.main.api.sax.EXIResult;
+import com.siemens.ct.exi.main.api.sax.EXISource;
+
+public class EXICodecServer {
+
+    private static final String DEFAULT_XSD = "common/XML/V2G_CI_MsgDef.xsd";
+
+    private final EXIFactory exiFactory;
+    private final TransformerFactory transformerFactory;
+
+    public EXICodecServer(String xsd) throws Exception {
+        Grammars grammars = GrammarFactory.newInstance().createGrammars(xsd);
+        exiFactory = DefaultEXIFactory.newInstance();
+        exiFactory.setGrammars(grammars);
+        exiFactory.setValuePartitionCapacity(0);
+        exiFactory.setMaximumNumberOfBuiltInProductions(0);
+        exiFactory.setMaximumNumberOfBuiltInElementGrammars(0);
+        transformerFactory = TransformerFactory.newInstance();
+    }
+
+    public byte[] encode(byte[] xml) throws Exception {
+        ByteArrayOutputStream os = new ByteArrayOutputStream();
+        EXIResult exiResult = new EXIResult(exiFactory);
+        exiResult.setOutputStream(os);
+        XMLReader xmlReader = XMLReaderFactory.createXMLReader();
+        xmlReader.setContentHandler(exiResult.getHandler());
+        xmlReader.parse(new InputSource(new ByteArrayInputStream(xml)));
+        return os.toByteArray();
+    }
+
+    public byte[] decode(byte[] exi) throws Exception {
+        ByteArrayOutputStream os = new ByteArrayOutputStream();
+        EXISource exiSource = new EXISource(exiFactory);
+        exiSource.setInputSource(new InputSource(new ByteArrayInputStream(exi)));
+        Transformer transformer = transformerFactory.newTransformer();
+        transformer.transform(exiSource, new StreamResult(os));
+        return os.toByteArray();
+    }
+
+    public static void main(String[] args) throws Exception {
+        // Anything the codec prints must not end up inside a response frame
+        PrintStream frames = new PrintStream(System.out, false);
+        System.setOut(System.err);
+
+        EXICodecServer server = new EXICodecServer(args.length > 0 ? args[0] : DEFAULT_XSD);
+        DataInputStream in = new DataInputStream(System.in);
+        DataOutputStream out = new DataOutputStream(frames);
+
+        while (true) {
+            int op;
+            byte[] payload;
+            try {
+                op = in.readUnsignedByte();
+                payload = new byte[in.readInt()];
+                in.readFully(payload);
+            } catch (EOFException e) {
+                break;
+            }
+
+            int status = 0;
+            byte[] result;
+            try {
+                if (op == 'E') {
+                    result = server.encode(payload);
+                } else if (op == 'D') {
+                    result = server.decode(payload);
+                } else {
+                    throw new IllegalArgumentException("Unknown op " + op);
+                }
+            } catch (Exception e) {
+                status = 1;
+                result = String.valueOf(e).getBytes(StandardCharsets.UTF_8);
+            }
+            out.writeByte(status);
+            out.writeInt(result.length);
+            out.write(result);
+            out.flush();
+        }
+    }
+}
@@ -110,7 +110,7 @@ def parsexmlstring_(instring, parser=None, **kwargs):
 try:
     from generatedsnamespaces import GenerateDSNamespaceDefs as GenerateDSNamespaceDefs_
 except ModulenotfoundExp_ :
-    GenerateDSNamespaceDefs_ = {"V2G_Message":'\n xmlns:ns7="urn:iso:15118:2:2013:MsgDef"\n xmlns:ns5="urn:iso:15118:2:2013:MsgBody"\n xmlns:ns8="urn:iso:15118:2:2013:MsgHeader"\n xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"\n xmlns:xmlsig="http://www.w3.org/2000/09/xmldsig#"',}
+    GenerateDSNamespaceDefs_ = {"V2G_Message":'\n xmlns:ns7="urn:iso:15118:2:2013:MsgDef"\n xmlns:ns5="urn:iso:15118:2:2013:MsgBody"\n xmlns:ns8="urn:iso:15118:2:2013:MsgHeader"\n xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"\n xmlns:xmlsig="http://www.w3.org/2000/09/xmldsig#"\n xmlns:ds="http://www.w3.org/2000/09/xmldsig#"',}
 try:
     from generatedsnamespaces import GenerateDSNamespaceTypePrefixes as GenerateDSNamespaceTypePrefixes_
 except ModulenotfoundExp_ :
@@ -1201,7 +1201,7 @@ class V2G_Message(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'V2G_Message':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1223,10 +1223,10 @@ class V2G_Message(GeneratedsSuper):
             eol_ = ''
         if self.Header is not None:
             namespaceprefix_ = self.Header_nsprefix_ + ':' if (UseCapturedNS_ and self.Header_nsprefix_) else ''
-            self.Header.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Header', pretty_print=pretty_print)
+            self.Header.export(outfile, level, 'ns7:', namespacedef_='', name_='Header', pretty_print=pretty_print)
         if self.Body is not None:
             namespaceprefix_ = self.Body_nsprefix_ + ':' if (UseCapturedNS_ and self.Body_nsprefix_) else ''
-            self.Body.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Body', pretty_print=pretty_print)
+            self.Body.export(outfile, level, 'ns7:', namespacedef_='', name_='Body', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -1268,7 +1268,7 @@ class MessageHeaderType(GeneratedsSuper):
         self.validate_sessionIDType(self.SessionID)
         self.SessionID_nsprefix_ = "ns8"
         self.Notification = Notification
-        self.Notification_nsprefix_ = "ns6"
+        self.Notification_nsprefix_ = "ns8"
         self.Signature = Signature
         self.Signature_nsprefix_ = "xmlsig"
     def factory(*args_, **kwargs_):
@@ -1330,7 +1330,7 @@ class MessageHeaderType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'MessageHeaderType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1356,7 +1356,7 @@ class MessageHeaderType(GeneratedsSuper):
             outfile.write('<%sSessionID>%s</%sSessionID>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.SessionID), input_name='SessionID')), namespaceprefix_ , eol_))
         if self.Notification is not None:
             namespaceprefix_ = self.Notification_nsprefix_ + ':' if (UseCapturedNS_ and self.Notification_nsprefix_) else ''
-            self.Notification.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Notification', pretty_print=pretty_print)
+            self.Notification.export(outfile, level, 'ns8:', namespacedef_='', name_='Notification', pretty_print=pretty_print)
         if self.Signature is not None:
             namespaceprefix_ = self.Signature_nsprefix_ + ':' if (UseCapturedNS_ and self.Signature_nsprefix_) else ''
             self.Signature.export(outfile, level, namespaceprefix_='xmlsig:', namespacedef_='', name_='Signature', pretty_print=pretty_print)
@@ -1407,18 +1407,18 @@ class ServiceType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.ServiceID = ServiceID
         self.validate_serviceIDType(self.ServiceID)
-        self.ServiceID_nsprefix_ = None
+        self.ServiceID_nsprefix_ = "ns6"
         self.ServiceName = ServiceName
         self.validate_serviceNameType(self.ServiceName)
-        self.ServiceName_nsprefix_ = None
+        self.ServiceName_nsprefix_ = "ns6"
         self.ServiceCategory = ServiceCategory
         self.validate_serviceCategoryType(self.ServiceCategory)
-        self.ServiceCategory_nsprefix_ = None
+        self.ServiceCategory_nsprefix_ = "ns6"
         self.ServiceScope = ServiceScope
         self.validate_serviceScopeType(self.ServiceScope)
-        self.ServiceScope_nsprefix_ = None
+        self.ServiceScope_nsprefix_ = "ns6"
         self.FreeService = FreeService
-        self.FreeService_nsprefix_ = None
+        self.FreeService_nsprefix_ = "ns6"
         self.extensiontype_ = extensiontype_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -1529,7 +1529,7 @@ class ServiceType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1649,7 +1649,7 @@ class ServiceListType(GeneratedsSuper):
             self.Service = []
         else:
             self.Service = Service
-        self.Service_nsprefix_ = None
+        self.Service_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -1692,7 +1692,7 @@ class ServiceListType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceListType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1714,7 +1714,7 @@ class ServiceListType(GeneratedsSuper):
             eol_ = ''
         for Service_ in self.Service:
             namespaceprefix_ = self.Service_nsprefix_ + ':' if (UseCapturedNS_ and self.Service_nsprefix_) else ''
-            Service_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Service', pretty_print=pretty_print)
+            Service_.export(outfile, level, 'ns6:', namespacedef_='', name_='Service', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -1752,7 +1752,7 @@ class SelectedServiceListType(GeneratedsSuper):
             self.SelectedService = []
         else:
             self.SelectedService = SelectedService
-        self.SelectedService_nsprefix_ = None
+        self.SelectedService_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -1795,7 +1795,7 @@ class SelectedServiceListType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SelectedServiceListType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1817,7 +1817,7 @@ class SelectedServiceListType(GeneratedsSuper):
             eol_ = ''
         for SelectedService_ in self.SelectedService:
             namespaceprefix_ = self.SelectedService_nsprefix_ + ':' if (UseCapturedNS_ and self.SelectedService_nsprefix_) else ''
-            SelectedService_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SelectedService', pretty_print=pretty_print)
+            SelectedService_.export(outfile, level, 'ns6:', namespacedef_='', name_='SelectedService', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -1852,9 +1852,9 @@ class SelectedServiceType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.ServiceID = ServiceID
         self.validate_serviceIDType(self.ServiceID)
-        self.ServiceID_nsprefix_ = None
+        self.ServiceID_nsprefix_ = "ns6"
         self.ParameterSetID = ParameterSetID
-        self.ParameterSetID_nsprefix_ = None
+        self.ParameterSetID_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -1906,7 +1906,7 @@ class SelectedServiceType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SelectedServiceType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -1979,7 +1979,7 @@ class ServiceParameterListType(GeneratedsSuper):
             self.ParameterSet = []
         else:
             self.ParameterSet = ParameterSet
-        self.ParameterSet_nsprefix_ = None
+        self.ParameterSet_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2022,7 +2022,7 @@ class ServiceParameterListType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceParameterListType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2044,7 +2044,7 @@ class ServiceParameterListType(GeneratedsSuper):
             eol_ = ''
         for ParameterSet_ in self.ParameterSet:
             namespaceprefix_ = self.ParameterSet_nsprefix_ + ':' if (UseCapturedNS_ and self.ParameterSet_nsprefix_) else ''
-            ParameterSet_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ParameterSet', pretty_print=pretty_print)
+            ParameterSet_.export(outfile, level, 'ns6:', namespacedef_='', name_='ParameterSet', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -2078,12 +2078,12 @@ class ParameterSetType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.ParameterSetID = ParameterSetID
-        self.ParameterSetID_nsprefix_ = None
+        self.ParameterSetID_nsprefix_ = "ns6"
         if Parameter is None:
             self.Parameter = []
         else:
             self.Parameter = Parameter
-        self.Parameter_nsprefix_ = None
+        self.Parameter_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2131,7 +2131,7 @@ class ParameterSetType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ParameterSetType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2157,7 +2157,7 @@ class ParameterSetType(GeneratedsSuper):
             outfile.write('<%sParameterSetID>%s</%sParameterSetID>%s' % (namespaceprefix_ , self.gds_format_integer(self.ParameterSetID, input_name='ParameterSetID'), namespaceprefix_ , eol_))
         for Parameter_ in self.Parameter:
             namespaceprefix_ = self.Parameter_nsprefix_ + ':' if (UseCapturedNS_ and self.Parameter_nsprefix_) else ''
-            Parameter_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Parameter', pretty_print=pretty_print)
+            Parameter_.export(outfile, level, 'ns6:', namespacedef_='', name_='Parameter', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -2199,17 +2199,17 @@ class ParameterType(GeneratedsSuper):
         self.Name = _cast(None, Name)
         self.Name_nsprefix_ = None
         self.boolValue = boolValue
-        self.boolValue_nsprefix_ = None
+        self.boolValue_nsprefix_ = "ns6"
         self.byteValue = byteValue
-        self.byteValue_nsprefix_ = None
+        self.byteValue_nsprefix_ = "ns6"
         self.shortValue = shortValue
-        self.shortValue_nsprefix_ = None
+        self.shortValue_nsprefix_ = "ns6"
         self.intValue = intValue
-        self.intValue_nsprefix_ = None
+        self.intValue_nsprefix_ = "ns6"
         self.physicalValue = physicalValue
-        self.physicalValue_nsprefix_ = None
+        self.physicalValue_nsprefix_ = "ns6"
         self.stringValue = stringValue
-        self.stringValue_nsprefix_ = None
+        self.stringValue_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2275,7 +2275,7 @@ class ParameterType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2291,7 +2291,7 @@ class ParameterType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ParameterType'):
         if self.Name is not None and 'Name' not in already_processed:
             already_processed.add('Name')
-            outfile.write(' Name=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Name), input_name='Name')), ))
+            outfile.write(' ns6:Name=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Name), input_name='Name')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='ParameterType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
@@ -2315,7 +2315,7 @@ class ParameterType(GeneratedsSuper):
             outfile.write('<%sintValue>%s</%sintValue>%s' % (namespaceprefix_ , self.gds_format_integer(self.intValue, input_name='intValue'), namespaceprefix_ , eol_))
         if self.physicalValue is not None:
             namespaceprefix_ = self.physicalValue_nsprefix_ + ':' if (UseCapturedNS_ and self.physicalValue_nsprefix_) else ''
-            self.physicalValue.export(outfile, level, namespaceprefix_, namespacedef_='', name_='physicalValue', pretty_print=pretty_print)
+            self.physicalValue.export(outfile, level, 'ns6:', namespacedef_='', name_='physicalValue', pretty_print=pretty_print)
         if self.stringValue is not None:
             namespaceprefix_ = self.stringValue_nsprefix_ + ':' if (UseCapturedNS_ and self.stringValue_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -2332,7 +2332,7 @@ class ParameterType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Name', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Name', find_attr_value_('Name', node))
         if value is not None and 'Name' not in already_processed:
             already_processed.add('Name')
             self.Name = value
@@ -2387,7 +2387,7 @@ class ChargeServiceType(ServiceType):
         self.ns_prefix_ = None
         super(globals().get("ChargeServiceType"), self).__init__(ServiceID, ServiceName, ServiceCategory, ServiceScope, FreeService,  **kwargs_)
         self.SupportedEnergyTransferMode = SupportedEnergyTransferMode
-        self.SupportedEnergyTransferMode_nsprefix_ = None
+        self.SupportedEnergyTransferMode_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2425,7 +2425,7 @@ class ChargeServiceType(ServiceType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargeServiceType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2448,7 +2448,7 @@ class ChargeServiceType(ServiceType):
             eol_ = ''
         if self.SupportedEnergyTransferMode is not None:
             namespaceprefix_ = self.SupportedEnergyTransferMode_nsprefix_ + ':' if (UseCapturedNS_ and self.SupportedEnergyTransferMode_nsprefix_) else ''
-            self.SupportedEnergyTransferMode.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SupportedEnergyTransferMode', pretty_print=pretty_print)
+            self.SupportedEnergyTransferMode.export(outfile, level, 'ns6:', namespacedef_='', name_='SupportedEnergyTransferMode', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -2486,7 +2486,7 @@ class SupportedEnergyTransferModeType(GeneratedsSuper):
             self.EnergyTransferMode = []
         else:
             self.EnergyTransferMode = EnergyTransferMode
-        self.EnergyTransferMode_nsprefix_ = None
+        self.EnergyTransferMode_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2544,7 +2544,7 @@ class SupportedEnergyTransferModeType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SupportedEnergyTransferModeType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2647,7 +2647,7 @@ class ContractSignatureEncryptedPrivateKeyType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ContractSignatureEncryptedPrivateKeyType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2663,7 +2663,7 @@ class ContractSignatureEncryptedPrivateKeyType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='ContractSignatureEncryptedPrivateKeyType'):
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns6:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='', name_='ContractSignatureEncryptedPrivateKeyType', fromsubclass_=False, pretty_print=True):
         pass
     def build(self, node, gds_collector_=None):
@@ -2679,7 +2679,7 @@ class ContractSignatureEncryptedPrivateKeyType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -2742,7 +2742,7 @@ class DiffieHellmanPublickeyType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DiffieHellmanPublickeyType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2758,7 +2758,7 @@ class DiffieHellmanPublickeyType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='DiffieHellmanPublickeyType'):
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns6:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='', name_='DiffieHellmanPublickeyType', fromsubclass_=False, pretty_print=True):
         pass
     def build(self, node, gds_collector_=None):
@@ -2774,7 +2774,7 @@ class DiffieHellmanPublickeyType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -2851,7 +2851,7 @@ class EMAIDType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EMAIDType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2867,7 +2867,7 @@ class EMAIDType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='EMAIDType'):
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns6:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='', name_='EMAIDType', fromsubclass_=False, pretty_print=True):
         pass
     def build(self, node, gds_collector_=None):
@@ -2883,7 +2883,7 @@ class EMAIDType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -2906,9 +2906,9 @@ class CertificateChainType(GeneratedsSuper):
         self.Id_nsprefix_ = None
         self.Certificate = Certificate
         self.validate_certificateType(self.Certificate)
-        self.Certificate_nsprefix_ = None
+        self.Certificate_nsprefix_ = "ns6"
         self.SubCertificates = SubCertificates
-        self.SubCertificates_nsprefix_ = None
+        self.SubCertificates_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -2963,7 +2963,7 @@ class CertificateChainType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CertificateChainType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -2979,7 +2979,7 @@ class CertificateChainType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='CertificateChainType'):
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns6:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CertificateChainType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
@@ -2991,7 +2991,7 @@ class CertificateChainType(GeneratedsSuper):
             outfile.write('<%sCertificate>%s</%sCertificate>%s' % (namespaceprefix_ , self.gds_format_base64(self.Certificate, input_name='Certificate'), namespaceprefix_ , eol_))
         if self.SubCertificates is not None:
             namespaceprefix_ = self.SubCertificates_nsprefix_ + ':' if (UseCapturedNS_ and self.SubCertificates_nsprefix_) else ''
-            self.SubCertificates.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SubCertificates', pretty_print=pretty_print)
+            self.SubCertificates.export(outfile, level, 'ns6:', namespacedef_='', name_='SubCertificates', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -3004,7 +3004,7 @@ class CertificateChainType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -3045,7 +3045,7 @@ class SubCertificatesType(GeneratedsSuper):
             self.Certificate = []
         else:
             self.Certificate = Certificate
-        self.Certificate_nsprefix_ = None
+        self.Certificate_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3097,7 +3097,7 @@ class SubCertificatesType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SubCertificatesType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3166,7 +3166,7 @@ class ListOfRootCertificateIDsType(GeneratedsSuper):
             self.RootCertificateID = []
         else:
             self.RootCertificateID = RootCertificateID
-        self.RootCertificateID_nsprefix_ = "xmlsig"
+        self.RootCertificateID_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3209,7 +3209,7 @@ class ListOfRootCertificateIDsType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ListOfRootCertificateIDsType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3231,7 +3231,7 @@ class ListOfRootCertificateIDsType(GeneratedsSuper):
             eol_ = ''
         for RootCertificateID_ in self.RootCertificateID:
             namespaceprefix_ = self.RootCertificateID_nsprefix_ + ':' if (UseCapturedNS_ and self.RootCertificateID_nsprefix_) else ''
-            RootCertificateID_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='RootCertificateID', pretty_print=pretty_print)
+            RootCertificateID_.export(outfile, level, 'ns6:', namespacedef_='', name_='RootCertificateID', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -3266,17 +3266,17 @@ class MeterInfoType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.MeterID = MeterID
         self.validate_meterIDType(self.MeterID)
-        self.MeterID_nsprefix_ = None
+        self.MeterID_nsprefix_ = "ns6"
         self.MeterReading = MeterReading
-        self.MeterReading_nsprefix_ = None
+        self.MeterReading_nsprefix_ = "ns6"
         self.SigMeterReading = SigMeterReading
         self.validate_sigMeterReadingType(self.SigMeterReading)
-        self.SigMeterReading_nsprefix_ = None
+        self.SigMeterReading_nsprefix_ = "ns6"
         self.MeterStatus = MeterStatus
         self.validate_meterStatusType(self.MeterStatus)
-        self.MeterStatus_nsprefix_ = None
+        self.MeterStatus_nsprefix_ = "ns6"
         self.TMeter = TMeter
-        self.TMeter_nsprefix_ = None
+        self.TMeter_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3365,7 +3365,7 @@ class MeterInfoType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'MeterInfoType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3476,12 +3476,12 @@ class PhysicalValueType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.Multiplier = Multiplier
         self.validate_unitMultiplierType(self.Multiplier)
-        self.Multiplier_nsprefix_ = None
+        self.Multiplier_nsprefix_ = "ns6"
         self.Unit = Unit
         self.validate_unitSymbolType(self.Unit)
-        self.Unit_nsprefix_ = None
+        self.Unit_nsprefix_ = "ns6"
         self.Value = Value
-        self.Value_nsprefix_ = None
+        self.Value_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3560,7 +3560,7 @@ class PhysicalValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PhysicalValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3643,10 +3643,10 @@ class NotificationType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.FaultCode = FaultCode
         self.validate_faultCodeType(self.FaultCode)
-        self.FaultCode_nsprefix_ = None
+        self.FaultCode_nsprefix_ = "ns6"
         self.FaultMsg = FaultMsg
         self.validate_faultMsgType(self.FaultMsg)
-        self.FaultMsg_nsprefix_ = None
+        self.FaultMsg_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3716,7 +3716,7 @@ class NotificationType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'NotificationType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3822,7 +3822,7 @@ class SASchedulesType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SASchedulesType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3882,7 +3882,7 @@ class SAScheduleListType(SASchedulesType):
             self.SAScheduleTuple = []
         else:
             self.SAScheduleTuple = SAScheduleTuple
-        self.SAScheduleTuple_nsprefix_ = None
+        self.SAScheduleTuple_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -3916,7 +3916,7 @@ class SAScheduleListType(SASchedulesType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SAScheduleListType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SAScheduleList', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SAScheduleListType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -3926,7 +3926,7 @@ class SAScheduleListType(SASchedulesType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SAScheduleListType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -3949,7 +3949,7 @@ class SAScheduleListType(SASchedulesType):
             eol_ = ''
         for SAScheduleTuple_ in self.SAScheduleTuple:
             namespaceprefix_ = self.SAScheduleTuple_nsprefix_ + ':' if (UseCapturedNS_ and self.SAScheduleTuple_nsprefix_) else ''
-            SAScheduleTuple_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SAScheduleTuple', pretty_print=pretty_print)
+            SAScheduleTuple_.export(outfile, level, 'ns6:', namespacedef_='', name_='SAScheduleTuple', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -3985,11 +3985,11 @@ class SAScheduleTupleType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.SAScheduleTupleID = SAScheduleTupleID
         self.validate_SAIDType(self.SAScheduleTupleID)
-        self.SAScheduleTupleID_nsprefix_ = None
+        self.SAScheduleTupleID_nsprefix_ = "ns6"
         self.PMaxSchedule = PMaxSchedule
-        self.PMaxSchedule_nsprefix_ = None
+        self.PMaxSchedule_nsprefix_ = "ns6"
         self.SalesTariff = SalesTariff
-        self.SalesTariff_nsprefix_ = None
+        self.SalesTariff_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4053,7 +4053,7 @@ class SAScheduleTupleType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SAScheduleTupleType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4079,10 +4079,10 @@ class SAScheduleTupleType(GeneratedsSuper):
             outfile.write('<%sSAScheduleTupleID>%s</%sSAScheduleTupleID>%s' % (namespaceprefix_ , self.gds_format_integer(self.SAScheduleTupleID, input_name='SAScheduleTupleID'), namespaceprefix_ , eol_))
         if self.PMaxSchedule is not None:
             namespaceprefix_ = self.PMaxSchedule_nsprefix_ + ':' if (UseCapturedNS_ and self.PMaxSchedule_nsprefix_) else ''
-            self.PMaxSchedule.export(outfile, level, namespaceprefix_, namespacedef_='', name_='PMaxSchedule', pretty_print=pretty_print)
+            self.PMaxSchedule.export(outfile, level, 'ns6:', namespacedef_='', name_='PMaxSchedule', pretty_print=pretty_print)
         if self.SalesTariff is not None:
             namespaceprefix_ = self.SalesTariff_nsprefix_ + ':' if (UseCapturedNS_ and self.SalesTariff_nsprefix_) else ''
-            self.SalesTariff.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SalesTariff', pretty_print=pretty_print)
+            self.SalesTariff.export(outfile, level, 'ns6:', namespacedef_='', name_='SalesTariff', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4132,17 +4132,17 @@ class SalesTariffType(GeneratedsSuper):
         self.Id_nsprefix_ = None
         self.SalesTariffID = SalesTariffID
         self.validate_SAIDType(self.SalesTariffID)
-        self.SalesTariffID_nsprefix_ = None
+        self.SalesTariffID_nsprefix_ = "ns6"
         self.SalesTariffDescription = SalesTariffDescription
         self.validate_tariffDescriptionType(self.SalesTariffDescription)
-        self.SalesTariffDescription_nsprefix_ = None
+        self.SalesTariffDescription_nsprefix_ = "ns6"
         self.NumEPriceLevels = NumEPriceLevels
-        self.NumEPriceLevels_nsprefix_ = None
+        self.NumEPriceLevels_nsprefix_ = "ns6"
         if SalesTariffEntry is None:
             self.SalesTariffEntry = []
         else:
             self.SalesTariffEntry = SalesTariffEntry
-        self.SalesTariffEntry_nsprefix_ = None
+        self.SalesTariffEntry_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4234,7 +4234,7 @@ class SalesTariffType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SalesTariffType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4250,7 +4250,7 @@ class SalesTariffType(GeneratedsSuper):
     def _exportAttributes(self, outfile, level, already_processed, namespaceprefix_='', name_='SalesTariffType'):
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns6:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SalesTariffType', fromsubclass_=False, pretty_print=True):
         if pretty_print:
             eol_ = '\n'
@@ -4270,7 +4270,7 @@ class SalesTariffType(GeneratedsSuper):
             outfile.write('<%sNumEPriceLevels>%s</%sNumEPriceLevels>%s' % (namespaceprefix_ , self.gds_format_integer(self.NumEPriceLevels, input_name='NumEPriceLevels'), namespaceprefix_ , eol_))
         for SalesTariffEntry_ in self.SalesTariffEntry:
             namespaceprefix_ = self.SalesTariffEntry_nsprefix_ + ':' if (UseCapturedNS_ and self.SalesTariffEntry_nsprefix_) else ''
-            SalesTariffEntry_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SalesTariffEntry', pretty_print=pretty_print)
+            SalesTariffEntry_.export(outfile, level, 'ns6:', namespacedef_='', name_='SalesTariffEntry', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4283,7 +4283,7 @@ class SalesTariffType(GeneratedsSuper):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgDataTypes}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -4332,7 +4332,7 @@ class PMaxScheduleType(GeneratedsSuper):
             self.PMaxScheduleEntry = []
         else:
             self.PMaxScheduleEntry = PMaxScheduleEntry
-        self.PMaxScheduleEntry_nsprefix_ = None
+        self.PMaxScheduleEntry_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4375,7 +4375,7 @@ class PMaxScheduleType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PMaxScheduleType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4397,7 +4397,7 @@ class PMaxScheduleType(GeneratedsSuper):
             eol_ = ''
         for PMaxScheduleEntry_ in self.PMaxScheduleEntry:
             namespaceprefix_ = self.PMaxScheduleEntry_nsprefix_ + ':' if (UseCapturedNS_ and self.PMaxScheduleEntry_nsprefix_) else ''
-            PMaxScheduleEntry_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='PMaxScheduleEntry', pretty_print=pretty_print)
+            PMaxScheduleEntry_.export(outfile, level, 'ns6:', namespacedef_='', name_='PMaxScheduleEntry', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4431,7 +4431,7 @@ class EntryType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.TimeInterval = TimeInterval
-        self.TimeInterval_nsprefix_ = None
+        self.TimeInterval_nsprefix_ = "ns6"
         self.extensiontype_ = extensiontype_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -4471,7 +4471,7 @@ class EntryType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EntryType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4500,7 +4500,7 @@ class EntryType(GeneratedsSuper):
         else:
             eol_ = ''
         if self.TimeInterval is not None:
-            self.TimeInterval.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.TimeInterval.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4557,12 +4557,12 @@ class SalesTariffEntryType(EntryType):
         self.ns_prefix_ = None
         super(globals().get("SalesTariffEntryType"), self).__init__(TimeInterval,  **kwargs_)
         self.EPriceLevel = EPriceLevel
-        self.EPriceLevel_nsprefix_ = None
+        self.EPriceLevel_nsprefix_ = "ns6"
         if ConsumptionCost is None:
             self.ConsumptionCost = []
         else:
             self.ConsumptionCost = ConsumptionCost
-        self.ConsumptionCost_nsprefix_ = None
+        self.ConsumptionCost_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4601,7 +4601,7 @@ class SalesTariffEntryType(EntryType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SalesTariffEntryType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SalesTariffEntry', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SalesTariffEntryType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -4611,7 +4611,7 @@ class SalesTariffEntryType(EntryType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SalesTariffEntryType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4638,7 +4638,7 @@ class SalesTariffEntryType(EntryType):
             outfile.write('<%sEPriceLevel>%s</%sEPriceLevel>%s' % (namespaceprefix_ , self.gds_format_integer(self.EPriceLevel, input_name='EPriceLevel'), namespaceprefix_ , eol_))
         for ConsumptionCost_ in self.ConsumptionCost:
             namespaceprefix_ = self.ConsumptionCost_nsprefix_ + ':' if (UseCapturedNS_ and self.ConsumptionCost_nsprefix_) else ''
-            ConsumptionCost_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ConsumptionCost', pretty_print=pretty_print)
+            ConsumptionCost_.export(outfile, level, 'ns6:', namespacedef_='', name_='ConsumptionCost', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4680,7 +4680,7 @@ class PMaxScheduleEntryType(EntryType):
         self.ns_prefix_ = None
         super(globals().get("PMaxScheduleEntryType"), self).__init__(TimeInterval,  **kwargs_)
         self.PMax = PMax
-        self.PMax_nsprefix_ = None
+        self.PMax_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4708,7 +4708,7 @@ class PMaxScheduleEntryType(EntryType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='PMaxScheduleEntryType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='PMaxScheduleEntry', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PMaxScheduleEntryType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -4718,7 +4718,7 @@ class PMaxScheduleEntryType(EntryType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PMaxScheduleEntryType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4741,7 +4741,7 @@ class PMaxScheduleEntryType(EntryType):
             eol_ = ''
         if self.PMax is not None:
             namespaceprefix_ = self.PMax_nsprefix_ + ':' if (UseCapturedNS_ and self.PMax_nsprefix_) else ''
-            self.PMax.export(outfile, level, namespaceprefix_, namespacedef_='', name_='PMax', pretty_print=pretty_print)
+            self.PMax.export(outfile, level, 'ns6:', namespacedef_='', name_='PMax', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -4810,7 +4810,7 @@ class IntervalType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'IntervalType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -4868,10 +4868,10 @@ class RelativeTimeIntervalType(IntervalType):
         super(globals().get("RelativeTimeIntervalType"), self).__init__( **kwargs_)
         self.start = start
         self.validate_startType(self.start)
-        self.start_nsprefix_ = None
+        self.start_nsprefix_ = "ns6"
         self.duration = duration
         self.validate_durationType(self.duration)
-        self.duration_nsprefix_ = None
+        self.duration_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -4938,7 +4938,7 @@ class RelativeTimeIntervalType(IntervalType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='RelativeTimeIntervalType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='RelativeTimeInterval', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('RelativeTimeIntervalType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -4948,7 +4948,7 @@ class RelativeTimeIntervalType(IntervalType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'RelativeTimeIntervalType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5022,12 +5022,12 @@ class ConsumptionCostType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.startValue = startValue
-        self.startValue_nsprefix_ = None
+        self.startValue_nsprefix_ = "ns6"
         if Cost is None:
             self.Cost = []
         else:
             self.Cost = Cost
-        self.Cost_nsprefix_ = None
+        self.Cost_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -5075,7 +5075,7 @@ class ConsumptionCostType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ConsumptionCostType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5097,10 +5097,10 @@ class ConsumptionCostType(GeneratedsSuper):
             eol_ = ''
         if self.startValue is not None:
             namespaceprefix_ = self.startValue_nsprefix_ + ':' if (UseCapturedNS_ and self.startValue_nsprefix_) else ''
-            self.startValue.export(outfile, level, namespaceprefix_, namespacedef_='', name_='startValue', pretty_print=pretty_print)
+            self.startValue.export(outfile, level, 'ns6:', namespacedef_='', name_='startValue', pretty_print=pretty_print)
         for Cost_ in self.Cost:
             namespaceprefix_ = self.Cost_nsprefix_ + ':' if (UseCapturedNS_ and self.Cost_nsprefix_) else ''
-            Cost_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='Cost', pretty_print=pretty_print)
+            Cost_.export(outfile, level, 'ns6:', namespacedef_='', name_='Cost', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -5140,12 +5140,12 @@ class CostType(GeneratedsSuper):
         self.ns_prefix_ = None
         self.costKind = costKind
         self.validate_costKindType(self.costKind)
-        self.costKind_nsprefix_ = None
+        self.costKind_nsprefix_ = "ns6"
         self.amount = amount
-        self.amount_nsprefix_ = None
+        self.amount_nsprefix_ = "ns6"
         self.amountMultiplier = amountMultiplier
         self.validate_unitMultiplierType(self.amountMultiplier)
-        self.amountMultiplier_nsprefix_ = None
+        self.amountMultiplier_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -5224,7 +5224,7 @@ class CostType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CostType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5306,10 +5306,10 @@ class EVSEStatusType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.NotificationMaxDelay = NotificationMaxDelay
-        self.NotificationMaxDelay_nsprefix_ = None
+        self.NotificationMaxDelay_nsprefix_ = "ns6"
         self.EVSENotification = EVSENotification
         self.validate_EVSENotificationType(self.EVSENotification)
-        self.EVSENotification_nsprefix_ = None
+        self.EVSENotification_nsprefix_ = "ns6"
         self.extensiontype_ = extensiontype_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -5369,7 +5369,7 @@ class EVSEStatusType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EVSEStatusType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5451,7 +5451,7 @@ class AC_EVSEStatusType(EVSEStatusType):
         self.ns_prefix_ = None
         super(globals().get("AC_EVSEStatusType"), self).__init__(NotificationMaxDelay, EVSENotification,  **kwargs_)
         self.RCD = RCD
-        self.RCD_nsprefix_ = None
+        self.RCD_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -5479,7 +5479,7 @@ class AC_EVSEStatusType(EVSEStatusType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVSEStatusType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVSEStatus', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('AC_EVSEStatusType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -5489,7 +5489,7 @@ class AC_EVSEStatusType(EVSEStatusType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'AC_EVSEStatusType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5583,7 +5583,7 @@ class EVStatusType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EVStatusType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5641,10 +5641,10 @@ class DC_EVSEStatusType(EVSEStatusType):
         super(globals().get("DC_EVSEStatusType"), self).__init__(NotificationMaxDelay, EVSENotification,  **kwargs_)
         self.EVSEIsolationStatus = EVSEIsolationStatus
         self.validate_isolationLevelType(self.EVSEIsolationStatus)
-        self.EVSEIsolationStatus_nsprefix_ = None
+        self.EVSEIsolationStatus_nsprefix_ = "ns6"
         self.EVSEStatusCode = EVSEStatusCode
         self.validate_DC_EVSEStatusCodeType(self.EVSEStatusCode)
-        self.EVSEStatusCode_nsprefix_ = None
+        self.EVSEStatusCode_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -5707,7 +5707,7 @@ class DC_EVSEStatusType(EVSEStatusType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVSEStatusType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVSEStatus', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('DC_EVSEStatusType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -5717,7 +5717,7 @@ class DC_EVSEStatusType(EVSEStatusType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DC_EVSEStatusType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5792,13 +5792,13 @@ class DC_EVStatusType(EVStatusType):
         self.ns_prefix_ = None
         super(globals().get("DC_EVStatusType"), self).__init__( **kwargs_)
         self.EVReady = EVReady
-        self.EVReady_nsprefix_ = None
+        self.EVReady_nsprefix_ = "ns6"
         self.EVErrorCode = EVErrorCode
         self.validate_DC_EVErrorCodeType(self.EVErrorCode)
-        self.EVErrorCode_nsprefix_ = None
+        self.EVErrorCode_nsprefix_ = "ns6"
         self.EVRESSSOC = EVRESSSOC
         self.validate_percentValueType(self.EVRESSSOC)
-        self.EVRESSSOC_nsprefix_ = None
+        self.EVRESSSOC_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -5868,7 +5868,7 @@ class DC_EVStatusType(EVStatusType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVStatusType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVStatus', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('DC_EVStatusType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -5878,7 +5878,7 @@ class DC_EVStatusType(EVStatusType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DC_EVStatusType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -5962,7 +5962,7 @@ class EVChargeParameterType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.DepartureTime = DepartureTime
-        self.DepartureTime_nsprefix_ = None
+        self.DepartureTime_nsprefix_ = "ns6"
         self.extensiontype_ = extensiontype_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -6002,7 +6002,7 @@ class EVChargeParameterType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EVChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6072,13 +6072,13 @@ class AC_EVChargeParameterType(EVChargeParameterType):
         self.ns_prefix_ = None
         super(globals().get("AC_EVChargeParameterType"), self).__init__(DepartureTime,  **kwargs_)
         self.EAmount = EAmount
-        self.EAmount_nsprefix_ = None
+        self.EAmount_nsprefix_ = "ns6"
         self.EVMaxVoltage = EVMaxVoltage
-        self.EVMaxVoltage_nsprefix_ = None
+        self.EVMaxVoltage_nsprefix_ = "ns6"
         self.EVMaxCurrent = EVMaxCurrent
-        self.EVMaxCurrent_nsprefix_ = None
+        self.EVMaxCurrent_nsprefix_ = "ns6"
         self.EVMinCurrent = EVMinCurrent
-        self.EVMinCurrent_nsprefix_ = None
+        self.EVMinCurrent_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -6121,7 +6121,7 @@ class AC_EVChargeParameterType(EVChargeParameterType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVChargeParameterType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVChargeParameter', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('AC_EVChargeParameterType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -6131,7 +6131,7 @@ class AC_EVChargeParameterType(EVChargeParameterType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'AC_EVChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6154,16 +6154,16 @@ class AC_EVChargeParameterType(EVChargeParameterType):
             eol_ = ''
         if self.EAmount is not None:
             namespaceprefix_ = self.EAmount_nsprefix_ + ':' if (UseCapturedNS_ and self.EAmount_nsprefix_) else ''
-            self.EAmount.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EAmount', pretty_print=pretty_print)
+            self.EAmount.export(outfile, level, 'ns6:', namespacedef_='', name_='EAmount', pretty_print=pretty_print)
         if self.EVMaxVoltage is not None:
             namespaceprefix_ = self.EVMaxVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaxVoltage_nsprefix_) else ''
-            self.EVMaxVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaxVoltage', pretty_print=pretty_print)
+            self.EVMaxVoltage.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMaxVoltage', pretty_print=pretty_print)
         if self.EVMaxCurrent is not None:
             namespaceprefix_ = self.EVMaxCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaxCurrent_nsprefix_) else ''
-            self.EVMaxCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaxCurrent', pretty_print=pretty_print)
+            self.EVMaxCurrent.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMaxCurrent', pretty_print=pretty_print)
         if self.EVMinCurrent is not None:
             namespaceprefix_ = self.EVMinCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMinCurrent_nsprefix_) else ''
-            self.EVMinCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMinCurrent', pretty_print=pretty_print)
+            self.EVMinCurrent.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMinCurrent', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -6214,23 +6214,23 @@ class DC_EVChargeParameterType(EVChargeParameterType):
         self.ns_prefix_ = None
         super(globals().get("DC_EVChargeParameterType"), self).__init__(DepartureTime,  **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = None
+        self.DC_EVStatus_nsprefix_ = "ns6"
         self.EVMaximumCurrentLimit = EVMaximumCurrentLimit
-        self.EVMaximumCurrentLimit_nsprefix_ = None
+        self.EVMaximumCurrentLimit_nsprefix_ = "ns6"
         self.EVMaximumPowerLimit = EVMaximumPowerLimit
-        self.EVMaximumPowerLimit_nsprefix_ = None
+        self.EVMaximumPowerLimit_nsprefix_ = "ns6"
         self.EVMaximumVoltageLimit = EVMaximumVoltageLimit
-        self.EVMaximumVoltageLimit_nsprefix_ = None
+        self.EVMaximumVoltageLimit_nsprefix_ = "ns6"
         self.EVEnergyCapacity = EVEnergyCapacity
-        self.EVEnergyCapacity_nsprefix_ = None
+        self.EVEnergyCapacity_nsprefix_ = "ns6"
         self.EVEnergyRequest = EVEnergyRequest
-        self.EVEnergyRequest_nsprefix_ = None
+        self.EVEnergyRequest_nsprefix_ = "ns6"
         self.FullSOC = FullSOC
         self.validate_percentValueType(self.FullSOC)
-        self.FullSOC_nsprefix_ = None
+        self.FullSOC_nsprefix_ = "ns6"
         self.BulkSOC = BulkSOC
         self.validate_percentValueType(self.BulkSOC)
-        self.BulkSOC_nsprefix_ = None
+        self.BulkSOC_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -6310,7 +6310,7 @@ class DC_EVChargeParameterType(EVChargeParameterType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVChargeParameterType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVChargeParameter', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('DC_EVChargeParameterType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -6320,7 +6320,7 @@ class DC_EVChargeParameterType(EVChargeParameterType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DC_EVChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6343,22 +6343,22 @@ class DC_EVChargeParameterType(EVChargeParameterType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns6:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
         if self.EVMaximumCurrentLimit is not None:
             namespaceprefix_ = self.EVMaximumCurrentLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumCurrentLimit_nsprefix_) else ''
-            self.EVMaximumCurrentLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumCurrentLimit', pretty_print=pretty_print)
+            self.EVMaximumCurrentLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMaximumCurrentLimit', pretty_print=pretty_print)
         if self.EVMaximumPowerLimit is not None:
             namespaceprefix_ = self.EVMaximumPowerLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumPowerLimit_nsprefix_) else ''
-            self.EVMaximumPowerLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumPowerLimit', pretty_print=pretty_print)
+            self.EVMaximumPowerLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMaximumPowerLimit', pretty_print=pretty_print)
         if self.EVMaximumVoltageLimit is not None:
             namespaceprefix_ = self.EVMaximumVoltageLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumVoltageLimit_nsprefix_) else ''
-            self.EVMaximumVoltageLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumVoltageLimit', pretty_print=pretty_print)
+            self.EVMaximumVoltageLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVMaximumVoltageLimit', pretty_print=pretty_print)
         if self.EVEnergyCapacity is not None:
             namespaceprefix_ = self.EVEnergyCapacity_nsprefix_ + ':' if (UseCapturedNS_ and self.EVEnergyCapacity_nsprefix_) else ''
-            self.EVEnergyCapacity.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVEnergyCapacity', pretty_print=pretty_print)
+            self.EVEnergyCapacity.export(outfile, level, 'ns6:', namespacedef_='', name_='EVEnergyCapacity', pretty_print=pretty_print)
         if self.EVEnergyRequest is not None:
             namespaceprefix_ = self.EVEnergyRequest_nsprefix_ + ':' if (UseCapturedNS_ and self.EVEnergyRequest_nsprefix_) else ''
-            self.EVEnergyRequest.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVEnergyRequest', pretty_print=pretty_print)
+            self.EVEnergyRequest.export(outfile, level, 'ns6:', namespacedef_='', name_='EVEnergyRequest', pretty_print=pretty_print)
         if self.FullSOC is not None:
             namespaceprefix_ = self.FullSOC_nsprefix_ + ':' if (UseCapturedNS_ and self.FullSOC_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -6476,7 +6476,7 @@ class EVSEChargeParameterType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EVSEChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6533,11 +6533,11 @@ class AC_EVSEChargeParameterType(EVSEChargeParameterType):
         self.ns_prefix_ = None
         super(globals().get("AC_EVSEChargeParameterType"), self).__init__( **kwargs_)
         self.AC_EVSEStatus = AC_EVSEStatus
-        self.AC_EVSEStatus_nsprefix_ = None
+        self.AC_EVSEStatus_nsprefix_ = "ns6"
         self.EVSENominalVoltage = EVSENominalVoltage
-        self.EVSENominalVoltage_nsprefix_ = None
+        self.EVSENominalVoltage_nsprefix_ = "ns6"
         self.EVSEMaxCurrent = EVSEMaxCurrent
-        self.EVSEMaxCurrent_nsprefix_ = None
+        self.EVSEMaxCurrent_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -6575,7 +6575,7 @@ class AC_EVSEChargeParameterType(EVSEChargeParameterType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVSEChargeParameterType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='AC_EVSEChargeParameter', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('AC_EVSEChargeParameterType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -6585,7 +6585,7 @@ class AC_EVSEChargeParameterType(EVSEChargeParameterType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'AC_EVSEChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6608,13 +6608,13 @@ class AC_EVSEChargeParameterType(EVSEChargeParameterType):
             eol_ = ''
         if self.AC_EVSEStatus is not None:
             namespaceprefix_ = self.AC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.AC_EVSEStatus_nsprefix_) else ''
-            self.AC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='AC_EVSEStatus', pretty_print=pretty_print)
+            self.AC_EVSEStatus.export(outfile, level, 'ns6:', namespacedef_='', name_='AC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSENominalVoltage is not None:
             namespaceprefix_ = self.EVSENominalVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSENominalVoltage_nsprefix_) else ''
-            self.EVSENominalVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSENominalVoltage', pretty_print=pretty_print)
+            self.EVSENominalVoltage.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSENominalVoltage', pretty_print=pretty_print)
         if self.EVSEMaxCurrent is not None:
             namespaceprefix_ = self.EVSEMaxCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaxCurrent_nsprefix_) else ''
-            self.EVSEMaxCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaxCurrent', pretty_print=pretty_print)
+            self.EVSEMaxCurrent.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMaxCurrent', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -6660,23 +6660,23 @@ class DC_EVSEChargeParameterType(EVSEChargeParameterType):
         self.ns_prefix_ = None
         super(globals().get("DC_EVSEChargeParameterType"), self).__init__( **kwargs_)
         self.DC_EVSEStatus = DC_EVSEStatus
-        self.DC_EVSEStatus_nsprefix_ = None
+        self.DC_EVSEStatus_nsprefix_ = "ns6"
         self.EVSEMaximumCurrentLimit = EVSEMaximumCurrentLimit
-        self.EVSEMaximumCurrentLimit_nsprefix_ = None
+        self.EVSEMaximumCurrentLimit_nsprefix_ = "ns6"
         self.EVSEMaximumPowerLimit = EVSEMaximumPowerLimit
-        self.EVSEMaximumPowerLimit_nsprefix_ = None
+        self.EVSEMaximumPowerLimit_nsprefix_ = "ns6"
         self.EVSEMaximumVoltageLimit = EVSEMaximumVoltageLimit
-        self.EVSEMaximumVoltageLimit_nsprefix_ = None
+        self.EVSEMaximumVoltageLimit_nsprefix_ = "ns6"
         self.EVSEMinimumCurrentLimit = EVSEMinimumCurrentLimit
-        self.EVSEMinimumCurrentLimit_nsprefix_ = None
+        self.EVSEMinimumCurrentLimit_nsprefix_ = "ns6"
         self.EVSEMinimumVoltageLimit = EVSEMinimumVoltageLimit
-        self.EVSEMinimumVoltageLimit_nsprefix_ = None
+        self.EVSEMinimumVoltageLimit_nsprefix_ = "ns6"
         self.EVSECurrentRegulationTolerance = EVSECurrentRegulationTolerance
-        self.EVSECurrentRegulationTolerance_nsprefix_ = None
+        self.EVSECurrentRegulationTolerance_nsprefix_ = "ns6"
         self.EVSEPeakCurrentRipple = EVSEPeakCurrentRipple
-        self.EVSEPeakCurrentRipple_nsprefix_ = None
+        self.EVSEPeakCurrentRipple_nsprefix_ = "ns6"
         self.EVSEEnergyToBeDelivered = EVSEEnergyToBeDelivered
-        self.EVSEEnergyToBeDelivered_nsprefix_ = None
+        self.EVSEEnergyToBeDelivered_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -6744,7 +6744,7 @@ class DC_EVSEChargeParameterType(EVSEChargeParameterType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVSEChargeParameterType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVSEChargeParameter', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('DC_EVSEChargeParameterType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -6754,7 +6754,7 @@ class DC_EVSEChargeParameterType(EVSEChargeParameterType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DC_EVSEChargeParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6777,31 +6777,31 @@ class DC_EVSEChargeParameterType(EVSEChargeParameterType):
             eol_ = ''
         if self.DC_EVSEStatus is not None:
             namespaceprefix_ = self.DC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVSEStatus_nsprefix_) else ''
-            self.DC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
+            self.DC_EVSEStatus.export(outfile, level, 'ns6:', namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSEMaximumCurrentLimit is not None:
             namespaceprefix_ = self.EVSEMaximumCurrentLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumCurrentLimit_nsprefix_) else ''
-            self.EVSEMaximumCurrentLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumCurrentLimit', pretty_print=pretty_print)
+            self.EVSEMaximumCurrentLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMaximumCurrentLimit', pretty_print=pretty_print)
         if self.EVSEMaximumPowerLimit is not None:
             namespaceprefix_ = self.EVSEMaximumPowerLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumPowerLimit_nsprefix_) else ''
-            self.EVSEMaximumPowerLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumPowerLimit', pretty_print=pretty_print)
+            self.EVSEMaximumPowerLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMaximumPowerLimit', pretty_print=pretty_print)
         if self.EVSEMaximumVoltageLimit is not None:
             namespaceprefix_ = self.EVSEMaximumVoltageLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumVoltageLimit_nsprefix_) else ''
-            self.EVSEMaximumVoltageLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumVoltageLimit', pretty_print=pretty_print)
+            self.EVSEMaximumVoltageLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMaximumVoltageLimit', pretty_print=pretty_print)
         if self.EVSEMinimumCurrentLimit is not None:
             namespaceprefix_ = self.EVSEMinimumCurrentLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMinimumCurrentLimit_nsprefix_) else ''
-            self.EVSEMinimumCurrentLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMinimumCurrentLimit', pretty_print=pretty_print)
+            self.EVSEMinimumCurrentLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMinimumCurrentLimit', pretty_print=pretty_print)
         if self.EVSEMinimumVoltageLimit is not None:
             namespaceprefix_ = self.EVSEMinimumVoltageLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMinimumVoltageLimit_nsprefix_) else ''
-            self.EVSEMinimumVoltageLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMinimumVoltageLimit', pretty_print=pretty_print)
+            self.EVSEMinimumVoltageLimit.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEMinimumVoltageLimit', pretty_print=pretty_print)
         if self.EVSECurrentRegulationTolerance is not None:
             namespaceprefix_ = self.EVSECurrentRegulationTolerance_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSECurrentRegulationTolerance_nsprefix_) else ''
-            self.EVSECurrentRegulationTolerance.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSECurrentRegulationTolerance', pretty_print=pretty_print)
+            self.EVSECurrentRegulationTolerance.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSECurrentRegulationTolerance', pretty_print=pretty_print)
         if self.EVSEPeakCurrentRipple is not None:
             namespaceprefix_ = self.EVSEPeakCurrentRipple_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEPeakCurrentRipple_nsprefix_) else ''
-            self.EVSEPeakCurrentRipple.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEPeakCurrentRipple', pretty_print=pretty_print)
+            self.EVSEPeakCurrentRipple.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEPeakCurrentRipple', pretty_print=pretty_print)
         if self.EVSEEnergyToBeDelivered is not None:
             namespaceprefix_ = self.EVSEEnergyToBeDelivered_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEEnergyToBeDelivered_nsprefix_) else ''
-            self.EVSEEnergyToBeDelivered.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEEnergyToBeDelivered', pretty_print=pretty_print)
+            self.EVSEEnergyToBeDelivered.export(outfile, level, 'ns6:', namespacedef_='', name_='EVSEEnergyToBeDelivered', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -6910,7 +6910,7 @@ class EVPowerDeliveryParameterType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'EVPowerDeliveryParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -6967,11 +6967,11 @@ class DC_EVPowerDeliveryParameterType(EVPowerDeliveryParameterType):
         self.ns_prefix_ = None
         super(globals().get("DC_EVPowerDeliveryParameterType"), self).__init__( **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = None
+        self.DC_EVStatus_nsprefix_ = "ns6"
         self.BulkChargingComplete = BulkChargingComplete
-        self.BulkChargingComplete_nsprefix_ = None
+        self.BulkChargingComplete_nsprefix_ = "ns6"
         self.ChargingComplete = ChargingComplete
-        self.ChargingComplete_nsprefix_ = None
+        self.ChargingComplete_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -7009,7 +7009,7 @@ class DC_EVPowerDeliveryParameterType(EVPowerDeliveryParameterType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVPowerDeliveryParameterType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_=' xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='DC_EVPowerDeliveryParameter', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('DC_EVPowerDeliveryParameterType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -7019,7 +7019,7 @@ class DC_EVPowerDeliveryParameterType(EVPowerDeliveryParameterType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DC_EVPowerDeliveryParameterType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7042,7 +7042,7 @@ class DC_EVPowerDeliveryParameterType(EVPowerDeliveryParameterType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns6:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
         if self.BulkChargingComplete is not None:
             namespaceprefix_ = self.BulkChargingComplete_nsprefix_ + ':' if (UseCapturedNS_ and self.BulkChargingComplete_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -7100,7 +7100,7 @@ class ChargingProfileType(GeneratedsSuper):
             self.ProfileEntry = []
         else:
             self.ProfileEntry = ProfileEntry
-        self.ProfileEntry_nsprefix_ = None
+        self.ProfileEntry_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -7143,7 +7143,7 @@ class ChargingProfileType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargingProfileType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7165,7 +7165,7 @@ class ChargingProfileType(GeneratedsSuper):
             eol_ = ''
         for ProfileEntry_ in self.ProfileEntry:
             namespaceprefix_ = self.ProfileEntry_nsprefix_ + ':' if (UseCapturedNS_ and self.ProfileEntry_nsprefix_) else ''
-            ProfileEntry_.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ProfileEntry', pretty_print=pretty_print)
+            ProfileEntry_.export(outfile, level, 'ns6:', namespacedef_='', name_='ProfileEntry', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -7199,12 +7199,12 @@ class ProfileEntryType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.ChargingProfileEntryStart = ChargingProfileEntryStart
-        self.ChargingProfileEntryStart_nsprefix_ = None
+        self.ChargingProfileEntryStart_nsprefix_ = "ns6"
         self.ChargingProfileEntryMaxPower = ChargingProfileEntryMaxPower
-        self.ChargingProfileEntryMaxPower_nsprefix_ = None
+        self.ChargingProfileEntryMaxPower_nsprefix_ = "ns6"
         self.ChargingProfileEntryMaxNumberOfPhasesInUse = ChargingProfileEntryMaxNumberOfPhasesInUse
         self.validate_maxNumPhasesType(self.ChargingProfileEntryMaxNumberOfPhasesInUse)
-        self.ChargingProfileEntryMaxNumberOfPhasesInUse_nsprefix_ = None
+        self.ChargingProfileEntryMaxNumberOfPhasesInUse_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -7268,7 +7268,7 @@ class ProfileEntryType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ProfileEntryType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7294,7 +7294,7 @@ class ProfileEntryType(GeneratedsSuper):
             outfile.write('<%sChargingProfileEntryStart>%s</%sChargingProfileEntryStart>%s' % (namespaceprefix_ , self.gds_format_integer(self.ChargingProfileEntryStart, input_name='ChargingProfileEntryStart'), namespaceprefix_ , eol_))
         if self.ChargingProfileEntryMaxPower is not None:
             namespaceprefix_ = self.ChargingProfileEntryMaxPower_nsprefix_ + ':' if (UseCapturedNS_ and self.ChargingProfileEntryMaxPower_nsprefix_) else ''
-            self.ChargingProfileEntryMaxPower.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ChargingProfileEntryMaxPower', pretty_print=pretty_print)
+            self.ChargingProfileEntryMaxPower.export(outfile, level, 'ns6:', namespacedef_='', name_='ChargingProfileEntryMaxPower', pretty_print=pretty_print)
         if self.ChargingProfileEntryMaxNumberOfPhasesInUse is not None:
             namespaceprefix_ = self.ChargingProfileEntryMaxNumberOfPhasesInUse_nsprefix_ + ':' if (UseCapturedNS_ and self.ChargingProfileEntryMaxNumberOfPhasesInUse_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -7349,7 +7349,7 @@ class PaymentOptionListType(GeneratedsSuper):
             self.PaymentOption = []
         else:
             self.PaymentOption = PaymentOption
-        self.PaymentOption_nsprefix_ = None
+        self.PaymentOption_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -7407,7 +7407,7 @@ class PaymentOptionListType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PaymentOptionListType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7540,7 +7540,7 @@ class SignatureType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignatureType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7665,7 +7665,7 @@ class SignatureValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignatureValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7784,7 +7784,7 @@ class SignedInfoType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignedInfoType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -7920,7 +7920,7 @@ class CanonicalizationMethodType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CanonicalizationMethodType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8077,7 +8077,7 @@ class SignatureMethodType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignatureMethodType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8238,7 +8238,7 @@ class ReferenceType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ReferenceType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8375,7 +8375,7 @@ class TransformsType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'TransformsType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8437,7 +8437,7 @@ class TransformType(GeneratedsSuper):
             self.XPath = []
         else:
             self.XPath = XPath
-        self.XPath_nsprefix_ = None
+        self.XPath_nsprefix_ = "ds"
         self.valueOf_ = valueOf_
         if mixedclass_ is None:
             self.mixedclass_ = MixedContainer
@@ -8501,7 +8501,7 @@ class TransformType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'TransformType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8651,7 +8651,7 @@ class DigestMethodType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DigestMethodType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -8897,7 +8897,7 @@ class KeyInfoType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'KeyInfoType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9127,7 +9127,7 @@ class KeyValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'KeyValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9276,7 +9276,7 @@ class RetrievalMethodType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'RetrievalMethodType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9352,22 +9352,22 @@ class X509DataType(GeneratedsSuper):
             self.X509SKI = []
         else:
             self.X509SKI = X509SKI
-        self.X509SKI_nsprefix_ = None
+        self.X509SKI_nsprefix_ = "ds"
         if X509SubjectName is None:
             self.X509SubjectName = []
         else:
             self.X509SubjectName = X509SubjectName
-        self.X509SubjectName_nsprefix_ = None
+        self.X509SubjectName_nsprefix_ = "ds"
         if X509Certificate is None:
             self.X509Certificate = []
         else:
             self.X509Certificate = X509Certificate
-        self.X509Certificate_nsprefix_ = None
+        self.X509Certificate_nsprefix_ = "ds"
         if X509CRL is None:
             self.X509CRL = []
         else:
             self.X509CRL = X509CRL
-        self.X509CRL_nsprefix_ = None
+        self.X509CRL_nsprefix_ = "ds"
         self.anytypeobjs_ = anytypeobjs_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -9458,7 +9458,7 @@ class X509DataType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'X509DataType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9561,9 +9561,9 @@ class X509IssuerSerialType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.X509IssuerName = X509IssuerName
-        self.X509IssuerName_nsprefix_ = None
+        self.X509IssuerName_nsprefix_ = "ds"
         self.X509SerialNumber = X509SerialNumber
-        self.X509SerialNumber_nsprefix_ = None
+        self.X509SerialNumber_nsprefix_ = "ds"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -9605,7 +9605,7 @@ class X509IssuerSerialType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'X509IssuerSerialType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9673,9 +9673,9 @@ class PGPDataType(GeneratedsSuper):
         self.parent_object_ = kwargs_.get('parent_object_')
         self.ns_prefix_ = None
         self.PGPKeyID = PGPKeyID
-        self.PGPKeyID_nsprefix_ = None
+        self.PGPKeyID_nsprefix_ = "ds"
         self.PGPKeyPacket = PGPKeyPacket
-        self.PGPKeyPacket_nsprefix_ = None
+        self.PGPKeyPacket_nsprefix_ = "ds"
         if anytypeobjs_ is None:
             self.anytypeobjs_ = []
         else:
@@ -9726,7 +9726,7 @@ class PGPDataType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PGPDataType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9805,7 +9805,7 @@ class SPKIDataType(GeneratedsSuper):
             self.SPKISexp = []
         else:
             self.SPKISexp = SPKISexp
-        self.SPKISexp_nsprefix_ = None
+        self.SPKISexp_nsprefix_ = "ds"
         self.anytypeobjs_ = anytypeobjs_
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
@@ -9852,7 +9852,7 @@ class SPKIDataType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SPKIDataType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -9983,7 +9983,7 @@ class ObjectType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ObjectType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10128,7 +10128,7 @@ class ManifestType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ManifestType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10241,7 +10241,7 @@ class SignaturePropertiesType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignaturePropertiesType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10362,7 +10362,7 @@ class SignaturePropertyType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SignaturePropertyType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10540,7 +10540,7 @@ class DSAKeyValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DSAKeyValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10766,7 +10766,7 @@ class RSAKeyValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'RSAKeyValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10887,7 +10887,7 @@ class BodyType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'BodyType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -10908,7 +10908,7 @@ class BodyType(GeneratedsSuper):
         else:
             eol_ = ''
         if self.BodyElement is not None:
-            self.BodyElement.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.BodyElement.export(outfile, level, 'ns5:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -11160,7 +11160,7 @@ class BodyBaseType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'BodyBaseType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11218,7 +11218,7 @@ class SessionSetupReqType(BodyBaseType):
         super(globals().get("SessionSetupReqType"), self).__init__( **kwargs_)
         self.EVCCID = EVCCID
         self.validate_evccIDType(self.EVCCID)
-        self.EVCCID_nsprefix_ = "ns6"
+        self.EVCCID_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11259,7 +11259,7 @@ class SessionSetupReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionSetupReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionSetupReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SessionSetupReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -11269,7 +11269,7 @@ class SessionSetupReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SessionSetupReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11333,12 +11333,12 @@ class SessionSetupResType(BodyBaseType):
         super(globals().get("SessionSetupResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEID = EVSEID
         self.validate_evseIDType(self.EVSEID)
-        self.EVSEID_nsprefix_ = "ns6"
+        self.EVSEID_nsprefix_ = "ns5"
         self.EVSETimeStamp = EVSETimeStamp
-        self.EVSETimeStamp_nsprefix_ = None
+        self.EVSETimeStamp_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11408,7 +11408,7 @@ class SessionSetupResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SessionSetupResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='SessionSetupRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SessionSetupResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -11418,7 +11418,7 @@ class SessionSetupResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SessionSetupResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11504,10 +11504,10 @@ class ServiceDiscoveryReqType(BodyBaseType):
         super(globals().get("ServiceDiscoveryReqType"), self).__init__( **kwargs_)
         self.ServiceScope = ServiceScope
         self.validate_serviceScopeType(self.ServiceScope)
-        self.ServiceScope_nsprefix_ = "ns6"
+        self.ServiceScope_nsprefix_ = "ns5"
         self.ServiceCategory = ServiceCategory
         self.validate_serviceCategoryType(self.ServiceCategory)
-        self.ServiceCategory_nsprefix_ = "ns6"
+        self.ServiceCategory_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11568,7 +11568,7 @@ class ServiceDiscoveryReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDiscoveryReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDiscoveryReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ServiceDiscoveryReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -11578,7 +11578,7 @@ class ServiceDiscoveryReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceDiscoveryReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11654,13 +11654,13 @@ class ServiceDiscoveryResType(BodyBaseType):
         super(globals().get("ServiceDiscoveryResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.PaymentOptionList = PaymentOptionList
-        self.PaymentOptionList_nsprefix_ = "ns6"
+        self.PaymentOptionList_nsprefix_ = "ns5"
         self.ChargeService = ChargeService
-        self.ChargeService_nsprefix_ = "ns6"
+        self.ChargeService_nsprefix_ = "ns5"
         self.ServiceList = ServiceList
-        self.ServiceList_nsprefix_ = "ns6"
+        self.ServiceList_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11718,7 +11718,7 @@ class ServiceDiscoveryResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDiscoveryResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDiscoveryRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ServiceDiscoveryResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -11728,7 +11728,7 @@ class ServiceDiscoveryResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceDiscoveryResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11755,13 +11755,13 @@ class ServiceDiscoveryResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.PaymentOptionList is not None:
             namespaceprefix_ = self.PaymentOptionList_nsprefix_ + ':' if (UseCapturedNS_ and self.PaymentOptionList_nsprefix_) else ''
-            self.PaymentOptionList.export(outfile, level, namespaceprefix_, namespacedef_='', name_='PaymentOptionList', pretty_print=pretty_print)
+            self.PaymentOptionList.export(outfile, level, 'ns5:', namespacedef_='', name_='PaymentOptionList', pretty_print=pretty_print)
         if self.ChargeService is not None:
             namespaceprefix_ = self.ChargeService_nsprefix_ + ':' if (UseCapturedNS_ and self.ChargeService_nsprefix_) else ''
-            self.ChargeService.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ChargeService', pretty_print=pretty_print)
+            self.ChargeService.export(outfile, level, 'ns5:', namespacedef_='', name_='ChargeService', pretty_print=pretty_print)
         if self.ServiceList is not None:
             namespaceprefix_ = self.ServiceList_nsprefix_ + ':' if (UseCapturedNS_ and self.ServiceList_nsprefix_) else ''
-            self.ServiceList.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ServiceList', pretty_print=pretty_print)
+            self.ServiceList.export(outfile, level, 'ns5:', namespacedef_='', name_='ServiceList', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -11816,7 +11816,7 @@ class ServiceDetailReqType(BodyBaseType):
         super(globals().get("ServiceDetailReqType"), self).__init__( **kwargs_)
         self.ServiceID = ServiceID
         self.validate_serviceIDType(self.ServiceID)
-        self.ServiceID_nsprefix_ = "ns6"
+        self.ServiceID_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11854,7 +11854,7 @@ class ServiceDetailReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDetailReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDetailReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ServiceDetailReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -11864,7 +11864,7 @@ class ServiceDetailReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceDetailReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -11928,12 +11928,12 @@ class ServiceDetailResType(BodyBaseType):
         super(globals().get("ServiceDetailResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.ServiceID = ServiceID
         self.validate_serviceIDType(self.ServiceID)
-        self.ServiceID_nsprefix_ = "ns6"
+        self.ServiceID_nsprefix_ = "ns5"
         self.ServiceParameterList = ServiceParameterList
-        self.ServiceParameterList_nsprefix_ = "ns6"
+        self.ServiceParameterList_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -11996,7 +11996,7 @@ class ServiceDetailResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDetailResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ServiceDetailRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ServiceDetailResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12006,7 +12006,7 @@ class ServiceDetailResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ServiceDetailResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12037,7 +12037,7 @@ class ServiceDetailResType(BodyBaseType):
             outfile.write('<%sServiceID>%s</%sServiceID>%s' % (namespaceprefix_ , self.gds_format_integer(self.ServiceID, input_name='ServiceID'), namespaceprefix_ , eol_))
         if self.ServiceParameterList is not None:
             namespaceprefix_ = self.ServiceParameterList_nsprefix_ + ':' if (UseCapturedNS_ and self.ServiceParameterList_nsprefix_) else ''
-            self.ServiceParameterList.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ServiceParameterList', pretty_print=pretty_print)
+            self.ServiceParameterList.export(outfile, level, 'ns5:', namespacedef_='', name_='ServiceParameterList', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -12090,9 +12090,9 @@ class PaymentServiceSelectionReqType(BodyBaseType):
         super(globals().get("PaymentServiceSelectionReqType"), self).__init__( **kwargs_)
         self.SelectedPaymentOption = SelectedPaymentOption
         self.validate_paymentOptionType(self.SelectedPaymentOption)
-        self.SelectedPaymentOption_nsprefix_ = "ns6"
+        self.SelectedPaymentOption_nsprefix_ = "ns5"
         self.SelectedServiceList = SelectedServiceList
-        self.SelectedServiceList_nsprefix_ = "ns6"
+        self.SelectedServiceList_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12140,7 +12140,7 @@ class PaymentServiceSelectionReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentServiceSelectionReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentServiceSelectionReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PaymentServiceSelectionReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12150,7 +12150,7 @@ class PaymentServiceSelectionReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PaymentServiceSelectionReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12177,7 +12177,7 @@ class PaymentServiceSelectionReqType(BodyBaseType):
             outfile.write('<%sSelectedPaymentOption>%s</%sSelectedPaymentOption>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.SelectedPaymentOption), input_name='SelectedPaymentOption')), namespaceprefix_ , eol_))
         if self.SelectedServiceList is not None:
             namespaceprefix_ = self.SelectedServiceList_nsprefix_ + ':' if (UseCapturedNS_ and self.SelectedServiceList_nsprefix_) else ''
-            self.SelectedServiceList.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SelectedServiceList', pretty_print=pretty_print)
+            self.SelectedServiceList.export(outfile, level, 'ns5:', namespacedef_='', name_='SelectedServiceList', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -12222,7 +12222,7 @@ class PaymentServiceSelectionResType(BodyBaseType):
         super(globals().get("PaymentServiceSelectionResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12265,7 +12265,7 @@ class PaymentServiceSelectionResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentServiceSelectionResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentServiceSelectionRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PaymentServiceSelectionResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12275,7 +12275,7 @@ class PaymentServiceSelectionResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PaymentServiceSelectionResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12339,9 +12339,9 @@ class PaymentDetailsReqType(BodyBaseType):
         super(globals().get("PaymentDetailsReqType"), self).__init__( **kwargs_)
         self.eMAID = eMAID
         self.validate_eMAIDType(self.eMAID)
-        self.eMAID_nsprefix_ = "ns6"
+        self.eMAID_nsprefix_ = "ns5"
         self.ContractSignatureCertChain = ContractSignatureCertChain
-        self.ContractSignatureCertChain_nsprefix_ = "ns6"
+        self.ContractSignatureCertChain_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12391,7 +12391,7 @@ class PaymentDetailsReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentDetailsReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PaymentDetailsReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PaymentDetailsReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12401,7 +12401,7 @@ class PaymentDetailsReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PaymentDetailsReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12428,7 +12428,7 @@ class PaymentDetailsReqType(BodyBaseType):
             outfile.write('<%seMAID>%s</%seMAID>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.eMAID), input_name='eMAID')), namespaceprefix_ , eol_))
         if self.ContractSignatureCertChain is not None:
             namespaceprefix_ = self.ContractSignatureCertChain_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureCertChain_nsprefix_) else ''
-            self.ContractSignatureCertChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
+            self.ContractSignatureCertChain.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -12473,12 +12473,12 @@ class PaymentDetailsResType(BodyBaseType):
         super(globals().get("PaymentDetailsResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.GenChallenge = GenChallenge
         self.validate_genChallengeType(self.GenChallenge)
-        self.GenChallenge_nsprefix_ = "ns6"
+        self.GenChallenge_nsprefix_ = "ns5"
         self.EVSETimeStamp = EVSETimeStamp
-        self.EVSETimeStamp_nsprefix_ = None
+        self.EVSETimeStamp_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12540,7 +12540,7 @@ class PaymentDetailsResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='PaymentDetailsResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='PaymentDetailsRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PaymentDetailsResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12550,7 +12550,7 @@ class PaymentDetailsResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PaymentDetailsResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12644,7 +12644,7 @@ class AuthorizationReqType(BodyBaseType):
         self.Id_nsprefix_ = None
         self.GenChallenge = GenChallenge
         self.validate_genChallengeType(self.GenChallenge)
-        self.GenChallenge_nsprefix_ = "ns6"
+        self.GenChallenge_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12685,7 +12685,7 @@ class AuthorizationReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='AuthorizationReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='AuthorizationReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('AuthorizationReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12695,7 +12695,7 @@ class AuthorizationReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'AuthorizationReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12712,7 +12712,7 @@ class AuthorizationReqType(BodyBaseType):
         super(AuthorizationReqType, self)._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='AuthorizationReqType')
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns5:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='AuthorizationReqType', fromsubclass_=False, pretty_print=True):
         super(AuthorizationReqType, self)._exportChildren(outfile, level, namespaceprefix_, namespacedef_, name_, True, pretty_print=pretty_print)
         if pretty_print:
@@ -12735,7 +12735,7 @@ class AuthorizationReqType(BodyBaseType):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgBody}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -12772,10 +12772,10 @@ class AuthorizationResType(BodyBaseType):
         super(globals().get("AuthorizationResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEProcessing = EVSEProcessing
         self.validate_EVSEProcessingType(self.EVSEProcessing)
-        self.EVSEProcessing_nsprefix_ = "ns6"
+        self.EVSEProcessing_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -12838,7 +12838,7 @@ class AuthorizationResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='AuthorizationResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='AuthorizationRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('AuthorizationResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12848,7 +12848,7 @@ class AuthorizationResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'AuthorizationResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -12923,10 +12923,10 @@ class ChargeParameterDiscoveryReqType(BodyBaseType):
         self.ns_prefix_ = None
         super(globals().get("ChargeParameterDiscoveryReqType"), self).__init__( **kwargs_)
         self.MaxEntriesSAScheduleTuple = MaxEntriesSAScheduleTuple
-        self.MaxEntriesSAScheduleTuple_nsprefix_ = None
+        self.MaxEntriesSAScheduleTuple_nsprefix_ = "ns5"
         self.RequestedEnergyTransferMode = RequestedEnergyTransferMode
         self.validate_EnergyTransferModeType(self.RequestedEnergyTransferMode)
-        self.RequestedEnergyTransferMode_nsprefix_ = "ns6"
+        self.RequestedEnergyTransferMode_nsprefix_ = "ns5"
         self.EVChargeParameter = EVChargeParameter
         self.EVChargeParameter_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
@@ -12981,7 +12981,7 @@ class ChargeParameterDiscoveryReqType(BodyBaseType):
             return True
         else:
             return FalseChargeParameterDiscoveryReq
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:None="urn:iso:15118:2:2013:MsgBody"  xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ChargeParameterDiscoveryReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:None="urn:iso:15118:2:2013:MsgBody"  xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ChargeParameterDiscoveryReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ChargeParameterDiscoveryReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -12991,7 +12991,7 @@ class ChargeParameterDiscoveryReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargeParameterDiscoveryReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13021,7 +13021,7 @@ class ChargeParameterDiscoveryReqType(BodyBaseType):
             showIndent(outfile, level, pretty_print)
             outfile.write('<%sRequestedEnergyTransferMode>%s</%sRequestedEnergyTransferMode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.RequestedEnergyTransferMode), input_name='RequestedEnergyTransferMode')), namespaceprefix_ , eol_))
         if self.EVChargeParameter is not None:
-            self.EVChargeParameter.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.EVChargeParameter.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -13096,10 +13096,10 @@ class ChargeParameterDiscoveryResType(BodyBaseType):
         super(globals().get("ChargeParameterDiscoveryResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEProcessing = EVSEProcessing
         self.validate_EVSEProcessingType(self.EVSEProcessing)
-        self.EVSEProcessing_nsprefix_ = "ns6"
+        self.EVSEProcessing_nsprefix_ = "ns5"
         self.SASchedules = SASchedules
         self.SASchedules_nsprefix_ = "ns6"
         self.EVSEChargeParameter = EVSEChargeParameter
@@ -13176,7 +13176,7 @@ class ChargeParameterDiscoveryResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ChargeParameterDiscoveryResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='ChargeParameterDiscoveryRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ChargeParameterDiscoveryResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -13186,7 +13186,7 @@ class ChargeParameterDiscoveryResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargeParameterDiscoveryResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13216,9 +13216,9 @@ class ChargeParameterDiscoveryResType(BodyBaseType):
             showIndent(outfile, level, pretty_print)
             outfile.write('<%sEVSEProcessing>%s</%sEVSEProcessing>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.EVSEProcessing), input_name='EVSEProcessing')), namespaceprefix_ , eol_))
         if self.SASchedules is not None:
-            self.SASchedules.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.SASchedules.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
         if self.EVSEChargeParameter is not None:
-            self.EVSEChargeParameter.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.EVSEChargeParameter.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -13319,12 +13319,12 @@ class PowerDeliveryReqType(BodyBaseType):
         super(globals().get("PowerDeliveryReqType"), self).__init__( **kwargs_)
         self.ChargeProgress = ChargeProgress
         self.validate_chargeProgressType(self.ChargeProgress)
-        self.ChargeProgress_nsprefix_ = "ns6"
+        self.ChargeProgress_nsprefix_ = "ns5"
         self.SAScheduleTupleID = SAScheduleTupleID
         self.validate_SAIDType(self.SAScheduleTupleID)
-        self.SAScheduleTupleID_nsprefix_ = "ns6"
+        self.SAScheduleTupleID_nsprefix_ = "ns5"
         self.ChargingProfile = ChargingProfile
-        self.ChargingProfile_nsprefix_ = "ns6"
+        self.ChargingProfile_nsprefix_ = "ns5"
         self.EVPowerDeliveryParameter = EVPowerDeliveryParameter
         self.EVPowerDeliveryParameter_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
@@ -13401,7 +13401,7 @@ class PowerDeliveryReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PowerDeliveryReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PowerDeliveryReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PowerDeliveryReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -13411,7 +13411,7 @@ class PowerDeliveryReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PowerDeliveryReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13442,9 +13442,9 @@ class PowerDeliveryReqType(BodyBaseType):
             outfile.write('<%sSAScheduleTupleID>%s</%sSAScheduleTupleID>%s' % (namespaceprefix_ , self.gds_format_integer(self.SAScheduleTupleID, input_name='SAScheduleTupleID'), namespaceprefix_ , eol_))
         if self.ChargingProfile is not None:
             namespaceprefix_ = self.ChargingProfile_nsprefix_ + ':' if (UseCapturedNS_ and self.ChargingProfile_nsprefix_) else ''
-            self.ChargingProfile.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ChargingProfile', pretty_print=pretty_print)
+            self.ChargingProfile.export(outfile, level, 'ns5:', namespacedef_='', name_='ChargingProfile', pretty_print=pretty_print)
         if self.EVPowerDeliveryParameter is not None:
-            self.EVPowerDeliveryParameter.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.EVPowerDeliveryParameter.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -13521,7 +13521,7 @@ class PowerDeliveryResType(BodyBaseType):
         super(globals().get("PowerDeliveryResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEStatus = EVSEStatus
         self.EVSEStatus_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
@@ -13571,7 +13571,7 @@ class PowerDeliveryResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PowerDeliveryResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PowerDeliveryRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PowerDeliveryResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -13581,7 +13581,7 @@ class PowerDeliveryResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PowerDeliveryResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13607,7 +13607,7 @@ class PowerDeliveryResType(BodyBaseType):
             showIndent(outfile, level, pretty_print)
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.EVSEStatus is not None:
-            self.EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.EVSEStatus.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -13678,12 +13678,12 @@ class MeteringReceiptReqType(BodyBaseType):
         self.Id_nsprefix_ = None
         self.SessionID = SessionID
         self.validate_sessionIDType(self.SessionID)
-        self.SessionID_nsprefix_ = "ns6"
+        self.SessionID_nsprefix_ = "ns5"
         self.SAScheduleTupleID = SAScheduleTupleID
         self.validate_SAIDType(self.SAScheduleTupleID)
-        self.SAScheduleTupleID_nsprefix_ = "ns6"
+        self.SAScheduleTupleID_nsprefix_ = "ns5"
         self.MeterInfo = MeterInfo
-        self.MeterInfo_nsprefix_ = "ns6"
+        self.MeterInfo_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -13755,7 +13755,7 @@ class MeteringReceiptReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='MeteringReceiptReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='MeteringReceiptReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('MeteringReceiptReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -13765,7 +13765,7 @@ class MeteringReceiptReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'MeteringReceiptReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13782,7 +13782,7 @@ class MeteringReceiptReqType(BodyBaseType):
         super(MeteringReceiptReqType, self)._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='MeteringReceiptReqType')
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns5:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='MeteringReceiptReqType', fromsubclass_=False, pretty_print=True):
         super(MeteringReceiptReqType, self)._exportChildren(outfile, level, namespaceprefix_, namespacedef_, name_, True, pretty_print=pretty_print)
         if pretty_print:
@@ -13799,7 +13799,7 @@ class MeteringReceiptReqType(BodyBaseType):
             outfile.write('<%sSAScheduleTupleID>%s</%sSAScheduleTupleID>%s' % (namespaceprefix_ , self.gds_format_integer(self.SAScheduleTupleID, input_name='SAScheduleTupleID'), namespaceprefix_ , eol_))
         if self.MeterInfo is not None:
             namespaceprefix_ = self.MeterInfo_nsprefix_ + ':' if (UseCapturedNS_ and self.MeterInfo_nsprefix_) else ''
-            self.MeterInfo.export(outfile, level, namespaceprefix_, namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
+            self.MeterInfo.export(outfile, level, 'ns5:', namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -13812,7 +13812,7 @@ class MeteringReceiptReqType(BodyBaseType):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgBody}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -13856,7 +13856,7 @@ class MeteringReceiptResType(BodyBaseType):
         super(globals().get("MeteringReceiptResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEStatus = EVSEStatus
         self.EVSEStatus_nsprefix_ = "ns6"
     def factory(*args_, **kwargs_):
@@ -13906,7 +13906,7 @@ class MeteringReceiptResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='MeteringReceiptResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='MeteringReceiptRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('MeteringReceiptResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -13916,7 +13916,7 @@ class MeteringReceiptResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'MeteringReceiptResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -13942,7 +13942,7 @@ class MeteringReceiptResType(BodyBaseType):
             showIndent(outfile, level, pretty_print)
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.EVSEStatus is not None:
-            self.EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', pretty_print=pretty_print)
+            self.EVSEStatus.export(outfile, level, 'ns6:', namespacedef_='', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -14011,7 +14011,7 @@ class SessionStopReqType(BodyBaseType):
         super(globals().get("SessionStopReqType"), self).__init__( **kwargs_)
         self.ChargingSession = ChargingSession
         self.validate_chargingSessionType(self.ChargingSession)
-        self.ChargingSession_nsprefix_ = "ns6"
+        self.ChargingSession_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14054,7 +14054,7 @@ class SessionStopReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionStopReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionStopReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SessionStopReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14064,7 +14064,7 @@ class SessionStopReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SessionStopReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14128,7 +14128,7 @@ class SessionStopResType(BodyBaseType):
         super(globals().get("SessionStopResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14171,7 +14171,7 @@ class SessionStopResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionStopResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='SessionStopRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('SessionStopResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14181,7 +14181,7 @@ class SessionStopResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'SessionStopResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14246,12 +14246,12 @@ class CertificateUpdateReqType(BodyBaseType):
         self.Id = _cast(None, Id)
         self.Id_nsprefix_ = None
         self.ContractSignatureCertChain = ContractSignatureCertChain
-        self.ContractSignatureCertChain_nsprefix_ = "ns6"
+        self.ContractSignatureCertChain_nsprefix_ = "ns5"
         self.eMAID = eMAID
         self.validate_eMAIDType(self.eMAID)
-        self.eMAID_nsprefix_ = "ns6"
+        self.eMAID_nsprefix_ = "ns5"
         self.ListOfRootCertificateIDs = ListOfRootCertificateIDs
-        self.ListOfRootCertificateIDs_nsprefix_ = "ns6"
+        self.ListOfRootCertificateIDs_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14310,7 +14310,7 @@ class CertificateUpdateReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateUpdateReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateUpdateReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CertificateUpdateReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14320,7 +14320,7 @@ class CertificateUpdateReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CertificateUpdateReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14337,7 +14337,7 @@ class CertificateUpdateReqType(BodyBaseType):
         super(CertificateUpdateReqType, self)._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CertificateUpdateReqType')
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns5:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateUpdateReqType', fromsubclass_=False, pretty_print=True):
         super(CertificateUpdateReqType, self)._exportChildren(outfile, level, namespaceprefix_, namespacedef_, name_, True, pretty_print=pretty_print)
         if pretty_print:
@@ -14346,14 +14346,14 @@ class CertificateUpdateReqType(BodyBaseType):
             eol_ = ''
         if self.ContractSignatureCertChain is not None:
             namespaceprefix_ = self.ContractSignatureCertChain_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureCertChain_nsprefix_) else ''
-            self.ContractSignatureCertChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
+            self.ContractSignatureCertChain.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
         if self.eMAID is not None:
             namespaceprefix_ = self.eMAID_nsprefix_ + ':' if (UseCapturedNS_ and self.eMAID_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
             outfile.write('<%seMAID>%s</%seMAID>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.eMAID), input_name='eMAID')), namespaceprefix_ , eol_))
         if self.ListOfRootCertificateIDs is not None:
             namespaceprefix_ = self.ListOfRootCertificateIDs_nsprefix_ + ':' if (UseCapturedNS_ and self.ListOfRootCertificateIDs_nsprefix_) else ''
-            self.ListOfRootCertificateIDs.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ListOfRootCertificateIDs', pretty_print=pretty_print)
+            self.ListOfRootCertificateIDs.export(outfile, level, 'ns5:', namespacedef_='', name_='ListOfRootCertificateIDs', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -14366,7 +14366,7 @@ class CertificateUpdateReqType(BodyBaseType):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgBody}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -14407,19 +14407,19 @@ class CertificateUpdateResType(BodyBaseType):
         super(globals().get("CertificateUpdateResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.SAProvisioningCertificateChain = SAProvisioningCertificateChain
-        self.SAProvisioningCertificateChain_nsprefix_ = "ns6"
+        self.SAProvisioningCertificateChain_nsprefix_ = "ns5"
         self.ContractSignatureCertChain = ContractSignatureCertChain
-        self.ContractSignatureCertChain_nsprefix_ = "ns6"
+        self.ContractSignatureCertChain_nsprefix_ = "ns5"
         self.ContractSignatureEncryptedPrivateKey = ContractSignatureEncryptedPrivateKey
-        self.ContractSignatureEncryptedPrivateKey_nsprefix_ = "ns6"
+        self.ContractSignatureEncryptedPrivateKey_nsprefix_ = "ns5"
         self.DHpublickey = DHpublickey
-        self.DHpublickey_nsprefix_ = "ns6"
+        self.DHpublickey_nsprefix_ = "ns5"
         self.eMAID = eMAID
-        self.eMAID_nsprefix_ = "ns6"
+        self.eMAID_nsprefix_ = "ns5"
         self.RetryCounter = RetryCounter
-        self.RetryCounter_nsprefix_ = None
+        self.RetryCounter_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14492,7 +14492,7 @@ class CertificateUpdateResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CertificateUpdateResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CertificateUpdateRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CertificateUpdateResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14502,7 +14502,7 @@ class CertificateUpdateResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CertificateUpdateResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14529,19 +14529,19 @@ class CertificateUpdateResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.SAProvisioningCertificateChain is not None:
             namespaceprefix_ = self.SAProvisioningCertificateChain_nsprefix_ + ':' if (UseCapturedNS_ and self.SAProvisioningCertificateChain_nsprefix_) else ''
-            self.SAProvisioningCertificateChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SAProvisioningCertificateChain', pretty_print=pretty_print)
+            self.SAProvisioningCertificateChain.export(outfile, level, 'ns5:', namespacedef_='', name_='SAProvisioningCertificateChain', pretty_print=pretty_print)
         if self.ContractSignatureCertChain is not None:
             namespaceprefix_ = self.ContractSignatureCertChain_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureCertChain_nsprefix_) else ''
-            self.ContractSignatureCertChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
+            self.ContractSignatureCertChain.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
         if self.ContractSignatureEncryptedPrivateKey is not None:
             namespaceprefix_ = self.ContractSignatureEncryptedPrivateKey_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureEncryptedPrivateKey_nsprefix_) else ''
-            self.ContractSignatureEncryptedPrivateKey.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureEncryptedPrivateKey', pretty_print=pretty_print)
+            self.ContractSignatureEncryptedPrivateKey.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureEncryptedPrivateKey', pretty_print=pretty_print)
         if self.DHpublickey is not None:
             namespaceprefix_ = self.DHpublickey_nsprefix_ + ':' if (UseCapturedNS_ and self.DHpublickey_nsprefix_) else ''
-            self.DHpublickey.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DHpublickey', pretty_print=pretty_print)
+            self.DHpublickey.export(outfile, level, 'ns5:', namespacedef_='', name_='DHpublickey', pretty_print=pretty_print)
         if self.eMAID is not None:
             namespaceprefix_ = self.eMAID_nsprefix_ + ':' if (UseCapturedNS_ and self.eMAID_nsprefix_) else ''
-            self.eMAID.export(outfile, level, namespaceprefix_, namespacedef_='', name_='eMAID', pretty_print=pretty_print)
+            self.eMAID.export(outfile, level, 'ns5:', namespacedef_='', name_='eMAID', pretty_print=pretty_print)
         if self.RetryCounter is not None:
             namespaceprefix_ = self.RetryCounter_nsprefix_ + ':' if (UseCapturedNS_ and self.RetryCounter_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -14618,9 +14618,9 @@ class CertificateInstallationReqType(BodyBaseType):
         self.Id_nsprefix_ = None
         self.OEMProvisioningCert = OEMProvisioningCert
         self.validate_certificateType(self.OEMProvisioningCert)
-        self.OEMProvisioningCert_nsprefix_ = "ns6"
+        self.OEMProvisioningCert_nsprefix_ = "ns5"
         self.ListOfRootCertificateIDs = ListOfRootCertificateIDs
-        self.ListOfRootCertificateIDs_nsprefix_ = "ns6"
+        self.ListOfRootCertificateIDs_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14666,7 +14666,7 @@ class CertificateInstallationReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateInstallationReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateInstallationReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CertificateInstallationReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14676,7 +14676,7 @@ class CertificateInstallationReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CertificateInstallationReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14693,7 +14693,7 @@ class CertificateInstallationReqType(BodyBaseType):
         super(CertificateInstallationReqType, self)._exportAttributes(outfile, level, already_processed, namespaceprefix_, name_='CertificateInstallationReqType')
         if self.Id is not None and 'Id' not in already_processed:
             already_processed.add('Id')
-            outfile.write(' Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
+            outfile.write(' ns5:Id=%s' % (self.gds_encode(self.gds_format_string(quote_attrib(self.Id), input_name='Id')), ))
     def _exportChildren(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateInstallationReqType', fromsubclass_=False, pretty_print=True):
         super(CertificateInstallationReqType, self)._exportChildren(outfile, level, namespaceprefix_, namespacedef_, name_, True, pretty_print=pretty_print)
         if pretty_print:
@@ -14706,7 +14706,7 @@ class CertificateInstallationReqType(BodyBaseType):
             outfile.write('<%sOEMProvisioningCert>%s</%sOEMProvisioningCert>%s' % (namespaceprefix_ , self.gds_format_base64(self.OEMProvisioningCert, input_name='OEMProvisioningCert'), namespaceprefix_ , eol_))
         if self.ListOfRootCertificateIDs is not None:
             namespaceprefix_ = self.ListOfRootCertificateIDs_nsprefix_ + ':' if (UseCapturedNS_ and self.ListOfRootCertificateIDs_nsprefix_) else ''
-            self.ListOfRootCertificateIDs.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ListOfRootCertificateIDs', pretty_print=pretty_print)
+            self.ListOfRootCertificateIDs.export(outfile, level, 'ns5:', namespacedef_='', name_='ListOfRootCertificateIDs', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -14719,7 +14719,7 @@ class CertificateInstallationReqType(BodyBaseType):
             self._buildChildren(child, node, nodeName_, gds_collector_=gds_collector_)
         return self
     def _buildAttributes(self, node, attrs, already_processed):
-        value = find_attr_value_('Id', node)
+        value = attrs.get('{urn:iso:15118:2:2013:MsgBody}Id', find_attr_value_('Id', node))
         if value is not None and 'Id' not in already_processed:
             already_processed.add('Id')
             self.Id = value
@@ -14761,17 +14761,17 @@ class CertificateInstallationResType(BodyBaseType):
         super(globals().get("CertificateInstallationResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.SAProvisioningCertificateChain = SAProvisioningCertificateChain
-        self.SAProvisioningCertificateChain_nsprefix_ = "ns6"
+        self.SAProvisioningCertificateChain_nsprefix_ = "ns5"
         self.ContractSignatureCertChain = ContractSignatureCertChain
-        self.ContractSignatureCertChain_nsprefix_ = "ns6"
+        self.ContractSignatureCertChain_nsprefix_ = "ns5"
         self.ContractSignatureEncryptedPrivateKey = ContractSignatureEncryptedPrivateKey
-        self.ContractSignatureEncryptedPrivateKey_nsprefix_ = "ns6"
+        self.ContractSignatureEncryptedPrivateKey_nsprefix_ = "ns5"
         self.DHpublickey = DHpublickey
-        self.DHpublickey_nsprefix_ = "ns6"
+        self.DHpublickey_nsprefix_ = "ns5"
         self.eMAID = eMAID
-        self.eMAID_nsprefix_ = "ns6"
+        self.eMAID_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -14839,7 +14839,7 @@ class CertificateInstallationResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateInstallationResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CertificateInstallationRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CertificateInstallationResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14849,7 +14849,7 @@ class CertificateInstallationResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CertificateInstallationResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -14876,19 +14876,19 @@ class CertificateInstallationResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.SAProvisioningCertificateChain is not None:
             namespaceprefix_ = self.SAProvisioningCertificateChain_nsprefix_ + ':' if (UseCapturedNS_ and self.SAProvisioningCertificateChain_nsprefix_) else ''
-            self.SAProvisioningCertificateChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='SAProvisioningCertificateChain', pretty_print=pretty_print)
+            self.SAProvisioningCertificateChain.export(outfile, level, 'ns5:', namespacedef_='', name_='SAProvisioningCertificateChain', pretty_print=pretty_print)
         if self.ContractSignatureCertChain is not None:
             namespaceprefix_ = self.ContractSignatureCertChain_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureCertChain_nsprefix_) else ''
-            self.ContractSignatureCertChain.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
+            self.ContractSignatureCertChain.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureCertChain', pretty_print=pretty_print)
         if self.ContractSignatureEncryptedPrivateKey is not None:
             namespaceprefix_ = self.ContractSignatureEncryptedPrivateKey_nsprefix_ + ':' if (UseCapturedNS_ and self.ContractSignatureEncryptedPrivateKey_nsprefix_) else ''
-            self.ContractSignatureEncryptedPrivateKey.export(outfile, level, namespaceprefix_, namespacedef_='', name_='ContractSignatureEncryptedPrivateKey', pretty_print=pretty_print)
+            self.ContractSignatureEncryptedPrivateKey.export(outfile, level, 'ns5:', namespacedef_='', name_='ContractSignatureEncryptedPrivateKey', pretty_print=pretty_print)
         if self.DHpublickey is not None:
             namespaceprefix_ = self.DHpublickey_nsprefix_ + ':' if (UseCapturedNS_ and self.DHpublickey_nsprefix_) else ''
-            self.DHpublickey.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DHpublickey', pretty_print=pretty_print)
+            self.DHpublickey.export(outfile, level, 'ns5:', namespacedef_='', name_='DHpublickey', pretty_print=pretty_print)
         if self.eMAID is not None:
             namespaceprefix_ = self.eMAID_nsprefix_ + ':' if (UseCapturedNS_ and self.eMAID_nsprefix_) else ''
-            self.eMAID.export(outfile, level, namespaceprefix_, namespacedef_='', name_='eMAID', pretty_print=pretty_print)
+            self.eMAID.export(outfile, level, 'ns5:', namespacedef_='', name_='eMAID', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -14973,7 +14973,7 @@ class ChargingStatusReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody"', name_='ChargingStatusReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody"', name_='ChargingStatusReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ChargingStatusReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -14983,7 +14983,7 @@ class ChargingStatusReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargingStatusReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15032,21 +15032,21 @@ class ChargingStatusResType(BodyBaseType):
         super(globals().get("ChargingStatusResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.EVSEID = EVSEID
         self.validate_evseIDType(self.EVSEID)
-        self.EVSEID_nsprefix_ = "ns6"
+        self.EVSEID_nsprefix_ = "ns5"
         self.SAScheduleTupleID = SAScheduleTupleID
         self.validate_SAIDType(self.SAScheduleTupleID)
-        self.SAScheduleTupleID_nsprefix_ = "ns6"
+        self.SAScheduleTupleID_nsprefix_ = "ns5"
         self.EVSEMaxCurrent = EVSEMaxCurrent
-        self.EVSEMaxCurrent_nsprefix_ = "ns6"
+        self.EVSEMaxCurrent_nsprefix_ = "ns5"
         self.MeterInfo = MeterInfo
-        self.MeterInfo_nsprefix_ = "ns6"
+        self.MeterInfo_nsprefix_ = "ns5"
         self.ReceiptRequired = ReceiptRequired
-        self.ReceiptRequired_nsprefix_ = None
+        self.ReceiptRequired_nsprefix_ = "ns5"
         self.AC_EVSEStatus = AC_EVSEStatus
-        self.AC_EVSEStatus_nsprefix_ = "ns6"
+        self.AC_EVSEStatus_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15153,7 +15153,7 @@ class ChargingStatusResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='ChargingStatusResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='ChargingStatusRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('ChargingStatusResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15163,7 +15163,7 @@ class ChargingStatusResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'ChargingStatusResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15198,17 +15198,17 @@ class ChargingStatusResType(BodyBaseType):
             outfile.write('<%sSAScheduleTupleID>%s</%sSAScheduleTupleID>%s' % (namespaceprefix_ , self.gds_format_integer(self.SAScheduleTupleID, input_name='SAScheduleTupleID'), namespaceprefix_ , eol_))
         if self.EVSEMaxCurrent is not None:
             namespaceprefix_ = self.EVSEMaxCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaxCurrent_nsprefix_) else ''
-            self.EVSEMaxCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaxCurrent', pretty_print=pretty_print)
+            self.EVSEMaxCurrent.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEMaxCurrent', pretty_print=pretty_print)
         if self.MeterInfo is not None:
             namespaceprefix_ = self.MeterInfo_nsprefix_ + ':' if (UseCapturedNS_ and self.MeterInfo_nsprefix_) else ''
-            self.MeterInfo.export(outfile, level, namespaceprefix_, namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
+            self.MeterInfo.export(outfile, level, 'ns5:', namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
         if self.ReceiptRequired is not None:
             namespaceprefix_ = self.ReceiptRequired_nsprefix_ + ':' if (UseCapturedNS_ and self.ReceiptRequired_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
             outfile.write('<%sReceiptRequired>%s</%sReceiptRequired>%s' % (namespaceprefix_ , self.gds_format_boolean(self.ReceiptRequired, input_name='ReceiptRequired'), namespaceprefix_ , eol_))
         if self.AC_EVSEStatus is not None:
             namespaceprefix_ = self.AC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.AC_EVSEStatus_nsprefix_) else ''
-            self.AC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='AC_EVSEStatus', pretty_print=pretty_print)
+            self.AC_EVSEStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='AC_EVSEStatus', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -15284,7 +15284,7 @@ class CableCheckReqType(BodyBaseType):
         self.ns_prefix_ = "ns5"
         super(globals().get("CableCheckReqType"), self).__init__( **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = "ns6"
+        self.DC_EVStatus_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15312,7 +15312,7 @@ class CableCheckReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CableCheckReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CableCheckReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CableCheckReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15322,7 +15322,7 @@ class CableCheckReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CableCheckReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15345,7 +15345,7 @@ class CableCheckReqType(BodyBaseType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -15382,12 +15382,12 @@ class CableCheckResType(BodyBaseType):
         super(globals().get("CableCheckResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.DC_EVSEStatus = DC_EVSEStatus
-        self.DC_EVSEStatus_nsprefix_ = "ns6"
+        self.DC_EVSEStatus_nsprefix_ = "ns5"
         self.EVSEProcessing = EVSEProcessing
         self.validate_EVSEProcessingType(self.EVSEProcessing)
-        self.EVSEProcessing_nsprefix_ = "ns6"
+        self.EVSEProcessing_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15455,7 +15455,7 @@ class CableCheckResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CableCheckResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='CableCheckRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CableCheckResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15465,7 +15465,7 @@ class CableCheckResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CableCheckResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15492,7 +15492,7 @@ class CableCheckResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.DC_EVSEStatus is not None:
             namespaceprefix_ = self.DC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVSEStatus_nsprefix_) else ''
-            self.DC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
+            self.DC_EVSEStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSEProcessing is not None:
             namespaceprefix_ = self.EVSEProcessing_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEProcessing_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -15548,11 +15548,11 @@ class PreChargeReqType(BodyBaseType):
         self.ns_prefix_ = "ns5"
         super(globals().get("PreChargeReqType"), self).__init__( **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = "ns6"
+        self.DC_EVStatus_nsprefix_ = "ns5"
         self.EVTargetVoltage = EVTargetVoltage
-        self.EVTargetVoltage_nsprefix_ = "ns6"
+        self.EVTargetVoltage_nsprefix_ = "ns5"
         self.EVTargetCurrent = EVTargetCurrent
-        self.EVTargetCurrent_nsprefix_ = "ns6"
+        self.EVTargetCurrent_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15590,7 +15590,7 @@ class PreChargeReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PreChargeReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PreChargeReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PreChargeReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15600,7 +15600,7 @@ class PreChargeReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PreChargeReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15623,13 +15623,13 @@ class PreChargeReqType(BodyBaseType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
         if self.EVTargetVoltage is not None:
             namespaceprefix_ = self.EVTargetVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVTargetVoltage_nsprefix_) else ''
-            self.EVTargetVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVTargetVoltage', pretty_print=pretty_print)
+            self.EVTargetVoltage.export(outfile, level, 'ns5:', namespacedef_='', name_='EVTargetVoltage', pretty_print=pretty_print)
         if self.EVTargetCurrent is not None:
             namespaceprefix_ = self.EVTargetCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVTargetCurrent_nsprefix_) else ''
-            self.EVTargetCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVTargetCurrent', pretty_print=pretty_print)
+            self.EVTargetCurrent.export(outfile, level, 'ns5:', namespacedef_='', name_='EVTargetCurrent', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -15676,11 +15676,11 @@ class PreChargeResType(BodyBaseType):
         super(globals().get("PreChargeResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.DC_EVSEStatus = DC_EVSEStatus
-        self.DC_EVSEStatus_nsprefix_ = "ns6"
+        self.DC_EVSEStatus_nsprefix_ = "ns5"
         self.EVSEPresentVoltage = EVSEPresentVoltage
-        self.EVSEPresentVoltage_nsprefix_ = "ns6"
+        self.EVSEPresentVoltage_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15733,7 +15733,7 @@ class PreChargeResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PreChargeResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='PreChargeRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('PreChargeResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15743,7 +15743,7 @@ class PreChargeResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'PreChargeResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15770,10 +15770,10 @@ class PreChargeResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.DC_EVSEStatus is not None:
             namespaceprefix_ = self.DC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVSEStatus_nsprefix_) else ''
-            self.DC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
+            self.DC_EVSEStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSEPresentVoltage is not None:
             namespaceprefix_ = self.EVSEPresentVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEPresentVoltage_nsprefix_) else ''
-            self.EVSEPresentVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
+            self.EVSEPresentVoltage.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -15822,25 +15822,25 @@ class CurrentDemandReqType(BodyBaseType):
         self.ns_prefix_ = None
         super(globals().get("CurrentDemandReqType"), self).__init__( **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = "ns6"
+        self.DC_EVStatus_nsprefix_ = "ns5"
         self.EVTargetCurrent = EVTargetCurrent
-        self.EVTargetCurrent_nsprefix_ = "ns6"
+        self.EVTargetCurrent_nsprefix_ = "ns5"
         self.EVMaximumVoltageLimit = EVMaximumVoltageLimit
-        self.EVMaximumVoltageLimit_nsprefix_ = "ns6"
+        self.EVMaximumVoltageLimit_nsprefix_ = "ns5"
         self.EVMaximumCurrentLimit = EVMaximumCurrentLimit
-        self.EVMaximumCurrentLimit_nsprefix_ = "ns6"
+        self.EVMaximumCurrentLimit_nsprefix_ = "ns5"
         self.EVMaximumPowerLimit = EVMaximumPowerLimit
-        self.EVMaximumPowerLimit_nsprefix_ = "ns6"
+        self.EVMaximumPowerLimit_nsprefix_ = "ns5"
         self.BulkChargingComplete = BulkChargingComplete
-        self.BulkChargingComplete_nsprefix_ = None
+        self.BulkChargingComplete_nsprefix_ = "ns5"
         self.ChargingComplete = ChargingComplete
-        self.ChargingComplete_nsprefix_ = None
+        self.ChargingComplete_nsprefix_ = "ns5"
         self.RemainingTimeToFullSoC = RemainingTimeToFullSoC
-        self.RemainingTimeToFullSoC_nsprefix_ = "ns6"
+        self.RemainingTimeToFullSoC_nsprefix_ = "ns5"
         self.RemainingTimeToBulkSoC = RemainingTimeToBulkSoC
-        self.RemainingTimeToBulkSoC_nsprefix_ = "ns6"
+        self.RemainingTimeToBulkSoC_nsprefix_ = "ns5"
         self.EVTargetVoltage = EVTargetVoltage
-        self.EVTargetVoltage_nsprefix_ = "ns6"
+        self.EVTargetVoltage_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -15913,7 +15913,7 @@ class CurrentDemandReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CurrentDemandReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CurrentDemandReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CurrentDemandReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -15923,7 +15923,7 @@ class CurrentDemandReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CurrentDemandReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -15946,19 +15946,19 @@ class CurrentDemandReqType(BodyBaseType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
         if self.EVTargetCurrent is not None:
             namespaceprefix_ = self.EVTargetCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVTargetCurrent_nsprefix_) else ''
-            self.EVTargetCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVTargetCurrent', pretty_print=pretty_print)
+            self.EVTargetCurrent.export(outfile, level, 'ns5:', namespacedef_='', name_='EVTargetCurrent', pretty_print=pretty_print)
         if self.EVMaximumVoltageLimit is not None:
             namespaceprefix_ = self.EVMaximumVoltageLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumVoltageLimit_nsprefix_) else ''
-            self.EVMaximumVoltageLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumVoltageLimit', pretty_print=pretty_print)
+            self.EVMaximumVoltageLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVMaximumVoltageLimit', pretty_print=pretty_print)
         if self.EVMaximumCurrentLimit is not None:
             namespaceprefix_ = self.EVMaximumCurrentLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumCurrentLimit_nsprefix_) else ''
-            self.EVMaximumCurrentLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumCurrentLimit', pretty_print=pretty_print)
+            self.EVMaximumCurrentLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVMaximumCurrentLimit', pretty_print=pretty_print)
         if self.EVMaximumPowerLimit is not None:
             namespaceprefix_ = self.EVMaximumPowerLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVMaximumPowerLimit_nsprefix_) else ''
-            self.EVMaximumPowerLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVMaximumPowerLimit', pretty_print=pretty_print)
+            self.EVMaximumPowerLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVMaximumPowerLimit', pretty_print=pretty_print)
         if self.BulkChargingComplete is not None:
             namespaceprefix_ = self.BulkChargingComplete_nsprefix_ + ':' if (UseCapturedNS_ and self.BulkChargingComplete_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -15969,13 +15969,13 @@ class CurrentDemandReqType(BodyBaseType):
             outfile.write('<%sChargingComplete>%s</%sChargingComplete>%s' % (namespaceprefix_ , self.gds_format_boolean(self.ChargingComplete, input_name='ChargingComplete'), namespaceprefix_ , eol_))
         if self.RemainingTimeToFullSoC is not None:
             namespaceprefix_ = self.RemainingTimeToFullSoC_nsprefix_ + ':' if (UseCapturedNS_ and self.RemainingTimeToFullSoC_nsprefix_) else ''
-            self.RemainingTimeToFullSoC.export(outfile, level, namespaceprefix_, namespacedef_='', name_='RemainingTimeToFullSoC', pretty_print=pretty_print)
+            self.RemainingTimeToFullSoC.export(outfile, level, 'ns5:', namespacedef_='', name_='RemainingTimeToFullSoC', pretty_print=pretty_print)
         if self.RemainingTimeToBulkSoC is not None:
             namespaceprefix_ = self.RemainingTimeToBulkSoC_nsprefix_ + ':' if (UseCapturedNS_ and self.RemainingTimeToBulkSoC_nsprefix_) else ''
-            self.RemainingTimeToBulkSoC.export(outfile, level, namespaceprefix_, namespacedef_='', name_='RemainingTimeToBulkSoC', pretty_print=pretty_print)
+            self.RemainingTimeToBulkSoC.export(outfile, level, 'ns5:', namespacedef_='', name_='RemainingTimeToBulkSoC', pretty_print=pretty_print)
         if self.EVTargetVoltage is not None:
             namespaceprefix_ = self.EVTargetVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVTargetVoltage_nsprefix_) else ''
-            self.EVTargetVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVTargetVoltage', pretty_print=pretty_print)
+            self.EVTargetVoltage.export(outfile, level, 'ns5:', namespacedef_='', name_='EVTargetVoltage', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -16059,35 +16059,35 @@ class CurrentDemandResType(BodyBaseType):
         super(globals().get("CurrentDemandResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.DC_EVSEStatus = DC_EVSEStatus
-        self.DC_EVSEStatus_nsprefix_ = "ns6"
+        self.DC_EVSEStatus_nsprefix_ = "ns5"
         self.EVSEPresentVoltage = EVSEPresentVoltage
-        self.EVSEPresentVoltage_nsprefix_ = "ns6"
+        self.EVSEPresentVoltage_nsprefix_ = "ns5"
         self.EVSEPresentCurrent = EVSEPresentCurrent
-        self.EVSEPresentCurrent_nsprefix_ = "ns6"
+        self.EVSEPresentCurrent_nsprefix_ = "ns5"
         self.EVSECurrentLimitAchieved = EVSECurrentLimitAchieved
-        self.EVSECurrentLimitAchieved_nsprefix_ = None
+        self.EVSECurrentLimitAchieved_nsprefix_ = "ns5"
         self.EVSEVoltageLimitAchieved = EVSEVoltageLimitAchieved
-        self.EVSEVoltageLimitAchieved_nsprefix_ = None
+        self.EVSEVoltageLimitAchieved_nsprefix_ = "ns5"
         self.EVSEPowerLimitAchieved = EVSEPowerLimitAchieved
-        self.EVSEPowerLimitAchieved_nsprefix_ = None
+        self.EVSEPowerLimitAchieved_nsprefix_ = "ns5"
         self.EVSEMaximumVoltageLimit = EVSEMaximumVoltageLimit
-        self.EVSEMaximumVoltageLimit_nsprefix_ = "ns6"
+        self.EVSEMaximumVoltageLimit_nsprefix_ = "ns5"
         self.EVSEMaximumCurrentLimit = EVSEMaximumCurrentLimit
-        self.EVSEMaximumCurrentLimit_nsprefix_ = "ns6"
+        self.EVSEMaximumCurrentLimit_nsprefix_ = "ns5"
         self.EVSEMaximumPowerLimit = EVSEMaximumPowerLimit
-        self.EVSEMaximumPowerLimit_nsprefix_ = "ns6"
+        self.EVSEMaximumPowerLimit_nsprefix_ = "ns5"
         self.EVSEID = EVSEID
         self.validate_evseIDType(self.EVSEID)
-        self.EVSEID_nsprefix_ = "ns6"
+        self.EVSEID_nsprefix_ = "ns5"
         self.SAScheduleTupleID = SAScheduleTupleID
         self.validate_SAIDType(self.SAScheduleTupleID)
-        self.SAScheduleTupleID_nsprefix_ = "ns6"
+        self.SAScheduleTupleID_nsprefix_ = "ns5"
         self.MeterInfo = MeterInfo
-        self.MeterInfo_nsprefix_ = "ns6"
+        self.MeterInfo_nsprefix_ = "ns5"
         self.ReceiptRequired = ReceiptRequired
-        self.ReceiptRequired_nsprefix_ = None
+        self.ReceiptRequired_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -16229,7 +16229,7 @@ class CurrentDemandResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CurrentDemandResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes"  xmlns:None="urn:iso:15118:2:2013:MsgBody" ', name_='CurrentDemandRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('CurrentDemandResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -16239,7 +16239,7 @@ class CurrentDemandResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'CurrentDemandResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -16266,13 +16266,13 @@ class CurrentDemandResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.DC_EVSEStatus is not None:
             namespaceprefix_ = self.DC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVSEStatus_nsprefix_) else ''
-            self.DC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
+            self.DC_EVSEStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSEPresentVoltage is not None:
             namespaceprefix_ = self.EVSEPresentVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEPresentVoltage_nsprefix_) else ''
-            self.EVSEPresentVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
+            self.EVSEPresentVoltage.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
         if self.EVSEPresentCurrent is not None:
             namespaceprefix_ = self.EVSEPresentCurrent_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEPresentCurrent_nsprefix_) else ''
-            self.EVSEPresentCurrent.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEPresentCurrent', pretty_print=pretty_print)
+            self.EVSEPresentCurrent.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEPresentCurrent', pretty_print=pretty_print)
         if self.EVSECurrentLimitAchieved is not None:
             namespaceprefix_ = self.EVSECurrentLimitAchieved_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSECurrentLimitAchieved_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -16287,13 +16287,13 @@ class CurrentDemandResType(BodyBaseType):
             outfile.write('<%sEVSEPowerLimitAchieved>%s</%sEVSEPowerLimitAchieved>%s' % (namespaceprefix_ , self.gds_format_boolean(self.EVSEPowerLimitAchieved, input_name='EVSEPowerLimitAchieved'), namespaceprefix_ , eol_))
         if self.EVSEMaximumVoltageLimit is not None:
             namespaceprefix_ = self.EVSEMaximumVoltageLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumVoltageLimit_nsprefix_) else ''
-            self.EVSEMaximumVoltageLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumVoltageLimit', pretty_print=pretty_print)
+            self.EVSEMaximumVoltageLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEMaximumVoltageLimit', pretty_print=pretty_print)
         if self.EVSEMaximumCurrentLimit is not None:
             namespaceprefix_ = self.EVSEMaximumCurrentLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumCurrentLimit_nsprefix_) else ''
-            self.EVSEMaximumCurrentLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumCurrentLimit', pretty_print=pretty_print)
+            self.EVSEMaximumCurrentLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEMaximumCurrentLimit', pretty_print=pretty_print)
         if self.EVSEMaximumPowerLimit is not None:
             namespaceprefix_ = self.EVSEMaximumPowerLimit_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEMaximumPowerLimit_nsprefix_) else ''
-            self.EVSEMaximumPowerLimit.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEMaximumPowerLimit', pretty_print=pretty_print)
+            self.EVSEMaximumPowerLimit.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEMaximumPowerLimit', pretty_print=pretty_print)
         if self.EVSEID is not None:
             namespaceprefix_ = self.EVSEID_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEID_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -16304,7 +16304,7 @@ class CurrentDemandResType(BodyBaseType):
             outfile.write('<%sSAScheduleTupleID>%s</%sSAScheduleTupleID>%s' % (namespaceprefix_ , self.gds_format_integer(self.SAScheduleTupleID, input_name='SAScheduleTupleID'), namespaceprefix_ , eol_))
         if self.MeterInfo is not None:
             namespaceprefix_ = self.MeterInfo_nsprefix_ + ':' if (UseCapturedNS_ and self.MeterInfo_nsprefix_) else ''
-            self.MeterInfo.export(outfile, level, namespaceprefix_, namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
+            self.MeterInfo.export(outfile, level, 'ns5:', namespacedef_='', name_='MeterInfo', pretty_print=pretty_print)
         if self.ReceiptRequired is not None:
             namespaceprefix_ = self.ReceiptRequired_nsprefix_ + ':' if (UseCapturedNS_ and self.ReceiptRequired_nsprefix_) else ''
             showIndent(outfile, level, pretty_print)
@@ -16422,7 +16422,7 @@ class WeldingDetectionReqType(BodyBaseType):
         self.ns_prefix_ = "ns5"
         super(globals().get("WeldingDetectionReqType"), self).__init__( **kwargs_)
         self.DC_EVStatus = DC_EVStatus
-        self.DC_EVStatus_nsprefix_ = "ns6"
+        self.DC_EVStatus_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -16450,7 +16450,7 @@ class WeldingDetectionReqType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='WeldingDetectionReqType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='WeldingDetectionReq', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('WeldingDetectionReqType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -16460,7 +16460,7 @@ class WeldingDetectionReqType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'WeldingDetectionReqType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -16483,7 +16483,7 @@ class WeldingDetectionReqType(BodyBaseType):
             eol_ = ''
         if self.DC_EVStatus is not None:
             namespaceprefix_ = self.DC_EVStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVStatus_nsprefix_) else ''
-            self.DC_EVStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
+            self.DC_EVStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVStatus', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -16520,11 +16520,11 @@ class WeldingDetectionResType(BodyBaseType):
         super(globals().get("WeldingDetectionResType"), self).__init__( **kwargs_)
         self.ResponseCode = ResponseCode
         self.validate_responseCodeType(self.ResponseCode)
-        self.ResponseCode_nsprefix_ = "ns6"
+        self.ResponseCode_nsprefix_ = "ns5"
         self.DC_EVSEStatus = DC_EVSEStatus
-        self.DC_EVSEStatus_nsprefix_ = "ns6"
+        self.DC_EVSEStatus_nsprefix_ = "ns5"
         self.EVSEPresentVoltage = EVSEPresentVoltage
-        self.EVSEPresentVoltage_nsprefix_ = "ns6"
+        self.EVSEPresentVoltage_nsprefix_ = "ns5"
     def factory(*args_, **kwargs_):
         if CurrentSubclassModule_ is not None:
             subclass = getSubclassFromModule_(
@@ -16577,7 +16577,7 @@ class WeldingDetectionResType(BodyBaseType):
             return True
         else:
             return False
-    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='WeldingDetectionResType', pretty_print=True):
+    def export(self, outfile, level, namespaceprefix_='', namespacedef_='xmlns:ns5="urn:iso:15118:2:2013:MsgBody" xmlns:ns6="urn:iso:15118:2:2013:MsgDataTypes" ', name_='WeldingDetectionRes', pretty_print=True):
         imported_ns_def_ = GenerateDSNamespaceDefs_.get('WeldingDetectionResType')
         if imported_ns_def_ is not None:
             namespacedef_ = imported_ns_def_
@@ -16587,7 +16587,7 @@ class WeldingDetectionResType(BodyBaseType):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'WeldingDetectionResType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
@@ -16614,10 +16614,10 @@ class WeldingDetectionResType(BodyBaseType):
             outfile.write('<%sResponseCode>%s</%sResponseCode>%s' % (namespaceprefix_ , self.gds_encode(self.gds_format_string(quote_xml(self.ResponseCode), input_name='ResponseCode')), namespaceprefix_ , eol_))
         if self.DC_EVSEStatus is not None:
             namespaceprefix_ = self.DC_EVSEStatus_nsprefix_ + ':' if (UseCapturedNS_ and self.DC_EVSEStatus_nsprefix_) else ''
-            self.DC_EVSEStatus.export(outfile, level, namespaceprefix_, namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
+            self.DC_EVSEStatus.export(outfile, level, 'ns5:', namespacedef_='', name_='DC_EVSEStatus', pretty_print=pretty_print)
         if self.EVSEPresentVoltage is not None:
             namespaceprefix_ = self.EVSEPresentVoltage_nsprefix_ + ':' if (UseCapturedNS_ and self.EVSEPresentVoltage_nsprefix_) else ''
-            self.EVSEPresentVoltage.export(outfile, level, namespaceprefix_, namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
+            self.EVSEPresentVoltage.export(outfile, level, 'ns5:', namespacedef_='', name_='EVSEPresentVoltage', pretty_print=pretty_print)
     def build(self, node, gds_collector_=None):
         self.gds_collector_ = gds_collector_
         if SaveElementTreeNode:
@@ -16705,7 +16705,7 @@ class DigestValueType(GeneratedsSuper):
             eol_ = ''
         if self.original_tagname_ is not None and name_ == 'DigestValueType':
             name_ = self.original_tagname_
-        if UseCapturedNS_ and self.ns_prefix_:
+        if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:
             namespaceprefix_ = self.ns_prefix_ + ':'
         showIndent(outfile, level, pretty_print)
         outfile.write('<%s%s%s' % (namespaceprefix_, name_, namespacedef_ and ' ' + namespacedef_ or '', ))
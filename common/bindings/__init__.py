@@ -0,0 +1,51 @@
+"""Shared generateDS bindings, loaded on first use.
+
+common/XML/msgDef1.py defines every type of V2G_CI_MsgDef.xsd and the schemas
+it imports, once. The constructed messages and the ones the parser returns are
+instances of the same classes. The child and attribute prefixes of msgDef1 are
+rewritten from the schema by common.bindings.namespaces.
+
+Nothing is imported together with the package. Attributes are resolved on
+first access through the module level __getattr__ (PEP 562) and then cached
+in the module namespace:
+
+    from common import bindings
+    bindings.PhysicalValueType          # loads msgDef1 once
+    bindings.appprotocol1               # loads only appprotocol1
+    bindings.msgDef1.parseString(data)
+
+The AppProtocol types (V2G_CI_AppProtocol.xsd) are a separate schema with
+clashing names (responseCodeType), they stay in bindings.appprotocol1.
+
+bindings.compact holds __slots__ versions of the charging loop messages.
+"""
+import importlib
+import sys
+
+_MODULES = {
+    'msgDef1': 'common.XML.msgDef1',
+    'appprotocol1': 'common.XML.appprotocol1',
+    'compact': 'common.bindings.compact',
+}
+
+
+def __getattr__(name):
+    if name in _MODULES:
+        value = importlib.import_module(_MODULES[name])
+    elif name.startswith('__'):
+        raise AttributeError(name)
+    else:
+        module = importlib.import_module(_MODULES['msgDef1'])
+        try:
+            value = getattr(module, name)
+        except AttributeError:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    names = set(globals()) | set(_MODULES)
+    if _MODULES['msgDef1'] in sys.modules:
+        names.update(dir(sys.modules[_MODULES['msgDef1']]))
+    return sorted(names)
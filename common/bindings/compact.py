@@ -0,0 +1,228 @@
+"""__slots__ models of the messages exchanged in the charging loop
+(CurrentDemandReq/Res, ChargingStatusReq/Res).
+
+A generateDS object keeps a __dict__ with its collector, element tree node,
+tag, parent and one namespace prefix per field, and with SaveElementTreeNode
+every parsed message also keeps its lxml tree alive. The classes below only
+store the schema fields. They take the same arguments as the generateDS
+classes of the same name, and V2G_Message has the get_Header()/get_Body()
+accessors the message handlers use:
+
+    value = compact.PhysicalValueType(0, 'A', 125)
+    message = compact.from_v2g_message(parsed)     # bindings.V2G_Message
+    message.get_Body().BodyElement.DC_EVStatus.EVRESSSOC
+    message.to_binding()                           # back to bindings.V2G_Message
+
+exi_utils.receiveAndCheckMessageType hands the received charging loop
+messages to the handlers in this form (exi_utils.COMPACT_LOOP_MESSAGES), the
+Python codec builds them while decoding (common.exi.objects.CompactBuilder).
+
+from_v2g_message/to_v2g_message convert losslessly between both forms.
+Fields that are not modelled here (Notification and Signature of the header)
+are kept as the generateDS objects.
+"""
+from common import bindings
+
+
+def _names(fields):
+    return tuple(name for name, _ in fields)
+
+
+class CompactType():
+    """Base class of the compact types
+
+    FIELDS lists (name, compact type or None for simple values) in schema
+    order, BINDING is the name of the generateDS class and TAG the element
+    name given to it as original_tagname_
+    """
+    __slots__ = ()
+    FIELDS = ()
+    BINDING = None
+    TAG = None
+
+    def __init__(self, *args, **kwargs):
+        if len(args) > len(self.FIELDS):
+            raise TypeError("{} takes at most {} arguments".format(
+                type(self).__name__, len(self.FIELDS)))
+        for index, (name, _) in enumerate(self.FIELDS):
+            setattr(self, name, args[index] if index < len(args) else kwargs.pop(name, None))
+        if kwargs:
+            raise TypeError("{} has no field {}".format(type(self).__name__, ', '.join(kwargs)))
+
+    @classmethod
+    def from_binding(cls, obj):
+        """Compact copy of a generateDS object, None stays None"""
+        if obj is None:
+            return None
+        self = cls.__new__(cls)
+        for name, kind in cls.FIELDS:
+            value = getattr(obj, name)
+            if kind is not None:
+                value = kind.from_binding(value)
+            setattr(self, name, value)
+        return self
+
+    def to_binding(self):
+        """Equivalent generateDS object"""
+        kwargs = {}
+        for name, kind in self.FIELDS:
+            value = getattr(self, name)
+            if kind is not None and value is not None:
+                value = value.to_binding()
+            kwargs[name] = value
+        obj = getattr(bindings, self.BINDING)(**kwargs)
+        if self.TAG is not None:
+            obj.original_tagname_ = self.TAG
+        return obj
+
+    @property
+    def original_tagname_(self):
+        return self.TAG
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self):
+        return "{}({})".format(type(self).__name__, ', '.join(
+            "{}={!r}".format(name, getattr(self, name)) for name in self.__slots__))
+
+
+class PhysicalValueType(CompactType):
+    FIELDS = (('Multiplier', None), ('Unit', None), ('Value', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'PhysicalValueType'
+
+
+class DC_EVStatusType(CompactType):
+    FIELDS = (('EVReady', None), ('EVErrorCode', None), ('EVRESSSOC', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'DC_EVStatusType'
+
+
+class DC_EVSEStatusType(CompactType):
+    FIELDS = (('NotificationMaxDelay', None), ('EVSENotification', None),
+              ('EVSEIsolationStatus', None), ('EVSEStatusCode', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'DC_EVSEStatusType'
+    TAG = 'DC_EVSEStatus'
+
+
+class AC_EVSEStatusType(CompactType):
+    FIELDS = (('NotificationMaxDelay', None), ('EVSENotification', None), ('RCD', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'AC_EVSEStatusType'
+    TAG = 'AC_EVSEStatus'
+
+
+class MeterInfoType(CompactType):
+    FIELDS = (('MeterID', None), ('MeterReading', None), ('SigMeterReading', None),
+              ('MeterStatus', None), ('TMeter', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'MeterInfoType'
+
+
+class MessageHeaderType(CompactType):
+    FIELDS = (('SessionID', None), ('Notification', None), ('Signature', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'MessageHeaderType'
+
+
+class CurrentDemandReqType(CompactType):
+    FIELDS = (('DC_EVStatus', DC_EVStatusType),
+              ('EVTargetCurrent', PhysicalValueType),
+              ('EVMaximumVoltageLimit', PhysicalValueType),
+              ('EVMaximumCurrentLimit', PhysicalValueType),
+              ('EVMaximumPowerLimit', PhysicalValueType),
+              ('BulkChargingComplete', None),
+              ('ChargingComplete', None),
+              ('RemainingTimeToFullSoC', PhysicalValueType),
+              ('RemainingTimeToBulkSoC', PhysicalValueType),
+              ('EVTargetVoltage', PhysicalValueType))
+    __slots__ = _names(FIELDS)
+    BINDING = 'CurrentDemandReqType'
+    TAG = 'CurrentDemandReq'
+
+
+class CurrentDemandResType(CompactType):
+    FIELDS = (('ResponseCode', None),
+              ('DC_EVSEStatus', DC_EVSEStatusType),
+              ('EVSEPresentVoltage', PhysicalValueType),
+              ('EVSEPresentCurrent', PhysicalValueType),
+              ('EVSECurrentLimitAchieved', None),
+              ('EVSEVoltageLimitAchieved', None),
+              ('EVSEPowerLimitAchieved', None),
+              ('EVSEMaximumVoltageLimit', PhysicalValueType),
+              ('EVSEMaximumCurrentLimit', PhysicalValueType),
+              ('EVSEMaximumPowerLimit', PhysicalValueType),
+              ('EVSEID', None),
+              ('SAScheduleTupleID', None),
+              ('MeterInfo', MeterInfoType),
+              ('ReceiptRequired', None))
+    __slots__ = _names(FIELDS)
+    BINDING = 'CurrentDemandResType'
+    TAG = 'CurrentDemandRes'
+
+
+class ChargingStatusReqType(CompactType):
+    __slots__ = ()
+    BINDING = 'ChargingStatusReqType'
+    TAG = 'ChargingStatusReq'
+
+
+class ChargingStatusResType(CompactType):
+    FIELDS = (('ResponseCode', None),
+              ('EVSEID', None),
+              ('SAScheduleTupleID', None),
+              ('EVSEMaxCurrent', PhysicalValueType),
+              ('MeterInfo', MeterInfoType),
+              ('ReceiptRequired', None),
+              ('AC_EVSEStatus', AC_EVSEStatusType))
+    __slots__ = _names(FIELDS)
+    BINDING = 'ChargingStatusResType'
+    TAG = 'ChargingStatusRes'
+
+
+BODY_TYPES = {cls.BINDING: cls for cls in (
+    CurrentDemandReqType, CurrentDemandResType, ChargingStatusReqType, ChargingStatusResType)}
+
+
+class BodyType(CompactType):
+    """Body with one of the BODY_TYPES as BodyElement"""
+    FIELDS = (('BodyElement', None),)
+    __slots__ = _names(FIELDS)
+    BINDING = 'BodyType'
+
+    @classmethod
+    def from_binding(cls, obj):
+        body_element = obj.BodyElement
+        body_type = BODY_TYPES.get(type(body_element).__name__)
+        if body_type is None:
+            raise ValueError("No compact model for {}".format(type(body_element).__name__))
+        return cls(body_type.from_binding(body_element))
+
+    def to_binding(self):
+        return bindings.BodyType(self.BodyElement.to_binding())
+
+
+class V2G_Message(CompactType):
+    FIELDS = (('Header', MessageHeaderType), ('Body', BodyType))
+    __slots__ = _names(FIELDS)
+    BINDING = 'V2G_Message'
+
+    def get_Header(self):
+        return self.Header
+
+    def get_Body(self):
+        return self.Body
+
+
+def from_v2g_message(message):
+    """bindings.V2G_Message -> V2G_Message, ValueError for other messages"""
+    return V2G_Message.from_binding(message)
+
+
+def to_v2g_message(message):
+    """V2G_Message -> bindings.V2G_Message"""
+    return message.to_binding()
@@ -0,0 +1,123 @@
+"""Namespace prefixes of the generated bindings.
+
+generateDS wrote common/XML/msgDef1.py with the child prefixes it found first
+for a type, so many MsgBody and MsgDataTypes children are exported without a
+prefix or with the one of their parent, and the qualified Id and Name
+attributes without any. This rewrites the module from V2G_CI_MsgDef.xsd:
+
+- every child of an ISO type gets the prefix of its element's namespace, and
+  complex children are exported with it instead of the parent's prefix
+- a prefix passed in by the parent wins over the ns_prefix_ of the child
+- xmldsig children without a prefix get ds
+- the types of substitution group members are exported with the name of
+  their element by default, the parser sets original_tagname_ to it
+- qualified attributes are exported with their prefix and read in both forms
+
+The prefixes are the ones V2G_Message declares. The rewrite is idempotent,
+run it from the repository root after regenerating msgDef1:
+
+    python -m common.bindings.namespaces
+"""
+import re
+import sys
+
+from common.exi.codec import get_codec
+from common.exi.schema import ComplexType
+
+MODULE = 'common/XML/msgDef1.py'
+
+PREFIXES = {
+    'urn:iso:15118:2:2013:MsgBody': 'ns5',
+    'urn:iso:15118:2:2013:MsgDataTypes': 'ns6',
+    'urn:iso:15118:2:2013:MsgDef': 'ns7',
+    'urn:iso:15118:2:2013:MsgHeader': 'ns8',
+}
+XMLDSIG = 'http://www.w3.org/2000/09/xmldsig#'
+
+_CLASS = re.compile(r'^class (\w+)\(.*?^# end class \1$', re.M | re.S)
+
+
+def _class_types(schema):
+    """{class name: complex type}, anonymous types are named by their element"""
+    types = {}
+    for qname, complex_type in schema.types.items():
+        if isinstance(complex_type, ComplexType) and complex_type.qname:
+            types[qname[1]] = complex_type
+    for qname, decl in schema.elements.items():
+        if isinstance(decl.type, ComplexType) and decl.type.qname is None:
+            types[qname[1]] = decl.type
+    return types
+
+
+def _member_names(schema):
+    """{complex type: element name} of the substitution group members"""
+    names = {}
+    for head in schema.substitutions:
+        for decl in schema.substitution_members(schema.get_element(head)):
+            if not decl.abstract:
+                names[id(decl.type)] = decl.qname[1]
+    return names
+
+
+def _patch_class(block, complex_type, model, tagname):
+    if tagname is not None:
+        # the base class __init__ resets original_tagname_, name the default
+        block = re.sub(r"(    def export\(self, outfile, level, .*?name_=')\w+(', pretty_print=True\):)",
+                       r'\g<1>%s\2' % tagname, block, count=1)
+    for decl, member in model.children(complex_type):
+        if decl.qname[0] == XMLDSIG:
+            block = re.sub(r'(self\.%s_nsprefix_ = )None' % member, r'\1"ds"', block)
+            continue
+        prefix = PREFIXES.get(decl.qname[0])
+        if prefix is None:
+            continue
+        # generateDS names the members of a substitution group after the element
+        names = '|'.join({member, decl.qname[1]})
+        block = re.sub(r'(self\.(?:%s)_nsprefix_ = )(None|"\w*")' % names,
+                       r'\1"%s"' % prefix, block)
+        block = re.sub(r"((?:self\.|\b)(?:%s)_?\.export\(outfile, level, )(namespaceprefix_|'\w*:'), " % names,
+                       r"\1'%s:', " % prefix, block)
+    for use in complex_type.attributes:
+        namespace, local = use.decl.qname
+        prefix = PREFIXES.get(namespace)
+        if prefix is None:
+            continue
+        block = block.replace("outfile.write(' %s=%%s'" % local,
+                              "outfile.write(' %s:%s=%%s'" % (prefix, local))
+        block = block.replace("value = find_attr_value_('%s', node)" % local,
+                              "value = attrs.get('{%s}%s', find_attr_value_('%s', node))"
+                              % (namespace, local, local))
+    return block
+
+
+def rewrite(source, schema_path='common/XML/V2G_CI_MsgDef.xsd'):
+    """Source of msgDef1 with the prefixes of the schema"""
+    codec = get_codec(schema_path)
+    types = _class_types(codec.schema)
+    tagnames = _member_names(codec.schema)
+
+    def patch(match):
+        complex_type = types.get(match.group(1))
+        if complex_type is None:
+            return match.group(0)
+        return _patch_class(match.group(0), complex_type, codec.model, tagnames.get(id(complex_type)))
+
+    source = _CLASS.sub(patch, source)
+    return source.replace('if UseCapturedNS_ and self.ns_prefix_:',
+                          'if UseCapturedNS_ and self.ns_prefix_ and not namespaceprefix_:')
+
+
+def main(path=MODULE):
+    with open(path) as f:
+        source = f.read()
+    patched = rewrite(source)
+    changed = sum(1 for old, new in zip(source.splitlines(), patched.splitlines()) if old != new)
+    if changed:
+        with open(path, 'w') as f:
+            f.write(patched)
+    print('%d lines of %s rewritten' % (changed, path))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
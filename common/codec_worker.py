@@ -0,0 +1,157 @@
+"""Persistent EXI codec worker. Starts common/EXICodecServer.java once in a
+JVM that stays warm and exchanges length prefixed frames with it over a pipe,
+so every encode/decode after the first one skips JVM start up, jar loading and
+the grammar build from V2G_CI_MsgDef.xsd. CodecWorkerPool runs several of them
+for requests that are issued concurrently (signature digests).
+"""
+import atexit
+import queue
+import struct
+import subprocess
+import threading
+
+SERVER_SOURCE = 'common/EXICodecServer.java'
+CLASSPATH = 'common/encode.jar'
+SCHEMA = 'common/XML/V2G_CI_MsgDef.xsd'
+
+_FRAME_HEADER = struct.Struct('>BI')
+
+# Upper bound of the JVMs of the worker pool, they are started on demand
+POOL_SIZE = 4
+
+
+class CodecWorkerError(Exception):
+    """Raised when the codec server rejects a request or dies"""
+
+
+class CodecWorker():
+    """Handle to a single EXICodecServer process. The process is started lazily
+    on the first request and restarted if it has exited. Requests are
+    serialized with a lock, a single worker can be shared by every thread.
+    """
+    def __init__(self, java='java', classpath=CLASSPATH, source=SERVER_SOURCE, schema=SCHEMA):
+        self.cmd = [java, '-cp', classpath, source, schema]
+        self.process = None
+        self.lock = threading.Lock()
+
+    def start(self):
+        """Starts the server process if it is not running"""
+        if self.process is None or self.process.poll() is not None:
+            self.process = subprocess.Popen(self.cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def stop(self):
+        """Closes the pipe, the server exits when its stdin reaches EOF"""
+        with self.lock:
+            if self.process is None:
+                return
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._discard()
+                return
+            self.process = None
+
+    def _discard(self):
+        """Kills and reaps the server process after a failed request, the
+        next request starts a new one
+        """
+        process, self.process = self.process, None
+        try:
+            process.kill()
+        except OSError:
+            pass
+        for pipe in (process.stdin, process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        process.wait()
+
+    def _read_exactly(self, size):
+        data = self.process.stdout.read(size)
+        if len(data) != size:
+            self._discard()
+            raise CodecWorkerError("EXI codec server closed the pipe")
+        return data
+
+    def request(self, op, payload):
+        """Sends one request frame and returns the payload of the response"""
+        with self.lock:
+            self.start()
+            try:
+                self.process.stdin.write(_FRAME_HEADER.pack(op, len(payload)))
+                self.process.stdin.write(payload)
+                self.process.stdin.flush()
+            except (BrokenPipeError, OSError) as error:
+                self._discard()
+                raise CodecWorkerError("EXI codec server is not running") from error
+            status, size = _FRAME_HEADER.unpack(self._read_exactly(_FRAME_HEADER.size))
+            result = self._read_exactly(size)
+        if status != 0:
+            raise CodecWorkerError(result.decode('utf-8', 'replace'))
+        return result
+
+    def encode(self, xml_bytes):
+        """XML bytes -> EXI bytes"""
+        return self.request(ord('E'), xml_bytes)
+
+    def decode(self, exi_bytes):
+        """EXI bytes -> XML bytes"""
+        return self.request(ord('D'), exi_bytes)
+
+
+class CodecWorkerPool():
+    """Up to ``size`` CodecWorkers for requests from several threads at once.
+    A request takes an idle worker, the most recently used one first, so a
+    worker process is only started when the running ones are all busy
+    """
+    def __init__(self, size=POOL_SIZE, **kwargs):
+        self.workers = [CodecWorker(**kwargs) for _ in range(size)]
+        self.idle = queue.LifoQueue()
+        for worker in reversed(self.workers):
+            self.idle.put(worker)
+
+    def request(self, op, payload):
+        worker = self.idle.get()
+        try:
+            return worker.request(op, payload)
+        finally:
+            self.idle.put(worker)
+
+    def encode(self, xml_bytes):
+        """XML bytes -> EXI bytes"""
+        return self.request(ord('E'), xml_bytes)
+
+    def decode(self, exi_bytes):
+        """EXI bytes -> XML bytes"""
+        return self.request(ord('D'), exi_bytes)
+
+    def stop(self):
+        for worker in self.workers:
+            worker.stop()
+
+
+_worker = None
+_pool = None
+_worker_lock = threading.Lock()
+
+
+def get_worker():
+    """Returns the process wide codec worker"""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = CodecWorker()
+            atexit.register(_worker.stop)
+    return _worker
+
+
+def get_worker_pool():
+    """Returns the process wide worker pool, used for concurrent requests"""
+    global _pool
+    with _worker_lock:
+        if _pool is None:
+            _pool = CodecWorkerPool()
+            atexit.register(_pool.stop)
+    return _pool
@@ -0,0 +1,6 @@
+"""Pure Python schema-informed EXI codec for the ISO 15118-2 messages, a drop
+in replacement for common/encode.jar and common/decode.jar.
+"""
+from common.exi.codec import EXICodec, get_codec
+from common.exi.datatypes import EXICodecError
+from common.exi.schema import SchemaError
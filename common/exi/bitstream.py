@@ -0,0 +1,134 @@
+"""Bit packed EXI streams (EXI 1.0, section 7.1) with the primitive encodings
+used by the codec: n-bit unsigned integers, unsigned and signed integers,
+booleans, binary and string values.
+"""
+
+
+class EXIStreamError(Exception):
+    """Raised when an EXI stream ends early or is malformed"""
+
+
+class BitWriter():
+    """Writes bit packed values, most significant bit first"""
+    def __init__(self):
+        self.buffer = bytearray()
+        self.current = 0
+        self.count = 0
+
+    def write_bits(self, value, bits):
+        """n-bit unsigned integer"""
+        if bits == 0:
+            return
+        self.current = (self.current << bits) | value
+        self.count += bits
+        while self.count >= 8:
+            self.count -= 8
+            self.buffer.append((self.current >> self.count) & 0xFF)
+        self.current &= (1 << self.count) - 1
+
+    def write_boolean(self, value):
+        self.write_bits(1 if value else 0, 1)
+
+    def write_unsigned(self, value):
+        """Unsigned integer, 7 bits per octet, least significant group first"""
+        if value < 0:
+            raise ValueError('Unsigned integer expected, got %d' % value)
+        while True:
+            group = value & 0x7F
+            value >>= 7
+            if value:
+                self.write_bits(group | 0x80, 8)
+            else:
+                self.write_bits(group, 8)
+                return
+
+    def write_integer(self, value):
+        """Signed integer: sign bit followed by the magnitude (minus one if negative)"""
+        if value < 0:
+            self.write_boolean(True)
+            self.write_unsigned(-value - 1)
+        else:
+            self.write_boolean(False)
+            self.write_unsigned(value)
+
+    def write_binary(self, data):
+        self.write_unsigned(len(data))
+        if self.count == 0:
+            self.buffer.extend(data)
+        else:
+            for byte in data:
+                self.write_bits(byte, 8)
+
+    def write_characters(self, text):
+        """Code points of a string, the length has to be written by the caller"""
+        for char in text:
+            self.write_unsigned(ord(char))
+
+    def write_string(self, text):
+        self.write_unsigned(len(text))
+        self.write_characters(text)
+
+    def getbits(self):
+        """Content written so far as (integer, number of bits), unpadded"""
+        return ((int.from_bytes(self.buffer, 'big') << self.count) | self.current,
+                len(self.buffer) * 8 + self.count)
+
+    def getvalue(self):
+        """Stream content, padded with zero bits to the next octet"""
+        if self.count:
+            return bytes(self.buffer) + bytes([(self.current << (8 - self.count)) & 0xFF])
+        return bytes(self.buffer)
+
+
+class BitReader():
+    """Reads bit packed values written by BitWriter"""
+    def __init__(self, data):
+        self.data = data
+        self.position = 0
+
+    def read_bits(self, bits):
+        if bits == 0:
+            return 0
+        start = self.position
+        end = start + bits
+        if end > len(self.data) * 8:
+            raise EXIStreamError('Unexpected end of EXI stream')
+        first = start >> 3
+        last = (end + 7) >> 3
+        chunk = int.from_bytes(self.data[first:last], 'big')
+        self.position = end
+        return (chunk >> ((last << 3) - end)) & ((1 << bits) - 1)
+
+    def read_boolean(self):
+        return self.read_bits(1) == 1
+
+    def read_unsigned(self):
+        value = 0
+        shift = 0
+        while True:
+            group = self.read_bits(8)
+            value |= (group & 0x7F) << shift
+            if not group & 0x80:
+                return value
+            shift += 7
+
+    def read_integer(self):
+        if self.read_boolean():
+            return -self.read_unsigned() - 1
+        return self.read_unsigned()
+
+    def read_binary(self):
+        length = self.read_unsigned()
+        if self.position & 7 == 0:
+            start = self.position >> 3
+            if start + length > len(self.data):
+                raise EXIStreamError('Unexpected end of EXI stream')
+            self.position += length * 8
+            return bytes(self.data[start:start + length])
+        return bytes(self.read_bits(8) for _ in range(length))
+
+    def read_characters(self, length):
+        return ''.join(chr(self.read_unsigned()) for _ in range(length))
+
+    def read_string(self):
+        return self.read_characters(self.read_unsigned())
@@ -0,0 +1,844 @@
+"""Schema-informed EXI encoder and decoder.
+
+The options match the bundled encode.jar/decode.jar (EXIficient): default
+fidelity options (no comments, PIs, DTDs, prefixes or lexical values), non
+strict grammars, bit packed alignment, valuePartitionCapacity = 0 and grammar
+learning disabled (maximumNumberOfBuiltInProductions = 0,
+maximumNumberOfBuiltInElementGrammars = 0). Undeclared elements are cast to
+xs:anyType with an xsi:type attribute, as EXIficient does when grammar
+learning is restricted.
+
+``python -m common.exi.conformance`` compares the codec with the jar output
+stored in common/EXI_Files.
+"""
+import functools
+import io
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape, quoteattr
+
+from common.exi import grammar as g
+from common.exi.bitstream import BitReader, BitWriter
+from common.exi.datatypes import EXICodecError, STRING, BOOLEAN, datatype_for
+from common.exi.objects import CompactBuilder, ObjectBuilder, ObjectModel, UnsupportedContent
+from common.exi.schema import XS, XSI, XML_NS, ComplexType, load_schema
+
+XML_NAMES = ['base', 'id', 'lang', 'space']
+XSI_NAMES = ['nil', 'type']
+XS_NAMES = sorted(['ENTITIES', 'ENTITY', 'ID', 'IDREF', 'IDREFS', 'NCName', 'NMTOKEN',
+                   'NMTOKENS', 'NOTATION', 'Name', 'QName', 'anySimpleType', 'anyType',
+                   'anyURI', 'base64Binary', 'boolean', 'byte', 'date', 'dateTime', 'decimal',
+                   'double', 'duration', 'float', 'gDay', 'gMonth', 'gMonthDay', 'gYear',
+                   'gYearMonth', 'hexBinary', 'int', 'integer', 'language', 'long',
+                   'negativeInteger', 'nonNegativeInteger', 'nonPositiveInteger',
+                   'normalizedString', 'positiveInteger', 'short', 'string', 'time', 'token',
+                   'unsignedByte', 'unsignedInt', 'unsignedLong', 'unsignedShort'])
+
+# Distinguishing bits '10', no options, final version 1
+HEADER = 0x80
+
+
+def _split(tag):
+    """ElementTree/lxml '{uri}local' to (uri, local)"""
+    if tag[0] == '{':
+        uri, local = tag[1:].split('}', 1)
+        return uri, local
+    return '', tag
+
+
+class StringTables():
+    """URI and local name partitions of the string table (section 7.3). The
+    value partitions are not kept since their capacity is 0.
+    """
+    def __init__(self, template):
+        self.uris = list(template.uris)
+        self.uri_ids = dict(template.uri_ids)
+        self.names = [list(names) for names in template.names]
+        self.name_ids = [dict(ids) for ids in template.name_ids]
+
+    @classmethod
+    def initial(cls, schema):
+        """Template prefilled from the schema"""
+        table = cls.__new__(cls)
+        table.uris = ['', XML_NS, XSI, XS] + schema.target_namespaces
+        table.uri_ids = {uri: index for index, uri in enumerate(table.uris)}
+        names = {XML_NS: XML_NAMES, XSI: XSI_NAMES}
+        table.names = []
+        for uri in table.uris:
+            partition = set(names.get(uri, ())) | schema.local_names.get(uri, set())
+            if uri == XS:
+                partition |= set(XS_NAMES)
+            table.names.append(sorted(partition))
+        table.name_ids = [{name: index for index, name in enumerate(partition)}
+                          for partition in table.names]
+        return table
+
+    def add_uri(self, uri):
+        self.uri_ids[uri] = len(self.uris)
+        self.uris.append(uri)
+        self.names.append([])
+        self.name_ids.append({})
+        return self.uri_ids[uri]
+
+    def add_name(self, uri_id, name):
+        self.name_ids[uri_id][name] = len(self.names[uri_id])
+        self.names[uri_id].append(name)
+
+
+class Encoder():
+    """Encodes one XML document (an ElementTree or lxml element)"""
+    def __init__(self, codec, prefixes=None):
+        self.codec = codec
+        self.prefixes = prefixes or {}
+        self.tables = StringTables(codec.tables)
+        self.writer = BitWriter()
+        # Undeclared elements that have learned AT(xsi:type)
+        self.cast = set()
+
+    # Event codes
+
+    def first_level(self, state, production):
+        self.writer.write_bits(production.code, state.bits)
+
+    def second_level(self, state, kind):
+        if kind not in state.second:
+            raise EXICodecError('Event %d is not allowed here' % kind)
+        self.writer.write_bits(len(state.productions), state.bits)
+        self.writer.write_bits(state.second.index(kind), state.second_bits)
+
+    # QNames and values
+
+    def uri(self, uri):
+        tables = self.tables
+        bits = g.bit_width(len(tables.uris) + 1)
+        uri_id = tables.uri_ids.get(uri)
+        if uri_id is not None:
+            self.writer.write_bits(uri_id + 1, bits)
+            return uri_id
+        self.writer.write_bits(0, bits)
+        self.writer.write_string(uri)
+        return tables.add_uri(uri)
+
+    def local_name(self, uri_id, name):
+        tables = self.tables
+        name_id = tables.name_ids[uri_id].get(name)
+        if name_id is not None:
+            self.writer.write_unsigned(0)
+            self.writer.write_bits(name_id, g.bit_width(len(tables.names[uri_id])))
+        else:
+            self.writer.write_unsigned(len(name) + 1)
+            self.writer.write_characters(name)
+            tables.add_name(uri_id, name)
+
+    def qname(self, qname):
+        self.local_name(self.uri(qname[0]), qname[1])
+
+    def qname_value(self, text, element):
+        """QName typed value (xsi:type), the prefix is resolved on ``element``"""
+        qname = self.resolve_prefix(text.strip(), element)
+        self.qname(qname)
+        return qname
+
+    def resolve_prefix(self, text, element):
+        """Resolves a prefixed QName value, with the namespace map of lxml
+        elements or the declarations seen while parsing the document
+        """
+        prefix, _, local = text.rpartition(':')
+        nsmap = getattr(element, 'nsmap', None)
+        if nsmap is not None and (prefix or None) in nsmap:
+            return (nsmap[prefix or None], local)
+        if prefix in self.prefixes:
+            return (self.prefixes[prefix], local)
+        if prefix == 'xsi':
+            return (XSI, local)
+        if prefix in ('xs', 'xsd'):
+            return (XS, local)
+        raise EXICodecError('Unknown prefix in QName value %r' % text)
+
+    def attribute_value(self, qname, text):
+        decl = self.codec.schema.get_attribute(qname)
+        datatype = datatype_for(decl.type) if decl is not None else STRING
+        try:
+            value = datatype.parse(text)
+        except ValueError:
+            datatype, value = STRING, text
+        datatype.write(self.writer, value)
+
+    # Structure
+
+    def document(self, root):
+        self.writer.write_bits(HEADER, 8)
+        self.start_element(self.codec.builder.document, root)
+        return self.writer.getvalue()
+
+    def start_element(self, parent, node):
+        """Encodes the SE event for ``node`` in ``parent`` and the element,
+        returns the parent state that follows
+        """
+        qname = _split(node.tag)
+        production = parent.lookup.get((g.SE, qname))
+        if production is not None:
+            self.first_level(parent, production)
+            state = self.codec.builder.element_grammar(production.payload).start
+            self.element(node, state)
+            return production.target
+        production = parent.lookup.get((g.SE_NS, qname[0]))
+        if production is not None:
+            self.first_level(parent, production)
+            self.local_name(self.tables.uri_ids[qname[0]], qname[1])
+            self.undeclared_element(node, qname)
+            return production.target
+        production = parent.lookup.get((g.SE_ANY, None))
+        if production is not None:
+            self.first_level(parent, production)
+            self.qname(qname)
+            self.undeclared_element(node, qname)
+            return production.target
+        self.second_level(parent, g.SE_ANY)
+        self.qname(qname)
+        self.undeclared_element(node, qname)
+        return parent.undeclared_target(g.SE_ANY)
+
+    def undeclared_element(self, node, qname):
+        decl = self.codec.schema.get_element(qname)
+        if decl is not None:
+            self.element(node, self.codec.builder.element_grammar(decl).start)
+            return
+        # Built-in grammar without learning, cast to xs:anyType unless the
+        # element carries its own xsi:type
+        state = g.BUILT_IN_CAST.start if qname in self.cast else g.BUILT_IN.start
+        self.cast.add(qname)
+        self.second_level(state, g.AT_ANY)
+        self.qname(g.XSI_TYPE)
+        type_name = node.get('{%s}type' % XSI)
+        if type_name is None:
+            self.qname(g.XS_ANY_TYPE)
+            state = self.codec.builder.ur_type.start
+        else:
+            state = self.type_state(self.qname_value(type_name, node), state)
+        self.element(node, state, skip_type=True)
+
+    def type_state(self, type_qname, fallback):
+        type_definition = self.codec.builder.type_for(type_qname)
+        if type_definition is None:
+            return fallback
+        return self.codec.builder.grammar(type_definition).start
+
+    def element(self, node, state, skip_type=False):
+        attributes = []
+        type_name = None
+        nil = None
+        for key, value in node.attrib.items():
+            qname = _split(key)
+            if qname == g.XSI_TYPE:
+                type_name = value
+            elif qname == g.XSI_NIL:
+                nil = value
+            else:
+                attributes.append((qname, value))
+        attributes.sort(key=lambda item: (item[0][1], item[0][0]))
+
+        if type_name is not None and not skip_type:
+            state = self.xsi_type(state, type_name, node)
+        if nil is not None:
+            state = self.xsi_nil(state, nil)
+        for qname, value in attributes:
+            state = self.attribute(state, qname, value)
+
+        state = self.characters(state, node.text)
+        for child in node:
+            if not isinstance(child.tag, str):
+                # comments and processing instructions are not preserved
+                state = self.characters(state, child.tail)
+                continue
+            state = self.start_element(state, child)
+            state = self.characters(state, child.tail)
+        self.end(state)
+
+    def end(self, state):
+        production = state.lookup.get((g.EE, None))
+        if production is not None:
+            self.first_level(state, production)
+        else:
+            self.second_level(state, g.EE)
+
+    def xsi_type(self, state, type_name, node):
+        if g.AT_XSI_TYPE in state.second:
+            self.second_level(state, g.AT_XSI_TYPE)
+        else:
+            self.second_level(state, g.AT_ANY)
+            self.qname(g.XSI_TYPE)
+        return self.type_state(self.qname_value(type_name, node), state)
+
+    def xsi_nil(self, state, text):
+        try:
+            nil = BOOLEAN.parse(text)
+        except ValueError:
+            return self.attribute(state, g.XSI_NIL, text)
+        if g.AT_XSI_NIL in state.second:
+            self.second_level(state, g.AT_XSI_NIL)
+        else:
+            self.second_level(state, g.AT_ANY)
+            self.qname(g.XSI_NIL)
+        BOOLEAN.write(self.writer, nil)
+        if nil and state.grammar is not None and state.grammar.empty is not None:
+            return state.grammar.empty
+        return state
+
+    def attribute(self, state, qname, text):
+        production = state.lookup.get((g.AT, qname))
+        if production is not None:
+            datatype = datatype_for(production.payload.type)
+            try:
+                value = datatype.parse(text)
+            except ValueError:
+                # AT(qname) [untyped value] on the third level
+                self.second_level(state, g.AT_INVALID)
+                declared = [p for p in state.productions if p.kind == g.AT]
+                self.writer.write_bits(declared.index(production), g.bit_width(len(declared) + 1))
+                STRING.write(self.writer, text)
+                return production.target
+            self.first_level(state, production)
+            datatype.write(self.writer, value)
+            return production.target
+        production = state.lookup.get((g.AT_NS, qname[0]))
+        if production is not None:
+            self.first_level(state, production)
+            self.local_name(self.tables.uri_ids[qname[0]], qname[1])
+            self.attribute_value(qname, text)
+            return production.target
+        production = state.lookup.get((g.AT_ANY, None))
+        if production is not None:
+            self.first_level(state, production)
+            self.qname(qname)
+            self.attribute_value(qname, text)
+            return production.target
+        self.second_level(state, g.AT_ANY)
+        self.qname(qname)
+        self.attribute_value(qname, text)
+        return state
+
+    def characters(self, state, text):
+        if not text:
+            return state
+        production = state.lookup.get((g.CH, None))
+        if production is not None:
+            datatype = datatype_for(production.payload)
+            try:
+                value = datatype.parse(text)
+            except ValueError:
+                pass
+            else:
+                self.first_level(state, production)
+                datatype.write(self.writer, value)
+                return production.target
+        else:
+            if text.isspace():
+                # whitespace in element only and mixed content is not significant
+                return state
+            production = state.lookup.get((g.CH_UNTYPED, None))
+            if production is not None:
+                self.first_level(state, production)
+                STRING.write(self.writer, text)
+                return production.target
+        self.second_level(state, g.CH_UNTYPED)
+        STRING.write(self.writer, text)
+        return state.undeclared_target(g.CH_UNTYPED)
+
+
+class ObjectEncoder(Encoder):
+    """Encodes a generateDS object graph without exporting it to XML. Values
+    are written from the Python objects, element names and namespaces come
+    from the schema (common.exi.objects.ObjectModel)
+    """
+    def document(self, root):
+        decl = self.codec.model.root_element(root)
+        self.writer.write_bits(HEADER, 8)
+        state = self.codec.builder.document
+        production = state.lookup.get((g.SE, decl.qname))
+        if production is None:
+            raise UnsupportedContent('%s is not a document element' % decl.qname[1])
+        self.first_level(state, production)
+        self.object_element(decl, root, self.codec.builder.element_grammar(decl).start)
+        return self.writer.getvalue()
+
+    def object_element(self, decl, obj, state):
+        type_definition = decl.type
+        if not isinstance(type_definition, ComplexType):
+            # Simple type wrapped in a class (xmldsig DigestValueType)
+            self.end(self.characters(state, self.text(obj)))
+            return
+        if type(obj).__name__ != (type_definition.qname or decl.qname)[1]:
+            raise UnsupportedContent('%s needs an xsi:type' % type(obj).__name__)
+        if getattr(obj, 'anytypeobjs_', None) or getattr(obj, 'content_', None):
+            raise UnsupportedContent('Wildcard or mixed content in %s' % decl.qname[1])
+        for use in type_definition.attributes:
+            value = getattr(obj, use.decl.qname[1], None)
+            if value is not None:
+                state = self.attribute(state, use.decl.qname, str(value))
+        if type_definition.content == 'simple' or type_definition.mixed:
+            state = self.characters(state, self.text(obj))
+        else:
+            for child, member in self.codec.model.children(type_definition):
+                value = getattr(obj, member, None)
+                if value is None:
+                    continue
+                for item in value if isinstance(value, list) else (value,):
+                    state = self.child_element(state, child, item)
+        self.end(state)
+
+    @staticmethod
+    def text(obj):
+        """Simple content of a class, kept as text in valueOf_"""
+        text = obj.valueOf_
+        if text is not None and not isinstance(text, str):
+            raise UnsupportedContent('valueOf_ of %s is not text' % type(obj).__name__)
+        return text
+
+    def child_element(self, state, decl, value):
+        is_object = hasattr(value, 'original_tagname_')
+        if is_object:
+            decl = self.codec.model.element_for(decl, value)
+        production = state.lookup.get((g.SE, decl.qname))
+        if production is None:
+            raise UnsupportedContent('%s is not expected here' % decl.qname[1])
+        self.first_level(state, production)
+        child_state = self.codec.builder.element_grammar(production.payload).start
+        if is_object:
+            self.object_element(production.payload, value, child_state)
+        else:
+            self.simple_value(child_state, value)
+        return production.target
+
+    def simple_value(self, state, value):
+        """Content of an element with a simple type, written typed"""
+        if isinstance(value, str) and not value:
+            self.end(state)
+            return
+        production = state.lookup.get((g.CH, None))
+        if production is None:
+            raise UnsupportedContent('No typed content for %r' % (value,))
+        datatype = datatype_for(production.payload)
+        try:
+            converted = datatype.convert(value)
+        except ValueError as error:
+            raise UnsupportedContent(str(error))
+        self.first_level(state, production)
+        datatype.write(self.writer, converted)
+        self.end(production.target)
+
+
+def _tag(qname):
+    return '{%s}%s' % qname if qname[0] else qname[1]
+
+
+class ObjectExporter(ObjectEncoder):
+    """Exports a generateDS object graph to an ElementTree with the element
+    names and namespaces of the schema. The graph is walked by the
+    ObjectEncoder, the tree encodes to the stream of encode_object
+    """
+    def document(self, root, decl=None):
+        """Element of ``root``, by default as its global element"""
+        self.nodes = []
+        self.root = None
+        if decl is None:
+            decl = self.codec.model.root_element(root)
+        self.object_element(decl, root, self.codec.builder.element_grammar(decl).start)
+        return self.root
+
+    def start_node(self, qname):
+        if self.nodes:
+            node = ET.SubElement(self.nodes[-1], _tag(qname))
+        else:
+            node = self.root = ET.Element(_tag(qname))
+        self.nodes.append(node)
+
+    def object_element(self, decl, obj, state):
+        self.start_node(decl.qname)
+        super().object_element(decl, obj, state)
+        self.nodes.pop()
+
+    def child_element(self, state, decl, value):
+        if hasattr(value, 'original_tagname_'):
+            return super().child_element(state, decl, value)
+        self.start_node(decl.qname)
+        target = super().child_element(state, decl, value)
+        self.nodes.pop()
+        return target
+
+    def attribute(self, state, qname, text):
+        self.nodes[-1].set(_tag(qname), text)
+        return super().attribute(state, qname, text)
+
+    def characters(self, state, text):
+        # Typed text in its canonical form, as it is decoded: a fragment
+        # encoded on its own may take the untyped route (base64 line breaks)
+        production = state.lookup.get((g.CH, None)) if text else None
+        if production is not None:
+            try:
+                text = datatype_for(production.payload).format(text)
+            except ValueError:
+                pass
+        self.nodes[-1].text = text
+        return super().characters(state, text)
+
+    def simple_value(self, state, value):
+        super().simple_value(state, value)
+        if not isinstance(value, str) or value:
+            datatype = datatype_for(state.lookup[(g.CH, None)].payload)
+            self.nodes[-1].text = datatype.format(value)
+
+
+class _XMLWriter():
+    """Serializes decoded events, prefixes are ns<uri id> as in the jar output"""
+    def __init__(self, tables):
+        self.tables = tables
+        self.parts = ['<?xml version="1.0" encoding="UTF-8"?>']
+        self.declared = set()
+        self.pending = None
+
+    def prefix(self, uri_id):
+        uri = self.tables.uris[uri_id]
+        if uri == XSI:
+            return 'xsi'
+        if uri == XML_NS:
+            return 'xml'
+        return 'ns%d' % uri_id
+
+    def name(self, qname, declarations):
+        uri, local = qname
+        if not uri:
+            return local
+        uri_id = self.tables.uri_ids[uri]
+        if uri_id not in self.declared and uri != XML_NS:
+            self.declared.add(uri_id)
+            declarations.append(uri_id)
+        return '%s:%s' % (self.prefix(uri_id), local)
+
+    def start(self, qname, decl=None):
+        self.flush()
+        declarations = []
+        name = self.name(qname, declarations)
+        if len(self.parts) == 1:
+            for uri_id, uri in enumerate(self.tables.uris):
+                if uri_id not in self.declared and uri not in ('', XML_NS):
+                    self.declared.add(uri_id)
+                    declarations.append(uri_id)
+        self.pending = [name, declarations, []]
+        return name
+
+    def attribute(self, qname, value):
+        name = self.name(qname, self.pending[1])
+        self.pending[2].append('%s=%s' % (name, quoteattr(value, {'\n': '&#10;',
+                                                                   '\r': '&#13;',
+                                                                   '\t': '&#9;'})))
+
+    def qname_value(self, qname):
+        if not qname[0]:
+            return qname[1]
+        return self.name(qname, self.pending[1])
+
+    def flush(self, empty=False):
+        if self.pending is None:
+            return
+        name, declarations, attributes = self.pending
+        items = [name] + ['xmlns:%s="%s"' % (self.prefix(uri_id), self.tables.uris[uri_id])
+                          for uri_id in declarations] + attributes
+        self.parts.append('<%s%s>' % (' '.join(items), '/' if empty else ''))
+        self.pending = None
+
+    @staticmethod
+    def lexical():
+        return True
+
+    def characters(self, text):
+        self.flush()
+        self.parts.append(escape(text))
+
+    def end(self, name):
+        if self.pending is not None:
+            self.flush(empty=True)
+        else:
+            self.parts.append('</%s>' % name)
+
+    def getvalue(self):
+        return ''.join(self.parts).encode('utf-8')
+
+
+class Decoder():
+    """Decodes one EXI stream to XML, or to objects with an ObjectBuilder
+    (common.exi.objects) as ``output``
+    """
+    def __init__(self, codec, data, output=None):
+        self.codec = codec
+        self.tables = StringTables(codec.tables)
+        self.reader = BitReader(data)
+        self.output = output if output is not None else _XMLWriter(self.tables)
+        self.cast = set()
+
+    def event(self, state):
+        """Reads an event code, returns (kind, production)"""
+        code = self.reader.read_bits(state.bits)
+        if code < len(state.productions):
+            production = state.productions[code]
+            return production.kind, production
+        if not state.second:
+            raise EXICodecError('Invalid event code %d' % code)
+        index = self.reader.read_bits(state.second_bits)
+        if index >= len(state.second):
+            raise EXICodecError('Invalid second level event code %d' % index)
+        return state.second[index], None
+
+    def uri(self):
+        tables = self.tables
+        uri_id = self.reader.read_bits(g.bit_width(len(tables.uris) + 1))
+        if uri_id:
+            if uri_id > len(tables.uris):
+                raise EXICodecError('URI id %d out of range' % uri_id)
+            return uri_id - 1
+        return tables.add_uri(self.reader.read_string())
+
+    def local_name(self, uri_id):
+        tables = self.tables
+        length = self.reader.read_unsigned()
+        if length == 0:
+            partition = tables.names[uri_id]
+            name_id = self.reader.read_bits(g.bit_width(len(partition)))
+            if name_id >= len(partition):
+                raise EXICodecError('Local name id %d out of range' % name_id)
+            return partition[name_id]
+        name = self.reader.read_characters(length - 1)
+        tables.add_name(uri_id, name)
+        return name
+
+    def qname(self):
+        uri_id = self.uri()
+        return (self.tables.uris[uri_id], self.local_name(uri_id))
+
+    def value(self, datatype):
+        """Element content, in the form the output asks for"""
+        if self.output.lexical():
+            return datatype.read(self.reader)
+        return datatype.value(self.reader)
+
+    def attribute_value(self, qname):
+        decl = self.codec.schema.get_attribute(qname)
+        return (datatype_for(decl.type) if decl is not None else STRING).read(self.reader)
+
+    def document(self):
+        header = self.reader.read_bits(8)
+        if header != HEADER:
+            if header == ord('$'):
+                raise EXICodecError('EXI cookie is not supported')
+            raise EXICodecError('Unsupported EXI header 0x%02x' % header)
+        kind, production = self.event(self.codec.builder.document)
+        if kind == g.SE:
+            self.element(production.name,
+                         self.codec.builder.element_grammar(production.payload).start,
+                         production.payload)
+        else:
+            self.undeclared_element(self.qname())
+        return self.output.getvalue()
+
+    def undeclared_element(self, qname):
+        decl = self.codec.schema.get_element(qname)
+        if decl is not None:
+            self.element(qname, self.codec.builder.element_grammar(decl).start, decl)
+        elif qname in self.cast:
+            self.element(qname, g.BUILT_IN_CAST.start)
+        else:
+            self.cast.add(qname)
+            self.element(qname, g.BUILT_IN.start)
+
+    def element(self, qname, state, decl=None):
+        name = self.output.start(qname, decl)
+        reader = self.reader
+        while True:
+            kind, production = self.event(state)
+            if kind == g.EE:
+                self.output.end(name)
+                return
+            if kind == g.AT and production.payload is None:
+                # AT(xsi:type) learned by a built-in grammar
+                state = self.xsi_type(state)
+            elif kind == g.AT:
+                value = datatype_for(production.payload.type).read(reader)
+                self.output.attribute(production.name, value)
+                state = production.target
+            elif kind in (g.AT_NS, g.AT_ANY):
+                if kind == g.AT_NS:
+                    attribute = (production.name, self.local_name(self.tables.uri_ids[production.name]))
+                else:
+                    attribute = self.qname()
+                if attribute == g.XSI_TYPE:
+                    state = self.xsi_type(state)
+                elif attribute == g.XSI_NIL:
+                    state = self.xsi_nil(state)
+                else:
+                    self.output.attribute(attribute, self.attribute_value(attribute))
+                    state = production.target if production is not None else state
+            elif kind == g.AT_XSI_TYPE:
+                state = self.xsi_type(state)
+            elif kind == g.AT_XSI_NIL:
+                state = self.xsi_nil(state)
+            elif kind == g.AT_INVALID:
+                declared = [p for p in state.productions if p.kind == g.AT]
+                index = reader.read_bits(g.bit_width(len(declared) + 1))
+                if index < len(declared):
+                    self.output.attribute(declared[index].name, STRING.read(reader))
+                    state = declared[index].target
+                else:
+                    self.output.attribute(self.qname(), STRING.read(reader))
+            elif kind == g.SE:
+                self.output.flush()
+                self.element(production.name,
+                             self.codec.builder.element_grammar(production.payload).start,
+                             production.payload)
+                state = production.target
+            elif kind in (g.SE_NS, g.SE_ANY):
+                self.output.flush()
+                if production is not None and kind == g.SE_NS:
+                    child = (production.name, self.local_name(self.tables.uri_ids[production.name]))
+                else:
+                    child = self.qname()
+                self.undeclared_element(child)
+                state = production.target if production is not None \
+                    else state.undeclared_target(kind)
+            elif kind == g.CH:
+                self.output.characters(self.value(datatype_for(production.payload)))
+                state = production.target
+            elif kind == g.CH_UNTYPED:
+                self.output.characters(STRING.read(reader))
+                state = production.target if production is not None \
+                    else state.undeclared_target(kind)
+
+    def xsi_type(self, state):
+        uri_id = self.uri()
+        qname = (self.tables.uris[uri_id], self.local_name(uri_id))
+        self.output.attribute(g.XSI_TYPE, self.output.qname_value(qname))
+        type_definition = self.codec.builder.type_for(qname)
+        if type_definition is None:
+            return state
+        return self.codec.builder.grammar(type_definition).start
+
+    def xsi_nil(self, state):
+        nil = self.reader.read_boolean()
+        self.output.attribute(g.XSI_NIL, 'true' if nil else 'false')
+        if nil and state.grammar is not None and state.grammar.empty is not None:
+            return state.grammar.empty
+        return state
+
+
+def _codec_errors(function):
+    """Reraises every failure of a codec entry point as EXICodecError, the
+    error the callers fall back on
+    """
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        try:
+            return function(*args, **kwargs)
+        except EXICodecError:
+            raise
+        except Exception as error:
+            raise EXICodecError('%s: %s' % (type(error).__name__, error)) from error
+    return wrapper
+
+
+class EXICodec():
+    """Schema-informed EXI codec for one schema (by default the ISO 15118-2
+    message definition used by encode.jar/decode.jar)
+    """
+    def __init__(self, schema_path):
+        self.schema = load_schema(schema_path)
+        self.builder = g.GrammarBuilder(self.schema)
+        self.tables = StringTables.initial(self.schema)
+        self.model = ObjectModel(self.schema)
+
+    @_codec_errors
+    def encode(self, xml_bytes):
+        """XML document (bytes or str) -> EXI bytes"""
+        parser = ET.XMLPullParser(events=('start-ns', 'start'))
+        parser.feed(xml_bytes)
+        parser.close()
+        prefixes = {}
+        root = None
+        for event, item in parser.read_events():
+            if event == 'start-ns':
+                prefixes.setdefault(*item)
+            elif root is None:
+                root = item
+        return self.encode_element(root, prefixes)
+
+    @_codec_errors
+    def encode_element(self, element, prefixes=None):
+        """ElementTree or lxml element -> EXI bytes"""
+        return Encoder(self, prefixes).document(element)
+
+    @_codec_errors
+    def decode(self, exi_bytes):
+        """EXI bytes -> XML document bytes"""
+        return Decoder(self, exi_bytes).document()
+
+    @_codec_errors
+    def encode_object(self, message):
+        """generateDS object (msgDef1/appprotocol1) -> EXI bytes. The object
+        graph is encoded directly, objects the ObjectEncoder does not cover are
+        exported to XML first
+        """
+        try:
+            return ObjectEncoder(self).document(message)
+        except UnsupportedContent:
+            return self.encode(_export(message))
+
+    @_codec_errors
+    def export_object(self, message):
+        """generateDS object -> the XML document encode_object encodes, with
+        the element names and namespaces of the schema. Objects the
+        ObjectEncoder does not cover are exported by generateDS
+        """
+        try:
+            return ET.tostring(ObjectExporter(self).document(message), encoding='utf-8')
+        except UnsupportedContent:
+            return _export(message)
+
+    @_codec_errors
+    def export_fragment(self, obj, name):
+        """generateDS object -> XML document of the element ``name`` on its
+        own (the elements signed by xmldsig references), with the element
+        names and namespaces of the schema
+        """
+        decl = self.model.fragment_element(name, obj)
+        return ET.tostring(ObjectExporter(self).document(obj, decl), encoding='utf-8')
+
+    @_codec_errors
+    def decode_object(self, exi_bytes, binding, compact=None):
+        """EXI bytes -> generateDS object, ``binding`` is the generated module
+        (msgDef1 or appprotocol1) whose classes are instantiated. The objects
+        are built from the decoded events, messages with content the
+        ObjectBuilder does not cover are parsed from XML. With ``compact``
+        (common.bindings.compact) the charging loop messages are built as its
+        __slots__ models
+        """
+        if compact is None:
+            builder = ObjectBuilder(self, binding)
+        else:
+            builder = CompactBuilder(self, binding, compact)
+        try:
+            return Decoder(self, exi_bytes, builder).document()
+        except UnsupportedContent:
+            return binding.parseString(self.decode(exi_bytes), silence=True)
+
+
+def _export(message):
+    buffer = io.StringIO()
+    message.export(outfile=buffer, level=0)
+    return buffer.getvalue().encode('utf-8')
+
+
+_codecs = {}
+
+
+def get_codec(schema_path='common/XML/V2G_CI_MsgDef.xsd'):
+    """Codec for ``schema_path``, the grammars are built once per process"""
+    if schema_path not in _codecs:
+        _codecs[schema_path] = EXICodec(schema_path)
+    return _codecs[schema_path]
@@ -0,0 +1,94 @@
+"""Conformance check of the Python EXI codec against the streams produced by
+encode.jar in common/EXI_Files. Every sample XML has to encode to exactly the
+bytes of its EXI file and every EXI file has to survive decode + encode.
+Samples of a global element are decoded to the bindings as well, the direct
+object encoder and the XML route (export_object + encode) have to write the
+same stream for them.
+
+Run from the repository root:
+
+    python -m common.exi.conformance
+"""
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+from common import bindings
+from common.exi.codec import get_codec
+
+EXI_FILES = 'common/EXI_Files'
+
+# (xml, exi) pairs written by encode.jar with the MsgDef schema
+SAMPLES = [
+    ('testresres.xml', 'test1_xml.exi'),
+    ('v2gxml.xml', 'exisample.exi'),
+    ('final.xml', 'final_xml.exi'),
+    ('eMAID.xml', 'eMAID_xml.exi'),
+    ('DHpublickey.xml', 'DHpublickey_xml.exi'),
+    ('ContractSignatureEncryptedPrivateKey.xml', 'ContractSignatureEncryptedPrivateKey_xml.exi'),
+    ('ContractSignatureCertChain.xml', 'ContractSignatureCertChain_xml.exi'),
+    ('testpaps.xml', 'testpaps_xml.exi'),
+    ('installationreq.xml', 'installationreq.xml.exi'),
+    ('installationres.xml', 'installationres.xml.exi'),
+]
+
+
+def _read(name):
+    with open(os.path.join(EXI_FILES, name), 'rb') as f:
+        return f.read()
+
+
+def check_sample(codec, xml_name, exi_name):
+    """Returns a list of failure descriptions for one sample pair"""
+    failures = []
+    xml_bytes = _read(xml_name)
+    expected = _read(exi_name)
+    encoded = codec.encode(xml_bytes)
+    if encoded != expected:
+        position = next((i for i, (a, b) in enumerate(zip(encoded, expected)) if a != b),
+                        min(len(encoded), len(expected)))
+        failures.append('%s: encoding differs from %s at byte %d (%d vs %d bytes)'
+                        % (xml_name, exi_name, position, len(encoded), len(expected)))
+    if codec.encode(codec.decode(expected)) != expected:
+        failures.append('%s: decode + encode does not reproduce the stream' % exi_name)
+    failures.extend(check_routes(codec, exi_name, expected))
+    return failures
+
+
+def check_routes(codec, exi_name, exi):
+    """Compares the object routes for a sample of a global element"""
+    name = ET.fromstring(codec.decode(exi)).tag.rpartition('}')[2]
+    if name not in codec.model.globals:
+        return []
+    message = codec.decode_object(exi, bindings.msgDef1)
+    message.original_tagname_ = name
+    if codec.encode_object(message) != codec.encode(codec.export_object(message)):
+        return ['%s: encode_object and export_object + encode differ' % exi_name]
+    return []
+
+
+def run(samples=SAMPLES, schema_path='common/XML/V2G_CI_MsgDef.xsd'):
+    """Checks all samples, returns {xml name: failures} for the failing ones"""
+    codec = get_codec(schema_path)
+    results = {}
+    for xml_name, exi_name in samples:
+        try:
+            failures = check_sample(codec, xml_name, exi_name)
+        except Exception as error:
+            failures = ['%s: %s: %s' % (xml_name, type(error).__name__, error)]
+        if failures:
+            results[xml_name] = failures
+    return results
+
+
+def main():
+    results = run()
+    for failures in results.values():
+        for failure in failures:
+            print('FAIL ' + failure)
+    print('%d of %d samples conform' % (len(SAMPLES) - len(results), len(SAMPLES)))
+    return 1 if results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
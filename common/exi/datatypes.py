@@ -0,0 +1,389 @@
+"""Typed value encodings (EXI 1.0, section 7.1 and the datatype
+representation map of section 7.4) for the XSD simple types.
+
+``parse`` raises ValueError for values that are not valid for the type, the
+codec then falls back to an untyped (string) representation. ``write`` writes
+a parsed value and ``read`` returns the canonical lexical form. ``value``
+returns the decoded value as the generateDS bindings store it (bool, int,
+bytes for base64Binary, str for strings, enumerations and hexBinary),
+``convert`` turns such a value into the argument of ``write`` and ``format``
+into the lexical form ``parse`` reads back.
+"""
+import base64
+import binascii
+import decimal
+
+from common.exi.grammar import bit_width
+from common.exi.schema import XS
+
+
+class EXICodecError(Exception):
+    """Raised for values or events the codec cannot represent"""
+
+
+def collapse(text):
+    return ' '.join(text.split())
+
+
+class StringValue():
+    """String with the value string table disabled (valuePartitionCapacity=0):
+    every value is a miss, written as length + 2 followed by the code points.
+    """
+    def parse(self, text):
+        return text
+
+    def convert(self, value):
+        value = getattr(value, 'value', value)
+        return value if isinstance(value, str) else str(value)
+
+    format = convert
+
+    def write(self, writer, text):
+        writer.write_unsigned(len(text) + 2)
+        writer.write_characters(text)
+
+    def read(self, reader):
+        length = reader.read_unsigned()
+        if length < 2:
+            raise EXICodecError('String table hits are not possible with a value capacity of 0')
+        return reader.read_characters(length - 2)
+
+    value = read
+
+
+class BooleanValue():
+    def parse(self, text):
+        value = text.strip()
+        if value in ('true', '1'):
+            return True
+        if value in ('false', '0'):
+            return False
+        raise ValueError('Invalid boolean %r' % text)
+
+    def convert(self, value):
+        return self.parse(value) if isinstance(value, str) else bool(value)
+
+    def format(self, value):
+        return 'true' if self.convert(value) else 'false'
+
+    def write(self, writer, value):
+        writer.write_boolean(value)
+
+    def read(self, reader):
+        return 'true' if reader.read_boolean() else 'false'
+
+    def value(self, reader):
+        return reader.read_boolean()
+
+
+class Base64Value():
+    def parse(self, text):
+        try:
+            return base64.b64decode(''.join(text.split()), validate=True)
+        except binascii.Error as error:
+            raise ValueError(str(error))
+
+    def convert(self, value):
+        return self.parse(value) if isinstance(value, str) else bytes(value)
+
+    def format(self, value):
+        return base64.b64encode(self.convert(value)).decode('ascii')
+
+    def write(self, writer, data):
+        writer.write_binary(data)
+
+    def read(self, reader):
+        return base64.b64encode(reader.read_binary()).decode('ascii')
+
+    def value(self, reader):
+        return reader.read_binary()
+
+
+class HexValue():
+    def parse(self, text):
+        return bytes.fromhex(''.join(text.split()))
+
+    def convert(self, value):
+        return self.parse(value) if isinstance(value, str) else bytes(value)
+
+    def format(self, value):
+        return self.convert(value).hex().upper()
+
+    def write(self, writer, data):
+        writer.write_binary(data)
+
+    def read(self, reader):
+        return reader.read_binary().hex().upper()
+
+    value = read
+
+
+def _parse_integer(text):
+    value = text.strip()
+    if not value or not value.lstrip('+-').isdigit() or value[1:2] in ('+', '-'):
+        raise ValueError('Invalid integer %r' % text)
+    return int(value)
+
+
+def _convert_integer(datatype, value):
+    """Integer values of the bindings may be str or float (as '%d' exports them)"""
+    if isinstance(value, str):
+        return datatype.parse(value)
+    return datatype.parse(str(int(value)))
+
+
+def _format_integer(datatype, value):
+    return str(datatype.convert(value))
+
+
+class NBitIntegerValue():
+    """Integer with a bounded range of at most 4096 values"""
+    def __init__(self, minimum, maximum):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.bits = bit_width(maximum - minimum + 1)
+
+    def parse(self, text):
+        value = _parse_integer(text)
+        if not self.minimum <= value <= self.maximum:
+            raise ValueError('%d out of range' % value)
+        return value
+
+    convert = _convert_integer
+    format = _format_integer
+
+    def write(self, writer, value):
+        writer.write_bits(value - self.minimum, self.bits)
+
+    def read(self, reader):
+        return str(self.value(reader))
+
+    def value(self, reader):
+        return reader.read_bits(self.bits) + self.minimum
+
+
+class UnsignedIntegerValue():
+    def parse(self, text):
+        value = _parse_integer(text)
+        if value < 0:
+            raise ValueError('Negative value for an unsigned integer')
+        return value
+
+    convert = _convert_integer
+    format = _format_integer
+
+    def write(self, writer, value):
+        writer.write_unsigned(value)
+
+    def read(self, reader):
+        return str(reader.read_unsigned())
+
+    def value(self, reader):
+        return reader.read_unsigned()
+
+
+class IntegerValue():
+    def parse(self, text):
+        return _parse_integer(text)
+
+    convert = _convert_integer
+    format = _format_integer
+
+    def write(self, writer, value):
+        writer.write_integer(value)
+
+    def read(self, reader):
+        return str(reader.read_integer())
+
+    def value(self, reader):
+        return reader.read_integer()
+
+
+class DecimalValue():
+    """Sign, integral part and the fractional digits in reverse order"""
+    def parse(self, text):
+        try:
+            value = decimal.Decimal(text.strip())
+        except decimal.InvalidOperation:
+            raise ValueError('Invalid decimal %r' % text)
+        if not value.is_finite():
+            raise ValueError('Invalid decimal %r' % text)
+        sign, digits, exponent = value.as_tuple()
+        digits = ''.join(map(str, digits))
+        if exponent >= 0:
+            integral, fractional = digits + '0' * exponent, ''
+        else:
+            digits = digits.rjust(-exponent + 1, '0')
+            integral, fractional = digits[:exponent], digits[exponent:]
+        fractional = fractional.rstrip('0')
+        negative = bool(sign) and (int(integral) != 0 or bool(fractional))
+        return negative, int(integral), int(fractional[::-1]) if fractional else 0
+
+    def convert(self, value):
+        return self.parse(str(value))
+
+    def format(self, value):
+        self.convert(value)
+        return str(value)
+
+    def write(self, writer, value):
+        negative, integral, fractional = value
+        writer.write_boolean(negative)
+        writer.write_unsigned(integral)
+        writer.write_unsigned(fractional)
+
+    def read(self, reader):
+        negative = reader.read_boolean()
+        integral = reader.read_unsigned()
+        fractional = str(reader.read_unsigned())[::-1]
+        return '%s%d.%s' % ('-' if negative else '', integral, fractional)
+
+    def value(self, reader):
+        return decimal.Decimal(self.read(reader))
+
+
+class FloatValue():
+    """Mantissa and base 10 exponent, both as signed integers"""
+    SPECIAL = -(1 << 14)
+
+    def parse(self, text):
+        value = text.strip()
+        if value in ('INF', '-INF', 'NaN'):
+            return {'INF': 1, '-INF': -1, 'NaN': 0}[value], self.SPECIAL
+        try:
+            number = decimal.Decimal(value)
+        except decimal.InvalidOperation:
+            raise ValueError('Invalid float %r' % text)
+        sign, digits, exponent = number.normalize().as_tuple()
+        mantissa = int(''.join(map(str, digits)) or '0')
+        if mantissa == 0:
+            exponent = 0
+        return (-mantissa if sign else mantissa), exponent
+
+    def convert(self, value):
+        if isinstance(value, float) and value != value:
+            return self.parse('NaN')
+        if isinstance(value, float) and value in (float('inf'), float('-inf')):
+            return self.parse('INF' if value > 0 else '-INF')
+        return self.parse(str(value))
+
+    def format(self, value):
+        if isinstance(value, float) and value != value:
+            return 'NaN'
+        if isinstance(value, float) and value in (float('inf'), float('-inf')):
+            return 'INF' if value > 0 else '-INF'
+        self.convert(value)
+        return str(value)
+
+    def write(self, writer, value):
+        writer.write_integer(value[0])
+        writer.write_integer(value[1])
+
+    def read(self, reader):
+        mantissa = reader.read_integer()
+        exponent = reader.read_integer()
+        if exponent == self.SPECIAL:
+            return {1: 'INF', -1: '-INF'}.get(mantissa, 'NaN')
+        return '%dE%d' % (mantissa, exponent)
+
+    def value(self, reader):
+        return float(self.read(reader))
+
+
+class EnumerationValue():
+    """Index of the value in the enumeration facet"""
+    def __init__(self, values, collapse_whitespace):
+        self.values = values
+        self.index = {value: position for position, value in enumerate(values)}
+        self.bits = bit_width(len(values))
+        self.collapse_whitespace = collapse_whitespace
+
+    def parse(self, text):
+        value = collapse(text) if self.collapse_whitespace else text
+        if value not in self.index:
+            raise ValueError('%r is not an enumerated value' % text)
+        return self.index[value]
+
+    def convert(self, value):
+        # generateDS enumerations are (str, Enum) members
+        return self.parse(getattr(value, 'value', value))
+
+    def format(self, value):
+        value = getattr(value, 'value', value)
+        self.parse(value)
+        return value
+
+    def write(self, writer, position):
+        writer.write_bits(position, self.bits)
+
+    def read(self, reader):
+        position = reader.read_bits(self.bits)
+        if position >= len(self.values):
+            raise EXICodecError('Enumeration index %d out of range' % position)
+        return self.values[position]
+
+    value = read
+
+
+class UnsupportedValue():
+    def __init__(self, primitive):
+        self.primitive = primitive
+
+    def parse(self, text):
+        raise EXICodecError('xs:%s values are not supported' % self.primitive)
+
+    convert = format = parse
+
+    def write(self, writer, value):
+        raise EXICodecError('xs:%s values are not supported' % self.primitive)
+
+    def read(self, reader):
+        raise EXICodecError('xs:%s values are not supported' % self.primitive)
+
+    value = read
+
+
+STRING = StringValue()
+BOOLEAN = BooleanValue()
+
+_cache = {}
+
+
+def datatype_for(simple_type):
+    """Value encoding for a SimpleType"""
+    key = id(simple_type)
+    if key in _cache:
+        return _cache[key]
+    primitive = simple_type.primitive
+    facets = simple_type.facets
+    if 'enumeration' in facets and primitive not in ('QName', 'NOTATION'):
+        datatype = EnumerationValue(facets['enumeration'], primitive != 'string')
+    elif primitive == 'boolean':
+        datatype = BOOLEAN
+    elif primitive == 'base64Binary':
+        datatype = Base64Value()
+    elif primitive == 'hexBinary':
+        datatype = HexValue()
+    elif primitive == 'decimal' and simple_type.derives_from((XS, 'integer')):
+        minimum = facets.get('minInclusive')
+        if 'minExclusive' in facets:
+            minimum = facets['minExclusive'] + 1
+        maximum = facets.get('maxInclusive')
+        if 'maxExclusive' in facets:
+            maximum = facets['maxExclusive'] - 1
+        if minimum is not None and maximum is not None and maximum - minimum < 4096:
+            datatype = NBitIntegerValue(minimum, maximum)
+        elif minimum is not None and minimum >= 0:
+            datatype = UnsignedIntegerValue()
+        else:
+            datatype = IntegerValue()
+    elif primitive == 'decimal':
+        datatype = DecimalValue()
+    elif primitive in ('float', 'double'):
+        datatype = FloatValue()
+    elif primitive in ('string', 'anyURI', 'QName', 'NOTATION', 'anySimpleType'):
+        datatype = STRING
+    else:
+        datatype = UnsupportedValue(primitive)
+    _cache[key] = datatype
+    return datatype
@@ -0,0 +1,411 @@
+"""Schema-informed EXI grammars (EXI 1.0, section 8.5) for the non strict
+mode used by the bundled EXIficient jars.
+
+Type grammars are first built as proto grammars (a small NFA with epsilon
+edges), then normalized by subset construction. Productions of every state
+are ordered as required by the event code assignment rules, so the position
+of a production is its first level event code.
+"""
+import threading
+
+from common.exi.schema import (ElementDecl, Wildcard, ModelGroup, ComplexType, SimpleType,
+                               ANY_TYPE, XS, XSI)
+
+# Event kinds, the numeric value is the event code ordering of section 8.5.4.3
+AT = 0
+AT_NS = 1
+AT_ANY = 2
+SE = 3
+SE_NS = 4
+SE_ANY = 5
+EE = 6
+CH = 7
+CH_UNTYPED = 8
+# Second level only
+AT_XSI_TYPE = 9
+AT_XSI_NIL = 10
+AT_INVALID = 11
+
+# Kinds of element grammar states
+FIRST_START_TAG = 0
+START_TAG = 1
+CONTENT = 2
+
+XSI_TYPE = (XSI, 'type')
+XSI_NIL = (XSI, 'nil')
+
+
+def bit_width(count):
+    """Number of bits of an n-bit unsigned integer that distinguishes ``count`` values"""
+    return (count - 1).bit_length() if count > 1 else 0
+
+
+class Production():
+    """Event of a grammar state. ``name`` is the qname (AT/SE) or the namespace
+    (AT_NS/SE_NS), ``payload`` the declaration or simple type, ``target`` the
+    next state (None for EE).
+    """
+    __slots__ = ('kind', 'name', 'payload', 'target', 'code')
+
+    def __init__(self, kind, name=None, payload=None, target=None, code=0):
+        self.kind = kind
+        self.name = name
+        self.payload = payload
+        self.target = target
+        self.code = code
+
+    def __repr__(self):
+        return 'Production(%d, %r)' % (self.kind, self.name)
+
+
+class State():
+    """Grammar state with its first and second level event codes"""
+    __slots__ = ('kind', 'productions', 'bits', 'second', 'second_bits', 'content2',
+                 'lookup', 'grammar')
+
+    def __init__(self, kind, grammar=None):
+        self.kind = kind
+        self.productions = []
+        self.bits = 0
+        self.second = []
+        self.second_bits = 0
+        self.content2 = None
+        self.lookup = {}
+        self.grammar = grammar
+
+    def finish(self, second_level=True):
+        """Assigns event codes and builds the lookup used by the encoder"""
+        for code, production in enumerate(self.productions):
+            production.code = code
+            key = (production.kind, production.name)
+            self.lookup.setdefault(key, production)
+        if not second_level:
+            self.bits = bit_width(len(self.productions))
+            return
+        self.bits = bit_width(len(self.productions) + 1)
+        kinds = {production.kind for production in self.productions}
+        second = []
+        if EE not in kinds:
+            second.append(EE)
+        if self.kind == FIRST_START_TAG:
+            second.extend((AT_XSI_TYPE, AT_XSI_NIL))
+        if self.kind != CONTENT:
+            second.extend((AT_ANY, AT_INVALID))
+        second.extend((SE_ANY, CH_UNTYPED))
+        self.second = second
+        self.second_bits = bit_width(len(second))
+
+    def undeclared_target(self, kind):
+        """State that follows an undeclared (second level) event"""
+        if kind in (SE_ANY, CH_UNTYPED):
+            return self.content2 if self.content2 is not None else self
+        return self
+
+
+class Grammar():
+    """Element grammar for one type definition"""
+    def __init__(self, type_definition):
+        self.type = type_definition
+        self.start = None
+        self.empty = None
+
+    @property
+    def simple_type(self):
+        """Simple type of the character content, if the content is simple"""
+        if isinstance(self.type, SimpleType):
+            return self.type
+        if isinstance(self.type, ComplexType) and self.type.content == 'simple':
+            return self.type.simple_type
+        return None
+
+
+class _Proto():
+    """Proto grammar: NFA whose edges are (label, target). A label None is an
+    epsilon edge. Labels are tuples that sort in event code order.
+    """
+    def __init__(self, schema):
+        self.schema = schema
+        self.edges = []
+        self.payloads = {}
+        self.order = {}
+
+    def new(self):
+        self.edges.append([])
+        return len(self.edges) - 1
+
+    def add(self, source, label, target, payload=None):
+        self.edges[source].append((label, target))
+        if payload is not None:
+            self.payloads[label] = payload
+
+    def epsilon(self, source, target):
+        self.edges[source].append((None, target))
+
+    def number_particles(self, particle):
+        """Schema order of the particles, used to sort SE(qname) productions"""
+        self.order[id(particle)] = len(self.order)
+        if isinstance(particle.term, ModelGroup):
+            for child in particle.term.particles:
+                self.number_particles(child)
+
+    def term(self, particle):
+        start = self.new()
+        end = self.new()
+        term = particle.term
+        if isinstance(term, ElementDecl):
+            members = self.schema.substitution_members(term) if term.is_global else [term]
+            for rank, member in enumerate(members):
+                self.add(start, (SE, self.order[id(particle)], rank, member.qname), end, member)
+        elif isinstance(term, Wildcard):
+            if term.namespaces is None:
+                self.add(start, (SE_ANY,), end)
+            else:
+                for uri in term.namespaces:
+                    self.add(start, (SE_NS, uri), end)
+        elif term.compositor == 'sequence':
+            current = start
+            for child in term.particles:
+                child_start, child_end = self.particle(child)
+                self.epsilon(current, child_start)
+                current = child_end
+            self.epsilon(current, end)
+        elif term.compositor == 'choice':
+            if not term.particles:
+                self.epsilon(start, end)
+            for child in term.particles:
+                child_start, child_end = self.particle(child)
+                self.epsilon(start, child_start)
+                self.epsilon(child_end, end)
+        else:
+            # xs:all, any order of the particles
+            self.epsilon(start, end)
+            for child in term.particles:
+                child_start, child_end = self.particle(child)
+                self.epsilon(start, child_start)
+                self.epsilon(child_end, start)
+        return start, end
+
+    def particle(self, particle):
+        start = current = self.new()
+        for _ in range(particle.min_occurs):
+            term_start, term_end = self.term(particle)
+            self.epsilon(current, term_start)
+            current = term_end
+        end = self.new()
+        if particle.max_occurs is None:
+            term_start, term_end = self.term(particle)
+            self.epsilon(current, term_start)
+            self.epsilon(term_end, term_start)
+            self.epsilon(term_start, end)
+        else:
+            for _ in range(particle.max_occurs - particle.min_occurs):
+                term_start, term_end = self.term(particle)
+                self.epsilon(current, term_start)
+                self.epsilon(current, end)
+                current = term_end
+            self.epsilon(current, end)
+        return start, end
+
+    def closure(self, states):
+        result = set(states)
+        pending = list(states)
+        while pending:
+            state = pending.pop()
+            for label, target in self.edges[state]:
+                if label is None and target not in result:
+                    result.add(target)
+                    pending.append(target)
+        return frozenset(result)
+
+    def normalize(self, grammar, start, content_start):
+        """Subset construction, returns the initial state"""
+        states = {}
+        pending = []
+
+        def get(nfa_states, kind):
+            key = (nfa_states, kind)
+            if key not in states:
+                states[key] = State(kind, grammar)
+                pending.append(key)
+            return states[key]
+
+        initial = get(self.closure([start]), FIRST_START_TAG)
+        content2 = self.closure([content_start])
+        while pending:
+            key = pending.pop()
+            nfa_states, kind = key
+            state = states[key]
+            transitions = {}
+            for nfa_state in nfa_states:
+                for label, target in self.edges[nfa_state]:
+                    if label is not None:
+                        transitions.setdefault(label, set())
+                        if target is not None:
+                            transitions[label].add(target)
+            for label in sorted(transitions, key=_label_key):
+                event = label[0]
+                name = None
+                if event == AT:
+                    name = (label[2], label[1])
+                elif event == SE:
+                    name = label[3]
+                elif event in (AT_NS, SE_NS):
+                    name = label[1]
+                target = None
+                if event != EE:
+                    next_kind = START_TAG if event in (AT, AT_NS, AT_ANY) else CONTENT
+                    target = get(self.closure(transitions[label]), next_kind)
+                state.productions.append(Production(event, name, self.payloads.get(label), target))
+            if kind != CONTENT:
+                state.content2 = get(content2, CONTENT)
+        for state in states.values():
+            state.finish()
+        return initial
+
+
+def _label_key(label):
+    # EE and CH labels carry no names, SE labels sort on schema order
+    return label
+
+
+class GrammarBuilder():
+    """Builds and caches the element grammars of a schema. Grammars are built
+    on first use under a lock, sessions on several threads share them
+    """
+    def __init__(self, schema):
+        self.schema = schema
+        # Grammars being built, recursive types find their own grammar here
+        self.cache = {}
+        # Complete grammars, read without the lock
+        self.built = {}
+        self.lock = threading.RLock()
+        self.document = self._document_grammar()
+        self.ur_type = self.grammar(ANY_TYPE)
+
+    def grammar(self, type_definition):
+        """Element grammar for a type definition"""
+        key = id(type_definition)
+        grammar = self.built.get(key)
+        if grammar is not None:
+            return grammar
+        with self.lock:
+            if key not in self.cache:
+                grammar = Grammar(type_definition)
+                self.cache[key] = grammar
+                if type_definition is ANY_TYPE:
+                    self._ur_type(grammar)
+                else:
+                    grammar.start = self._type_grammar(grammar, type_definition, empty=False)
+                    grammar.empty = self._type_grammar(grammar, type_definition, empty=True)
+                self.built[key] = grammar
+            return self.cache[key]
+
+    def element_grammar(self, decl):
+        """Element grammar for an element declaration"""
+        return self.grammar(decl.type)
+
+    def _type_grammar(self, grammar, type_definition, empty):
+        proto = _Proto(self.schema)
+        start = current = proto.new()
+        if isinstance(type_definition, ComplexType):
+            for use in type_definition.attributes:
+                after = proto.new()
+                label = (AT, use.decl.qname[1], use.decl.qname[0])
+                proto.add(current, label, after, use.decl)
+                if not use.required:
+                    proto.epsilon(current, after)
+                if type_definition.attribute_wildcard is not None:
+                    self._attribute_wildcard(proto, current, type_definition.attribute_wildcard)
+                current = after
+            if type_definition.attribute_wildcard is not None:
+                self._attribute_wildcard(proto, current, type_definition.attribute_wildcard)
+        content_start = current
+        first_content = len(proto.edges)
+        if not empty:
+            simple_type = type_definition if isinstance(type_definition, SimpleType) \
+                else type_definition.simple_type
+            if simple_type is not None:
+                after = proto.new()
+                proto.add(current, (CH,), after, simple_type)
+                current = after
+            elif type_definition.particle is not None:
+                proto.number_particles(type_definition.particle)
+                particle_start, particle_end = proto.particle(type_definition.particle)
+                proto.epsilon(current, particle_start)
+                current = particle_end
+            if isinstance(type_definition, ComplexType) and type_definition.mixed:
+                for state in [content_start] + list(range(first_content, len(proto.edges))):
+                    proto.add(state, (CH_UNTYPED,), state)
+        proto.add(current, (EE,), None)
+        return proto.normalize(grammar, start, content_start)
+
+    @staticmethod
+    def _attribute_wildcard(proto, state, wildcard):
+        if wildcard.namespaces is None:
+            proto.add(state, (AT_ANY,), state)
+        else:
+            for uri in wildcard.namespaces:
+                proto.add(state, (AT_NS, uri), state)
+
+    @staticmethod
+    def _ur_type(grammar):
+        start = State(FIRST_START_TAG, grammar)
+        content = State(CONTENT, grammar)
+        start.productions = [Production(AT_ANY, target=start), Production(SE_ANY, target=content),
+                             Production(EE), Production(CH_UNTYPED, target=content)]
+        content.productions = [Production(SE_ANY, target=content), Production(EE),
+                               Production(CH_UNTYPED, target=content)]
+        start.content2 = content
+        empty = State(FIRST_START_TAG, grammar)
+        empty.productions = [Production(AT_ANY, target=empty), Production(EE)]
+        empty.content2 = content
+        for state in (start, content, empty):
+            state.finish()
+        grammar.start = start
+        grammar.empty = empty
+
+    def _document_grammar(self):
+        """DocContent: SE(G_0) ... SE(G_n-1), SE(*) in the order of section 8.5.1"""
+        state = State(CONTENT)
+        decls = sorted(self.schema.elements.values(),
+                       key=lambda decl: (decl.qname[1], decl.qname[0]))
+        state.productions = [Production(SE, decl.qname, decl) for decl in decls]
+        state.productions.append(Production(SE_ANY))
+        state.finish(second_level=False)
+        return state
+
+    def type_for(self, qname):
+        """Type definition named by an xsi:type value, None if unknown"""
+        try:
+            return self.schema.get_type(qname)
+        except Exception:
+            return None
+
+
+class BuiltInGrammar():
+    """Built-in element grammar without grammar learning
+    (maximumNumberOfBuiltInProductions = 0). The only production EXIficient
+    still learns is AT(xsi:type): once an element has been cast, later
+    occurrences of the same qname start with it at the first level, although
+    the encoder keeps using AT(*) for the cast.
+    """
+    def __init__(self, cast=False):
+        self.start = State(START_TAG)
+        self.content = State(CONTENT)
+        if cast:
+            self.start.productions = [Production(AT, XSI_TYPE)]
+        self.start.second = [EE, AT_ANY, SE_ANY, CH_UNTYPED]
+        self.start.second_bits = 2
+        self.start.bits = 1 if cast else 0
+        self.start.content2 = self.content
+        self.content.productions = [Production(EE)]
+        self.content.bits = 1
+        self.content.second = [SE_ANY, CH_UNTYPED]
+        self.content.second_bits = 1
+        self.content.content2 = self.content
+        self.start.grammar = self.content.grammar = None
+
+
+BUILT_IN = BuiltInGrammar()
+BUILT_IN_CAST = BuiltInGrammar(cast=True)
+XS_ANY_TYPE = (XS, 'anyType')
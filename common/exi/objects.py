@@ -0,0 +1,326 @@
+"""Mapping between the EXI events and the generateDS objects
+(common/XML/msgDef1.py, appprotocol1.py), without XML text in between.
+
+- ObjectBuilder: output of the Decoder that instantiates the classes of the
+  schema types as their elements start. Typed values (int, bool, bytes) are
+  assigned as they are read: no XML string, lxml tree or GdsCollector_.
+- CompactBuilder: ObjectBuilder that builds the charging loop messages as
+  the __slots__ models of common.bindings.compact.
+- ObjectModel: members of the objects in schema order, used by the
+  ObjectEncoder and ObjectExporter (common/exi/codec.py) to walk an object
+  graph.
+
+Content the generated classes keep as mixed or wildcard content (xmldsig
+Transform with children, Object, SignatureProperty, undeclared elements)
+raises UnsupportedContent, EXICodec.decode_object and encode_object then take
+the XML route.
+"""
+from common.exi import grammar as g
+from common.exi.schema import ComplexType, ModelGroup, ElementDecl, ANY_TYPE, XSI
+
+
+class UnsupportedContent(Exception):
+    """Raised for content the ObjectBuilder cannot map to the bindings"""
+
+
+class ObjectModel():
+    """Schema view of the generateDS classes: an element is stored in the
+    member named like the element the content model references, which is the
+    element itself or the head of its substitution group. Members are
+    exported in schema order
+    """
+    def __init__(self, schema):
+        self.schema = schema
+        self.members = {}
+        self.particles = {}
+        self.globals = {}
+        self.referenced = None
+        for decl in schema.elements.values():
+            self.globals.setdefault(decl.qname[1], []).append(decl)
+
+    def member(self, decl):
+        """Attribute of the parent object holding ``decl``"""
+        name = self.members.get(id(decl))
+        if name is None:
+            if self.referenced is None:
+                self.referenced = self._referenced()
+            head = decl
+            while id(head) not in self.referenced and head.substitution_group is not None:
+                head = self.schema.get_element(head.substitution_group)
+            name = self.members[id(decl)] = head.qname[1]
+        return name
+
+    def _referenced(self):
+        """ids of the element declarations some content model refers to"""
+        referenced = set()
+        pending = [t for t in self.schema.types.values() if isinstance(t, ComplexType)]
+        pending.extend(decl.type for decl in self.schema.elements.values())
+        seen = set()
+        while pending:
+            complex_type = pending.pop()
+            if not isinstance(complex_type, ComplexType) or id(complex_type) in seen:
+                continue
+            seen.add(id(complex_type))
+            particles = [complex_type.particle] if complex_type.particle is not None else []
+            while particles:
+                term = particles.pop().term
+                if isinstance(term, ModelGroup):
+                    particles.extend(term.particles)
+                elif isinstance(term, ElementDecl):
+                    referenced.add(id(term))
+                    pending.append(term.type)
+        return referenced
+
+    def children(self, complex_type):
+        """(declaration, member) of the child elements in schema order"""
+        children = self.particles.get(id(complex_type))
+        if children is None:
+            children = []
+            if complex_type.particle is not None:
+                self._collect(complex_type.particle, children)
+            self.particles[id(complex_type)] = children
+        return children
+
+    def _collect(self, particle, children):
+        term = particle.term
+        if isinstance(term, ModelGroup):
+            for child in term.particles:
+                self._collect(child, children)
+        elif isinstance(term, ElementDecl):
+            children.append((term, self.member(term)))
+
+    def element_for(self, decl, obj):
+        """Declaration of the element ``obj`` is exported as when it is stored
+        in the member of ``decl``: the substitution group member named by
+        original_tagname_, or the one with the type of the object
+        """
+        if decl.qname not in self.schema.substitutions:
+            return decl
+        tag = getattr(obj, 'original_tagname_', None)
+        members = self.schema.substitution_members(decl)
+        for member in members:
+            if member.qname[1] == tag and not member.abstract:
+                return member
+        for member in members:
+            if not member.abstract and _type_name(member) == type(obj).__name__:
+                return member
+        raise UnsupportedContent('No element for %s in %s' % (type(obj).__name__, decl.qname[1]))
+
+    def root_element(self, obj):
+        """Global declaration of a root object, named by original_tagname_ or
+        by the class as export() names it
+        """
+        name = getattr(obj, 'original_tagname_', None) or type(obj).__name__
+        candidates = self.globals.get(name, [])
+        if len(candidates) != 1:
+            raise UnsupportedContent('No global element %s' % name)
+        return candidates[0]
+
+    def fragment_element(self, name, obj):
+        """Declaration of an element encoded on its own: the global element
+        ``name`` or the local one of the type of ``obj``
+        """
+        candidates = self.globals.get(name, [])
+        if len(candidates) == 1:
+            return candidates[0]
+        for type_definition in self.schema.types.values():
+            if not isinstance(type_definition, ComplexType):
+                continue
+            for decl, _ in self.children(type_definition):
+                if decl.qname[1] == name and _type_name(decl) == type(obj).__name__:
+                    return decl
+        raise UnsupportedContent('No element %s of %s' % (name, type(obj).__name__))
+
+
+def _type_name(decl):
+    """Name of the generateDS class of an element declaration"""
+    if decl.type.qname is not None:
+        return decl.type.qname[1]
+    return decl.qname[1]
+
+
+class _Frame():
+    """Element being built: the object (or simple value) and its declaration"""
+    __slots__ = ('decl', 'type', 'prefix', 'obj', 'value', 'attributes')
+
+    def __init__(self, decl, prefix):
+        self.decl = decl
+        self.type = decl.type
+        self.prefix = prefix
+        self.obj = None
+        self.value = None
+        self.attributes = []
+
+
+class ObjectBuilder():
+    """Output of a Decoder that creates objects of the ``binding`` module
+    instead of writing XML. getvalue() returns the root object. Namespace
+    prefixes are the ns<uri id> prefixes of the decoded XML, as the objects
+    parsed from it would capture them
+    """
+    def __init__(self, codec, binding):
+        self.schema = codec.schema
+        self.model = codec.model
+        self.uri_ids = codec.tables.uri_ids
+        self.binding = binding
+        self.base = binding.GeneratedsSuper
+        self.stack = []
+        self.root = None
+
+    def prefix(self, uri):
+        if not uri:
+            return None
+        if uri == XSI:
+            return 'xsi'
+        return 'ns%d' % self.uri_ids[uri]
+
+    def binding_class(self, frame):
+        """Class of the element, None for simple values. Simple types only
+        have a class if generateDS wrapped them (xmldsig DigestValueType)
+        """
+        type_definition = frame.type
+        if type_definition.qname:
+            name = type_definition.qname[1]
+        else:
+            name = frame.decl.qname[1]
+        cls = getattr(self.binding, name, None)
+        if not isinstance(type_definition, ComplexType):
+            if isinstance(cls, type) and issubclass(cls, self.base):
+                return cls
+            return None
+        if type_definition is ANY_TYPE or type_definition.abstract or cls is None:
+            raise UnsupportedContent('No class for %s' % frame.decl.qname[1])
+        return cls
+
+    def lexical(self):
+        """Simple content of classes is kept as text (valueOf_)"""
+        self.flush()
+        return self.stack[-1].obj is not None
+
+    def start(self, qname, decl=None):
+        if decl is None:
+            raise UnsupportedContent('Undeclared element %s' % qname[1])
+        self.flush()
+        if self.stack and getattr(self.stack[-1].type, 'mixed', False):
+            raise UnsupportedContent('Mixed content in %s' % qname[1])
+        self.stack.append(_Frame(decl, self.prefix(qname[0])))
+        return qname
+
+    def attribute(self, qname, value):
+        frame = self.stack[-1]
+        if qname == g.XSI_TYPE:
+            frame.type = self.schema.types.get(value)
+            if frame.type is None:
+                raise UnsupportedContent('Unknown xsi:type %s' % value[1])
+        elif qname != g.XSI_NIL:
+            frame.attributes.append((qname[1], value))
+
+    @staticmethod
+    def qname_value(qname):
+        return qname
+
+    def flush(self, empty=False):
+        """Creates the object of the innermost element once its attributes
+        are known
+        """
+        if not self.stack:
+            return
+        frame = self.stack[-1]
+        if frame.obj is not None or frame.attributes is None:
+            return
+        cls = self.binding_class(frame)
+        if cls is not None:
+            frame.obj = self.instantiate(cls, frame)
+        frame.attributes = None
+
+    @staticmethod
+    def instantiate(cls, frame):
+        obj = cls()
+        obj.ns_prefix_ = frame.prefix
+        for attribute, value in frame.attributes:
+            setattr(obj, attribute, value)
+        return obj
+
+    def characters(self, value):
+        frame = self.stack[-1]
+        if isinstance(frame.type, ComplexType) and frame.type.content != 'simple':
+            raise UnsupportedContent('Character content in %s' % frame.decl.qname[1])
+        frame.value = value
+
+    def end(self, name):
+        self.flush()
+        frame = self.stack.pop()
+        if frame.obj is None:
+            value = frame.value
+        else:
+            value = frame.obj
+            if getattr(frame.type, 'content', 'simple') == 'simple' or frame.type.mixed:
+                value.valueOf_ = frame.value if frame.value is not None else ''
+        if not self.stack:
+            self.root = value
+            return
+        parent = self.stack[-1].obj
+        member = self.model.member(frame.decl)
+        current = getattr(parent, member, UnsupportedContent)
+        if current is UnsupportedContent:
+            raise UnsupportedContent('%s has no member %s' % (type(parent).__name__, member))
+        self.annotate(parent, member, frame)
+        if isinstance(current, list):
+            current.append(value)
+        else:
+            setattr(parent, member, value)
+
+    @staticmethod
+    def annotate(parent, member, frame):
+        """What the generateDS parser records about a child: tag and parent
+        of objects, the prefix of simple values
+        """
+        if frame.obj is not None:
+            frame.obj.original_tagname_ = frame.decl.qname[1]
+            frame.obj.parent_object_ = parent
+        else:
+            setattr(parent, member + '_nsprefix_', frame.prefix)
+
+    def getvalue(self):
+        return self.root
+
+
+class CompactBuilder(ObjectBuilder):
+    """ObjectBuilder of V2G messages that creates the charging loop messages
+    as the __slots__ models of ``compact`` (common.bindings.compact) from the
+    body element on. The generateDS root, Body and header built up to there
+    are replaced by their compact models, other messages stay generateDS
+    objects of ``binding``
+    """
+    def __init__(self, codec, binding, compact):
+        super().__init__(codec, binding)
+        self.compact = compact
+        self.loop = False
+
+    def binding_class(self, frame):
+        type_definition = frame.type
+        name = type_definition.qname[1] if type_definition.qname else frame.decl.qname[1]
+        if not self.loop:
+            if len(self.stack) != 3 or name not in self.compact.BODY_TYPES:
+                return super().binding_class(frame)
+            root, body = self.stack[0], self.stack[1]
+            root.obj = self.compact.V2G_Message(
+                self.compact.MessageHeaderType.from_binding(root.obj.Header))
+            body.obj = self.compact.BodyType()
+            self.loop = True
+            return self.compact.BODY_TYPES[name]
+        if not isinstance(type_definition, ComplexType):
+            return None
+        cls = getattr(self.compact, name, None)
+        if not (isinstance(cls, type) and issubclass(cls, self.compact.CompactType)):
+            raise UnsupportedContent('No compact model for %s' % name)
+        return cls
+
+    def instantiate(self, cls, frame):
+        if self.loop:
+            return cls()
+        return ObjectBuilder.instantiate(cls, frame)
+
+    def annotate(self, parent, member, frame):
+        if not isinstance(parent, self.compact.CompactType):
+            ObjectBuilder.annotate(parent, member, frame)
@@ -0,0 +1,492 @@
+"""XML Schema loader for the EXI codec. Reads the XSD files shipped in
+common/XML (following xs:import) into a small component model: element and
+attribute declarations, simple and complex type definitions and particles.
+Only the XSD features used by the ISO 15118-2 schemas and xmldsig are
+supported (no xs:group, xs:attributeGroup, lists or unions).
+"""
+import os
+import xml.etree.ElementTree as ET
+
+XS = 'http://www.w3.org/2001/XMLSchema'
+XSI = 'http://www.w3.org/2001/XMLSchema-instance'
+XML_NS = 'http://www.w3.org/XML/1998/namespace'
+
+UNBOUNDED = None
+
+
+def _xs(tag):
+    return '{%s}%s' % (XS, tag)
+
+
+class SchemaError(Exception):
+    """Raised for XSD constructs the loader does not understand"""
+
+
+class SimpleType():
+    """Atomic simple type. ``primitive`` is the built-in primitive the type is
+    derived from, ``facets`` holds the accumulated facets of the derivation chain.
+    """
+    def __init__(self, qname, base=None, primitive=None, facets=None):
+        self.qname = qname
+        self.base = base
+        self.primitive = primitive if primitive else (base.primitive if base else None)
+        self.facets = dict(base.facets) if base else {}
+        if facets:
+            self.facets.update(facets)
+
+    def derives_from(self, qname):
+        """True if the type is ``qname`` or is derived from it"""
+        simple_type = self
+        while simple_type is not None:
+            if simple_type.qname == qname:
+                return True
+            simple_type = simple_type.base
+        return False
+
+    def __repr__(self):
+        return 'SimpleType(%r)' % (self.qname,)
+
+
+class ComplexType():
+    """Complex type definition. ``content`` is one of 'empty', 'simple' or
+    'element', ``particle`` is the effective content model for element content.
+    """
+    def __init__(self, qname):
+        self.qname = qname
+        self.abstract = False
+        self.mixed = False
+        self.content = 'empty'
+        self.simple_type = None
+        self.attributes = []
+        self.attribute_wildcard = None
+        self.particle = None
+        self.base = None
+
+    def __repr__(self):
+        return 'ComplexType(%r)' % (self.qname,)
+
+
+class ElementDecl():
+    """Element declaration, global or local"""
+    def __init__(self, qname, is_global):
+        self.qname = qname
+        self.is_global = is_global
+        self.type = None
+        self.abstract = False
+        self.nillable = False
+        self.substitution_group = None
+
+    def __repr__(self):
+        return 'ElementDecl(%r)' % (self.qname,)
+
+
+class AttributeDecl():
+    """Attribute declaration, global or local"""
+    def __init__(self, qname, simple_type):
+        self.qname = qname
+        self.type = simple_type
+
+
+class AttributeUse():
+    """Attribute declaration as used by a complex type"""
+    def __init__(self, decl, required):
+        self.decl = decl
+        self.required = required
+
+
+class Wildcard():
+    """Element or attribute wildcard. ``namespaces`` is None for ##any and
+    ##other, otherwise the tuple of allowed namespace URIs.
+    """
+    def __init__(self, namespaces):
+        self.namespaces = namespaces
+
+
+class ModelGroup():
+    """sequence, choice or all"""
+    def __init__(self, compositor, particles):
+        self.compositor = compositor
+        self.particles = particles
+
+
+class Particle():
+    """Term with occurrence bounds, ``max_occurs`` is None for unbounded"""
+    def __init__(self, term, min_occurs=1, max_occurs=1):
+        self.term = term
+        self.min_occurs = min_occurs
+        self.max_occurs = max_occurs
+
+
+def _builtin_types():
+    """Built-in XSD simple types with the facets EXI needs (bounds and base)"""
+    types = {}
+
+    def add(name, base, **facets):
+        base_type = types[(XS, base)] if base else None
+        types[(XS, name)] = SimpleType((XS, name), base_type, None if base else name, facets)
+
+    add('anySimpleType', None)
+    for primitive in ('string', 'boolean', 'decimal', 'float', 'double', 'duration',
+                      'dateTime', 'time', 'date', 'gYearMonth', 'gYear', 'gMonthDay',
+                      'gDay', 'gMonth', 'hexBinary', 'base64Binary', 'anyURI', 'QName',
+                      'NOTATION'):
+        types[(XS, primitive)] = SimpleType((XS, primitive), types[(XS, 'anySimpleType')],
+                                            primitive)
+    add('normalizedString', 'string')
+    add('token', 'normalizedString')
+    add('language', 'token')
+    add('NMTOKEN', 'token')
+    add('NMTOKENS', 'NMTOKEN')
+    add('Name', 'token')
+    add('NCName', 'Name')
+    add('ID', 'NCName')
+    add('IDREF', 'NCName')
+    add('IDREFS', 'IDREF')
+    add('ENTITY', 'NCName')
+    add('ENTITIES', 'ENTITY')
+    add('integer', 'decimal')
+    add('nonPositiveInteger', 'integer', maxInclusive=0)
+    add('negativeInteger', 'nonPositiveInteger', maxInclusive=-1)
+    add('long', 'integer', minInclusive=-2**63, maxInclusive=2**63 - 1)
+    add('int', 'long', minInclusive=-2**31, maxInclusive=2**31 - 1)
+    add('short', 'int', minInclusive=-2**15, maxInclusive=2**15 - 1)
+    add('byte', 'short', minInclusive=-2**7, maxInclusive=2**7 - 1)
+    add('nonNegativeInteger', 'integer', minInclusive=0)
+    add('unsignedLong', 'nonNegativeInteger', maxInclusive=2**64 - 1)
+    add('unsignedInt', 'unsignedLong', maxInclusive=2**32 - 1)
+    add('unsignedShort', 'unsignedInt', maxInclusive=2**16 - 1)
+    add('unsignedByte', 'unsignedShort', maxInclusive=2**8 - 1)
+    add('positiveInteger', 'nonNegativeInteger', minInclusive=1)
+    return types
+
+
+BUILTIN_TYPES = _builtin_types()
+ANY_TYPE = ComplexType((XS, 'anyType'))
+
+
+class _Document():
+    """One parsed XSD file"""
+    def __init__(self, path):
+        self.path = path
+        self.namespaces = {}
+        for event, item in ET.iterparse(path, events=('start-ns',)):
+            prefix, uri = item
+            self.namespaces.setdefault(prefix, uri)
+        self.root = ET.parse(path).getroot()
+        self.target_namespace = self.root.get('targetNamespace', '')
+        self.element_qualified = self.root.get('elementFormDefault') == 'qualified'
+        self.attribute_qualified = self.root.get('attributeFormDefault') == 'qualified'
+
+    def resolve(self, value):
+        """Resolves a QName valued XSD attribute to (uri, local)"""
+        if ':' in value:
+            prefix, local = value.split(':', 1)
+            return (self.namespaces[prefix], local)
+        return (self.namespaces.get('', ''), value)
+
+
+class Schema():
+    """Set of schema components loaded from an XSD and everything it imports"""
+    def __init__(self, path):
+        self.path = path
+        self.documents = []
+        self.elements = {}
+        self.attributes = {}
+        self.types = dict(BUILTIN_TYPES)
+        self.types[ANY_TYPE.qname] = ANY_TYPE
+        self.substitutions = {}
+        # Every named declaration and definition, used to prefill the string table
+        self.local_names = {}
+        self._raw_types = {}
+        self._raw_elements = {}
+        self._raw_attributes = {}
+        self._load(os.path.abspath(path), set())
+        for qname in list(self._raw_types):
+            self.get_type(qname)
+        for qname in list(self._raw_elements):
+            self.get_element(qname)
+        for decl in self.elements.values():
+            if decl.substitution_group is not None:
+                self.substitutions.setdefault(decl.substitution_group, []).append(decl)
+
+    @property
+    def target_namespaces(self):
+        """Namespaces that have at least one declaration"""
+        return sorted(uri for uri in self.local_names if uri not in ('', XS))
+
+    def _add_name(self, uri, local):
+        self.local_names.setdefault(uri, set()).add(local)
+
+    def _load(self, path, seen):
+        if path in seen:
+            return
+        seen.add(path)
+        document = _Document(path)
+        self.documents.append(document)
+        for node in document.root:
+            if node.tag == _xs('import') or node.tag == _xs('include'):
+                location = node.get('schemaLocation')
+                if location:
+                    self._load(os.path.join(os.path.dirname(path), location), seen)
+            elif node.tag == _xs('element'):
+                qname = (document.target_namespace, node.get('name'))
+                self._raw_elements[qname] = (document, node)
+            elif node.tag in (_xs('complexType'), _xs('simpleType')):
+                qname = (document.target_namespace, node.get('name'))
+                self._raw_types[qname] = (document, node)
+                self._add_name(*qname)
+            elif node.tag == _xs('attribute'):
+                qname = (document.target_namespace, node.get('name'))
+                self._raw_attributes[qname] = (document, node)
+        self._collect_names(document, document.root, top=True)
+
+    def _collect_names(self, document, node, top=False):
+        """Adds the local names of all element and attribute declarations"""
+        for child in node:
+            if child.tag == _xs('element') and child.get('name'):
+                uri = document.target_namespace if top or document.element_qualified \
+                    or child.get('form') == 'qualified' else ''
+                self._add_name(uri, child.get('name'))
+            elif child.tag == _xs('attribute') and child.get('name'):
+                uri = document.target_namespace if top or document.attribute_qualified \
+                    or child.get('form') == 'qualified' else ''
+                self._add_name(uri, child.get('name'))
+            self._collect_names(document, child)
+
+    # Lookups, resolving raw components on first use
+
+    def get_type(self, qname):
+        """Type definition (SimpleType or ComplexType) for ``qname``"""
+        if qname in self.types:
+            return self.types[qname]
+        if qname not in self._raw_types:
+            raise SchemaError('Unknown type %r' % (qname,))
+        document, node = self._raw_types[qname]
+        if node.tag == _xs('simpleType'):
+            return self._simple_type(document, node, qname)
+        return self._complex_type(document, node, qname)
+
+    def get_element(self, qname):
+        """Global element declaration for ``qname`` or None"""
+        if qname in self.elements:
+            return self.elements[qname]
+        if qname not in self._raw_elements:
+            return None
+        document, node = self._raw_elements[qname]
+        decl = ElementDecl(qname, True)
+        self.elements[qname] = decl
+        if node.get('substitutionGroup'):
+            decl.substitution_group = document.resolve(node.get('substitutionGroup'))
+        self._element_details(document, node, decl)
+        return decl
+
+    def get_attribute(self, qname):
+        """Global attribute declaration for ``qname`` or None"""
+        if qname in self.attributes:
+            return self.attributes[qname]
+        if qname not in self._raw_attributes:
+            return None
+        document, node = self._raw_attributes[qname]
+        decl = AttributeDecl(qname, self._attribute_type(document, node))
+        self.attributes[qname] = decl
+        return decl
+
+    def substitution_members(self, decl):
+        """Elements that may appear in place of ``decl``, including ``decl``
+        itself, sorted by local name and then namespace. Abstract heads are kept,
+        as EXIficient keeps them in the substitution group productions.
+        """
+        members = []
+        pending = [decl]
+        while pending:
+            current = pending.pop()
+            members.append(current)
+            pending.extend(self.substitutions.get(current.qname, ()))
+        return sorted(members, key=lambda member: (member.qname[1], member.qname[0]))
+
+    # Component builders
+
+    def _element_details(self, document, node, decl):
+        decl.abstract = node.get('abstract') == 'true'
+        decl.nillable = node.get('nillable') == 'true'
+        if node.get('type'):
+            decl.type = self.get_type(document.resolve(node.get('type')))
+        else:
+            inline = node.find(_xs('complexType'))
+            if inline is None:
+                inline = node.find(_xs('simpleType'))
+            if inline is None:
+                decl.type = ANY_TYPE
+            elif inline.tag == _xs('simpleType'):
+                decl.type = self._simple_type(document, inline, None)
+            else:
+                decl.type = self._complex_type(document, inline, None)
+
+    def _simple_type(self, document, node, qname):
+        restriction = node.find(_xs('restriction'))
+        if restriction is None:
+            raise SchemaError('Only restrictions are supported for simple types (%r)' % (qname,))
+        if restriction.get('base'):
+            base = self.get_type(document.resolve(restriction.get('base')))
+        else:
+            base = self._simple_type(document, restriction.find(_xs('simpleType')), None)
+        facets = {}
+        enumeration = []
+        for facet in restriction:
+            name = facet.tag.split('}')[1]
+            if name == 'enumeration':
+                enumeration.append(facet.get('value'))
+            elif name in ('minInclusive', 'maxInclusive', 'minExclusive', 'maxExclusive') \
+                    and base.derives_from((XS, 'integer')):
+                facets[name] = int(facet.get('value'))
+            elif name in ('length', 'minLength', 'maxLength', 'totalDigits', 'fractionDigits'):
+                facets[name] = int(facet.get('value'))
+            elif name != 'simpleType' and name != 'annotation':
+                facets[name] = facet.get('value')
+        if enumeration:
+            facets['enumeration'] = enumeration
+        simple_type = SimpleType(qname, base, facets=facets)
+        if qname is not None:
+            self.types[qname] = simple_type
+        return simple_type
+
+    def _attribute_type(self, document, node):
+        if node.get('type'):
+            return self.get_type(document.resolve(node.get('type')))
+        inline = node.find(_xs('simpleType'))
+        if inline is not None:
+            return self._simple_type(document, inline, None)
+        return self.types[(XS, 'anySimpleType')]
+
+    def _attribute_uses(self, document, node):
+        uses = []
+        wildcard = None
+        for child in node:
+            if child.tag == _xs('attribute'):
+                if child.get('ref'):
+                    decl = self.get_attribute(document.resolve(child.get('ref')))
+                else:
+                    qualified = document.attribute_qualified or child.get('form') == 'qualified'
+                    uri = document.target_namespace if qualified else ''
+                    decl = AttributeDecl((uri, child.get('name')),
+                                         self._attribute_type(document, child))
+                if child.get('use') != 'prohibited':
+                    uses.append(AttributeUse(decl, child.get('use') == 'required'))
+            elif child.tag == _xs('anyAttribute'):
+                wildcard = self._wildcard(document, child)
+        return uses, wildcard
+
+    def _complex_type(self, document, node, qname):
+        complex_type = ComplexType(qname)
+        if qname is not None:
+            self.types[qname] = complex_type
+        complex_type.abstract = node.get('abstract') == 'true'
+        complex_type.mixed = node.get('mixed') == 'true'
+
+        simple_content = node.find(_xs('simpleContent'))
+        complex_content = node.find(_xs('complexContent'))
+        if simple_content is not None:
+            derivation = simple_content[0]
+            base = self.get_type(document.resolve(derivation.get('base')))
+            complex_type.base = base
+            complex_type.content = 'simple'
+            if isinstance(base, SimpleType):
+                complex_type.simple_type = base
+            else:
+                complex_type.simple_type = base.simple_type
+                complex_type.attributes = list(base.attributes)
+            uses, wildcard = self._attribute_uses(document, derivation)
+            self._merge_attributes(complex_type, uses, wildcard)
+            return complex_type
+
+        definition = node
+        base = None
+        if complex_content is not None:
+            if complex_content.get('mixed') == 'true':
+                complex_type.mixed = True
+            definition = complex_content[0]
+            base = self.get_type(document.resolve(definition.get('base')))
+            complex_type.base = base
+        particle = None
+        for child in definition:
+            if child.tag in (_xs('sequence'), _xs('choice'), _xs('all')):
+                particle = self._particle(document, child)
+        if particle is not None and _is_empty(particle):
+            particle = None
+        if base is not None and definition.tag == _xs('extension') and base is not ANY_TYPE:
+            complex_type.attributes = list(base.attributes)
+            complex_type.attribute_wildcard = base.attribute_wildcard
+            if base.particle is not None:
+                if particle is None:
+                    particle = base.particle
+                else:
+                    particle = Particle(ModelGroup('sequence', [base.particle, particle]))
+        uses, wildcard = self._attribute_uses(document, definition)
+        self._merge_attributes(complex_type, uses, wildcard)
+        complex_type.particle = particle
+        complex_type.content = 'element' if particle is not None else 'empty'
+        return complex_type
+
+    @staticmethod
+    def _merge_attributes(complex_type, uses, wildcard):
+        by_name = {use.decl.qname: use for use in complex_type.attributes}
+        for use in uses:
+            by_name[use.decl.qname] = use
+        complex_type.attributes = sorted(by_name.values(),
+                                         key=lambda use: (use.decl.qname[1], use.decl.qname[0]))
+        if wildcard is not None:
+            complex_type.attribute_wildcard = wildcard
+
+    def _wildcard(self, document, node):
+        namespace = node.get('namespace', '##any')
+        if namespace in ('##any', '##other'):
+            return Wildcard(None)
+        uris = []
+        for token in namespace.split():
+            if token == '##targetNamespace':
+                uris.append(document.target_namespace)
+            elif token == '##local':
+                uris.append('')
+            else:
+                uris.append(token)
+        return Wildcard(tuple(sorted(set(uris))))
+
+    def _particle(self, document, node):
+        min_occurs = int(node.get('minOccurs', '1'))
+        max_value = node.get('maxOccurs', '1')
+        max_occurs = UNBOUNDED if max_value == 'unbounded' else int(max_value)
+        if node.tag == _xs('element'):
+            if node.get('ref'):
+                term = self.get_element(document.resolve(node.get('ref')))
+            else:
+                uri = document.target_namespace \
+                    if document.element_qualified or node.get('form') == 'qualified' else ''
+                term = ElementDecl((uri, node.get('name')), False)
+                self._element_details(document, node, term)
+        elif node.tag == _xs('any'):
+            term = self._wildcard(document, node)
+        else:
+            compositor = node.tag.split('}')[1]
+            particles = [self._particle(document, child) for child in node
+                         if child.tag in (_xs('element'), _xs('any'), _xs('sequence'),
+                                          _xs('choice'), _xs('all'))]
+            term = ModelGroup(compositor, particles)
+        return Particle(term, min_occurs, max_occurs)
+
+
+def _is_empty(particle):
+    term = particle.term
+    if isinstance(term, ModelGroup):
+        return all(_is_empty(child) for child in term.particles)
+    return particle.max_occurs == 0
+
+
+_schemas = {}
+
+
+def load_schema(path):
+    """Loads (once per process) the schema at ``path``"""
+    path = os.path.abspath(path)
+    if path not in _schemas:
+        _schemas[path] = Schema(path)
+    return _schemas[path]
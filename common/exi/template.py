@@ -0,0 +1,126 @@
+"""Precompiled EXI messages for the charging loop.
+
+CurrentDemandReq/Res and ChargingStatusRes are sent every few hundred
+milliseconds with the same structure, only SoC, present voltage/current and
+the limit flags change. With the string value table disabled every typed
+value is encoded independently of the rest of the stream, so the message can
+be encoded once with Field placeholders in place of these values, and each
+loop only encodes the values and splices them between the constant bit runs:
+
+    skeleton = create_current_demand_req(EVRESSSOC=Field('EVRESSSOC'), ...)
+    template = MessageTemplate(skeleton)
+    exi = template.render({'EVRESSSOC': 55, ...})
+
+Optional elements change the structure: TemplateCache keeps one template per
+set of absent (None) values.
+"""
+from common.exi import grammar as g
+from common.exi.bitstream import BitWriter
+from common.exi.codec import get_codec, ObjectEncoder
+from common.exi.datatypes import datatype_for
+from common.exi.objects import UnsupportedContent
+
+# Encoded bits kept per slot, a slot sees few distinct values (flags, SoC)
+_SLOT_CACHE_SIZE = 256
+
+
+class Field():
+    """Placeholder of a simple value in a skeleton message"""
+    __slots__ = ('name',)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return 'Field(%r)' % self.name
+
+
+class _TemplateEncoder(ObjectEncoder):
+    """ObjectEncoder that cuts the stream at every Field. ``parts`` holds the
+    constant runs as (bits, length) and the slots as (name, datatype)
+    """
+    def __init__(self, codec):
+        ObjectEncoder.__init__(self, codec)
+        self.parts = []
+
+    def simple_value(self, state, value):
+        if not isinstance(value, Field):
+            ObjectEncoder.simple_value(self, state, value)
+            return
+        production = state.lookup.get((g.CH, None))
+        if production is None:
+            raise UnsupportedContent('No typed content for %s' % value.name)
+        self.first_level(state, production)
+        self.parts.append(self.writer.getbits())
+        self.parts.append((value.name, datatype_for(production.payload)))
+        self.writer = BitWriter()
+        self.end(production.target)
+
+
+class MessageTemplate():
+    """EXI stream of a skeleton message (generateDS objects with Field
+    placeholders), rendered with the values of the placeholders
+    """
+    def __init__(self, message, codec=None):
+        encoder = _TemplateEncoder(codec or get_codec())
+        encoder.document(message)
+        parts = encoder.parts + [encoder.writer.getbits()]
+        self.constants = parts[0::2]
+        self.slots = parts[1::2]
+        self.cache = [{} for _ in self.slots]
+
+    def render(self, values):
+        """EXI bytes of the message, ``values`` maps the Field names to the
+        values. ValueError if a value cannot be written typed
+        """
+        bits, length = self.constants[0]
+        for (name, datatype), cache, (constant, constant_length) in zip(
+                self.slots, self.cache, self.constants[1:]):
+            value = values[name]
+            encoded = cache.get(value)
+            if encoded is None:
+                encoded = self.encode(datatype, value)
+                if len(cache) >= _SLOT_CACHE_SIZE:
+                    cache.clear()
+                cache[value] = encoded
+            value_bits, value_length = encoded
+            bits = (((bits << value_length) | value_bits) << constant_length) | constant
+            length += value_length + constant_length
+        padding = -length % 8
+        return (bits << padding).to_bytes((length + padding) // 8, 'big')
+
+    @staticmethod
+    def encode(datatype, value):
+        if value is None or (isinstance(value, str) and not value):
+            # absent or empty content changes the structure of the stream
+            raise ValueError('No content for a template field')
+        writer = BitWriter()
+        datatype.write(writer, datatype.convert(value))
+        return writer.getbits()
+
+
+class TemplateCache():
+    """Templates of one message by structure. ``create`` builds the message
+    from a dict of values; None values are left out of the skeleton, all
+    others become Fields. Values the template cannot write typed are encoded
+    from the full message by ``encode`` (default: EXICodec.encode_object)
+    """
+    def __init__(self, create, encode=None, codec=None):
+        self.create = create
+        self.encode = encode
+        self.codec = codec
+        self.templates = {}
+
+    def render(self, values):
+        if self.codec is None:
+            self.codec = get_codec()
+        key = frozenset(name for name, value in values.items() if value is None)
+        template = self.templates.get(key)
+        if template is None:
+            skeleton = self.create({name: None if value is None else Field(name)
+                                    for name, value in values.items()})
+            template = self.templates[key] = MessageTemplate(skeleton, self.codec)
+        try:
+            return template.render(values)
+        except ValueError:
+            return (self.encode or self.codec.encode_object)(self.create(values))
@@ -0,0 +1,111 @@
+"""Batch EXI encoding/decoding for offline processing of captured frames.
+
+The payloads are cut into chunks and converted on a process pool. Every pool
+process keeps its codec warm (the persistent Java worker or the Python codec,
+see java_caller), so the startup cost is paid once per process and not per
+message. Results are yielded in input order while at most ``2 * workers``
+chunks are in flight, so arbitrarily long inputs can be streamed.
+
+    from common.exi_utils import batch
+    for xml_bytes in batch.decode_batch(payloads, workers=4):
+        ...
+"""
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from common import java_caller
+from common.exi_utils import exi_utils
+
+
+def _encode_chunk(use_python_codec, chunk):
+    return [java_caller.xml_bytes_to_binary(xml_bytes, use_python_codec) for xml_bytes in chunk]
+
+
+def _decode_chunk(use_python_codec, chunk):
+    return [java_caller.binary_to_xml_bytes(exi, use_python_codec) for exi in chunk]
+
+
+def _chunks(iterable, chunksize):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(function, items, workers, chunksize, use_python_codec):
+    """Applies ``function`` to chunks of ``items``, yields the results in order.
+    The codec choice is passed with every chunk, java_caller.USE_PYTHON_CODEC
+    is left alone
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    function = functools.partial(function, use_python_codec)
+    if workers <= 0:
+        for chunk in _chunks(items, chunksize):
+            yield from function(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = []
+        for chunk in _chunks(items, chunksize):
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+
+def _to_xml_bytes(message, use_python_codec):
+    """XML bytes/str or a generateDS object -> XML bytes, objects are exported
+    as the live route does (exi_utils.export_xml)
+    """
+    if isinstance(message, (bytes, bytearray, memoryview)):
+        return bytes(message)
+    if isinstance(message, str):
+        return message.encode('utf-8')
+    return exi_utils.export_xml(message, use_python_codec)
+
+
+def encode_batch(messages, workers=None, chunksize=64, use_python_codec=None):
+    """Encodes messages to EXI
+
+    Args:
+        messages: Iterable of generateDS objects (V2G_Message, supportedAppProtocolReq, ...)
+            or XML documents (bytes or str)
+        workers (int): Size of the process pool, None for one per CPU, 0 to
+            convert in the calling process
+        chunksize (int): Messages sent to a pool process at once
+        use_python_codec (bool): Use the Python codec instead of Java,
+            None follows java_caller.USE_PYTHON_CODEC
+
+    Returns:
+        Iterator over the EXI bytes, in input order
+    """
+    if use_python_codec is None:
+        use_python_codec = java_caller.USE_PYTHON_CODEC
+    documents = (_to_xml_bytes(message, use_python_codec) for message in messages)
+    return _run(_encode_chunk, documents, workers, chunksize, use_python_codec)
+
+
+def decode_batch(payloads, workers=None, chunksize=64, use_python_codec=None, binding=None):
+    """Decodes EXI payloads (the V2GTP payload without header)
+
+    Args:
+        payloads: Iterable of EXI byte strings
+        workers, chunksize, use_python_codec: See encode_batch
+        binding: generateDS module (msgDef1 or appprotocol1). If given the XML
+            is parsed to objects in the calling process
+
+    Returns:
+        Iterator over the XML bytes (or objects), in input order
+    """
+    if use_python_codec is None:
+        use_python_codec = java_caller.USE_PYTHON_CODEC
+    results = _run(_decode_chunk, (bytes(payload) for payload in payloads), workers,
+                   chunksize, use_python_codec)
+    if binding is None:
+        return results
+    return (binding.parseString(xml_bytes, silence=True) for xml_bytes in results)
@@ -0,0 +1,85 @@
+"""Bounded LRU cache for the EXI codec results. The charging loops and the
+EVSEProcessing=Ongoing retries send the same messages over and over, with a
+cache hit the XML -> EXI (or EXI -> XML) conversion is skipped.
+
+Keys are BLAKE2b digests of the exported XML or of the EXI bytes, values are
+the bytes produced by the codec. Decoded messages are cached as XML bytes so
+every caller still gets its own generateDS object.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+def digest(data):
+    """Canonical key of a byte string"""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class LRUCache():
+    """Least recently used cache bounded by the number of entries and,
+    optionally, by the total size of the cached values in bytes
+    """
+
+    def __init__(self, maxsize=256, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """Cached value or None, counts the hit or miss"""
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= len(previous)
+            self.entries[key] = value
+            self.size += len(value)
+            while self.entries and (len(self.entries) > self.maxsize or (
+                    self.max_bytes is not None and self.size > self.max_bytes)):
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def get_or_compute(self, data, compute):
+        """Value for ``data`` (bytes), ``compute(data)`` on a miss"""
+        key = digest(data)
+        value = self.get(key)
+        if value is None:
+            value = bytes(compute(data))
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def stats(self):
+        """Counters as a dict: hits, misses, evictions, entries, bytes, hit_rate"""
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self.entries),
+                'bytes': self.size,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -1,20 +1,119 @@
+import io
+import logging
+
 from common import java_caller
-from common.XML import msgDef1, appprotocol1
+from common import log
+from common import timing
+from common.exi import get_codec
+from common.exi_utils.codec_cache import LRUCache
+from common import bindings
 from secc import secc_config
-from termcolor import colored
 from evcc import evcc_config
 
+logger = logging.getLogger(__name__)
+
 
 def print_colored_green(text):
-    """Pring text in green. For Debugging Purpose
+    """Logs text in green at INFO. For Debugging Purpose
     """
-    print(colored(text, 'green'))
+    logger.info('%s', text, extra=log.GREEN)
 
 
 def print_colored_red(text):
-    """Pring text in red. For Debugging Purpose
+    """Logs text in red at INFO. For Debugging Purpose
+    """
+    logger.info('%s', text, extra=log.RED)
+
+
+# Write every converted message to common/EXI_Files (testresres.xml,
+# test1_xml.exi, exisample.exi, v2gxml.xml, appprotocol.xml) for debugging.
+# The conversion itself always stays in memory.
+DEBUG_DUMP_FILES = False
+
+
+# Codec results of the last CODEC_CACHE_SIZE distinct messages are kept, so
+# repeated messages (charging loops, EVSEProcessing=Ongoing retries) skip the
+# codec. 0 disables the cache, CODEC_CACHE_MAX_BYTES optionally bounds the
+# cached bytes as well.
+CODEC_CACHE_SIZE = 256
+CODEC_CACHE_MAX_BYTES = None
+
+encode_cache = LRUCache(CODEC_CACHE_SIZE, CODEC_CACHE_MAX_BYTES)
+decode_cache = LRUCache(CODEC_CACHE_SIZE, CODEC_CACHE_MAX_BYTES)
+
+# With the Python codec (java_caller.USE_PYTHON_CODEC) received messages are
+# decoded straight to the binding objects, without XML text and lxml, and sent
+# messages are encoded from the objects without export(). The direct encoder
+# takes the element namespaces from the schema, not from the ns prefixes
+# generateDS gives new objects, and so does the XML route of the Python codec
+# (EXICodec.export_object): both write the same stream.
+DIRECT_OBJECT_DECODE = True
+DIRECT_OBJECT_ENCODE = True
+
+# The jar is given the XML of generateDS export(). With SCHEMA_EXPORT it gets
+# the XML of EXICodec.export_object as well and writes the streams of the
+# Python codec, at the cost of building the Python grammars once.
+SCHEMA_EXPORT = False
+
+# The charging loop messages (CurrentDemandReq/Res, ChargingStatusRes) are
+# rendered from templates the senders encode once (common/exi/template.py).
+# The templates come from the Python encoder, whose streams equal the jar
+# output, so they are used with either codec. Messages shown in SLOW_MODE
+# and DEBUG_DUMP_FILES take the normal route.
+MESSAGE_TEMPLATES = True
+
+# Received charging loop messages (CurrentDemandReq/Res, ChargingStatusReq/Res)
+# are decoded straight to the __slots__ models of common.bindings.compact
+# (common.exi.objects.CompactBuilder). Messages parsed from XML (Java codec,
+# DEBUG_DUMP_FILES) stay generateDS objects
+COMPACT_LOOP_MESSAGES = True
+
+
+def _encode(xml_bytes):
+    return encode_cache.get_or_compute(xml_bytes, java_caller.xml_bytes_to_binary)
+
+
+def _decode(exibytes):
+    return decode_cache.get_or_compute(exibytes, java_caller.binary_to_xml_bytes)
+
+
+def _encode_object(message):
+    if java_caller.USE_PYTHON_CODEC and DIRECT_OBJECT_ENCODE and not DEBUG_DUMP_FILES:
+        return get_codec().encode_object(message)
+    xml_bytes = export_xml(message)
+    exi = _encode(xml_bytes)
+    if DEBUG_DUMP_FILES:
+        _dump('testresres.xml', xml_bytes)
+        _dump('test1_xml.exi', exi)
+    return exi
+
+
+def _decode_object(exibytes, binding, filename, compact=None):
+    if java_caller.USE_PYTHON_CODEC and DIRECT_OBJECT_DECODE and not DEBUG_DUMP_FILES:
+        return get_codec().decode_object(exibytes, binding, compact)
+    xml_bytes = _decode(exibytes)
+    if DEBUG_DUMP_FILES:
+        _dump('exisample.exi', exibytes)
+        _dump(filename, xml_bytes)
+    return binding.parseString(xml_bytes, silence=True)
+
+
+def _dump(filename, data):
+    with open('common/EXI_Files/' + filename, 'wb') as outfile:
+        outfile.write(data)
+
+
+def export_xml(message, use_python_codec=None):
+    """Exports a generateDS message to XML bytes for the codec selected by
+    ``use_python_codec`` (None follows java_caller.USE_PYTHON_CODEC)
     """
-    print(colored(text, 'red'))
+    if use_python_codec is None:
+        use_python_codec = java_caller.USE_PYTHON_CODEC
+    if use_python_codec or SCHEMA_EXPORT:
+        return get_codec().export_object(message)
+    buffer = io.StringIO()
+    message.export(outfile=buffer, level=0)
+    return buffer.getvalue().encode('utf-8')
 
 
 def v2g_to_EXI(v2gmessage):
@@ -26,14 +125,7 @@ def v2g_to_EXI(v2gmessage):
     Returns:
         bytes: The EXI byte stream corresponding to the V2G XML message input
     """
-    
-    with open('common/EXI_Files/testresres.xml', 'w') as outfile:
-        v2gmessage.export(outfile=outfile, level=0)
-    java_caller.xml_to_binary('common/EXI_Files/testresres.xml',
-                              'common/EXI_Files/test1_xml.exi')
-    f = open("common/EXI_Files/test1_xml.exi", "rb")
-    exi2 = f.read()
-    return exi2
+    return _encode_object(v2gmessage)
 
 
 def EXI_to_v2g(exibytes):
@@ -45,13 +137,7 @@ def EXI_to_v2g(exibytes):
     Returns:
         XML V2G Message corresponding to EXI Stream
     """
-    f = open("common/EXI_Files/exisample.exi", "wb")
-    f.write(exibytes)
-    f.close()
-    java_caller.binary_to_xml('common/EXI_Files/exisample.exi',
-                              'common/EXI_Files/v2gxml.xml')
-    msg_res = msgDef1.parse('common/EXI_Files/v2gxml.xml', silence=True)
-    return msg_res
+    return _decode_object(exibytes, bindings.msgDef1, 'v2gxml.xml')
 
 
 def appprotocol_to_EXI(appprotocol):
@@ -63,13 +149,7 @@ def appprotocol_to_EXI(appprotocol):
     Returns:
         bytes: The EXI byte stream corresponding to the AppProtocol XML message input
     """
-    with open('EXI_Files/testresres.xml', 'w') as outfile:
-        appprotocol.export(outfile=outfile, level=0)
-    java_caller.xml_to_binary('EXI_Files/testresres.xml',
-                              'EXI_Files/test1_xml.exi')
-    f = open("EXI_Files/test1_xml.exi", "rb")
-    exi2 = f.read()
-    return exi2
+    return _encode_object(appprotocol)
 
 
 def EXI_to_appprotocol(exibytes):
@@ -81,15 +161,7 @@ def EXI_to_appprotocol(exibytes):
     Returns:
         XML AppProtocol Message
     """
-    
-
-    f = open("common/EXI_Files/exisample.exi", "wb")
-    f.write(exibytes)
-    f.close()
-    java_caller.binary_to_xml('common/EXI_Files/exisample.exi',
-                              'common/EXI_Files/appprotocol.xml')
-    msg_res = appprotocol1.parse('common/EXI_Files/appprotocol.xml', silence=True)
-    return msg_res
+    return _decode_object(exibytes, bindings.appprotocol1, 'appprotocol.xml')
 
 
 def add_Header_v2gEXI(exibytes, payloadtypename):
@@ -175,9 +247,12 @@ def receiveAndCheckMessageType(msg):
     elif header_value == 0x9001:
         return payload
     elif header_value == 0x8001:
-        message = EXI_to_v2g(payload)
+        with timing.phase('decode'):
+            message = _decode_object(payload, bindings.msgDef1, 'v2gxml.xml',
+                                     bindings.compact if COMPACT_LOOP_MESSAGES else None)
     elif header_value == 0xA000 or header_value == 0xA001:
-        message = EXI_to_appprotocol(payload)
+        with timing.phase('decode'):
+            message = EXI_to_appprotocol(payload)
 
     """Avoid if and use dictionary lookup """
     # action_map = {
@@ -202,16 +277,27 @@ def receiveAndCheckMessageType(msg):
     return message
 
 
+def is_slow_mode(tagname):
+    """True if the message is confirmed by hand before it is sent"""
+    return bool(secc_config.SLOW_MODE and (evcc_config.SLOW_MODE
+                                           or evcc_config.slow_mode_custom[tagname]))
+
+
+def use_message_templates(tagname):
+    """True if the message is rendered from a precompiled template"""
+    return MESSAGE_TEMPLATES and not DEBUG_DUMP_FILES and not is_slow_mode(tagname)
+
+
 def display_before_send(xmlmessage, v2gpmessage):
     '''Before sending a message, displays the message in XML form
     and in V2GTP form'''
-    
-    if isinstance(xmlmessage,appprotocol1.supportedAppProtocolReq) or isinstance(xmlmessage,appprotocol1.supportedAppProtocolRes):
+    if not secc_config.SLOW_MODE:
+        return
+    if isinstance(xmlmessage,bindings.appprotocol1.supportedAppProtocolReq) or isinstance(xmlmessage,bindings.appprotocol1.supportedAppProtocolRes):
         tagname = xmlmessage.original_tagname_
     else:
         tagname = xmlmessage.get_Body().BodyElement.original_tagname_
-    if (secc_config.SLOW_MODE and( evcc_config.SLOW_MODE
-            or evcc_config.slow_mode_custom[tagname])):
+    if is_slow_mode(tagname):
         print(f"Send {tagname} ?")
         print("Message to send:")
         print(xmlmessage)
@@ -225,7 +311,7 @@ def xml_to_v2gtp(xmlmessage,payloadtype):
     return v2gtp
 
 def check_v2g_message_type(xmlmessage):
-    if isinstance(xmlmessage, msgDef1.V2G_Message):
+    if isinstance(xmlmessage, (bindings.V2G_Message, bindings.compact.V2G_Message)):
         return xmlmessage.get_Body().BodyElement.original_tagname_
     else:
         return xmlmessage.original_tagname_
@@ -1,8 +1,15 @@
+import logging
+
+from common import log
+from common import timing
 from common.exi_utils import exi_utils
+from evcc import evcc_config
 from common.security import securityutils
 from secc.secc_message_sender import SECCMessageSender
 from evcc.evcc_message_sender import EVCCMessageSender
 
+logger = logging.getLogger(__name__)
+
 class MessageHandler:
     def __init__(self, evcc, secc):
         self.secc = secc
@@ -48,25 +55,32 @@ class MessageHandler:
             'SessionStopRes': self.handle_session_stop,
         }
 
-    def process_message_and_react(self, message, is_client=False, address=None):
+    @timing.timed_process
+    def process_message_and_react(self, message, is_client=False, address=None,
+                                  received_at=None):
         """Based on the message input, this methods reacts accordingly:
         State transition -> Send next message -> State transition
 
         Args:
             message (bytes): The received V2GTP Message
             address : Address of the sender. This parameter will be used for the UDP response
+            received_at : time.perf_counter() when the transport had the complete message,
+                used by common.timing
         """
         msg = exi_utils.receiveAndCheckMessageType(message)
-        print("RECEIVED: ")
-        print(msg)
+        # The message is only formatted (exported to XML) at DEBUG
+        logger.debug("RECEIVED:\n%s", msg)
 
         if isinstance(msg, bytes):
             if is_client:
+                timing.name_message('SECCDiscoveryRes')
                 self.handle_secc_discovery_res(msg)
             else:
+                timing.name_message('SECCDiscoveryReq')
                 self.handle_sdr(message, address)
         else:
             message_type = exi_utils.check_v2g_message_type(msg)
+            timing.name_message(message_type)
             handler = self.message_handlers.get(message_type)
             if handler and message_type[-1] == 'q':
                 handler(msg)
@@ -74,11 +88,17 @@ class MessageHandler:
                 handler(msg, False)
 
     def handle_secc_discovery_res(self, msg):
-        print("New State:", self.evcc.statemachine.state)
+        logger.info("New State: %s", self.evcc.statemachine.state)
 
         ip_address = ".".join(str(int.from_bytes(msg[i:i + 4], 'big')) for i in range(0, 16, 4))
         port = int.from_bytes(msg[16:18], "big")
+        self.start_session(ip_address, port)
 
+    def start_session(self, ip_address, port):
+        """Connects the EVCC to the SECC at ip_address:port and opens the session
+        with the supportedAppProtocolReq. Called after the SDP or directly when
+        the SECC address is known
+        """
         self.evcc.establish_evcc_tcp_connection(ip_address, port)
 
         self.message_sender_evcc.send_supported_app_protocol_req()
@@ -87,22 +107,21 @@ class MessageHandler:
         self.evcc.display_state()
 
     def handle_sdr(self, message, adress):
-        print("Received SECCDiscoveryReq")
+        logger.info("Received SECCDiscoveryReq")
 
             # Process SECCDiscoveryReq
         payload = message[8:]
-        if (payload[0] == 0 and payload[1] == 0):
-            self.secc.tlstcp = True
+        self.secc.tlstcp = payload[0] == 0 and payload[1] == 0
 
             # After Processing prepare and send the SECCDiscoveryRes message
         self.message_sender_secc.send_secc_discovery_res(message, adress)
 
             # Establish TCP Connection
-        self.secc.establish_secc_tcp_connection()
+        self.secc.establish_secc_tcp_connection(adress)
 
     def handle_supported_app_protocol(self, msg, is_request=True):
         if is_request:
-            print("Received supportedAppProtocolReq")
+            logger.info("Received supportedAppProtocolReq")
             # Change state
             self.secc.statemachine.supportedAppProtocolReq()
             # Prepare and send supportedAppProtocolRes
@@ -119,14 +138,16 @@ class MessageHandler:
 
     def handle_service_detail(self, msg, is_request=True):
         if is_request:
-            print("Received ServiceDetailReq")
+            logger.info("Received ServiceDetailReq")
             self.secc.statemachine.ServiceDetailReq()
             self.message_sender_secc.send_service_detail_res(msg)
             self.secc.statemachine.send_ServiceDetailRes()
             self.secc.display_state()
         else:
-            print("Received ServiceDetailRes")
-            opt = input("Wanna send another service detail request? y/n")
+            logger.info("Received ServiceDetailRes")
+            opt = "n"
+            if evcc_config.ASK_SERVICE_DETAILS:
+                opt = input("Wanna send another service detail request? y/n")
             if opt == "y":
                 # The EVCC wants to gain information about another Service
                 serviceid = input(
@@ -143,13 +164,13 @@ class MessageHandler:
 
     def handle_service_discovery(self, msg, is_request=True):
         if is_request:
-            print("Received ServiceDiscoveryReq")
+            logger.info("Received ServiceDiscoveryReq")
             self.secc.statemachine.ServiceDiscoveryReq()
             self.message_sender_secc.send_service_discovery_res(msg)
             self.secc.statemachine.send_ServiceDiscoveryRes()
             self.secc.display_state()
         else:
-            print("Received ServiceDiscoveryRes")
+            logger.info("Received ServiceDiscoveryRes")
             # Prepare and send ServiceDetailReq
             self.message_sender_evcc.send_service_detail_req(msg, 2)
             self.evcc.statemachine.send_ServiceDetailReq()
@@ -157,7 +178,7 @@ class MessageHandler:
 
     def handle_session_setup(self, msg, is_request=True):
         if is_request:
-            print("Received SessionSetupReq")
+            logger.info("Received SessionSetupReq")
 
             # Change state
             self.secc.statemachine.SessionSetupReq()
@@ -167,7 +188,7 @@ class MessageHandler:
             self.secc.statemachine.send_SessionSetupRes()
             self.secc.display_state()
         else:
-            print("Received SessionSetupRes")
+            logger.info("Received SessionSetupRes")
 
             # Prepare and send ServiceDiscoveryReq
             self.message_sender_evcc.send_service_discovery_req(msg)
@@ -178,7 +199,7 @@ class MessageHandler:
 
     def handle_payment_service_selection(self, msg, is_request=True):
         if is_request:
-            print("Received PaymentServiceSelectionReq")
+            logger.info("Received PaymentServiceSelectionReq")
             # If payment option is External Payment, skip to AuthorizationReq/Res message set
             self.secc.payment_option = msg.get_Body().BodyElement.SelectedPaymentOption
 
@@ -187,13 +208,13 @@ class MessageHandler:
             self.secc.statemachine.send_ServicePaymentSelectionRes()
             self.secc.display_state()
         else:
-            print("Received PaymentServiceSelectionRes")
+            logger.info("Received PaymentServiceSelectionRes")
             # Check if Contract or EIM and react accordingly
             if self.evcc.payment_option == "Contract":
                 self.message_sender_evcc.send_certificate_installation_req(msg)
                 self.evcc.statemachine.send_CertificateInstallationReq()
 
-            elif self.payment_option == "ExternalPayment":
+            elif self.evcc.payment_option == "ExternalPayment":
                 self.message_sender_evcc.send_authorization_req(msg)
                 self.evcc.statemachine.send_AuthorizationReq()
 
@@ -201,7 +222,7 @@ class MessageHandler:
 
     def handle_certificate_installation(self, msg, is_request = True):
         if is_request:
-            print("Received CertificateInstallationReq")
+            logger.info("Received CertificateInstallationReq")
             self.secc.statemachine.CertificateInstallationReq()
                 # Verify Signature
             securityutils.verify_certificate_installation_req(msg)
@@ -209,7 +230,7 @@ class MessageHandler:
             self.secc.statemachine.send_CertificateInstallationRes()
             self.secc.display_state()
         else:
-            print("Received CertificateInstallationRes")
+            logger.info("Received CertificateInstallationRes")
             # Verify Signature
             securityutils.verify_certificate_installation_res(msg)
             # Store Contract private key
@@ -222,7 +243,7 @@ class MessageHandler:
 
     def handle_payment_details(self, msg, is_request = True):
         if is_request:
-            print("Received PaymentDetailsReq")
+            logger.info("Received PaymentDetailsReq")
             self.secc.statemachine.PaymentDetailsReq()
             self.message_sender_secc.send_payment_details_res(msg)
             cert = msg.get_Body().BodyElement.ContractSignatureCertChain.Certificate
@@ -231,7 +252,7 @@ class MessageHandler:
             self.secc.statemachine.send_PaymentDetailsRes()
             self.secc.display_state()
         else:
-            print("Received PaymentDetailsRes")
+            logger.info("Received PaymentDetailsRes")
             self.evcc.genchallenge = msg.get_Body().BodyElement.GenChallenge
             self.message_sender_evcc.send_authorization_req(msg)
             self.evcc.statemachine.send_AuthorizationReq()
@@ -239,19 +260,18 @@ class MessageHandler:
 
     def handle_authorization(self, msg, is_request = True):
         if is_request:
-            print("Received AuthorizationReq")
+            logger.info("Received AuthorizationReq")
                 # AuthorizationReq <-> AuthorizationRes loop that ends when EVSEProcessing=Finished
             self.secc.statemachine.AuthorizationReq()
             self.message_sender_secc.send_authorization_res(msg)
 
             self.secc.display_state()
         else:
-            print("Received AuthorizationRes")
+            logger.info("Received AuthorizationRes")
             # Process Message
             evseprocessing = msg.get_Body().BodyElement.EVSEProcessing
             if evseprocessing == "Ongoing":
-                exi_utils.print_colored_red(
-                    "Send empty AuthorizationReq again")
+                logger.info("Send empty AuthorizationReq again", extra=log.RED)
                 self.message_sender_evcc.send_authorization_req(msg)
                 self.evcc.statemachine.send_AuthorizationReq()
             else:
@@ -261,7 +281,7 @@ class MessageHandler:
 
     def handle_charge_parameter_discovery(self, msg, is_request = True):
         if is_request:
-            print("Received ChargeParameterDiscoveryReq")
+            logger.info("Received ChargeParameterDiscoveryReq")
                 #Checking the request to see if DC or AC and instantiate controller
             if "DC" in msg.get_Body().BodyElement.RequestedEnergyTransferMode:
                 self.secc.controller.set_to_dc_charging()
@@ -272,7 +292,7 @@ class MessageHandler:
             self.message_sender_secc.send_charge_parameter_discovery_res(msg)
 
         else:
-            print("Received ChargeParameterDiscoveryRes")
+            logger.info("Received ChargeParameterDiscoveryRes")
             # Check if EVSEProcessing=Finished and react
             evseprocessing = msg.get_Body().BodyElement.EVSEProcessing
             if evseprocessing == "Ongoing":
@@ -294,12 +314,12 @@ class MessageHandler:
 
     def handle_cable_check(self, msg, is_request = True):
         if is_request:
-            print("Received CableCheckReq")
+            logger.info("Received CableCheckReq")
             self.secc.statemachine.CableCheckReq()
             self.message_sender_secc.send_cable_check_res(msg)
             self.secc.display_state()
         else:
-            print("Received CableCheckRes")
+            logger.info("Received CableCheckRes")
             # Check if EVSEProcessing=Finished and react
             evseprocessing = msg.get_Body().BodyElement.EVSEProcessing
             if evseprocessing == "Ongoing":
@@ -313,28 +333,26 @@ class MessageHandler:
 
     def handle_pre_charge(self, msg, is_request = True):
         if is_request:
-            print("Received PrechargeReq")
+            logger.info("Received PrechargeReq")
             self.secc.statemachine.PreChargeReq()
             self.message_sender_secc.send_pre_charge_res(msg)
             self.secc.statemachine.send_PrechargeRes()
             self.secc.display_state()
         else:
-            print("Received PrechargeRes")
+            logger.info("Received PrechargeRes")
             # Check to see if EVTargetVoltage == EVSEPresentVoltage
             # Take EVSEPresentVoltage value from PrechargeRes message
             evsepresentvoltage = msg.get_Body(
             ).BodyElement.EVSEPresentVoltage.get_Value()
-            exi_utils.print_colored_red(evsepresentvoltage)
+            logger.info("EVSEPresentVoltage: %s", evsepresentvoltage, extra=log.RED)
 
             if (evsepresentvoltage == self.evcc.controller.ev_target_voltage):
-                exi_utils.print_colored_red(
-                    "EV - EVSE Voltage matched. Charging will Start")
+                logger.info("EV - EVSE Voltage matched. Charging will Start", extra=log.RED)
                 self.message_sender_evcc.send_power_delivery_req(msg, "Start")
                 self.evcc.statemachine.send_PowerDeliveryReq()
             else:
                 # Send PreChargeReq Message again
-                exi_utils.print_colored_red(
-                    "Still waiting for EVSE Present Voltage to match")
+                logger.info("Still waiting for EVSE Present Voltage to match", extra=log.RED)
                 self.message_sender_evcc.send_pre_charge_req(msg)
                 self.evcc.statemachine.send_PreChargeReq()
 
@@ -342,11 +360,11 @@ class MessageHandler:
 
     def handle_power_delivery(self, msg, is_request = True):
         if is_request:
-            print("Received PowerDeliveryReq")
+            logger.info("Received PowerDeliveryReq")
             self.secc.statemachine.PowerDeliveryReq()
             self.message_sender_secc.send_power_delivery_res(msg)
             if msg.get_Body().BodyElement.ChargeProgress == 'Stop':
-                exi_utils.print_colored_red("STOP Charging")
+                logger.info("STOP Charging", extra=log.RED)
 
                 self.secc.statemachine.send_PowerDeliveryResStop()
             elif  self.secc.controller.is_DC_mode():
@@ -355,7 +373,7 @@ class MessageHandler:
                 self.secc.statemachine.send_PowerDeliveryRes()
             self.secc.display_state()
         else:
-            print("Received PowerDeliveryRes")
+            logger.info("Received PowerDeliveryRes")
 
             # If We are charging with AC then the next message should be ChargingStatusReq
             if self.evcc.controller.is_AC_mode(
@@ -379,10 +397,10 @@ class MessageHandler:
 
     def handle_current_demand(self, msg, is_request = True):
         if is_request:
-            print("Received CurrentDemandReq")
+            logger.info("Received CurrentDemandReq")
             self.secc.statemachine.CurrentDemandReq()
             self.message_sender_secc.send_current_demand_res(msg)
-            if msg.get_Body().BodyElement.ChargingComplete:
+            if self.message_sender_secc.receipt_required(msg):
                 self.secc.statemachine.send_CurrentDemandRes()
             else:
                 self.secc.statemachine.send_CurrentDemandResNoReceipt()
@@ -390,42 +408,40 @@ class MessageHandler:
         else:
             if msg.get_Body(
             ).BodyElement.ReceiptRequired == True and self.evcc.payment_option == "Contract":
-                print("Received CurrentDemandRes with Receipt Required (PnC)")
+                logger.info("Received CurrentDemandRes with Receipt Required (PnC)")
                 self.message_sender_evcc.send_metering_receipt_req(msg)
                 self.evcc.statemachine.send_MeteringReceiptReq()
                 self.evcc.display_state()
             else:
-                exi_utils.print_colored_red(
-                    "No Meter Receipt has to be signed!")
+                logger.info("No Meter Receipt has to be signed!", extra=log.RED)
                 if self.evcc.controller.evressoc < 100:
-                    # Charge the Battery.
+                    # Charge the Battery and continue the Charging Loop
                     self.evcc.controller.charge_up()
-
+                    self.message_sender_evcc.send_current_demand_req(msg)
+                    self.evcc.statemachine.send_CurrentDemandReq()
                 else:
-                    exi_utils.print_colored_red("Fully Charged")
-                    # Continue the Changing Loop
-                self.message_sender_evcc.send_current_demand_req(msg)
-                self.evcc.statemachine.send_CurrentDemandReq()
+                    # Without a Meter Receipt the EV stops right away
+                    logger.info("Fully Charged", extra=log.RED)
+                    self.message_sender_evcc.send_power_delivery_req(msg, "Stop")
+                    self.evcc.statemachine.send_PowerDeliveryReq()
                 self.evcc.display_state()
 
     def handle_charging_status(self, msg, is_request = True):
         if is_request:
-            print("Received ChargingStatusReq")
+            logger.info("Received ChargingStatusReq")
             self.secc.statemachine.ChargingStatusReq()
             self.message_sender_secc.send_charging_status_res(msg)
             self.secc.statemachine.send_ChargingStatusRes()
             self.secc.display_state()
         else:
-            print("Received ChargingStatusRes")
+            logger.info("Received ChargingStatusRes")
             # If not charged send another ChargingStatusReq
             if not self.evcc.controller.AC_charge_complete():
                 self.message_sender_evcc.send_charging_status_req(msg)
                 self.evcc.statemachine.send_ChargingStatusReq()
             else:
                 # If fully charged send PowerDeliveryReq with chargeProgress=Stop
-                print("###")
-                print("EV FULLY AC Charged")
-                print("###")
+                logger.info("EV FULLY AC Charged", extra=log.RED)
                 self.message_sender_evcc.send_power_delivery_req(msg, "Stop")
                 self.evcc.statemachine.send_PowerDeliveryReq()
 
@@ -434,26 +450,26 @@ class MessageHandler:
 
     def handle_metering_receipt(self, msg, is_request = True):
         if is_request:
-            print("Received MeteringReceiptReq")
+            logger.info("Received MeteringReceiptReq")
             self.secc.statemachine.MeteringReceiptReq()
             self.message_sender_secc.send_metering_receipt_res(msg)
             self.secc.statemachine.send_MeteringReceiptRes()
             self.secc.display_state()
         else:
-            print("Received MeteringReceiptRes")
+            logger.info("Received MeteringReceiptRes")
             self.message_sender_evcc.send_power_delivery_req(msg, "Stop")
             self.evcc.statemachine.send_PowerDeliveryReq()
             self.evcc.display_state()
 
     def handle_welding_detection(self, msg, is_request = True):
         if is_request:
-            print("Received WeldingDetectionReq")
+            logger.info("Received WeldingDetectionReq")
             self.secc.statemachine.WeldingDetectionReq()
             self.message_sender_secc.send_welding_detection_res(msg)
             self.secc.statemachine.send_WeldingDetectionRes()
             self.secc.display_state()
         else:
-            print("Received WeldingDetectionRes")
+            logger.info("Received WeldingDetectionRes")
             self.message_sender_evcc.send_session_stop_req(msg)
             self.evcc.statemachine.send_SessionStopReq()
             self.evcc.display_state()
@@ -461,13 +477,13 @@ class MessageHandler:
 
     def handle_session_stop(self, msg, is_request = True):
         if is_request:
-            print("Received SessionStopReq")
+            logger.info("Received SessionStopReq")
             self.secc.statemachine.SessionStopReq()
             self.message_sender_secc.send_session_stop_res(msg)
             self.secc.statemachine.send_SessionStopRes()
             self.secc.display_state()
         else:
-            print("Received SesssionStopRes")
-            print("Closing Connection")
+            logger.info("Received SesssionStopRes")
+            logger.info("Closing Connection")
             self.evcc.tcpsock.close()
-            print("Closed")
\ No newline at end of file
+            logger.info("Closed")
\ No newline at end of file
@@ -1,34 +1,142 @@
 """Modul that connects with the EXI jar files and does the encoding/decoding
 """
+import logging
 import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
+from common.codec_worker import get_worker, get_worker_pool, CodecWorkerError
+from common.exi import get_codec, EXICodecError
+
+logger = logging.getLogger(__name__)
+
+# Use the persistent codec worker (one warm JVM) instead of starting
+# encode.jar/decode.jar for every message
+USE_PERSISTENT_CODEC = True
+
+# Use the pure Python codec (common/exi) instead of Java. The samples of
+# python -m common.exi.conformance encode to the bytes of the jar
+USE_PYTHON_CODEC = False
+
+
+def xml_bytes_to_binary(xml_bytes, use_python_codec=None):
+    '''
+    convert xml bytes to EXI bytes, use_python_codec None follows USE_PYTHON_CODEC
+    '''
+    if USE_PYTHON_CODEC if use_python_codec is None else use_python_codec:
+        return get_codec().encode(xml_bytes)
+    return _run_java(get_worker, 'encode', xml_bytes)
+
+
+def binary_to_xml_bytes(exi_bytes, use_python_codec=None):
+    '''
+    convert EXI bytes to xml bytes, use_python_codec None follows USE_PYTHON_CODEC
+    '''
+    if USE_PYTHON_CODEC if use_python_codec is None else use_python_codec:
+        return get_codec().decode(exi_bytes)
+    return _run_java(get_worker, 'decode', exi_bytes)
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=len(get_worker_pool().workers))
+    return _executor
+
+
+# Jar and file names of the fallback when the codec worker is switched off
+# or fails
+_JARS = {'encode': ('encode.jar', 'fragment.xml', 'fragment.exi'),
+         'decode': ('decode.jar', 'fragment.exi', 'fragment.xml')}
+
+
+def _run_java(get, operation, data):
+    '''
+    encode or decode ``data`` with the worker (or worker pool) returned by
+    ``get``, or with a new encode.jar/decode.jar process
+    '''
+    if USE_PERSISTENT_CODEC:
+        try:
+            return getattr(get(), operation)(data)
+        except (CodecWorkerError, OSError) as error:
+            logger.warning("EXI codec worker failed, falling back to the jar: %s", error)
+    jar, input_name, output_name = _JARS[operation]
+    with tempfile.TemporaryDirectory() as directory:
+        input_file = os.path.join(directory, input_name)
+        output_file = os.path.join(directory, output_name)
+        with open(input_file, 'wb') as f:
+            f.write(data)
+        status = os.system('java -jar common/%s %s %s' % (jar, input_file, output_file))
+        if not os.path.exists(output_file):
+            raise EXICodecError('%s wrote no output (exit code %d)'
+                                % (jar, os.waitstatus_to_exitcode(status)))
+        with open(output_file, 'rb') as f:
+            return f.read()
+
+
+def _encode_with_java(xml_bytes):
+    return _run_java(get_worker_pool, 'encode', xml_bytes)
+
+
+def encode_documents(documents):
+    '''
+    convert several xml documents (bytes) to EXI bytes. With Java they are
+    encoded concurrently on the worker pool
+    '''
+    if USE_PYTHON_CODEC:
+        return [get_codec().encode(xml_bytes) for xml_bytes in documents]
+    if len(documents) == 1:
+        return [_encode_with_java(documents[0])]
+    return list(_get_executor().map(_encode_with_java, documents))
+
+
+def _run_through_worker(codec, input_file, output_file):
+    with open(input_file, 'rb') as f:
+        data = f.read()
+    try:
+        result = codec(data)
+    except (CodecWorkerError, EXICodecError, OSError) as error:
+        logger.warning("EXI codec worker failed, falling back to the jar: %s", error)
+        return False
+    with open(output_file, 'wb') as f:
+        f.write(result)
+    return True
 
 
 def xml_to_binary(xml_file, output_file):
-    
-    
-    
-    
+    '''
+    convert xml to binary
+    '''
+    if (USE_PERSISTENT_CODEC or USE_PYTHON_CODEC) and \
+            _run_through_worker(xml_bytes_to_binary, xml_file, output_file):
+        return
     cmd = 'java -jar common/encode.jar %s %s' % (xml_file, output_file)
     os.system(cmd)
-    
+
 '''
-convert binary to xml 
+convert binary to xml
 '''
 def binary_to_xml(binary_file, output_file):
-    
-    
+    if (USE_PERSISTENT_CODEC or USE_PYTHON_CODEC) and \
+            _run_through_worker(binary_to_xml_bytes, binary_file, output_file):
+        return
     cmd = 'java -jar common/decode.jar %s %s' % (binary_file, output_file)
     os.system(cmd)
 
 
 
 def main():
-    
-    print("Calling EXI java script")
-    
+
+    logger.info("Calling EXI java script")
+
 
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
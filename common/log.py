@@ -0,0 +1,96 @@
+"""Logging of the EVCC and SECC.
+
+Modules log through ``logging.getLogger(__name__)`` with lazy %-formatting.
+The received and sent messages are dumped at DEBUG only, so the generateDS
+objects are not formatted unless DEBUG is enabled. configure() sets up the
+console (and optionally a file) once per process. With ``queue=True`` the
+protocol threads only put the records on a queue, formatting and the
+terminal or file I/O happen on a QueueListener thread:
+
+    from common import log
+    log.configure(level=logging.DEBUG, queue=True, filename='v2g.log')
+    logger.info("Received %s", tagname, extra=log.RED)
+
+Records logged with ``extra=log.RED`` or ``extra=log.GREEN`` are coloured
+on the console.
+"""
+import atexit
+import logging
+import logging.handlers
+import queue as queues
+
+from termcolor import colored
+
+# Level of the console and file output. Message dumps are logged at DEBUG
+LOG_LEVEL = logging.INFO
+# Write the records on a background thread (QueueHandler/QueueListener)
+# instead of the protocol thread
+LOG_QUEUE = False
+LOG_FORMAT = '%(asctime)s %(levelname)-7s %(name)s: %(message)s'
+
+RED = {'color': 'red'}
+GREEN = {'color': 'green'}
+
+_handlers = []
+_listener = None
+
+
+class ColorFormatter(logging.Formatter):
+    """Formatter that colours records with a ``color`` attribute"""
+    def format(self, record):
+        text = logging.Formatter.format(self, record)
+        color = getattr(record, 'color', None)
+        return colored(text, color) if color else text
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves the formatting to the listener thread. The
+    arguments of a record must not be modified after it was logged
+    """
+    def prepare(self, record):
+        return record
+
+
+def configure(level=None, queue=None, filename=None, stream=None):
+    """Sets up the root logger, replacing an earlier configuration. Returns
+    the QueueListener with ``queue``, else None
+    """
+    global _listener
+    level = LOG_LEVEL if level is None else level
+    queue = LOG_QUEUE if queue is None else queue
+    stop()
+    root = logging.getLogger()
+    for handler in _handlers:
+        root.removeHandler(handler)
+    del _handlers[:]
+
+    console = logging.StreamHandler(stream)
+    console.setFormatter(ColorFormatter(LOG_FORMAT))
+    handlers = [console]
+    if filename:
+        logfile = logging.FileHandler(filename)
+        logfile.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(logfile)
+
+    if queue:
+        records = queues.SimpleQueue()
+        _handlers.append(DeferredQueueHandler(records))
+        _listener = logging.handlers.QueueListener(records, *handlers)
+        _listener.start()
+    else:
+        _handlers.extend(handlers)
+    for handler in _handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+    return _listener
+
+
+def stop():
+    """Writes the queued records and stops the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop)
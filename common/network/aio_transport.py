@@ -0,0 +1,354 @@
+"""asyncio transport for the SECC and the EVCC. The blocking sockets of
+network.py are replaced by protocols that run on one event loop:
+
+- SDPProtocol: UDP DatagramProtocol for the SECCDiscoveryReq/Res messages
+- V2GTPProtocol: TCP (or TLS) stream protocol that cuts the byte stream into
+  V2GTP messages using the payload length of the header
+- serve_secc: SDP, TCP and TLS servers of the SECC, one SECCSession per
+  connection driven by a coroutine
+- run_evcc: EVCC client (SDP or a known SECC address, then TCP/TLS with the
+  TLS session of the last connection to the SECC offered for resumption)
+
+python -m common.network.aio_transport starts the SECC on asyncio.
+
+The message handlers stay synchronous: the session coroutines run them in
+an executor, so signing or Java pipe IO of one session does not stall the
+others, and they write through small socket-like adapters that hand the
+writes back to the loop. Timeouts are asyncio.wait_for deadlines on the next
+received message.
+"""
+import asyncio
+import collections
+import functools
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# pylint: disable=import-error
+from secc import secc_config
+from evcc import evcc_config
+from common import log
+from common import timing
+from secc.secc_session import SECCSession, SessionRegistry
+from common.network import network
+from common.handlers import MessageHandler
+from common.security.ephemeral import ephemeral_keys
+
+logger = logging.getLogger(__name__)
+
+V2GTP_HEADER_LENGTH = network.V2GTP_HEADER_LENGTH
+
+
+class TransportSocket():
+    """Socket-like adapter over an asyncio transport, used by the message
+    senders (sendall, sendto, close, getpeercert). Transports are not thread
+    safe: calls from an executor thread are scheduled on ``loop``
+    """
+
+    def __init__(self, transport=None, loop=None):
+        self.transport = transport
+        self.loop = loop
+        self.pending = []
+
+    def attach(self, transport):
+        """Sets the transport, data written before is sent now"""
+        self.transport = transport
+        for data in self.pending:
+            transport.write(data)
+        self.pending = []
+
+    def call(self, method, *args):
+        """Calls the transport method on the loop thread"""
+        if self.loop is None or in_loop(self.loop):
+            method(*args)
+        else:
+            self.loop.call_soon_threadsafe(method, *args)
+
+    def sendall(self, data):
+        if self.transport is None:
+            self.pending.append(bytes(data))
+        else:
+            self.call(self.transport.write, bytes(data))
+
+    def sendto(self, data, address):
+        self.call(self.transport.sendto, bytes(data), address)
+
+    def getpeercert(self):
+        ssl_object = self.transport.get_extra_info('ssl_object')
+        return ssl_object.getpeercert() if ssl_object is not None else None
+
+    def getsockname(self):
+        return self.transport.get_extra_info('sockname')
+
+    def close(self):
+        if self.transport is not None:
+            self.call(self.transport.close)
+
+
+def in_loop(loop):
+    """True if called from the thread running ``loop``"""
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False
+
+
+async def process_message(loop, executor, message_handler, data, *args, **kwargs):
+    """Runs message_handler.process_message_and_react in the executor. The
+    writes of the handler are scheduled on the loop before the result, so they
+    are done when this returns
+    """
+    await loop.run_in_executor(executor, functools.partial(
+        message_handler.process_message_and_react, data, *args, **kwargs))
+
+
+class V2GTPProtocol(asyncio.Protocol):
+    """Stream protocol that queues complete V2GTP messages (header included).
+    A None in the queue marks the end of the connection. ``received_at`` is
+    the time.perf_counter() at which the last returned message was complete
+    """
+
+    def __init__(self):
+        self.transport = None
+        self.buffer = bytearray()
+        self.messages = asyncio.Queue()
+        self.arrivals = collections.deque()
+        self.received_at = None
+        self.connected = asyncio.get_event_loop().create_future()
+
+    def connection_made(self, transport):
+        self.transport = transport
+        if not self.connected.done():
+            self.connected.set_result(transport)
+
+    def data_received(self, data):
+        buffer = self.buffer
+        buffer.extend(data)
+        while len(buffer) >= V2GTP_HEADER_LENGTH:
+            try:
+                _, length = network.parse_v2gtp_header(buffer)
+            except network.V2GTPError as error:
+                logger.warning("%s", error, extra=log.RED)
+                self.transport.close()
+                return
+            length += V2GTP_HEADER_LENGTH
+            if len(buffer) < length:
+                break
+            self.messages.put_nowait(bytes(buffer[:length]))
+            self.arrivals.append(time.perf_counter())
+            del buffer[:length]
+
+    def connection_lost(self, exc):
+        self.messages.put_nowait(None)
+
+    async def next_message(self, timeout=None):
+        """Next V2GTP message, None if the peer closed the connection.
+        Raises asyncio.TimeoutError after ``timeout`` seconds
+        """
+        data = await asyncio.wait_for(self.messages.get(), timeout)
+        if data is not None:
+            self.received_at = self.arrivals.popleft()
+        return data
+
+
+class SDPProtocol(asyncio.DatagramProtocol):
+    """UDP protocol for the SDP messages, ``callback(data, address)`` is called
+    for every datagram
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.callback(data, addr)
+
+
+class AsyncSECC():
+    """SECC on an asyncio event loop. Provides the attributes the SDP message
+    sender expects (udpserver, tcpserver, ipadress, tlstcp)
+    """
+
+    def __init__(self):
+        self.ipadress = secc_config.IP_ADRESS
+        self.tlstcp = None
+        self.secc_key_path = secc_config.SECC_PRIVATEKEY_PATH
+        self.secc_cert_chain = secc_config.SECC_CERTCHAIN_PATH
+        self.sessions = SessionRegistry()
+        self.udpserver = TransportSocket()
+        self.tcp_server = None
+        self.tls_server = None
+        self.message_handler = MessageHandler(None, self)
+        # Message handling of the sessions, as the threads of the threaded SECC
+        self.executor = ThreadPoolExecutor(max_workers=secc_config.MAX_SESSIONS)
+        # DHpublickey key pairs of the CertificateInstallationRes, generated ahead
+        ephemeral_keys.start()
+
+    @property
+    def tcpserver(self):
+        """Server socket announced in the SECCDiscoveryRes: the TLS server if
+        the EVCC asked for TLS, the plain TCP server otherwise
+        """
+        server = self.tls_server if self.tlstcp else self.tcp_server
+        return server.sockets[0]
+
+    def establish_secc_tcp_connection(self, address=None):
+        """Connections are accepted by the TCP and TLS servers"""
+
+    def handle_sdp(self, data, address):
+        self.message_handler.process_message_and_react(data, False, address)
+
+    async def serve_session(self, protocol):
+        """Message loop of one connection"""
+        transport = await protocol.connected
+        loop = asyncio.get_event_loop()
+        address = transport.get_extra_info('peername')
+        logger.info("3: Connected to %s", address, extra=log.RED)
+        session = SECCSession(self, TransportSocket(transport, loop), address)
+        self.sessions.add(session)
+        try:
+            while True:
+                try:
+                    data = await protocol.next_message(secc_config.SEQUENCE_TIMEOUT)
+                except asyncio.TimeoutError:
+                    logger.warning("V2G_SECC_Sequence_Timeout for %s, closing the connection",
+                                   address, extra=log.RED)
+                    timing.metrics.count_timeout('V2G_SECC_Sequence_Timeout')
+                    break
+                if data is None:
+                    break
+                try:
+                    await process_message(loop, self.executor, session.message_handler,
+                                          data, False, received_at=protocol.received_at)
+                except Exception:  # pylint: disable=broad-except
+                    # Nothing else awaits this task, the EVCC would wait for
+                    # the response until its timeout
+                    logger.exception("Processing a message from %s failed, closing the connection",
+                                     address, extra=log.RED)
+                    break
+                self.sessions.bind(session)
+        finally:
+            self.sessions.remove(session)
+            transport.close()
+            logger.info("Connection %s closed", address, extra=log.RED)
+
+    def protocol_factory(self):
+        protocol = V2GTPProtocol()
+        asyncio.ensure_future(self.serve_session(protocol))
+        return protocol
+
+    async def serve(self):
+        """Starts the SDP, TCP and TLS servers and serves until cancelled"""
+        loop = asyncio.get_event_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: SDPProtocol(self.handle_sdp),
+            local_addr=('0.0.0.0', secc_config.UDP_PORT))
+        self.udpserver.attach(transport)
+        self.tcp_server = await loop.create_server(
+            self.protocol_factory, '0.0.0.0', secc_config.TCP_PORT, reuse_address=True)
+        context = network.get_secc_ssl_context(
+            server_cert=secc_config.SECC_CERTCHAIN_PATH,
+            server_key=secc_config.SECC_PRIVATEKEY_PATH)
+        self.tls_server = await loop.create_server(
+            self.protocol_factory, '0.0.0.0', secc_config.TLS_PORT, ssl=context,
+            reuse_address=True)
+        logger.info("Waiting For SECCDiscoveryReq UDP Message...")
+        try:
+            await asyncio.gather(self.tcp_server.serve_forever(),
+                                 self.tls_server.serve_forever())
+        finally:
+            transport.close()
+
+
+async def serve_secc():
+    """Runs an AsyncSECC until cancelled"""
+    await AsyncSECC().serve()
+
+
+async def discover_secc(evcc, executor=None):
+    """SECCDiscoveryReq on UDP, the SECCDiscoveryRes is processed by the EVCC"""
+    loop = asyncio.get_event_loop()
+    discovery = loop.create_future()
+
+    def on_datagram(data, address):
+        if not discovery.done():
+            discovery.set_result((data, address))
+
+    udp_transport, _ = await loop.create_datagram_endpoint(
+        lambda: SDPProtocol(on_datagram), family=socket.AF_INET, allow_broadcast=True)
+    evcc.udpclient = TransportSocket(udp_transport, loop)
+    try:
+        evcc.check_state_and_react()
+        data, address = await asyncio.wait_for(discovery, evcc_config.SDP_TIMEOUT)
+    finally:
+        udp_transport.close()
+    await process_message(loop, executor, evcc.message_handler, data, True, address)
+
+
+async def run_evcc(evcc, address=None, executor=None):
+    """Runs one EVCC session: SECCDiscoveryReq on UDP, then the V2G messages on
+    TCP/TLS. ``evcc`` is an evcc.EVCC whose sockets are replaced by transport
+    adapters. With the (ip, port) ``address`` of the SECC the SDP is skipped.
+    The messages are processed in ``executor``, the default executor of the
+    loop if None. Returns when the SECC closes the connection or on a timeout
+    """
+    loop = asyncio.get_event_loop()
+    connection = {}
+
+    def establish_evcc_tcp_connection(ipadress, port):
+        # Called by MessageHandler.start_session, the connection is opened
+        # below and the queued supportedAppProtocolReq is sent once it is up
+        connection['address'] = (ipadress, port)
+        evcc.tcpsock = TransportSocket(loop=loop)
+
+    evcc.establish_evcc_tcp_connection = establish_evcc_tcp_connection
+    if address is None:
+        await discover_secc(evcc, executor)
+    else:
+        evcc.message_handler.start_session(*address)
+    if 'address' not in connection:
+        return
+    context = None
+    if evcc.tls:
+        context = network.get_evcc_ssl_context(evcc_config.V2GROOTPATH,
+                                               evcc_config.VERIFY_SECC_CERTIFICATE)
+    ipadress, port = connection['address']
+    # Offers the TLS session of the last connection to this SECC
+    token = network.offered_tls_session.set(network.evcc_tls_sessions.get((ipadress, port)))
+    start = time.perf_counter()
+    try:
+        transport, protocol = await loop.create_connection(V2GTPProtocol, ipadress, port,
+                                                           ssl=context)
+    finally:
+        network.offered_tls_session.reset(token)
+    ssl_object = transport.get_extra_info('ssl_object')
+    if ssl_object is not None:
+        network.handshake_metrics.record(time.perf_counter() - start, ssl_object.session_reused)
+        network.evcc_tls_sessions[(ipadress, port)] = ssl_object.session
+        logger.info("SSL established, session resumed: %s", ssl_object.session_reused,
+                    extra=log.RED)
+    evcc.tcpsock.attach(transport)
+    try:
+        while not transport.is_closing():
+            try:
+                data = await protocol.next_message(evcc_config.MSG_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("V2G_EVCC_Msg_Timeout, closing the connection", extra=log.RED)
+                timing.metrics.count_timeout('V2G_EVCC_Msg_Timeout')
+                break
+            if data is None:
+                break
+            await process_message(loop, executor, evcc.message_handler,
+                                  data, True, received_at=protocol.received_at)
+    finally:
+        transport.close()
+
+
+if __name__ == '__main__':
+    log.configure()
+    timing.serve_metrics()
+    asyncio.run(serve_secc())
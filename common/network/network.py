@@ -3,28 +3,48 @@ SSL contexts can be created by using the methods contained in this module and a
 socket receive method (recvall) is being defined, in order to have more capacity
 of the messages that are received
     """
+import contextvars
+import logging
 import socket
 import ssl
 # import fcntl
 import struct
+import threading
 import uuid
 import os
 
 #import netifaces
 from secc import secc_config
 from cryptography.hazmat.primitives import serialization
-from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
 
-from evcc import evcc_config
-from secc import secc_config
+from common.security.keystore import keystore
+
+logger = logging.getLogger(__name__)
+
+# TLS session offered by EVCCSSLContext.wrap_bio: loop.create_connection has
+# no session argument, the asyncio EVCC sets it around the connection
+offered_tls_session = contextvars.ContextVar('offered_tls_session', default=None)
+
+
+class EVCCSSLContext(ssl.SSLContext):
+    """SSLContext of the EVCC, offers offered_tls_session for resumption when
+    asyncio wraps a connection without a session
+    """
+    def wrap_bio(self, incoming, outgoing, server_side=False, server_hostname=None,
+                 session=None):
+        if session is None:
+            session = offered_tls_session.get()
+        return super().wrap_bio(incoming, outgoing, server_side, server_hostname, session)
 
 
-def create_evcc_ssl_context(v2grootpath):
+def create_evcc_ssl_context(v2grootpath, verify=True):
     """Creates the SSL contect for the EVCC (client). EVCC will verify
     the SECC counterpart based on the V2G Root certificate.
 
     Args:
         v2grootpath (String): Path to the V2G Root certificate stored by the EVCC
+        verify (bool): Verify the SECC certificate chain. Only switched off for
+            loopback tests with an expired test PKI
 
     Returns:
         SSLContext: The SSL Context containing the TLS version, the verification mode
@@ -32,8 +52,8 @@ def create_evcc_ssl_context(v2grootpath):
         chain with its corresponding private key and verify if it has the same V2G Root certificate
     """
 
-    context = ssl.SSLContext(protocol=ssl.PROTOCOL_TLSv1_2)
-    context.verify_mode = ssl.CERT_REQUIRED
+    context = EVCCSSLContext(protocol=ssl.PROTOCOL_TLSv1_2)
+    context.verify_mode = ssl.CERT_REQUIRED if verify else ssl.CERT_NONE
     context.load_verify_locations(v2grootpath)
     context.set_ciphers("ECDHE-ECDSA-AES128-SHA256")
     return context
@@ -54,54 +74,233 @@ def create_secc_sll_context(server_cert, server_key):
         chain and its corresponding private key and  EVCC will verify if its V2G Root
         certificate is the same
     """
-    print(server_cert)
-    print(server_key)
-    # Load SECC Certificate
-    with open(server_cert, 'rb') as pkcs12_file:
-        pkcs12_data = pkcs12_file.read()
-    pkcs12_password_bytes = "123456".encode('utf8')
-
-    # Returns a tuple where 0:privatekey, 1:certificate, 2:certificate_chain
-    cpocertchain = load_key_and_certificates(pkcs12_data, pkcs12_password_bytes)
-
-    cposub1 = cpocertchain[2][0].public_bytes(serialization.Encoding.PEM)
-    cposub2 = cpocertchain[2][1].public_bytes(serialization.Encoding.PEM)
-    cpocert = cpocertchain[1].public_bytes(serialization.Encoding.PEM)
+    logger.debug("SECC certificate chain %s, key %s", server_cert, server_key)
+    # Load SECC Certificate (parsed once per process, see common/security/keystore.py)
+    cpocertchain = keystore.key_cert_chain(server_cert)
+
+    cposub1 = cpocertchain.chain[0].public_bytes(serialization.Encoding.PEM)
+    cposub2 = cpocertchain.chain[1].public_bytes(serialization.Encoding.PEM)
+    cpocert = cpocertchain.certificate.public_bytes(serialization.Encoding.PEM)
+    cpocertpem = cpocert + cposub2 + cposub1
     cpocertpem_path = secc_config.SECC_CERTCHAIN_PEM_PATH
-    f = open(cpocertpem_path , "wb")
-    f.write(cpocert)
-    f.write(cposub2)
-    f.write(cposub1)
+    # Only rewritten if the chain changed
+    if not os.path.exists(cpocertpem_path) or keystore.file_bytes(cpocertpem_path) != cpocertpem:
+        with open(cpocertpem_path, "wb") as f:
+            f.write(cpocertpem)
 
-    f.close()
     context = ssl.SSLContext(protocol=ssl.PROTOCOL_TLSv1_2)
     context.load_cert_chain(cpocertpem_path, server_key, password='123456')
     context.verify_mode = ssl.VerifyMode.CERT_NONE
     context.set_ciphers("ECDH-ECDSA-AES128-SHA256:" "ECDHE-ECDSA-AES128-SHA256")
+    # Session IDs (server side cache of the context) and session tickets let
+    # reconnecting EVCCs resume instead of running the full handshake
+    context.options &= ~ssl.OP_NO_TICKET
     return context
 
 
+_contexts = {}
+_contexts_lock = threading.Lock()
+
+
+def _cached_context(key, create):
+    with _contexts_lock:
+        context = _contexts.get(key)
+        if context is None:
+            context = _contexts[key] = create()
+    return context
+
+
+def get_evcc_ssl_context(v2grootpath, verify=True):
+    """create_evcc_ssl_context(), built once per process"""
+    return _cached_context(('evcc', v2grootpath, verify),
+                           lambda: create_evcc_ssl_context(v2grootpath, verify))
+
+
+def get_secc_ssl_context(server_cert, server_key):
+    """create_secc_sll_context(), built once per process. The server session
+    cache lives in the context, so sessions can only be resumed on a shared one
+    """
+    return _cached_context(('secc', server_cert, server_key),
+                           lambda: create_secc_sll_context(server_cert, server_key))
+
+
+class HandshakeMetrics():
+    """Count and duration of the TLS handshakes, full and resumed"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counts = {False: 0, True: 0}
+        self.seconds = {False: 0.0, True: 0.0}
+        self.failures = 0
+
+    def record(self, seconds, resumed):
+        with self.lock:
+            self.counts[bool(resumed)] += 1
+            self.seconds[bool(resumed)] += seconds
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+
+    def stats(self):
+        """Counters as a dict: full, resumed, failures and the mean handshake
+        times in milliseconds
+        """
+        with self.lock:
+            return {
+                'full': self.counts[False],
+                'resumed': self.counts[True],
+                'failures': self.failures,
+                'full_ms': 1e3 * self.seconds[False] / self.counts[False] if self.counts[False] else 0.0,
+                'resumed_ms': 1e3 * self.seconds[True] / self.counts[True] if self.counts[True] else 0.0,
+            }
+
+
+handshake_metrics = HandshakeMetrics()
+
+# TLS session of the last connection to each SECC (ip, port), offered again
+# by the EVCC on the next connection
+evcc_tls_sessions = {}
+
+
+V2GTP_HEADER = struct.Struct('>BBHI')
+V2GTP_HEADER_LENGTH = V2GTP_HEADER.size
+V2GTP_VERSION = 0x01
+V2GTP_INVERSE_VERSION = 0xFE
+# Largest payload that is accepted, protects the receive buffer
+MAX_PAYLOAD_LENGTH = 1 << 20
+
+
+class V2GTPError(Exception):
+    """Raised for V2GTP headers with a wrong version or payload length"""
+
+
+def parse_v2gtp_header(header):
+    """Validates the 8 byte V2GTP header built by exi_utils.add_Header_v2gEXI
+
+    Args:
+        header (bytes-like): The first 8 bytes of a V2GTP message
+
+    Returns:
+        (int, int): Payload type and payload length
+    """
+    version, inverse_version, payload_type, length = V2GTP_HEADER.unpack_from(header)
+    if version != V2GTP_VERSION or inverse_version != V2GTP_INVERSE_VERSION:
+        raise V2GTPError('Unsupported V2GTP version {:#04x}/{:#04x}'.format(
+            version, inverse_version))
+    if length > MAX_PAYLOAD_LENGTH:
+        raise V2GTPError('V2GTP payload length {} exceeds {}'.format(
+            length, MAX_PAYLOAD_LENGTH))
+    return payload_type, length
+
+
+def _recv_exactly(sock, view):
+    """Fills the memoryview from the socket, False if the peer closed first"""
+    while view:
+        count = sock.recv_into(view)
+        if not count:
+            return False
+        view = view[count:]
+    return True
+
+
 def recvall(sock):
-    """Receive method for a specific socket. Will store the whole
-    bytes message that a socket receives.
+    """Receive method for a specific socket. Reads exactly one V2GTP message:
+    the 8 byte header and then the number of payload bytes it announces.
 
     Args:
         sock Socket: The socket that receives the data
 
     Returns:
-        bytes: Data received from socket
+        bytes: The V2GTP message (header and payload), b'' if the socket was closed
     """
-    BUFF_SIZE = 4096  # 4 KiB
-    data = b''
-    while True:
-        part = sock.recv(BUFF_SIZE)
-        data += part
-        if not data:
-            break
-        if len(part) < BUFF_SIZE:
-            # either 0 or end of data
-            break
-    return data
+    header = bytearray(V2GTP_HEADER_LENGTH)
+    if not _recv_exactly(sock, memoryview(header)):
+        return b''
+    _, length = parse_v2gtp_header(header)
+    message = bytearray(V2GTP_HEADER_LENGTH + length)
+    message[:V2GTP_HEADER_LENGTH] = header
+    if not _recv_exactly(sock, memoryview(message)[V2GTP_HEADER_LENGTH:]):
+        return b''
+    return bytes(message)
+
+
+class V2GTPReader():
+    """Reads V2GTP messages from a stream socket into one preallocated buffer
+    with recv_into. A single recv can return several pipelined messages, they
+    are served from the buffer without further system calls.
+
+    The returned memoryviews point into the buffer and are only valid until
+    the next call of read_message.
+    """
+
+    def __init__(self, sock, buffer_size=65536):
+        self.sock = sock
+        self.buffer = bytearray(buffer_size)
+        self.view = memoryview(self.buffer)
+        self.start = 0
+        self.end = 0
+
+    def _fill(self, count):
+        """Makes sure ``count`` unread bytes are buffered, False on end of stream"""
+        while self.end - self.start < count:
+            if self.start + count > len(self.buffer):
+                self._compact(count)
+            received = self.sock.recv_into(self.view[self.end:])
+            if not received:
+                return False
+            self.end += received
+        return True
+
+    def _compact(self, count):
+        """Moves the unread bytes to the start of the buffer, grows it if
+        ``count`` bytes do not fit
+        """
+        pending = self.end - self.start
+        if count > len(self.buffer):
+            buffer = bytearray(max(count, 2 * len(self.buffer)))
+            buffer[:pending] = self.view[self.start:self.end]
+            self.buffer = buffer
+            self.view = memoryview(buffer)
+        else:
+            self.view[:pending] = self.view[self.start:self.end]
+        self.start = 0
+        self.end = pending
+
+    def read_message(self):
+        """Next V2GTP message
+
+        Returns:
+            memoryview: Header and payload of the message, None if the socket was closed
+        """
+        if not self._fill(V2GTP_HEADER_LENGTH):
+            return None
+        _, length = parse_v2gtp_header(self.view[self.start:self.start + V2GTP_HEADER_LENGTH])
+        total = V2GTP_HEADER_LENGTH + length
+        if not self._fill(total):
+            return None
+        message = self.view[self.start:self.start + total]
+        self.start += total
+        if self.start == self.end:
+            self.start = self.end = 0
+        return message
+
+    def read_payload(self):
+        """Next V2GTP message as (payload type, payload memoryview), None if
+        the socket was closed
+        """
+        message = self.read_message()
+        if message is None:
+            return None
+        return (V2GTP_HEADER.unpack_from(message)[2], message[V2GTP_HEADER_LENGTH:])
+
+    def has_buffered_message(self):
+        """True if a complete message is already buffered (pipelining)"""
+        pending = self.end - self.start
+        if pending < V2GTP_HEADER_LENGTH:
+            return False
+        length = V2GTP_HEADER.unpack_from(self.view, self.start)[3]
+        return pending >= V2GTP_HEADER_LENGTH + length
 
 
 def get_ip(interface):
@@ -161,14 +360,26 @@ def create_udp_tcp_serversocket():
     SDP messages and TCP will be used for the AppProtocol and V2G Messages
     """
     # UDP Layer
-    print("Starting UDP")
+    logger.info("Starting UDP")
     udpserver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     udpserver.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     udpserver.bind(('0.0.0.0', secc_config.UDP_PORT))
     # TCP Layer
-    print("Starting TCP")
+    logger.info("Starting TCP")
     tcpserver = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     tcpserver.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     tcpserver.bind(('0.0.0.0', secc_config.TCP_PORT))
     tcpserver.listen()
-    return (udpserver, tcpserver)
\ No newline at end of file
+    return (udpserver, tcpserver)
+
+
+def create_tls_serversocket():
+    """Instantiates the TCP socket of the TLS connections. It listens on its
+    own port, so the SECC knows from the port whether to start the handshake
+    """
+    logger.info("Starting TLS")
+    tlsserver = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tlsserver.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tlsserver.bind(('0.0.0.0', secc_config.TLS_PORT))
+    tlsserver.listen()
+    return tlsserver
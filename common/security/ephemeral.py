@@ -0,0 +1,83 @@
+"""Pool of ephemeral SECP256R1 key pairs for the DHpublickey of the
+CertificateInstallationRes.
+
+Key generation and the PEM export of the public key happen on a background
+thread, so while the EV waits only the ECDH exchange, HKDF and the AES
+encryption are left. Every pair is handed out once:
+
+    from common.security.ephemeral import ephemeral_keys
+    ephemeral_keys.start()                  # fill the pool at startup
+    key = ephemeral_keys.get()
+    key.private_key.exchange(ec.ECDH(), peer_public_key)
+    key.public_key_b64                      # DHpublickey content
+
+If the pool runs dry the pair is generated inline.
+"""
+import collections
+import threading
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+# Pairs kept ready. The refill thread tops the pool up to POOL_SIZE as soon
+# as it holds fewer than LOW_WATER_MARK pairs
+POOL_SIZE = 16
+LOW_WATER_MARK = 4
+
+EphemeralKey = collections.namedtuple('EphemeralKey', ['private_key', 'public_key_b64'])
+
+
+def generate_ephemeral_key():
+    """New key pair with the public key as base64 DER (PEM without armor)"""
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    public_key = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo)
+    return EphemeralKey(private_key, public_key.split(b"-----")[2].strip())
+
+
+class EphemeralKeyPool():
+    """Key pairs generated ahead of time by a daemon thread"""
+    def __init__(self, size=POOL_SIZE, low_water_mark=LOW_WATER_MARK):
+        self.size = size
+        self.low_water_mark = low_water_mark
+        self.keys = collections.deque()
+        self.condition = threading.Condition()
+        self.thread = None
+
+    def start(self):
+        """Starts the refill thread, it fills the pool right away"""
+        with self.condition:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._refill, name='ephemeral-keys',
+                                               daemon=True)
+                self.thread.start()
+
+    def get(self):
+        """A key pair that has not been handed out before"""
+        self.start()
+        with self.condition:
+            key = self.keys.popleft() if self.keys else None
+            if len(self.keys) < self.low_water_mark:
+                self.condition.notify()
+        if key is None:
+            key = generate_ephemeral_key()
+        return key
+
+    def __len__(self):
+        with self.condition:
+            return len(self.keys)
+
+    def _refill(self):
+        while True:
+            with self.condition:
+                while len(self.keys) >= self.low_water_mark:
+                    self.condition.wait()
+                missing = self.size - len(self.keys)
+            for _ in range(missing):
+                key = generate_ephemeral_key()
+                with self.condition:
+                    self.keys.append(key)
+
+
+ephemeral_keys = EphemeralKeyPool()
@@ -0,0 +1,106 @@
+"""Process wide cache of the keys and certificates under common/PKI.
+
+Every PEM/PKCS#12 file is read and parsed once (the PKCS#12 and encrypted
+PEM keys include a password based key derivation) and shared by all sessions.
+Entries are keyed by the absolute path and reloaded when the modification
+time or size of the file changes:
+
+    from common.security.keystore import keystore
+    keystore.private_key('common/PKI/CPS/cpsSubCA2.key')
+    chain = keystore.key_cert_chain('common/PKI/CPS/moCertChain.p12')
+    chain.certificate_b64, chain.chain_b64
+
+The ``*_b64`` members hold the certificates as base64 DER, the text between
+the PEM armor lines as the messages carry it.
+"""
+import collections
+import os
+import threading
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
+
+# Password of the keys and PKCS#12 containers under common/PKI
+DEFAULT_PASSWORD = b'123456'
+
+Certificate = collections.namedtuple('Certificate', ['certificate', 'certificate_b64'])
+KeyCertChain = collections.namedtuple(
+    'KeyCertChain', ['private_key', 'certificate', 'chain', 'certificate_b64', 'chain_b64'])
+
+
+def pem_body(certificate):
+    """Base64 DER of a certificate, the PEM text without the armor lines"""
+    return certificate.public_bytes(serialization.Encoding.PEM).split(b"-----")[2].strip()
+
+
+def _load_private_key(data, password):
+    return serialization.load_pem_private_key(data, password)
+
+
+def _load_certificate(data, _):
+    certificate = x509.load_pem_x509_certificate(data)
+    return Certificate(certificate, data.split(b"-----")[2].strip())
+
+
+def _load_key_cert_chain(data, password):
+    private_key, certificate, chain = load_key_and_certificates(data, password)
+    return KeyCertChain(private_key, certificate, chain, pem_body(certificate),
+                        [pem_body(c) for c in chain])
+
+
+def _read(data, _):
+    return data
+
+
+class KeyStore():
+    """Parsed keys and certificates by (path, password), reloaded when the
+    file changes on disk
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = {}
+
+    def _get(self, loader, path, password=None):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        key = (loader, path, password)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        with open(path, 'rb') as key_file:
+            value = loader(key_file.read(), password)
+        with self.lock:
+            self.entries[key] = (stamp, value)
+        return value
+
+    def private_key(self, path, password=DEFAULT_PASSWORD):
+        """Private key object of a PEM file"""
+        return self._get(_load_private_key, path, password)
+
+    def certificate(self, path):
+        """Certificate of a PEM file with its base64 DER"""
+        return self._get(_load_certificate, path)
+
+    def key_cert_chain(self, path, password=DEFAULT_PASSWORD):
+        """Private key, certificate and chain of a PKCS#12 file"""
+        return self._get(_load_key_cert_chain, path, password)
+
+    def file_bytes(self, path):
+        """Content of a key file as it is stored"""
+        return self._get(_read, path)
+
+    def invalidate(self, path=None):
+        """Drops the entries of ``path``, or all entries"""
+        with self.lock:
+            if path is None:
+                self.entries.clear()
+                return
+            path = os.path.abspath(path)
+            for key in [key for key in self.entries if key[1] == path]:
+                del self.entries[key]
+
+
+keystore = KeyStore()
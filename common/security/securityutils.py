@@ -14,6 +14,7 @@
 import os
 import base64
 import hashlib
+import logging
 import random
 from common import java_caller
 from cryptography.hazmat.primitives import serialization
@@ -26,7 +27,23 @@ from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.serialization.pkcs12 import load_key_and_certificates
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad, unpad
-from common.XML import msgbody1, msgdatatypes1, msgxmlschema1, msgDef1, msgheader1
+from common import bindings
+from common import timing
+from common.security.keystore import keystore
+from common.security.ephemeral import ephemeral_keys
+from common.exi_utils.codec_cache import LRUCache
+from common.exi import get_codec
+
+logger = logging.getLogger(__name__)
+
+# sign_authorization_req_message and sign_certinstallreq_message verify their
+# own signature again, only needed when debugging the signing
+VERIFY_OWN_SIGNATURES = False
+
+# Certificates received in messages, parsed once (by SHA-256 of the DER), and
+# the signatures that verified (by certificate, SignedInfo and signature)
+peer_certificates = LRUCache(64)
+verified_signatures = LRUCache(256)
 
 
 def load_private_key(path):
@@ -36,15 +53,10 @@ def load_private_key(path):
         path (String): Path of private key
 
     Returns:
-        EllipticCurvePrivateKey: Private key python object.
+        EllipticCurvePrivateKey: Private key python object. Keys are parsed
+        once per process (common/security/keystore.py)
     """
-    _f = open(path, "rb")
-    private_key = _f.read()
-
-    evcc_private_key = serialization.load_pem_private_key(
-        private_key, b'123456')
-
-    return evcc_private_key
+    return keystore.private_key(path)
 
 
 def aes_encrypt(derived_key, contract_private_key):
@@ -110,24 +122,24 @@ def aes_decrypt(derived_key, encrypted_contract_private_key):
 #             <DHpublickey>
 #
 #     """
-#     certinstres = msgbody1.CertificateInstallationResType()
-#     certinstres.ResponseCode = msgbody1.responseCodeType.OK
+#     certinstres = bindings.CertificateInstallationResType()
+#     certinstres.ResponseCode = bindings.responseCodeType.OK
 #
 #     # SAProvisioningCertificateChain
-#     saprovcertchain = msgbody1.CertificateChainType()
+#     saprovcertchain = bindings.CertificateChainType()
 #     saprovcertchain.Certificate = b""
 #
-#     sasubcertificates = msgdatatypes1.SubCertificatesType()
+#     sasubcertificates = bindings.SubCertificatesType()
 #     sasubcertificates.add_Certificate(b"")
 #     sasubcertificates.add_Certificate(b"")
 #
 #     saprovcertchain.SubCertificates = sasubcertificates
 #     certinstres.SAProvisioningCertificateChain = saprovcertchain
 #     # ContractSignatureCertChain
-#     contractsignaturecertchain = msgbody1.CertificateChainType()
+#     contractsignaturecertchain = bindings.CertificateChainType()
 #     contractsignaturecertchain.Certificate = b""
 #
-    # contractsubcertificates = msgdatatypes1.SubCertificatesType()
+    # contractsubcertificates = bindings.SubCertificatesType()
     # contractsubcertificates.add_Certificate(b"")
     # contractsubcertificates.add_Certificate(b"")
     #
@@ -136,15 +148,15 @@ def aes_decrypt(derived_key, encrypted_contract_private_key):
     # certinstres.ContractSignatureCertChain = contractsignaturecertchain
     #
     # # ContractSignatureEncryptedPrivateKey
-    # certinstres.ContractSignatureEncryptedPrivateKey = msgdatatypes1.ContractSignatureEncryptedPrivateKeyType(
+    # certinstres.ContractSignatureEncryptedPrivateKey = bindings.ContractSignatureEncryptedPrivateKeyType(
     #     valueOf_=b"")
     #
     # # DHpublickey
-    # certinstres.DHpublickey = msgdatatypes1.DiffieHellmanPublickeyType(
+    # certinstres.DHpublickey = bindings.DiffieHellmanPublickeyType(
     #     valueOf_=b"")
     #
     # # eMAID
-    # certinstres.eMAID = msgdatatypes1.EMAIDType(valueOf_="DE1ABCD2EF357A")
+    # certinstres.eMAID = bindings.EMAIDType(valueOf_="DE1ABCD2EF357A")
     # return certinstres
 
 """ use a loop to create the two certificate chain types (SAProvisioningCertificateChain and ContractSignatureCertChain)
@@ -172,8 +184,8 @@ def generate_certificate_installation_res_body():
             <ContractSignatureEncryptedPrivateKey>
             <DHpublickey>
     """
-    certinstres = msgbody1.CertificateInstallationResType()
-    certinstres.ResponseCode = msgbody1.responseCodeType.OK
+    certinstres = bindings.CertificateInstallationResType()
+    certinstres.ResponseCode = bindings.responseCodeType.OK
 
     # Define the certificate chain types
     chain_types = [
@@ -182,10 +194,10 @@ def generate_certificate_installation_res_body():
     ]
 
     for chain_name, num_subcerts in chain_types:
-        chain = msgbody1.CertificateChainType()
+        chain = bindings.CertificateChainType()
         chain.Certificate = b""
 
-        subcertificates = msgdatatypes1.SubCertificatesType()
+        subcertificates = bindings.SubCertificatesType()
         for _ in range(num_subcerts):
             subcertificates.add_Certificate(b"")
 
@@ -193,14 +205,14 @@ def generate_certificate_installation_res_body():
         setattr(certinstres, chain_name, chain)
 
     # ContractSignatureEncryptedPrivateKey
-    certinstres.ContractSignatureEncryptedPrivateKey = msgdatatypes1.ContractSignatureEncryptedPrivateKeyType(
+    certinstres.ContractSignatureEncryptedPrivateKey = bindings.ContractSignatureEncryptedPrivateKeyType(
         valueOf_=b"")
 
     # DHpublickey
-    certinstres.DHpublickey = msgdatatypes1.DiffieHellmanPublickeyType(valueOf_=b"")
+    certinstres.DHpublickey = bindings.DiffieHellmanPublickeyType(valueOf_=b"")
 
     # eMAID
-    certinstres.eMAID = msgdatatypes1.EMAIDType(valueOf_="DE1ABCD2EF357A")
+    certinstres.eMAID = bindings.EMAIDType(valueOf_="DE1ABCD2EF357A")
     return certinstres
 
 
@@ -304,12 +316,14 @@ def load_key_cert_chain(pkcs12_data, password):
     return cert_pem, private_key, cert_chain_pems
 
 
-def load_contract_certificates_to_xml(path, certinstres):
-    with open(path, 'rb') as pkcs12_file:
-        pkcs12_data = pkcs12_file.read()
+def load_cached_key_cert_chain(path):
+    """load_key_cert_chain() of a PKCS#12 file, parsed once per process"""
+    chain = keystore.key_cert_chain(path)
+    return chain.certificate_b64, chain.private_key, chain.chain_b64
 
-    password_bytes = b"123456"
-    cert_pem, _, cert_chain_pems = load_key_cert_chain(pkcs12_data, password_bytes)
+
+def load_contract_certificates_to_xml(path, certinstres):
+    cert_pem, _, cert_chain_pems = load_cached_key_cert_chain(path)
 
     certinstres.ContractSignatureCertChain.Certificate = cert_pem
 
@@ -321,11 +335,7 @@ def load_contract_certificates_to_xml(path, certinstres):
 
 
 def load_cps_certificates_to_xml(path, certinstres):
-    with open(path, 'rb') as pkcs12_file:
-        pkcs12_data = pkcs12_file.read()
-
-    password_bytes = b"123456"
-    cert_pem, _, cert_chain_pems = load_key_cert_chain(pkcs12_data, password_bytes)
+    cert_pem, _, cert_chain_pems = load_cached_key_cert_chain(path)
 
     certinstres.SAProvisioningCertificateChain.Certificate = cert_pem
 
@@ -337,11 +347,7 @@ def load_cps_certificates_to_xml(path, certinstres):
 
 
 def load_contract_cert_key_eim(pathcert):
-    with open(pathcert, 'rb') as pkcs12_file:
-        pkcs12_data = pkcs12_file.read()
-
-    password_bytes = b"123456"
-    cert_pem, private_key, _ = load_key_cert_chain(pkcs12_data, password_bytes)
+    cert_pem, private_key, _ = load_cached_key_cert_chain(pathcert)
 
     return cert_pem, private_key
 
@@ -361,21 +367,19 @@ def generate_dhpublickey_contractsignatureencryptedprivatekey(
     Returns:
         CertificateInstallationRes element with all elements filled
     """
-    # Generating an ephemeral key pair from the ECC domain parameters of the named curve
-    # ”secp256r1” (the public key part is the above mentioned DHpublickey),
-    dh_private_key = ec.generate_private_key(ec.SECP256R1())
-    dh_public_key = dh_private_key.public_key()
+    # Taking an ephemeral key pair from the ECC domain parameters of the named curve
+    # ”secp256r1” (the public key part is the above mentioned DHpublickey). The pairs
+    # are generated ahead of time (common/security/ephemeral.py)
+    dh_key = ephemeral_keys.get()
 
     # Generating a shared secret which is computed using the domain parameters of the named
     # curve ”secp256r1”, the private key part of the ephemeral key pair generated in the previous
     # step, and the OEM provisioning certificate’s public key,
 
     # OEM provisioning certificate public key
-    _f = open(pathtooemprov, "rb")
-    oemprov = _f.read()
-    oemprov = x509.load_pem_x509_certificate(oemprov)
+    oemprov = keystore.certificate(pathtooemprov).certificate
     oemprov_public_key = oemprov.public_key()
-    session_key = dh_private_key.exchange(ec.ECDH(), oemprov_public_key)
+    session_key = dh_key.private_key.exchange(ec.ECDH(), oemprov_public_key)
 
     # Using this shared secret as input for an agreed-upon key derivation function  in order to
     # derive the 128 bit session key
@@ -387,8 +391,7 @@ def generate_dhpublickey_contractsignatureencryptedprivatekey(
     ).derive(session_key)
 
     # Contract Private key
-    _f = open(pathtocontractprivatekey, "rb")
-    contract_private_key = _f.read()
+    contract_private_key = keystore.file_bytes(pathtocontractprivatekey)
 
     # Encrypting with AES
     contractSignatureEncryptedPrivateKey = aes_encrypt(derived_key,
@@ -397,15 +400,10 @@ def generate_dhpublickey_contractsignatureencryptedprivatekey(
         contractSignatureEncryptedPrivateKey).decode('utf-8')
 
     # Setting ContractSignatureEncryptedPrivateKey and DHpublickey to their respectable values
-    dh_public_key = dh_public_key.public_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo)
-
-    dh_public_key = dh_public_key.split(b"-----")[2].strip()
-    certinstres.ContractSignatureEncryptedPrivateKey = msgdatatypes1.ContractSignatureEncryptedPrivateKeyType(
+    certinstres.ContractSignatureEncryptedPrivateKey = bindings.ContractSignatureEncryptedPrivateKeyType(
         valueOf_=contractSignatureEncryptedPrivateKey)
-    certinstres.DHpublickey = msgdatatypes1.DiffieHellmanPublickeyType(
-        valueOf_=dh_public_key.decode('utf-8'))
+    certinstres.DHpublickey = bindings.DiffieHellmanPublickeyType(
+        valueOf_=dh_key.public_key_b64.decode('utf-8'))
     return certinstres
 
 
@@ -431,7 +429,7 @@ def generate_dhpublickey_contractsignatureencryptedprivatekey(
 #         bodypart.DHpublickey.set_Id("id3")
 #         bodypart.eMAID.set_Id("id4")
 #
-#     bodyelement = msgDef1.BodyType(bodypart)
+#     bodyelement = bindings.BodyType(bodypart)
 #
 #     v2gmessage.set_Body(bodyelement)
 #     return v2gmessage
@@ -470,11 +468,12 @@ def attach_reference_identifiers(v2gmessage):
             for field, id_value in id_mapping.items():
                 setattr(getattr(bodypart, field), "Id", id_value)
 
-    bodyelement = msgDef1.BodyType(bodypart)
+    bodyelement = bindings.BodyType(bodypart)
     v2gmessage.set_Body(bodyelement)
     return v2gmessage
 
 
+@timing.timed('sign')
 def sign_authorization_req_message(v2gmessage, contract_private_key):
     """Signs AuthorizationReq message. Will be signed by EVCC with private key
     belonging to contract certificate. Complete message body will be signed
@@ -497,31 +496,25 @@ def sign_authorization_req_message(v2gmessage, contract_private_key):
     # Transform Signed Info to EXI and encrypt using oem_private_key with sha256
     signed_info = signature.SignedInfo
 
-    with open('common/EXI_Files/testresres.xml', 'w') as outfile:
-        signed_info.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testresres.xml',
-                              'common/EXI_Files/test1_xml.exi')
-
-    #_f = open("common/EXI_Files/test1_xml.exi", "rb")
-    # exi2 = _f.read()
-    with open("common/EXI_Files/test1_xml.exi", "rb") as exi_file:
-        exi2 = exi_file.read()
+    exi2 = encode_fragments([(signed_info, 'SignedInfo')])[0]
     encrypted_has_value = contract_private_key.sign(exi2, ec.ECDSA(hashes.SHA256()))
 
     # To Base64
     signaturevalue = base64.b64encode(encrypted_has_value)
 
     signature.set_SignatureValue(
-        msgheader1.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
+        bindings.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
     v2gmessage.set_Header(header)
 
     # Verifying Signature (For Testing Porpuses)
-    evcc_public_key = contract_private_key.public_key()
-    signaturevalue2 = base64.b64decode(signaturevalue)
-    evcc_public_key.verify(signaturevalue2, exi2, ec.ECDSA(hashes.SHA256()))
+    if VERIFY_OWN_SIGNATURES:
+        evcc_public_key = contract_private_key.public_key()
+        signaturevalue2 = base64.b64decode(signaturevalue)
+        evcc_public_key.verify(signaturevalue2, exi2, ec.ECDSA(hashes.SHA256()))
     return v2gmessage
 
 
+@timing.timed('sign')
 def sign_certinstallreq_message(v2gmessage, oem_prov_private_key):
     """Signs CertInstallReq,  message.
     Will be signed by EVCC with private key
@@ -549,29 +542,26 @@ def sign_certinstallreq_message(v2gmessage, oem_prov_private_key):
     # Transform Signed Info to EXI and encrypt using oem_private_key with sha256
     signed_info = signature.SignedInfo
 
-    with open('common/EXI_Files/testresres.xml', 'w') as outfile:
-        signed_info.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testresres.xml',
-                              'common/EXI_Files/test1_xml.exi')
-    _f = open("common/EXI_Files/test1_xml.exi", "rb")
-    exi2 = _f.read()
+    exi2 = encode_fragments([(signed_info, 'SignedInfo')])[0]
     encrypted_has_value = oem_prov_private_key.sign(exi2, ec.ECDSA(hashes.SHA256()))
 
     # To Base64
     signaturevalue = base64.b64encode(encrypted_has_value)
 
     signature.set_SignatureValue(
-        msgheader1.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
+        bindings.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
     v2gmessage.set_Header(header)
 
     # Verifying Signature (For Testing Porpuses)
-    evcc_public_key = oem_prov_private_key.public_key()
-    signaturevalue2 = base64.b64decode(signaturevalue)
-    evcc_public_key.verify(signaturevalue2, exi2, ec.ECDSA(hashes.SHA256()))
+    if VERIFY_OWN_SIGNATURES:
+        evcc_public_key = oem_prov_private_key.public_key()
+        signaturevalue2 = base64.b64decode(signaturevalue)
+        evcc_public_key.verify(signaturevalue2, exi2, ec.ECDSA(hashes.SHA256()))
 
     return (v2gmessage)
 
 
+@timing.timed('sign')
 def sign_metering_receipt_req_message(v2gmessage, contract_private_key):
     """Signs MeteringReceiptReq. Will be signed by EVCC with private key
     belonging to the Contract Certificate. Complete message body will be signed
@@ -594,12 +584,7 @@ def sign_metering_receipt_req_message(v2gmessage, contract_private_key):
 
     signed_info = signature.SignedInfo
 
-    with open('common/EXI_Files/testresres.xml', 'w') as outfile:
-        signed_info.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testresres.xml',
-                              'common/EXI_Files/test1_xml.exi')
-    _f = open("common/EXI_Files/test1_xml.exi", "rb")
-    exi2 = _f.read()
+    exi2 = encode_fragments([(signed_info, 'SignedInfo')])[0]
 
     encrypted_has_value = contract_private_key.sign(exi2,
                                                     ec.ECDSA(hashes.SHA256()))
@@ -607,13 +592,14 @@ def sign_metering_receipt_req_message(v2gmessage, contract_private_key):
     signaturevalue = base64.b64encode(encrypted_has_value)
 
     signature.set_SignatureValue(
-        msgheader1.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
+        bindings.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
 
     v2gmessage.set_Header(header)
 
     return v2gmessage
 
 
+@timing.timed('sign')
 def sign_cert_install_res_message(v2gmessage, cpsSubCA2_private_key_path):
     bodypart = v2gmessage.get_Body().BodyElement
     digestvalues = generate_cert_install_res_digest_values(bodypart)
@@ -624,19 +610,10 @@ def sign_cert_install_res_message(v2gmessage, cpsSubCA2_private_key_path):
     # Transform Signed Info to EXI and encrypt using oem_private_key with sha256
     signed_info = signature.SignedInfo
 
-    with open('common/EXI_Files/testresres.xml', 'w') as outfile:
-        signed_info.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testresres.xml',
-                              'common/EXI_Files/test1_xml.exi')
-    _f = open("common/EXI_Files/test1_xml.exi", "rb")
-    exi2 = _f.read()
+    exi2 = encode_fragments([(signed_info, 'SignedInfo')])[0]
 
     # Load cpsSUBCA2 private key
-    _f = open(cpsSubCA2_private_key_path, "rb")
-    cpsSubCA2_private_key = _f.read()
-
-    cpsSubCA2_private_key = load_pem_private_key(cpsSubCA2_private_key,
-                                                 b'123456')
+    cpsSubCA2_private_key = keystore.private_key(cpsSubCA2_private_key_path)
 
     encrypted_has_value = cpsSubCA2_private_key.sign(exi2,
                                                      ec.ECDSA(hashes.SHA256()))
@@ -645,121 +622,63 @@ def sign_cert_install_res_message(v2gmessage, cpsSubCA2_private_key_path):
     signaturevalue = base64.b64encode(encrypted_has_value)
 
     signature.set_SignatureValue(
-        msgheader1.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
+        bindings.SignatureValueType(valueOf_=signaturevalue.decode('utf-8')))
     v2gmessage.set_Header(header)
 
     return v2gmessage
 
 
 
-def generate_authorization_req_digest_value(v2gmessage):
-    # 1.1 Generate EXI of the element
-    bodypart = v2gmessage.get_Body().BodyElement
-    with open('common/EXI_Files/final.xml', 'w') as outfile:
-        bodypart.export(outfile=outfile, level=0, name_='AuthorizationReq')
+def encode_fragments(fragments):
+    """EXI streams of (element, tagname) fragments, exported with the element
+    names and namespaces of the schema (EXICodec.export_fragment) and encoded
+    concurrently on the codec worker pool (java_caller.encode_documents)
+    """
+    codec = get_codec()
+    return java_caller.encode_documents(
+        [codec.export_fragment(element, tagname) for element, tagname in fragments])
 
-    java_caller.xml_to_binary('common/EXI_Files/final.xml', 'common/EXI_Files/final_xml.exi')
-    _f = open("common/EXI_Files/final_xml.exi", "rb")
-    exi = _f.read()
-    _f.close()
 
-    # 1.2 Exi to SHA-256 to Base64
-    digestvalue = base64.b64encode(hashlib.sha256(exi).digest())
-    return digestvalue
+def generate_digest_values(fragments):
+    """Digest values of the referenced elements of a signature
 
+    Args:
+        fragments : List of (element, tagname) of the signed elements
 
-def generate_metering_receipt_req_digest_value(v2gmessage):
-    # 1.1 Generate EXI of the element
+    Returns:
+        List of the base64 SHA-256 digests of the EXI fragments, in input order
+    """
+    return [base64.b64encode(hashlib.sha256(exi).digest())
+            for exi in encode_fragments(fragments)]
+
+
+def generate_authorization_req_digest_value(v2gmessage):
     bodypart = v2gmessage.get_Body().BodyElement
-    with open('common/EXI_Files/final.xml', 'w') as outfile:
-        bodypart.export(outfile=outfile, level=0, name_='MeteringReceiptReq')
+    return generate_digest_values([(bodypart, 'AuthorizationReq')])[0]
 
-    java_caller.xml_to_binary('EXI_Files/final.xml', 'EXI_Files/final_xml.exi')
-    _f = open("common/EXI_Files/final_xml.exi", "rb")
-    exi = _f.read()
-    _f.close()
 
-    # 1.2 Exi to SHA-256 to Base64
-    digestvalue = base64.b64encode(hashlib.sha256(exi).digest())
-    return digestvalue
+def generate_metering_receipt_req_digest_value(v2gmessage):
+    bodypart = v2gmessage.get_Body().BodyElement
+    return generate_digest_values([(bodypart, 'MeteringReceiptReq')])[0]
 
 
 def generate_cert_install_req_digest_value(v2gmessage, tagname):
-    # 1.1 Generate EXI of the element
     bodypart = v2gmessage.get_Body().BodyElement
-    with open('common/EXI_Files/final.xml', 'w') as outfile:
-        bodypart.export(outfile=outfile, level=0, name_=tagname)
+    return generate_digest_values([(bodypart, tagname)])[0]
 
-    java_caller.xml_to_binary('common/EXI_Files/final.xml', 'common/EXI_Files/final_xml.exi')
-    _f = open("common/EXI_Files/final_xml.exi", "rb")
-    exi = _f.read()
-    _f.close()
 
-    # 1.2 Exi to SHA-256 to Base64
-    digestvalue = base64.b64encode(hashlib.sha256(exi).digest())
-
-    return digestvalue
+# Elements of the CertificateInstallationRes referenced by its signature
+CERT_INSTALL_RES_REFERENCES = ('ContractSignatureCertChain',
+                               'ContractSignatureEncryptedPrivateKey',
+                               'eMAID',
+                               'DHpublickey')
 
 
 def generate_cert_install_res_digest_values(certinstres):
-    # ID1 ContractSignatureCertChain
-    # To EXI
-    contsigchain = certinstres.ContractSignatureCertChain
-    with open('common/EXI_Files/ContractSignatureCertChain.xml', 'w') as outfile:
-        contsigchain.export(outfile=outfile,
-                            level=0,
-                            name_='ContractSignatureCertChain')
-    java_caller.xml_to_binary('common/EXI_Files/ContractSignatureCertChain.xml',
-                              'common/EXI_Files/ContractSignatureCertChain_xml.exi')
-    _f = open("common/EXI_Files/ContractSignatureCertChain_xml.exi", "rb")
-    exi = _f.read()
-    # To digest value
-    digestvalue1 = base64.b64encode(hashlib.sha256(exi).digest())
-    # ID2 ContractSignatureEncryptedPrivateKey
-    # To EXI
-    consigencpri = certinstres.ContractSignatureEncryptedPrivateKey
-    with open('common/EXI_Files/ContractSignatureEncryptedPrivateKey.xml',
-              'w') as outfile:
-        consigencpri.export(outfile=outfile,
-                            level=0,
-                            name_='ContractSignatureEncryptedPrivateKey')
-    java_caller.xml_to_binary(
-        'common/EXI_Files/ContractSignatureEncryptedPrivateKey.xml',
-        'common/EXI_Files/ContractSignatureEncryptedPrivateKey_xml.exi')
-    _f = open("common/EXI_Files/ContractSignatureEncryptedPrivateKey_xml.exi", "rb")
-    exi2 = _f.read()
-    # To digest value
-    digestvalue2 = base64.b64encode(hashlib.sha256(exi2).digest())
-
-    # ID4 eMAID
-    # To EXI
-    emaid = certinstres.eMAID
-    with open('common/EXI_Files/eMAID.xml', 'w') as outfile:
-        emaid.export(outfile=outfile, level=0, name_='eMAID')
-    java_caller.xml_to_binary('common/EXI_Files/eMAID.xml', 'common/EXI_Files/eMAID_xml.exi')
-    _f = open("common/EXI_Files/eMAID_xml.exi", "rb")
-    exi4 = _f.read()
-    # To digest value
-    digestvalue4 = base64.b64encode(hashlib.sha256(exi4).digest())
-
-    # ID3 DHpublicKey
-    # To EXI
-    DHpublickey = certinstres.DHpublickey
-    with open('common/EXI_Files/DHpublickey.xml', 'w') as outfile:
-        DHpublickey.export(outfile=outfile, level=0, name_='DHpublickey')
-    java_caller.xml_to_binary('common/EXI_Files/DHpublickey.xml',
-                              'common/EXI_Files/DHpublickey_xml.exi')
-    _f = open("common/EXI_Files/DHpublickey_xml.exi", "rb")
-    exi3 = _f.read()
-    # To digest value
-    digestvalue3 = base64.b64encode(hashlib.sha256(exi3).digest())
-
-    digestvalues = {
-        'ContractSignatureCertChain': digestvalue1,
-        'ContractSignatureEncryptedPrivateKey': digestvalue2,
-        'eMAID': digestvalue4,
-        'DHpublicKey': digestvalue3
-    }
+    digestvalues = generate_digest_values(
+        [(getattr(certinstres, name), name) for name in CERT_INSTALL_RES_REFERENCES])
+    digestvalues = dict(zip(CERT_INSTALL_RES_REFERENCES, digestvalues))
+    digestvalues['DHpublicKey'] = digestvalues.pop('DHpublickey')
     return digestvalues
 
 
@@ -778,32 +697,32 @@ def generate_CertInstallReq_AuthorizationReq_MeteringReceiptReq_SignedInfo(
     Returns:
        The Signature element containing the SignedInfo element
     """
-    canmet = msgxmlschema1.CanonicalizationMethodType()
+    canmet = bindings.CanonicalizationMethodType()
     canmet.Algorithm = "http://www.w3.org/TR/canonical-exi/"
 
-    sigmet = msgxmlschema1.SignatureMethodType(
+    sigmet = bindings.SignatureMethodType(
         Algorithm="http://www.w3.org/2001/04/xmldsig-more#ecdsa-sha256")
-    tran = msgxmlschema1.TransformType(
+    tran = bindings.TransformType(
         Algorithm="http://www.w3.org/TR/canonical-exi/")
-    dig = msgxmlschema1.DigestMethodType(
+    dig = bindings.DigestMethodType(
         Algorithm="http://www.w3.org/2001/04/xmlenc#sha256")
 
-    trans = msgxmlschema1.TransformsType()
+    trans = bindings.TransformsType()
     trans.add_Transform(tran)
-    digv = msgxmlschema1.DigestValueType("")
+    digv = bindings.DigestValueType("")
 
-    ref = msgxmlschema1.ReferenceType(Transforms=trans,
+    ref = bindings.ReferenceType(Transforms=trans,
                                       DigestMethod=dig,
                                       DigestValue=digv)
     ref.URI = "#ID1"
     ref.set_DigestValue(
-        msgxmlschema1.DigestValueType(digest_value.decode("utf-8")))
+        bindings.DigestValueType(digest_value.decode("utf-8")))
 
-    siginf = msgxmlschema1.SignedInfoType(CanonicalizationMethod=canmet,
+    siginf = bindings.SignedInfoType(CanonicalizationMethod=canmet,
                                           SignatureMethod=sigmet)
     siginf.add_Reference(ref)
 
-    signature = msgxmlschema1.SignatureType()
+    signature = bindings.SignatureType()
     signature.SignedInfo = siginf
 
     return signature
@@ -811,39 +730,39 @@ def generate_CertInstallReq_AuthorizationReq_MeteringReceiptReq_SignedInfo(
 
 def generate_cert_install_res_signed_info(digest_values):
     # Creating Signed Info
-    canmet = msgxmlschema1.CanonicalizationMethodType()
+    canmet = bindings.CanonicalizationMethodType()
     canmet.Algorithm = "http://www.w3.org/TR/canonical-exi/"
-    sigmet = msgxmlschema1.SignatureMethodType(
+    sigmet = bindings.SignatureMethodType(
         Algorithm="http://www.w3.org/2001/04/xmldsig-more#ecdsa-sha256")
-    tran = msgxmlschema1.TransformType(
+    tran = bindings.TransformType(
         Algorithm="http://www.w3.org/TR/canonical-exi/")
-    dig = msgxmlschema1.DigestMethodType(
+    dig = bindings.DigestMethodType(
         Algorithm="http://www.w3.org/2001/04/xmlenc#sha256")
-    trans = msgxmlschema1.TransformsType()
+    trans = bindings.TransformsType()
     trans.add_Transform(tran)
 
-    digv = msgxmlschema1.DigestValueType("")
+    digv = bindings.DigestValueType("")
 
-    ref2 = msgxmlschema1.ReferenceType(Transforms=trans,
+    ref2 = bindings.ReferenceType(Transforms=trans,
                                        DigestMethod=dig,
                                        DigestValue=digv)
     ref2.URI = "#id2"
 
-    ref1 = msgxmlschema1.ReferenceType(Transforms=trans,
+    ref1 = bindings.ReferenceType(Transforms=trans,
                                        DigestMethod=dig,
                                        DigestValue=digv)
     ref1.URI = "#id1"
 
-    ref4 = msgxmlschema1.ReferenceType(Transforms=trans,
+    ref4 = bindings.ReferenceType(Transforms=trans,
                                        DigestMethod=dig,
                                        DigestValue=digv)
     ref4.URI = "#id4"
 
-    ref3 = msgxmlschema1.ReferenceType(Transforms=trans,
+    ref3 = bindings.ReferenceType(Transforms=trans,
                                        DigestMethod=dig,
                                        DigestValue=digv)
     ref3.URI = "#id3"
-    siginf = msgxmlschema1.SignedInfoType(CanonicalizationMethod=canmet,
+    siginf = bindings.SignedInfoType(CanonicalizationMethod=canmet,
                                           SignatureMethod=sigmet)
     siginf.add_Reference(ref2)
     siginf.add_Reference(ref1)
@@ -856,20 +775,55 @@ def generate_cert_install_res_signed_info(digest_values):
     digestvalue3 = digest_values['DHpublicKey']
 
     siginf.Reference[1].set_DigestValue(
-        msgxmlschema1.DigestValueType(valueOf_=digestvalue1.decode('utf-8')))
+        bindings.DigestValueType(valueOf_=digestvalue1.decode('utf-8')))
     siginf.Reference[0].set_DigestValue(
-        msgxmlschema1.DigestValueType(valueOf_=digestvalue2.decode('utf-8')))
+        bindings.DigestValueType(valueOf_=digestvalue2.decode('utf-8')))
     siginf.Reference[2].set_DigestValue(
-        msgxmlschema1.DigestValueType(valueOf_=digestvalue4.decode('utf-8')))
+        bindings.DigestValueType(valueOf_=digestvalue4.decode('utf-8')))
     siginf.Reference[3].set_DigestValue(
-        msgxmlschema1.DigestValueType(valueOf_=digestvalue3.decode('utf-8')))
+        bindings.DigestValueType(valueOf_=digestvalue3.decode('utf-8')))
 
-    signature = msgxmlschema1.SignatureType()
+    signature = bindings.SignatureType()
     signature.SignedInfo = siginf
 
     return signature
 
 
+def load_certificate(certificate_b64):
+    """Parses a certificate as the messages carry it (base64 DER). Certificates
+    are parsed once and cached by the SHA-256 of their DER
+
+    Returns:
+        (x509 certificate, public key, SHA-256 fingerprint)
+    """
+    der = base64.b64decode(certificate_b64)
+    fingerprint = hashlib.sha256(der).digest()
+    entry = peer_certificates.get(fingerprint)
+    if entry is None:
+        certificate = x509.load_der_x509_certificate(der)
+        entry = (certificate, certificate.public_key(), fingerprint)
+        peer_certificates.put(fingerprint, entry)
+    return entry
+
+
+def verify_signed_info(msg, public_key, fingerprint):
+    """Verifies the signature in the header of ``msg`` over its SignedInfo.
+    (certificate, SignedInfo, signature) combinations that verified before
+    are not verified again
+
+    Raises:
+        InvalidSignature: The signature does not match
+    """
+    signature = msg.get_Header().get_Signature()
+    exi = encode_fragments([(signature.get_SignedInfo(), 'SignedInfo')])[0]
+    signaturevalue = base64.b64decode(signature.get_SignatureValue().valueOf_)
+
+    key = fingerprint + hashlib.sha256(exi).digest() + hashlib.sha256(signaturevalue).digest()
+    if verified_signatures.get(key) is None:
+        public_key.verify(signaturevalue, exi, ec.ECDSA(hashes.SHA256()))
+        verified_signatures.put(key, signaturevalue)
+
+
 def verify_certificate_installation_req(msg):
     """Verifies CertificateInstallationReq Message. CertificateInstallationReq is being signed by
     OEM prov private key corresponding to the OEM prov certificate. The Secondary actor (CPS) verifies
@@ -878,32 +832,14 @@ def verify_certificate_installation_req(msg):
     Args:
          msg: CertificateInstallationReq msg
     """
-    # Getting EXI Message
-    testexi = msg.get_Header().get_Signature().get_SignedInfo()
-    with open('common/EXI_Files/installationreq.xml', 'w') as outfile:
-        testexi.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/installationreq.xml',
-                              'common/EXI_Files/installationreq.xml.exi')
-    _f = open("common/EXI_Files/installationreq.xml.exi", "rb")
-    exi3 = _f.read()
-
-    # Getting Signature of Message
-    signaturevalue = msg.get_Header().get_Signature().get_SignatureValue(
-    ).valueOf_
-    signaturevalue = base64.b64decode(signaturevalue)
-
     # Getting Public Key
     bodypart = msg.get_Body().BodyElement.get_OEMProvisioningCert()
-    _s = bodypart.decode('utf-8')
-    _s = '-----BEGIN CERTIFICATE-----\n' + _s + '\n-----END CERTIFICATE-----\n'
-
-    certfinal = x509.load_pem_x509_certificate(_s.encode())
-    evcc_public_key = certfinal.public_key()
+    _, evcc_public_key, fingerprint = load_certificate(bodypart)
 
     # Verifying Signature
-    evcc_public_key.verify(signaturevalue, exi3, ec.ECDSA(hashes.SHA256()))
+    verify_signed_info(msg, evcc_public_key, fingerprint)
 
-    print("CertificateInstallationReq Signature Verified!")
+    logger.info("CertificateInstallationReq Signature Verified!")
 
 
 def verify_certificate_installation_res(msg):
@@ -914,35 +850,16 @@ def verify_certificate_installation_res(msg):
     Args:
          msg: CertificateInstallationRes msg
     """
-    # Getting EXI Message
-    testexi = msg.get_Header().get_Signature().get_SignedInfo()
-    with open('common/EXI_Files/installationres.xml', 'w') as outfile:
-        testexi.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/installationres.xml',
-                              'common/EXI_Files/installationres.xml.exi')
-    _f = open("common/EXI_Files/installationres.xml.exi", "rb")
-    exi3 = _f.read()
-
-    # Getting Signature of Message
-    signaturevalue = msg.get_Header().get_Signature().get_SignatureValue(
-    ).valueOf_
-    signaturevalue = base64.b64decode(signaturevalue)
-
     # Getting Public Key
     bodypart = msg.get_Body(
     ).BodyElement.SAProvisioningCertificateChain.get_SubCertificates(
     ).Certificate[1]
-    _s = bodypart.decode('utf-8')
-    _s = '-----BEGIN CERTIFICATE-----\n' + _s + '\n-----END CERTIFICATE-----\n'
-
-    certfinal = x509.load_pem_x509_certificate(_s.encode())
-    cpssubca2_public_key = certfinal.public_key()
+    _, cpssubca2_public_key, fingerprint = load_certificate(bodypart)
 
     # Verifying Signature
-    cpssubca2_public_key.verify(signaturevalue, exi3,
-                                ec.ECDSA(hashes.SHA256()))
+    verify_signed_info(msg, cpssubca2_public_key, fingerprint)
 
-    print("CertificateInstallationReq Signature Verified!")
+    logger.info("CertificateInstallationReq Signature Verified!")
 
 
 def verify_metering_receipt_req(msg, contract_cert):
@@ -953,26 +870,10 @@ def verify_metering_receipt_req(msg, contract_cert):
     Args:
          msg: MeteringReceiptReq msg
     """
-    # Getting EXI Message
-    testexi = msg.get_Header().get_Signature().get_SignedInfo()
-    with open('common/EXI_Files/testpaps.xml', 'w') as outfile:
-        testexi.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testpaps.xml',
-                              'common/EXI_Files/testpaps_xml.exi')
-    _f = open("common/EXI_Files/testpaps_xml.exi", "rb")
-    exi3 = _f.read()
-
-    # Getting Signature of Message
-    signaturevalue = msg.get_Header().get_Signature().get_SignatureValue(
-    ).valueOf_
-    signaturevalue = base64.b64decode(signaturevalue)
-
-    contract_public_key = contract_cert.public_key()
+    verify_signed_info(msg, contract_cert.public_key(),
+                       contract_cert.fingerprint(hashes.SHA256()))
 
-    # Verifying Signature
-    contract_public_key.verify(signaturevalue, exi3, ec.ECDSA(hashes.SHA256()))
-
-    print("verify_metering_receipt_req Signature Verified!")
+    logger.info("verify_metering_receipt_req Signature Verified!")
     return True
 
 
@@ -984,25 +885,10 @@ def verify_authorization_req(msg, contract_cert):
         msg : AuthorizationReq message
         contract_cert : Contract certificate
     """
-    # Getting EXI Message
-    testexi = msg.get_Header().get_Signature().get_SignedInfo()
-    with open('common/EXI_Files/testpaps.xml', 'w') as outfile:
-        testexi.export(outfile=outfile, level=0, name_='SignedInfo')
-    java_caller.xml_to_binary('common/EXI_Files/testpaps.xml',
-                              'common/EXI_Files/testpaps_xml.exi')
-    _f = open("common/EXI_Files/testpaps_xml.exi", "rb")
-    exi3 = _f.read()
-
-    # Getting Signature of Message
-    signaturevalue = msg.get_Header().get_Signature().get_SignatureValue(
-    ).valueOf_
-    signaturevalue = base64.b64decode(signaturevalue)
-
-    contract_public_key = contract_cert.public_key()
-    # Verifying Signature
-    contract_public_key.verify(signaturevalue, exi3, ec.ECDSA(hashes.SHA256()))
+    verify_signed_info(msg, contract_cert.public_key(),
+                       contract_cert.fingerprint(hashes.SHA256()))
 
-    print("AuthorizationReq Signature Verified!")
+    logger.info("AuthorizationReq Signature Verified!")
 
 
 def load_pem_certificate(_s):
@@ -1014,13 +900,7 @@ def load_pem_certificate(_s):
     Returns:
         PEM public key object
     """
-
-    _s = _s.decode('utf-8')
-    _s = '-----BEGIN CERTIFICATE-----\n' + str(
-        _s) + '\n-----END CERTIFICATE-----\n'
-
-    certfinal = x509.load_pem_x509_certificate(_s.encode())
-    return certfinal
+    return load_certificate(_s)[0]
 
 
 def load_pem_public_key_formatted(_s):
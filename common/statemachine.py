@@ -0,0 +1,110 @@
+"""Table driven state machine for the EVCC and SECC sessions.
+
+The states and transitions are compiled once into a StateTable: states and
+triggers are numbered and every trigger owns a row holding the index of the
+destination for each source state (-1 if the trigger is not allowed there).
+The table is immutable and shared by all sessions, a session only holds a
+cursor with the index of its current state:
+
+    table = StateTable(states, transitions, initial='Initial', name='EVCC_State')
+    sm = table.cursor()
+    sm.send_supportedAppProtocolReq()     # one tuple lookup, no allocation
+    sm.state                              # 'WaitForsupportedAppProtocolRes'
+
+The definitions use the format of the transitions package: [trigger, source,
+dest] where source may be a list or '*' (every state) and dest may be '='
+(stay in the source state). The first transition of a (trigger, source) pair
+wins and states only referenced by transitions are added to the table.
+"""
+
+
+class TransitionError(Exception):
+    """Trigger not allowed in the current state"""
+
+
+class StateCursor():
+    """Current state of one session. The trigger methods are added by the
+    StateTable to a subclass per table
+    """
+    __slots__ = ('index',)
+    table = None
+
+    def __init__(self, index):
+        self.index = index
+
+    @property
+    def state(self):
+        return self.table.states[self.index]
+
+    def trigger(self, name):
+        """Fires the trigger ``name``"""
+        return getattr(self, name)()
+
+    def __repr__(self):
+        return '<%s %s>' % (type(self).__name__, self.state)
+
+
+def _trigger_method(trigger, row):
+    def fire(self):
+        dest = row[self.index]
+        if dest < 0:
+            raise TransitionError("Can't trigger event %s from state %s!" % (trigger, self.state))
+        self.index = dest
+        return True
+    fire.__name__ = trigger
+    return fire
+
+
+class StateTable():
+    """Immutable transition table, ``states`` and ``triggers`` are the names
+    by index and ``rows[trigger][source]`` the index of the destination
+    """
+    def __init__(self, states, transitions, initial, name='StateCursor'):
+        names = list(dict.fromkeys(states))
+        for _, sources, dest in transitions:
+            for state in (sources if isinstance(sources, list) else [sources]) + [dest]:
+                if state not in ('*', '=') and state not in names:
+                    names.append(state)
+        self.states = tuple(names)
+        self.index = {state: index for index, state in enumerate(self.states)}
+        self.triggers = tuple(dict.fromkeys(transition[0] for transition in transitions))
+
+        rows = {trigger: [-1] * len(self.states) for trigger in self.triggers}
+        for trigger, sources, dest in transitions:
+            if sources == '*':
+                sources = self.states
+            elif not isinstance(sources, list):
+                sources = [sources]
+            row = rows[trigger]
+            for source in sources:
+                source = self.index[source]
+                if row[source] < 0:
+                    row[source] = source if dest == '=' else self.index[dest]
+        self.rows = tuple(tuple(rows[trigger]) for trigger in self.triggers)
+        self.initial = self.index[initial]
+
+        attributes = {'__slots__': (), 'table': self}
+        for trigger, row in zip(self.triggers, self.rows):
+            if hasattr(StateCursor, trigger):
+                raise ValueError('Trigger %s shadows a cursor attribute' % trigger)
+            attributes[trigger] = _trigger_method(trigger, row)
+        self.cursor_class = type(name, (StateCursor,), attributes)
+
+    def cursor(self, state=None):
+        """New cursor in ``state``, by default in the initial state"""
+        return self.cursor_class(self.initial if state is None else self.index[state])
+
+    def edges(self):
+        """All transitions as sorted (trigger, source, dest) names"""
+        return sorted((trigger, self.states[source], self.states[dest])
+                      for trigger, row in zip(self.triggers, self.rows)
+                      for source, dest in enumerate(row) if dest >= 0)
+
+    def to_dot(self):
+        """State diagram in Graphviz dot format"""
+        lines = ['digraph %s {' % self.cursor_class.__name__,
+                 '    "%s" [shape=doublecircle];' % self.states[self.initial]]
+        lines += ['    "%s" -> "%s" [label="%s"];' % (source, dest, trigger)
+                  for trigger, source, dest in self.edges()]
+        lines.append('}')
+        return '\n'.join(lines)
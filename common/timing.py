@@ -0,0 +1,313 @@
+"""Per message timing of the EVCC and SECC against the ISO 15118-2 timing
+budgets.
+
+Every V2GTP message processed by MessageHandler.process_message_and_react is
+split into phases:
+
+- receive: complete frame at the transport until processing starts
+  (measured by the asyncio transport, 0 on the blocking sockets)
+- decode: EXI -> binding objects
+- handle: state machine, controllers and building the reply
+- encode: binding objects or templates -> EXI with the V2GTP header
+- sign: the securityutils sign_* functions (digests and ECDSA)
+- send: writing the reply to the socket
+
+The sum is compared with the budget of the message: the SECC has
+V2G_SECC_Msg_Performance_Time to answer a request, the EVCC has the
+V2G_SECC_Sequence_Timeout of the SECC to send its next request. Messages
+above BUDGET_FRACTION of their budget are logged and counted. The counters
+are read in process or, with METRICS_PORT, in the Prometheus text format:
+
+    from common import timing
+    timing.metrics.snapshot()['messages']['CurrentDemandReq']['max_seconds']
+    timing.serve_metrics(9115)            # http://127.0.0.1:9115/metrics
+"""
+import bisect
+import collections
+import functools
+import http.server
+import logging
+import threading
+import time
+
+from common import log
+
+logger = logging.getLogger(__name__)
+
+# Instrument the message handlers. The phases cost about a microsecond each
+TIMING = True
+# Share of the ISO budget above which a message is flagged
+BUDGET_FRACTION = 0.5
+# Port of the Prometheus text endpoint, None disables it. The endpoint only
+# listens on METRICS_ADDRESS
+METRICS_PORT = None
+METRICS_ADDRESS = '127.0.0.1'
+# Flagged messages kept for snapshot()
+RECENT_OVER_BUDGET = 100
+
+PHASES = ('receive', 'decode', 'handle', 'encode', 'sign', 'send')
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# ISO 15118-2 timing parameters in seconds
+V2G_SECC_SEQUENCE_TIMEOUT = 60
+V2G_EVCC_COMMUNICATION_SETUP_TIMEOUT = 20
+SDP_RESPONSE_TIMEOUT = 0.25
+V2G_SECC_MSG_PERFORMANCE_TIME = 1.5
+# Responses with their own V2G_SECC_Msg_Performance_Time
+SECC_MSG_PERFORMANCE_TIMES = {
+    'CertificateInstallationRes': 4.5,
+    'CertificateUpdateRes': 4.5,
+    'CurrentDemandRes': 0.025,
+}
+
+Budget = collections.namedtuple('Budget', ['name', 'seconds'])
+MessageTiming = collections.namedtuple(
+    'MessageTiming', ['message', 'phases', 'seconds', 'budget', 'share'])
+
+
+def budget(message):
+    """Budget of processing a received message until the reply is sent"""
+    if message == 'SECCDiscoveryReq':
+        return Budget('SDP_Response_Timeout', SDP_RESPONSE_TIMEOUT)
+    if message == 'SECCDiscoveryRes':
+        return Budget('V2G_EVCC_CommunicationSetup_Timeout',
+                      V2G_EVCC_COMMUNICATION_SETUP_TIMEOUT)
+    if message.endswith('Req'):
+        response = message[:-3] + 'Res'
+        return Budget('V2G_SECC_Msg_Performance_Time(%s)' % response,
+                      SECC_MSG_PERFORMANCE_TIMES.get(response, V2G_SECC_MSG_PERFORMANCE_TIME))
+    return Budget('V2G_SECC_Sequence_Timeout', V2G_SECC_SEQUENCE_TIMEOUT)
+
+
+class MessageStats():
+    """Counters of one message type"""
+    __slots__ = ('budget', 'count', 'over_budget', 'seconds', 'max_seconds', 'phases', 'buckets')
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.count = 0
+        self.over_budget = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+
+class TimingMetrics():
+    """Thread safe counters of the processed messages and the timeouts"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.messages = {}
+        self.timeouts = collections.Counter()
+        self.recent = collections.deque(maxlen=RECENT_OVER_BUDGET)
+
+    def observe(self, message, phases):
+        """Adds a processed message, returns its share of the budget"""
+        seconds = sum(phases.values())
+        with self.lock:
+            stats = self.messages.get(message)
+            if stats is None:
+                stats = self.messages[message] = MessageStats(budget(message))
+            stats.count += 1
+            stats.seconds += seconds
+            if seconds > stats.max_seconds:
+                stats.max_seconds = seconds
+            totals = stats.phases
+            for phase in PHASES:
+                totals[phase] += phases[phase]
+            stats.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+            share = seconds / stats.budget.seconds
+            if share > BUDGET_FRACTION:
+                stats.over_budget += 1
+                self.recent.append(MessageTiming(message, phases, seconds, stats.budget, share))
+        if share > BUDGET_FRACTION:
+            logger.warning("%s took %.1f ms, %.0f%% of %s (%.0f ms)", message, 1e3 * seconds,
+                           100 * share, stats.budget.name, 1e3 * stats.budget.seconds,
+                           extra=log.RED)
+        return share
+
+    def count_timeout(self, name):
+        """Counts an expired ISO timeout, e.g. V2G_SECC_Sequence_Timeout"""
+        with self.lock:
+            self.timeouts[name] += 1
+
+    def reset(self):
+        with self.lock:
+            self.messages.clear()
+            self.timeouts.clear()
+            self.recent.clear()
+
+    def snapshot(self):
+        """Counters as a dict: messages (per type), timeouts and the recent
+        messages over budget
+        """
+        with self.lock:
+            return {
+                'messages': {message: {
+                    'count': stats.count,
+                    'over_budget': stats.over_budget,
+                    'seconds': stats.seconds,
+                    'max_seconds': stats.max_seconds,
+                    'phases': dict(stats.phases),
+                    'budget_seconds': stats.budget.seconds,
+                } for message, stats in self.messages.items()},
+                'timeouts': dict(self.timeouts),
+                'recent_over_budget': [timing._asdict() for timing in self.recent],
+            }
+
+    def prometheus(self):
+        """Counters in the Prometheus text exposition format"""
+        lines = ['# HELP v2g_message_seconds Processing time of received V2G messages',
+                 '# TYPE v2g_message_seconds histogram']
+        with self.lock:
+            messages = sorted(self.messages.items())
+            for message, stats in messages:
+                cumulative = 0
+                for bound, count in zip(BUCKETS + ('+Inf',), stats.buckets):
+                    cumulative += count
+                    lines.append('v2g_message_seconds_bucket{message="%s",le="%s"} %d'
+                                 % (message, bound, cumulative))
+                lines.append('v2g_message_seconds_sum{message="%s"} %.9f'
+                             % (message, stats.seconds))
+                lines.append('v2g_message_seconds_count{message="%s"} %d'
+                             % (message, stats.count))
+            lines += ['# HELP v2g_message_phase_seconds_total Time per processing phase',
+                      '# TYPE v2g_message_phase_seconds_total counter']
+            lines += ['v2g_message_phase_seconds_total{message="%s",phase="%s"} %.9f'
+                      % (message, phase, stats.phases[phase])
+                      for message, stats in messages for phase in PHASES]
+            lines += ['# HELP v2g_message_budget_seconds ISO 15118-2 budget of the message',
+                      '# TYPE v2g_message_budget_seconds gauge']
+            lines += ['v2g_message_budget_seconds{message="%s"} %g'
+                      % (message, stats.budget.seconds) for message, stats in messages]
+            lines += ['# HELP v2g_message_over_budget_total Messages above BUDGET_FRACTION '
+                      'of the budget',
+                      '# TYPE v2g_message_over_budget_total counter']
+            lines += ['v2g_message_over_budget_total{message="%s"} %d'
+                      % (message, stats.over_budget) for message, stats in messages]
+            lines += ['# HELP v2g_timeouts_total Expired ISO 15118-2 timeouts',
+                      '# TYPE v2g_timeouts_total counter']
+            lines += ['v2g_timeouts_total{timeout="%s"} %d' % item
+                      for item in sorted(self.timeouts.items())]
+        return '\n'.join(lines) + '\n'
+
+
+metrics = TimingMetrics()
+
+_local = threading.local()
+
+
+class _Phase():
+    __slots__ = ('phases', 'name', 'start')
+
+    def __init__(self, phases, name):
+        self.phases = phases
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.phases[self.name] += time.perf_counter() - self.start
+
+
+class _NoPhase():
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name):
+    """Context manager that adds its duration to ``name`` of the message
+    being processed on this thread
+    """
+    record = getattr(_local, 'record', None)
+    if record is None:
+        return _NO_PHASE
+    return _Phase(record[1], name)
+
+
+def timed(name):
+    """Decorator that times every call as phase ``name``"""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with phase(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def name_message(message):
+    """Sets the type of the message being processed on this thread"""
+    record = getattr(_local, 'record', None)
+    if record is not None:
+        record[0] = message
+
+
+def timed_process(process):
+    """Decorator of process_message_and_react: records the phases of the
+    message and reports them to ``metrics``. A ``received_at`` keyword
+    argument (time.perf_counter() of the complete frame) gives the receive
+    phase
+    """
+    @functools.wraps(process)
+    def process_message_and_react(*args, **kwargs):
+        if not TIMING:
+            return process(*args, **kwargs)
+        start = time.perf_counter()
+        received_at = kwargs.get('received_at')
+        phases = dict.fromkeys(PHASES, 0.0)
+        if received_at is not None:
+            phases['receive'] = start - received_at
+        record = [None, phases]
+        outer = getattr(_local, 'record', None)
+        _local.record = record
+        try:
+            return process(*args, **kwargs)
+        finally:
+            _local.record = outer
+            nested = sum(phases.values()) - phases['receive']
+            phases['handle'] = max(0.0, time.perf_counter() - start - nested)
+            if record[0] is not None:
+                metrics.observe(record[0], phases)
+    return process_message_and_react
+
+
+class MetricsRequestHandler(http.server.BaseHTTPRequestHandler):
+    """GET /metrics returns metrics.prometheus()"""
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = metrics.prometheus().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        logger.debug("%s " + format, self.address_string(), *args)
+
+
+def serve_metrics(port=None, address=None):
+    """Starts the Prometheus endpoint on a daemon thread and returns the
+    server, None if no port is configured
+    """
+    port = METRICS_PORT if port is None else port
+    if port is None:
+        return None
+    server = http.server.ThreadingHTTPServer((address or METRICS_ADDRESS, port),
+                                             MetricsRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='timing-metrics', daemon=True).start()
+    logger.info("Timing metrics on http://%s:%d/metrics", *server.server_address[:2])
+    return server
@@ -8,7 +8,7 @@ the controller. The EVCC object is capable of:
 4)Change States
 """
 # pylint: disable=import-error
-import cProfile
+import logging
 import re
 
 import socket
@@ -16,7 +16,8 @@ import socket
 from evcc import evcc_states
 from evcc.evcontroller import EVSimController
 from evcc import evcc_config
-from common.XML import msgdatatypes1
+from common import bindings
+from common import log
 from common.exi_utils import exi_utils
 from common.network import network
 
@@ -26,6 +27,8 @@ from evcc.evcc_handler import EVCCMessageHandler
 
 import os, time
 
+logger = logging.getLogger(__name__)
+
 
 
 
@@ -35,20 +38,28 @@ class EVCC():
     """Class Repressenting SECC. Stores important attributes that simulate SECC behaviour
     and enables the functionality to receive, process and send messages
     """
-    def __init__(self):
+    def __init__(self, tls=None, charging_mode=None, charging=None, payment_option=None,
+                 controller=None):
+        """The arguments default to evcc_config (TLS, CHARGING_MODE, CHARGING,
+        SELECTEDPAYMENTOPTION), several EVCCs in one process may differ.
+        ``controller`` replaces the EVSimController, e.g. a vehicle of an
+        evcc.fleetcontroller.EVFleetController
+        """
         self.port = 15118
-        self.tls = evcc_config.TLS
+        self.tls = evcc_config.TLS if tls is None else tls
         self.tcp = evcc_config.TCP
-        self.charging = evcc_config.CHARGING
+        self.charging = evcc_config.CHARGING if charging is None else charging
         self.contract_cert = None
         self.contract_private_key = None
 
         self.oem_prov_cert = evcc_config.OEMPATH
         self.oem_prov_key = evcc_config.OEMPROV_PRIV_KEY
-        self.payment_option = evcc_config.SELECTEDPAYMENTOPTION
+        self.payment_option = (evcc_config.SELECTEDPAYMENTOPTION if payment_option is None
+                               else payment_option)
         # Represents the battery status. Percentage value. Will be used for the CurrentDemandReq/Res
         # Charging Loop
-        self.controller = EVSimController(evcc_config.CHARGING_MODE)
+        self.controller = controller or EVSimController(
+            evcc_config.CHARGING_MODE if charging_mode is None else charging_mode)
 
         self.genchallenge = None
 
@@ -59,6 +70,8 @@ class EVCC():
 
         # TCP socket. Will be Initiated after SECCDiscoveryRes
         self.tcpsock = None
+        # V2GTP framing reader of tcpsock
+        self.reader = None
 
         # State Machine for EVCC
         res = evcc_states.create_evcc_state_machine()
@@ -71,7 +84,7 @@ class EVCC():
     def display_state(self):
         """Displays the current state of the EVCC
         """
-        print("New State: ", self.statemachine.state)
+        logger.info("New State: %s", self.statemachine.state)
 
 
 
@@ -83,7 +96,7 @@ class EVCC():
 
             # Check For UDP Messages IF State is Initial
             if self.statemachine.state == "Initial":
-                print("Waiting For SECCDiscoveryRes UDP Message...")
+                logger.info("Waiting For SECCDiscoveryRes UDP Message...")
                 seccdiscoveryres_message, address = self.udpclient.recvfrom(
                     1024)
                 #self.message_handler.process_message_and_react(seccdiscoveryres_message, address)
@@ -91,15 +104,20 @@ class EVCC():
 
             # Check For TCP Messages on other States (Will happen after SECCDisoveryReq/Res)
             elif self.tcpsock:
+                if self.reader is None or self.reader.sock is not self.tcpsock:
+                    self.reader = network.V2GTPReader(self.tcpsock)
                 try:
-                    data = network.recvall(self.tcpsock)
-                except socket.error:
-                    print("Socket is closed")
+                    data = self.reader.read_message()
+                except (socket.error, network.V2GTPError):
+                    logger.info("Socket is closed")
+                    break
+                if data is None:
+                    logger.info("Socket is closed")
                     break
                 self.message_handler.process_message_and_react(data, True)
                 #self.message_handler.process_message_and_react(data)
             else:
-                exi_utils.print_colored_red("Client closed")
+                logger.info("Client closed", extra=log.RED)
 
 
 
@@ -162,25 +180,32 @@ class EVCC():
             print(v2gmsg)
             input("Press Enter to continue...")
         self.udpclient.sendto(v2gmsg, ("<broadcast>", 15118))
-        print("Message sent!")
+        logger.info("Message sent!")
 
 
     def establish_evcc_tcp_connection(self, ipadress, port):
 
-        exi_utils.print_colored_red("Starting TCP")
+        logger.info("Starting TCP", extra=log.RED)
         self.tcpsock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         if (self.tcp and self.tls):
-            context = network.create_evcc_ssl_context(evcc_config.V2GROOTPATH)
-            self.tcpsock = context.wrap_socket(self.tcpsock, server_side=False)
+            context = network.get_evcc_ssl_context(evcc_config.V2GROOTPATH,
+                                                   evcc_config.VERIFY_SECC_CERTIFICATE)
             self.tcpsock.connect((ipadress, port))
-            exi_utils.print_colored_red("SSL established. Peer: {}".format(
-                self.tcpsock.getpeercert()))
+            # Offers the session of the last connection to this SECC for resumption
+            start = time.perf_counter()
+            self.tcpsock = context.wrap_socket(
+                self.tcpsock, server_side=False,
+                session=network.evcc_tls_sessions.get((ipadress, port)))
+            network.handshake_metrics.record(time.perf_counter() - start,
+                                             self.tcpsock.session_reused)
+            network.evcc_tls_sessions[(ipadress, port)] = self.tcpsock.session
+            logger.info("SSL established. Peer: %s", self.tcpsock.getpeercert(), extra=log.RED)
 
     def parse_ev_status(self):
         '''Parses the values of the EVStatus Controller to XML format'''
         evstatus = self.controller.get_ev_status()
         if self.controller.is_DC_mode:
-            return msgdatatypes1.DC_EVStatusType(
+            return bindings.DC_EVStatusType(
                 EVReady=evstatus["EVReady"],
                 EVErrorCode=evstatus["EVErrorCode"],
                 EVRESSSOC=self.controller.evressoc)
@@ -188,6 +213,7 @@ class EVCC():
 
 
 if __name__ == '__main__':
+    log.configure()
     ev = EVCC()
     # t1 = time.time()
     ev.check_state_and_react()
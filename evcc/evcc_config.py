@@ -4,9 +4,20 @@ import os
 
 TLS = True
 TCP = True
+# Verify the SECC certificate chain against the V2G root in the TLS handshake.
+# Only switched off for loopback tests with an expired test PKI
+VERIFY_SECC_CERTIFICATE = True
 HOST = "127.0.0.1"
 PORT = 8080
+# Timeouts in seconds used by the asyncio transport (ISO 15118-2, Table 109):
+# V2G_EVCC_Communication_Setup_Timeout for the SDP answer and
+# V2G_EVCC_Msg_Timeout for every response
+SDP_TIMEOUT = 20
+MSG_TIMEOUT = 2
 SLOW_MODE = False
+# Ask on the console for another ServiceDetailReq after each ServiceDetailRes.
+# Headless runs (benchmarks) go on with the PaymentServiceSelectionReq
+ASK_SERVICE_DETAILS = True
 slow_mode_custom = {
     "supportedAppProtocolReq": False,
     "SessionSetupReq": False,
@@ -1,15 +1,23 @@
-from common.XML import appprotocol1, msgbody1, msgdatatypes1, msgDef1
+import logging
+
+from common import bindings
+from common import timing
 from evcc import evcc_config
 from common.exi_utils import exi_utils
 from common.security import securityutils
+from common.security.keystore import keystore
 from common.network import network
-from cryptography import x509
+from common.exi.template import TemplateCache
+
+logger = logging.getLogger(__name__)
 
 
 class EVCCMessageSender:
     def __init__(self, evcc):
         self.evcc = evcc
         self.sessionid = None
+        self.current_demand_req_template = TemplateCache(
+            self.create_current_demand_req, exi_utils.v2g_to_EXI)
 
     def send_supported_app_protocol_req(self):
         """Send supportedAppProtocolReq Message. EVCC transmits the list of its supported
@@ -20,13 +28,13 @@ class EVCCMessageSender:
         -SchemaID:  Schema ID assigned to givem ProtocolNamespace
         -Priority: A number indicating the priority of the given ProtocolNamespace. Low number means high Priority
         """
-        print("3: Preparing supportedAppProtocolReq")
+        logger.debug("3: Preparing supportedAppProtocolReq")
 
-        supapppr = appprotocol1.supportedAppProtocolReq()
+        supapppr = bindings.appprotocol1.supportedAppProtocolReq()
 
         appprotocols = evcc_config.appprotocols
         for protocol in appprotocols:
-            apppr = appprotocol1.AppProtocolType(
+            apppr = bindings.appprotocol1.AppProtocolType(
                 ProtocolNamespace=protocol[0],
                 VersionNumberMinor=protocol[1],
                 VersionNumberMajor=protocol[2],
@@ -37,17 +45,19 @@ class EVCCMessageSender:
         supapppr.original_tagname_ = "supportedAppProtocolReq"
 
         # Transform to EXI
-        supp_app_protocol_req_msg = exi_utils.v2g_to_EXI(supapppr)
-        v2gmsg = exi_utils.add_Header_v2gEXI(supp_app_protocol_req_msg,
-                                             'appprotreq')
+        with timing.phase('encode'):
+            supp_app_protocol_req_msg = exi_utils.v2g_to_EXI(supapppr)
+            v2gmsg = exi_utils.add_Header_v2gEXI(supp_app_protocol_req_msg,
+                                                 'appprotreq')
 
         exi_utils.display_before_send(supapppr, v2gmsg)
 
-        print("3: supportedAppProtocolReq sent")
+        logger.info("3: supportedAppProtocolReq sent")
 
-        self.evcc.tcpsock.sendall(v2gmsg)
+        with timing.phase('send'):
+            self.evcc.tcpsock.sendall(v2gmsg)
 
-        print("New State: ", self.evcc.statemachine.state)
+        logger.info("New State: %s", self.evcc.statemachine.state)
 
     def send_session_setup_req(self, message):
         """Send SessionSetupReq Message. Sends the request to initiate a charging session. SessionID in Header
@@ -57,18 +67,18 @@ class EVCCMessageSender:
             EVCCD: MAC address of the EVCC, given as six hexBinary encodedbytes
         """
         # Preparing SessionSetupReq
-        print("5:Preparing SessionSetupReq ")
-        header = msgDef1.MessageHeaderType(SessionID=bytes(8))
+        logger.debug("5:Preparing SessionSetupReq")
+        header = bindings.MessageHeaderType(SessionID=bytes(8))
         mac = network.get_mac_in_hex()
 
-        sesssetreq = msgbody1.SessionSetupReqType(EVCCID=mac)
+        sesssetreq = bindings.SessionSetupReqType(EVCCID=mac)
         sesssetreq.original_tagname_ = 'SessionSetupReq'
 
         ses_sest_req_msg = self.create_v2g_message(session_id=self.sessionid,
                                                    body_element=sesssetreq)
         self.send_v2g_message(ses_sest_req_msg)
 
-        print("5:SessionSetupReq sent")
+        logger.info("5:SessionSetupReq sent")
 
     def send_service_discovery_req(self, message):
         """By sending the ServiceDiscoveryReq message the EVCC triggers the SECC to send information about all
@@ -82,18 +92,18 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("7: Preparing ServiceDiscoveryReq")
+        logger.debug("7: Preparing ServiceDiscoveryReq")
 
-        sessiondiscreq = msgbody1.ServiceDiscoveryReqType()
+        sessiondiscreq = bindings.ServiceDiscoveryReqType()
         sessiondiscreq.original_tagname_ = "ServiceDiscoveryReq"
 
-        self.session_id = message.get_Header().get_SessionID()
+        self.sessionid = message.get_Header().get_SessionID()
 
         ses_ser_dis_req = self.create_v2g_message(session_id=self.sessionid,
                                                   body_element=sessiondiscreq)
         self.send_v2g_message(ses_ser_dis_req)
 
-        print("7: ServiceDiscoveryReq Sent")
+        logger.info("7: ServiceDiscoveryReq Sent")
 
     def send_service_detail_req(self, message, serviceid):
         """By sending the ServiceDetailReq message the EVCC requests the SECC to send specific additional
@@ -105,16 +115,16 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("9: Preparing ServiceDetailReq")
+        logger.debug("9: Preparing ServiceDetailReq")
 
-        servdetreq = msgbody1.ServiceDetailReqType(ServiceID=serviceid)
+        servdetreq = bindings.ServiceDetailReqType(ServiceID=serviceid)
         servdetreq.original_tagname_ = "ServiceDetailReq"
 
         ser_det_req = self.create_v2g_message(session_id=self.sessionid,
                                               body_element=servdetreq)
         self.send_v2g_message(ser_det_req)
 
-        print("9: ServiceDetailReq Sent")
+        logger.info("9: ServiceDetailReq Sent")
 
     def send_payment_service_selection_req(self, message):
         """With this message the SECC informs the EVCC whether the selected services and payment option were accepted.
@@ -126,17 +136,17 @@ class EVCCMessageSender:
         Args:
             message: The Last V2G Message
         """
-        print("11: Preparing PaymentServiceSelectionReq")
+        logger.debug("11: Preparing PaymentServiceSelectionReq")
 
-        selservlis = msgbody1.SelectedServiceListType()
-        selservice1 = msgdatatypes1.SelectedServiceType(ServiceID=1)
-        selservice2 = msgdatatypes1.SelectedServiceType(ServiceID=2,
+        selservlis = bindings.SelectedServiceListType()
+        selservice1 = bindings.SelectedServiceType(ServiceID=1)
+        selservice2 = bindings.SelectedServiceType(ServiceID=2,
                                                         ParameterSetID=1)
         selservlis.add_SelectedService(selservice1)
         selservlis.add_SelectedService(selservice2)
 
-        payserselreq = msgbody1.PaymentServiceSelectionReqType(
-            SelectedPaymentOption=evcc_config.SELECTEDPAYMENTOPTION,
+        payserselreq = bindings.PaymentServiceSelectionReqType(
+            SelectedPaymentOption=self.evcc.payment_option,
             SelectedServiceList=selservlis)
 
         payserselreq.original_tagname_ = "PaymentServiceSelectionReq"
@@ -145,7 +155,7 @@ class EVCCMessageSender:
         pay_ser_sel_req = self.create_v2g_message(session_id=self.sessionid,
                                                   body_element=payserselreq)
         self.send_v2g_message(pay_ser_sel_req)
-        print("11: PaymentServiceSelectionReq Sent")
+        logger.info("11: PaymentServiceSelectionReq Sent")
 
     def send_certificate_installation_req(self, message):
         """With this message the EVCC sends the request to install the contract certificate
@@ -156,20 +166,18 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("13: Preparing CertificateInstallationReq")
-        _f = open(self.evcc.oem_prov_cert, "rb")
+        logger.debug("13: Preparing CertificateInstallationReq")
+        oem_prov_cert = keystore.certificate(self.evcc.oem_prov_cert)
+        cert1 = oem_prov_cert.certificate
+        cert = oem_prov_cert.certificate_b64
 
-        cert = _f.read()
-        cert1 = x509.load_pem_x509_certificate(cert)
-        cert = cert.split(b"-----")[2].strip()
-
-        certinstreq = msgbody1.CertificateInstallationReqType()
+        certinstreq = bindings.CertificateInstallationReqType()
 
         certinstreq.OEMProvisioningCert = cert
 
-        listofrootcerts = msgbody1.ListOfRootCertificateIDsType()
+        listofrootcerts = bindings.ListOfRootCertificateIDsType()
         listofrootcerts.add_RootCertificateID(
-            msgdatatypes1.X509IssuerSerialType(
+            bindings.X509IssuerSerialType(
                 X509IssuerName=cert1.issuer,
                 X509SerialNumber=cert1.serial_number))
 
@@ -208,19 +216,19 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("15: Preparing PaymentDetailsReq")
+        logger.debug("15: Preparing PaymentDetailsReq")
         self.evcc.contract_cert = message.get_Body(
         ).BodyElement.ContractSignatureCertChain
 
         emaid = message.get_Body().BodyElement.eMAID.valueOf_
 
-        paydetreq = msgbody1.PaymentDetailsReqType()
+        paydetreq = bindings.PaymentDetailsReqType()
         paydetreq.eMAID = emaid
 
-        contractsignaturecertchain = msgbody1.CertificateChainType()
+        contractsignaturecertchain = bindings.CertificateChainType()
         contractsignaturecertchain.Certificate = b""
 
-        contractsubcertificates = msgdatatypes1.SubCertificatesType()
+        contractsubcertificates = bindings.SubCertificatesType()
         contractsubcertificates.add_Certificate(b"")
         contractsubcertificates.add_Certificate(b"")
 
@@ -252,11 +260,11 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("17 Preparing AuthorizationReq ")
+        logger.debug("17 Preparing AuthorizationReq")
 
         # Preparing AuthorizationReq
 
-        autreq = msgbody1.AuthorizationReqType()
+        autreq = bindings.AuthorizationReqType()
 
         autreq.original_tagname_ = "AuthorizationReq"
 
@@ -302,47 +310,47 @@ class EVCCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("19: Preparing ChargeParameterDiscoveryReq")
+        logger.debug("19: Preparing ChargeParameterDiscoveryReq")
 
         ###
 
-        chargeparamreq = msgbody1.ChargeParameterDiscoveryReqType()
+        chargeparamreq = bindings.ChargeParameterDiscoveryReqType()
         chargeparamreq.original_tagname_ = "ChargeParameterDiscoveryReq"
 
-        chargeparamreq.RequestedEnergyTransferMode = evcc_config.CHARGING
+        chargeparamreq.RequestedEnergyTransferMode = self.evcc.charging
 
         # Check If DC or AC, prepare messages accordingly
-        if ("DC" in evcc_config.CHARGING):
-            dcevchargeparameter = msgdatatypes1.DC_EVChargeParameterType()
+        if ("DC" in self.evcc.charging):
+            dcevchargeparameter = bindings.DC_EVChargeParameterType()
             # Get DC_EVStatus
             dcevchargeparameter.DC_EVStatus = self.evcc.parse_ev_status()
-            dcevchargeparameter.EVMaximumCurrentLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVMaximumCurrentLimit = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='A',
                 Value=self.evcc.controller.maximum_current_limit)
-            dcevchargeparameter.EVMaximumVoltageLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVMaximumVoltageLimit = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='V',
                 Value=self.evcc.controller.maximum_voltage_limit)
-            dcevchargeparameter.EVEnergyRequest = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVEnergyRequest = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='Wh',
                 Value=self.evcc.controller.ev_energy_request)
             dcevchargeparameter.original_tagname_ = "DC_EVChargeParameter"
             chargeparamreq.EVChargeParameter = dcevchargeparameter
-        elif ("AC" in evcc_config.CHARGING):
-            acevchargeparameter = msgdatatypes1.AC_EVChargeParameterType()
-            acevchargeparameter.EAmount = msgdatatypes1.PhysicalValueType(
+        elif ("AC" in self.evcc.charging):
+            acevchargeparameter = bindings.AC_EVChargeParameterType()
+            acevchargeparameter.EAmount = bindings.PhysicalValueType(
                 Multiplier=3, Unit='Wh', Value=self.evcc.controller.eamount)
-            acevchargeparameter.EVMaxVoltage = msgdatatypes1.PhysicalValueType(
+            acevchargeparameter.EVMaxVoltage = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='V',
                 Value=self.evcc.controller.ev_max_voltage)
-            acevchargeparameter.EVMaxCurrent = msgdatatypes1.PhysicalValueType(
+            acevchargeparameter.EVMaxCurrent = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='A',
                 Value=self.evcc.controller.ev_max_current)
-            acevchargeparameter.EVMinCurrent = msgdatatypes1.PhysicalValueType(
+            acevchargeparameter.EVMinCurrent = bindings.PhysicalValueType(
                 Multiplier=0,
                 Unit='A',
                 Value=self.evcc.controller.ev_min_current)
@@ -353,7 +361,7 @@ class EVCCMessageSender:
                                                   body_element=chargeparamreq)
         self.send_v2g_message(cha_par_req_msg)
 
-        print("19: ChargeParameterDiscoveryReq Sent")
+        logger.info("19: ChargeParameterDiscoveryReq Sent")
 
     def send_cable_check_req(self, message):
         """With the CableCheckReq the EV triggers the EVSE, or actually the DC supply (the power
@@ -364,9 +372,9 @@ class EVCCMessageSender:
             -DC_EVStatus: Current status of the EV
 
         """
-        print("21: Preparing CableCheckReq")
+        logger.debug("21: Preparing CableCheckReq")
 
-        cablecheckreq = msgbody1.CableCheckReqType()
+        cablecheckreq = bindings.CableCheckReqType()
         #GET DC_EVStatus
         cablecheckreq.DC_EVStatus = self.evcc.parse_ev_status()
 
@@ -375,24 +383,24 @@ class EVCCMessageSender:
         cab_che_req_msg = self.create_v2g_message(session_id=self.sessionid,
                                                   body_element=cablecheckreq)
         self.send_v2g_message(cab_che_req_msg)
-        print("21: CableCheckReq Sent")
+        logger.info("21: CableCheckReq Sent")
 
     def send_pre_charge_req(self, message):
         """Contains both the requested DC current and voltage for the high-voltage battery."""
 
-        print("23: Preparing PreChargeReq")
+        logger.debug("23: Preparing PreChargeReq")
 
-        prechareq = msgbody1.PreChargeReqType()
+        prechareq = bindings.PreChargeReqType()
 
         prechareq.DC_EVStatus = self.evcc.parse_ev_status()
-        prechareq.EVTargetVoltage = msgdatatypes1.PhysicalValueType(
+        prechareq.EVTargetVoltage = bindings.PhysicalValueType(
             Multiplier=0,
-            Unit=msgdatatypes1.unitSymbolType.V,
+            Unit=bindings.unitSymbolType.V,
             Value=self.evcc.controller.ev_target_voltage)
 
-        prechareq.EVTargetCurrent = msgdatatypes1.PhysicalValueType(
+        prechareq.EVTargetCurrent = bindings.PhysicalValueType(
             Multiplier=0,
-            Unit=msgdatatypes1.unitSymbolType.A,
+            Unit=bindings.unitSymbolType.A,
             Value=self.evcc.controller.ev_target_current)
 
         prechareq.original_tagname_ = "PreChargeReq"
@@ -401,33 +409,33 @@ class EVCCMessageSender:
                                                   body_element=prechareq)
         self.send_v2g_message(pre_cha_req_msg)
 
-        print("23: PreChargeReq Sent")
+        logger.info("23: PreChargeReq Sent")
 
     def send_power_delivery_req(self, message, chargeprogress):
-        print("25: Preparing PowerDeliveryReq")
+        logger.debug("25: Preparing PowerDeliveryReq")
 
         ###
 
-        powdelreq = msgbody1.PowerDeliveryReqType()
+        powdelreq = bindings.PowerDeliveryReqType()
 
         powdelreq.original_tagname_ = "PowerDeliveryReq"
 
-        powdelreq.ChargeProgress = msgbody1.chargeProgressType(chargeprogress)
+        powdelreq.ChargeProgress = bindings.chargeProgressType(chargeprogress)
         powdelreq.SAScheduleTupleID = 1
 
-        charprofile = msgbody1.ChargingProfileType()
-        profentry1 = msgdatatypes1.ProfileEntryType(
+        charprofile = bindings.ChargingProfileType()
+        profentry1 = bindings.ProfileEntryType(
             ChargingProfileEntryStart=0,
-            ChargingProfileEntryMaxPower=msgdatatypes1.PhysicalValueType(
-                3, msgdatatypes1.unitSymbolType.W, 25))
-        profentry2 = msgdatatypes1.ProfileEntryType(
+            ChargingProfileEntryMaxPower=bindings.PhysicalValueType(
+                3, bindings.unitSymbolType.W, 25))
+        profentry2 = bindings.ProfileEntryType(
             ChargingProfileEntryStart=600,
-            ChargingProfileEntryMaxPower=msgdatatypes1.PhysicalValueType(
-                3, msgdatatypes1.unitSymbolType.W, 50))
-        profentry3 = msgdatatypes1.ProfileEntryType(
+            ChargingProfileEntryMaxPower=bindings.PhysicalValueType(
+                3, bindings.unitSymbolType.W, 50))
+        profentry3 = bindings.ProfileEntryType(
             ChargingProfileEntryStart=1080,
-            ChargingProfileEntryMaxPower=msgdatatypes1.PhysicalValueType(
-                0, msgdatatypes1.unitSymbolType.W, 0))
+            ChargingProfileEntryMaxPower=bindings.PhysicalValueType(
+                0, bindings.unitSymbolType.W, 0))
 
         charprofile.add_ProfileEntry(profentry1)
         charprofile.add_ProfileEntry(profentry2)
@@ -439,13 +447,13 @@ class EVCCMessageSender:
                                                   body_element=powdelreq)
         self.send_v2g_message(pow_del_req_msg)
 
-        print("25: PowerDeliveryReq Sent")
+        logger.info("25: PowerDeliveryReq Sent")
 
     def send_charging_status_req(self, message):
         
         
 
-        chastareq = msgDef1.ChargingStatusReqType()
+        chastareq = bindings.ChargingStatusReqType()
         chastareq.original_tagname_ = "ChargingStatusReq"
 
         cha_sta_req_msg = self.create_v2g_message(session_id=self.sessionid,
@@ -453,37 +461,61 @@ class EVCCMessageSender:
         self.send_v2g_message(cha_sta_req_msg)
 
     def send_current_demand_req(self, message):
-        print("27: Preparing CurrentDemandReq")
-        ###
-
-        curdemreq = msgbody1.CurrentDemandReqType()
-
-        curdemreq.DC_EVStatus = self.evcc.parse_ev_status()
-        curdemreq.EVTargetCurrent = msgdatatypes1.PhysicalValueType(
-            0, msgdatatypes1.unitSymbolType.A,
-            self.evcc.controller.ev_target_current)
-        curdemreq.EVMaximumVoltageLimit = msgdatatypes1.PhysicalValueType(
-            0, msgdatatypes1.unitSymbolType.V,
-            self.evcc.controller.maximum_voltage_limit)
-        curdemreq.EVMaximumCurrentLimit = msgdatatypes1.PhysicalValueType(
-            0, msgdatatypes1.unitSymbolType.A,
-            self.evcc.controller.maximum_current_limit)
-        curdemreq.EVMaximumPowerLimit = msgdatatypes1.PhysicalValueType(
-            3, msgdatatypes1.unitSymbolType.W,
-            self.evcc.controller.ev_maximum_power_limit)
-        curdemreq.BulkChargingComplete = bool(
-            self.evcc.controller.evressoc > 80)
-        curdemreq.ChargingComplete = bool(self.evcc.controller.evressoc >= 100)
-        curdemreq.RemainingTimeToFullSoC = msgdatatypes1.PhysicalValueType(
-            0, msgdatatypes1.unitSymbolType.S, 1080)
-        curdemreq.EVTargetVoltage = msgdatatypes1.PhysicalValueType(
-            0, msgdatatypes1.unitSymbolType.V, 400)
+        logger.debug("27: Preparing CurrentDemandReq")
+        values = self.current_demand_req_values()
+        if exi_utils.use_message_templates("CurrentDemandReq"):
+            with timing.phase('encode'):
+                exi = self.current_demand_req_template.render(values)
+            self.send_exi(exi)
+        else:
+            self.send_v2g_message(self.create_current_demand_req(values))
+        logger.info("27: CurrentDemandReq Sent")
+
+    def current_demand_req_values(self):
+        """Values of the CurrentDemandReq that change from loop to loop"""
+        controller = self.evcc.controller
+        evstatus = controller.get_ev_status()
+        return {
+            "SessionID": self.sessionid,
+            "EVReady": evstatus["EVReady"],
+            "EVErrorCode": evstatus["EVErrorCode"],
+            "EVRESSSOC": controller.evressoc,
+            "EVTargetCurrent": controller.ev_target_current,
+            "EVMaximumVoltageLimit": controller.maximum_voltage_limit,
+            "EVMaximumCurrentLimit": controller.maximum_current_limit,
+            "EVMaximumPowerLimit": controller.ev_maximum_power_limit,
+            "BulkChargingComplete": bool(controller.evressoc > 80),
+            "ChargingComplete": bool(controller.evressoc >= 100),
+        }
+
+    def create_current_demand_req(self, values):
+        """CurrentDemandReq message from current_demand_req_values(), or from
+        template Fields
+        """
+        curdemreq = bindings.CurrentDemandReqType()
+
+        curdemreq.DC_EVStatus = bindings.DC_EVStatusType(
+            EVReady=values["EVReady"],
+            EVErrorCode=values["EVErrorCode"],
+            EVRESSSOC=values["EVRESSSOC"])
+        curdemreq.EVTargetCurrent = bindings.PhysicalValueType(
+            0, bindings.unitSymbolType.A, values["EVTargetCurrent"])
+        curdemreq.EVMaximumVoltageLimit = bindings.PhysicalValueType(
+            0, bindings.unitSymbolType.V, values["EVMaximumVoltageLimit"])
+        curdemreq.EVMaximumCurrentLimit = bindings.PhysicalValueType(
+            0, bindings.unitSymbolType.A, values["EVMaximumCurrentLimit"])
+        curdemreq.EVMaximumPowerLimit = bindings.PhysicalValueType(
+            3, bindings.unitSymbolType.W, values["EVMaximumPowerLimit"])
+        curdemreq.BulkChargingComplete = values["BulkChargingComplete"]
+        curdemreq.ChargingComplete = values["ChargingComplete"]
+        curdemreq.RemainingTimeToFullSoC = bindings.PhysicalValueType(
+            0, bindings.unitSymbolType.S, 1080)
+        curdemreq.EVTargetVoltage = bindings.PhysicalValueType(
+            0, bindings.unitSymbolType.V, 400)
         curdemreq.original_tagname_ = "CurrentDemandReq"
 
-        cur_dem_req_msg = self.create_v2g_message(session_id=self.sessionid,
-                                                  body_element=curdemreq)
-        self.send_v2g_message(cur_dem_req_msg)
-        print("27: CurrentDemandReq Sent")
+        return self.create_v2g_message(session_id=values["SessionID"],
+                                       body_element=curdemreq)
 
     def send_metering_receipt_req(self, message):
         """Send the MeteringReceiptReq message. MeterInfo from PowerDeliveryRes
@@ -492,10 +524,13 @@ class EVCCMessageSender:
             message : _description_
         """
         meterinfo = message.get_Body().BodyElement.MeterInfo
+        if isinstance(meterinfo, bindings.compact.MeterInfoType):
+            meterinfo = meterinfo.to_binding()
         
-        meterrecreq = msgbody1.MeteringReceiptReqType()
+        meterrecreq = bindings.MeteringReceiptReqType()
         
 
+        meterrecreq.SessionID = self.sessionid
         meterrecreq.SAScheduleTupleID = 1
 
         meterrecreq.original_tagname_ = "MeteringReceiptReq"
@@ -515,7 +550,7 @@ class EVCCMessageSender:
     def send_welding_detection_req(self, message):
         
         
-        weldetreq = msgbody1.WeldingDetectionReqType()
+        weldetreq = bindings.WeldingDetectionReqType()
         weldetreq.DC_EVStatus = self.evcc.parse_ev_status()
         weldetreq.original_tagname_ = "WeldingDetectionReq"
 
@@ -532,8 +567,8 @@ class EVCCMessageSender:
             message: Last V2G message
         """
         
-        sessetreq = msgbody1.SessionStopReqType()
-        sessetreq.ChargingSession = msgbody1.chargingSessionType.TERMINATE
+        sessetreq = bindings.SessionStopReqType()
+        sessetreq.ChargingSession = bindings.chargingSessionType.TERMINATE
         sessetreq.original_tagname_ = "SessionStopReq"
         
         ses_set_req_msg = self.create_v2g_message(session_id=self.sessionid,
@@ -543,12 +578,19 @@ class EVCCMessageSender:
         
 
     def create_v2g_message(self, session_id, body_element):
-        header = msgDef1.MessageHeaderType(SessionID=session_id)
-        body = msgDef1.BodyType(body_element)
-        return msgDef1.V2G_Message(Header=header, Body=body)
+        header = bindings.MessageHeaderType(SessionID=session_id)
+        body = bindings.BodyType(body_element)
+        return bindings.V2G_Message(Header=header, Body=body)
 
     def send_v2g_message(self, v2g_message):
-        v2gmsg = exi_utils.v2g_to_EXI(v2g_message)
-        v2gpmsg = exi_utils.add_Header_v2gEXI(v2gmsg, "v2g")
+        with timing.phase('encode'):
+            v2gmsg = exi_utils.v2g_to_EXI(v2g_message)
+            v2gpmsg = exi_utils.add_Header_v2gEXI(v2gmsg, "v2g")
         exi_utils.display_before_send(v2g_message, v2gpmsg)
-        self.evcc.tcpsock.sendall(v2gpmsg)
\ No newline at end of file
+        with timing.phase('send'):
+            self.evcc.tcpsock.sendall(v2gpmsg)
+
+    def send_exi(self, v2gmsg):
+        """Sends a V2G message that is already EXI encoded"""
+        with timing.phase('send'):
+            self.evcc.tcpsock.sendall(exi_utils.add_Header_v2gEXI(v2gmsg, "v2g"))
\ No newline at end of file
@@ -1,5 +1,10 @@
 from enum import Enum
+import logging
 import random
+
+logger = logging.getLogger(__name__)
+
+
 class EVSimController():
     """Controller Simulator. Either creates a controller for DC or AC case
     """
@@ -31,11 +36,11 @@ class EVSimController():
             self.chargingmode = "AC"
         
         self.evstate = EVState.B
-        print(f"EV STARTING STATE: {self.evstate}")
+        logger.info("EV STARTING STATE: %s", self.evstate)
 
     def set_state(self, new_state):
         self.evstate = new_state
-        print(f"EV NEW STATE: {self.evstate}")
+        logger.info("EV NEW STATE: %s", self.evstate)
     
     def get_ev_status(self):
         '''This Method will generate EVStatus elements'''
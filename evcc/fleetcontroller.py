@@ -0,0 +1,263 @@
+"""Fleet of simulated EVs with their batteries in NumPy arrays.
+
+EVFleetController holds the state of charge, the charging current and the
+limits of every vehicle and advances all of them (or a selection) in one
+vectorized step along a CC/CV charging curve: a battery with a linear open
+circuit voltage and an internal resistance is charged with its current limit
+until the terminal voltage reaches the charge voltage, then with the
+decaying current that holds this voltage. Charging is complete when that
+current falls below TERMINATION_CURRENT of the maximum current.
+
+fleet.vehicle(i) is an EVSimController for one EVCC session: its attributes
+(evressoc, ev_target_current, get_ev_status(), ...) read the arrays, every
+CurrentDemandRes/ChargingStatusRes advances the vehicle by MESSAGE_SECONDS.
+Site studies step the whole fleet and read power():
+
+    python -m evcc.fleetcontroller --vehicles 20000 --hours 4 --site-limit 3000
+"""
+import argparse
+import logging
+import time
+
+import numpy as np
+
+from common import log
+from evcc.evcontroller import EVSimController, EVState
+
+logger = logging.getLogger(__name__)
+
+# Simulated charging time of one CurrentDemand/ChargingStatus loop of a session
+MESSAGE_SECONDS = 60
+# Charging stops when the current holding the charge voltage falls below
+# this share of the maximum current
+TERMINATION_CURRENT = 0.05
+# Open circuit voltage of an empty battery as share of the charge voltage
+EMPTY_VOLTAGE = 0.75
+# AC charging: grid voltage, phases and maximum current of the onboard charger
+AC_VOLTAGE = 230
+AC_PHASES = 3
+AC_MAX_CURRENT = 32
+# PhysicalValueType values are shorts
+MAX_PHYSICAL_VALUE = 32767
+
+
+class EVFleetController():
+    """Batteries of a fleet of simulated EVs. The arguments are scalars or
+    one value per vehicle:
+
+    - dc: DC (True) or AC (False) charging
+    - soc: state of charge 0..1
+    - capacity: usable energy in Wh
+    - charge_voltage: charge (CV) voltage and maximum voltage in V
+    - max_current: maximum DC charging current in A
+    - max_power: maximum charging power in W, the onboard charger for AC
+    - cv_soc: state of charge at which the CV phase starts at full current
+    """
+    def __init__(self, dc, soc=0.5, capacity=60000, charge_voltage=400, max_current=125,
+                 max_power=50000, cv_soc=0.8):
+        self.dc = np.array(dc, dtype=bool, ndmin=1)
+        shape = self.dc.shape
+
+        def array(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), shape).copy()
+        self.soc = array(soc)
+        self.capacity = array(capacity)
+        self.charge_voltage = array(charge_voltage)
+        self.max_power = np.where(self.dc, array(max_power), np.minimum(
+            array(max_power), AC_VOLTAGE * AC_PHASES * AC_MAX_CURRENT))
+        self.max_current = np.minimum(array(max_current), self.max_power / self.charge_voltage)
+        self.empty_voltage = EMPTY_VOLTAGE * self.charge_voltage
+        # Internal resistance and charge in coulombs
+        self.resistance = ((self.charge_voltage - self.open_circuit_voltage(array(cv_soc)))
+                           / self.max_current)
+        self.charge = 3600 * self.capacity / (0.5 * (self.empty_voltage + self.charge_voltage))
+        self.energy = np.zeros(shape)
+        self.current = np.minimum(self.max_current, self.holding_current(self.soc))
+        self.complete = self.holding_current(self.soc) <= TERMINATION_CURRENT * self.max_current
+        self.current[self.complete] = 0.0
+        self.seconds = 0.0
+
+    def __len__(self):
+        return len(self.dc)
+
+    def open_circuit_voltage(self, soc, index=slice(None)):
+        return self.empty_voltage[index] + (
+            self.charge_voltage[index] - self.empty_voltage[index]) * soc
+
+    def holding_current(self, soc, index=slice(None)):
+        """Current at which the terminal voltage is the charge voltage"""
+        return ((self.charge_voltage[index] - self.open_circuit_voltage(soc, index))
+                / self.resistance[index])
+
+    def step(self, seconds, current_limit=None, index=slice(None)):
+        """Charges the vehicles selected by ``index`` for ``seconds``, with
+        their current limited to ``current_limit`` (A, scalar or per selected
+        vehicle, e.g. the EVSE or the site limit)
+        """
+        soc = self.soc[index]
+        limit = self.max_current[index]
+        if current_limit is not None:
+            limit = np.minimum(limit, current_limit)
+        charge = self.charge[index]
+        resistance = self.resistance[index]
+        span = self.charge_voltage[index] - self.empty_voltage[index]
+        # CC up to the state of charge where the limit reaches the charge
+        # voltage, the CV phase approaches a full battery exponentially
+        cv_soc = np.clip((self.charge_voltage[index] - limit * resistance
+                          - self.empty_voltage[index]) / span, 0.0, 1.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cc_seconds = np.where(limit > 0, (cv_soc - soc) * charge / limit, np.inf)
+        cc_seconds = np.clip(cc_seconds, 0.0, seconds)
+        new_soc = np.where(cc_seconds > 0, soc + limit * cc_seconds / charge, soc)
+        new_soc = 1.0 - (1.0 - new_soc) * np.exp(-(seconds - cc_seconds) * span
+                                                 / (resistance * charge))
+        complete = self.complete[index]
+        new_soc = np.where(complete, soc, np.minimum(new_soc, 1.0))
+        holding = self.holding_current(new_soc, index)
+        complete = complete | (holding <= TERMINATION_CURRENT * self.max_current[index])
+        self.current[index] = np.where(complete, 0.0, np.minimum(limit, holding))
+        self.energy[index] += (new_soc - soc) * self.capacity[index]
+        self.soc[index] = new_soc
+        self.complete[index] = complete
+        if isinstance(index, slice) and index == slice(None):
+            self.seconds += seconds
+
+    def voltage(self):
+        """Terminal voltage in V"""
+        return self.open_circuit_voltage(self.soc) + self.current * self.resistance
+
+    def power(self):
+        """Charging power in W"""
+        return self.current * self.voltage()
+
+    def soc_percent(self):
+        """EVRESSSOC of every vehicle, 100 once charging is complete"""
+        return np.where(self.complete, 100, np.minimum(99, (100 * self.soc).astype(int)))
+
+    def vehicle(self, index):
+        """EVSimController of one vehicle for an EVCC session"""
+        return EVFleetVehicle(self, index)
+
+
+class EVFleetVehicle(EVSimController):
+    """One vehicle of an EVFleetController with the attributes of the
+    EVSimController, read from the fleet arrays
+    """
+    # pylint: disable=super-init-not-called
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index
+        self.ac_charging_finish = None
+        self.chargingmode = "DC" if fleet.dc[index] else "AC"
+        self.evstate = EVState.B
+        logger.info("EV STARTING STATE: %s", self.evstate)
+
+    @property
+    def evressoc(self):
+        fleet = self.fleet
+        return 100 if fleet.complete[self.index] else min(99, int(100 * fleet.soc[self.index]))
+
+    @property
+    def ev_target_voltage(self):
+        return int(round(self.fleet.charge_voltage[self.index]))
+
+    @property
+    def ev_target_current(self):
+        return int(round(self.fleet.current[self.index]))
+
+    @property
+    def maximum_voltage_limit(self):
+        return int(round(self.fleet.charge_voltage[self.index]))
+
+    @property
+    def maximum_current_limit(self):
+        return int(self.fleet.max_current[self.index])
+
+    @property
+    def ev_maximum_power_limit(self):
+        # kW, sent with Multiplier 3
+        return int(self.fleet.max_power[self.index] // 1000)
+
+    @property
+    def ev_energy_request(self):
+        fleet = self.fleet
+        energy = (1.0 - fleet.soc[self.index]) * fleet.capacity[self.index]
+        return min(MAX_PHYSICAL_VALUE, int(round(energy)))
+
+    @property
+    def eamount(self):
+        # kWh, sent with Multiplier 3
+        fleet = self.fleet
+        return int(round((1.0 - fleet.soc[self.index]) * fleet.capacity[self.index] / 1000))
+
+    @property
+    def ev_max_voltage(self):
+        return AC_VOLTAGE
+
+    @property
+    def ev_max_current(self):
+        return AC_MAX_CURRENT
+
+    @property
+    def ev_min_current(self):
+        return 0
+
+    def charge_up(self):
+        """Charges the battery for MESSAGE_SECONDS"""
+        self.fleet.step(MESSAGE_SECONDS, index=self.index)
+
+    def AC_charge_complete(self):
+        self.fleet.step(MESSAGE_SECONDS, index=self.index)
+        self.ac_charging_finish = bool(self.fleet.complete[self.index])
+        return self.ac_charging_finish
+
+
+def random_fleet(vehicles, dc_share=0.3, seed=None):
+    """Fleet with random batteries, charging modes and states of charge"""
+    rng = np.random.default_rng(seed)
+    return EVFleetController(rng.random(vehicles) < dc_share,
+                             soc=rng.uniform(0.1, 0.6, vehicles),
+                             capacity=rng.uniform(40000, 100000, vehicles),
+                             max_current=rng.uniform(100, 200, vehicles),
+                             max_power=rng.choice([50000, 75000, 150000], vehicles),
+                             cv_soc=rng.uniform(0.75, 0.85, vehicles))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--vehicles', type=int, default=10000)
+    parser.add_argument('--dc-share', type=float, default=0.3)
+    parser.add_argument('--hours', type=float, default=4.0)
+    parser.add_argument('--step', type=float, default=60.0, help='seconds per step')
+    parser.add_argument('--site-limit', type=float, default=None,
+                        help='kW of the site, shared in proportion to the current limits')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+    log.configure(level=logging.WARNING)
+
+    fleet = random_fleet(args.vehicles, args.dc_share, args.seed)
+    steps = max(1, int(round(3600 * args.hours / args.step)))
+    report_every = max(1, int(round(900 / args.step)))
+    print('{:>8} {:>10} {:>12} {:>10} {:>12}'.format(
+        'time', 'charging', 'power [kW]', 'SoC [%]', 'energy [MWh]'))
+    elapsed = 0.0
+    for number in range(1, steps + 1):
+        start = time.perf_counter()
+        current_limit = None
+        if args.site_limit is not None:
+            # Scale the current limits down if the site would be exceeded
+            demand = (fleet.max_current * fleet.charge_voltage)[~fleet.complete].sum()
+            if demand > 1000 * args.site_limit:
+                current_limit = fleet.max_current * (1000 * args.site_limit / demand)
+        fleet.step(args.step, current_limit)
+        elapsed += time.perf_counter() - start
+        if number % report_every == 0 or number == steps:
+            print('{:>5.0f} min {:>10} {:>12.0f} {:>10.1f} {:>12.2f}'.format(
+                fleet.seconds / 60, int(np.count_nonzero(~fleet.complete)),
+                fleet.power().sum() / 1000, 100 * fleet.soc.mean(), fleet.energy.sum() / 1e6))
+    print('%d vehicles, %.1f us per step (%.3f us per vehicle)'
+          % (len(fleet), 1e6 * elapsed / steps, 1e6 * elapsed / steps / len(fleet)))
+
+
+if __name__ == "__main__":
+    main()
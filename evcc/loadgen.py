@@ -0,0 +1,277 @@
+"""Load generator for an SECC: a fleet of headless EVCCs on asyncio
+(common/network/aio_transport.py), optionally spread over worker processes.
+
+The vehicles arrive as a Poisson process with --rate sessions per second (0
+starts them all at once, limited by --concurrency), each with a charging mode,
+payment option and transport drawn from the given choices. They connect to the
+SECC address directly, the broadcast SDP is skipped. With --fleet their
+batteries are charged along the CC/CV curve of evcc.fleetcontroller (needs
+NumPy) from a random state of charge. The report has the
+throughput, the error rate by cause and the p50/p95/p99 of the session
+durations and of the response time of every message type:
+
+    python -m evcc.loadgen --secc 192.168.1.10 --vehicles 500 --rate 20 --processes 4
+
+Start the SECC with python -m common.network.aio_transport (or secc/secc.py)
+first. The test PKI is expired, --verify turns the TLS certificate check on.
+"""
+import argparse
+import asyncio
+import collections
+import json
+import logging
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from common import java_caller
+from common import log
+from common.network import aio_transport
+from evcc import evcc_config
+from evcc.evcc import EVCC
+from secc import secc_config
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ('tcp', 'tls')
+MODES = {'ac': ('AC', 'AC_three_phase_core'), 'dc': ('DC', 'DC_combo_core')}
+PAYMENTS = {'eim': 'ExternalPayment', 'pnc': 'Contract'}
+PERCENTILES = (50, 95, 99)
+
+Vehicle = collections.namedtuple(
+    'Vehicle', ['number', 'arrival', 'transport', 'mode', 'payment', 'soc'])
+SessionResult = collections.namedtuple(
+    'SessionResult', ['vehicle', 'ok', 'error', 'seconds', 'responses'])
+
+
+def percentile(values, q):
+    """Nearest rank percentile of sorted values"""
+    index = max(0, min(len(values) - 1, -(-len(values) * q // 100) - 1))
+    return values[index]
+
+
+def distribution(values):
+    """count, p50/p95/p99 and max in milliseconds"""
+    values = sorted(values)
+    if not values:
+        return {'count': 0}
+    result = {'count': len(values)}
+    for q in PERCENTILES:
+        result['p%d_ms' % q] = round(1e3 * percentile(values, q), 3)
+    result['max_ms'] = round(1e3 * values[-1], 3)
+    return result
+
+
+class ResponseTimes():
+    """Response times measured on the EVCC: the handler of each response
+    records the time since the previous message was handled (and the next
+    request sent)
+    """
+    def __init__(self):
+        self.samples = {}
+        self.last = None
+
+    def attach(self, evcc):
+        """Wraps the handlers of the MessageHandler of ``evcc``"""
+        handler = evcc.message_handler
+        process = handler.process_message_and_react
+        self.last = time.perf_counter()
+
+        def process_message_and_react(*args, **kwargs):
+            try:
+                return process(*args, **kwargs)
+            finally:
+                self.last = time.perf_counter()
+        handler.process_message_and_react = process_message_and_react
+        for message_type, function in handler.message_handlers.items():
+            if message_type.endswith('Res'):
+                handler.message_handlers[message_type] = self.timed(message_type, function)
+
+    def timed(self, message_type, function):
+        def handle(*args, **kwargs):
+            if self.last is not None:
+                self.samples.setdefault(message_type, []).append(time.perf_counter() - self.last)
+            return function(*args, **kwargs)
+        return handle
+
+
+def configure(java=False, verify=False, log_level=logging.WARNING):
+    """Headless EVCC settings of a load generator process"""
+    java_caller.USE_PYTHON_CODEC = not java
+    evcc_config.ASK_SERVICE_DETAILS = False
+    evcc_config.SLOW_MODE = secc_config.SLOW_MODE = False
+    evcc_config.VERIFY_SECC_CERTIFICATE = verify
+    log.configure(level=log_level)
+
+
+def schedule(args):
+    """Vehicles with their arrival offsets in seconds"""
+    rng = random.Random(args.seed)
+    vehicles = []
+    arrival = 0.0
+    for number in range(args.vehicles):
+        if args.rate > 0 and number:
+            arrival += rng.expovariate(args.rate)
+        vehicles.append(Vehicle(number, arrival, rng.choice(args.transport),
+                                rng.choice(args.mode), rng.choice(args.payment),
+                                rng.uniform(0.1, 0.6)))
+    return vehicles
+
+
+async def run_session(vehicle, secc, timeout, controller=None):
+    """Runs the session of one vehicle against ``secc`` = (host, tcp port,
+    tls port), complete if the SessionStopRes arrived
+    """
+    charging_mode, charging = MODES[vehicle.mode]
+    evcc = EVCC(tls=vehicle.transport == 'tls', charging_mode=charging_mode,
+                charging=charging, payment_option=PAYMENTS[vehicle.payment],
+                controller=controller)
+    evcc.udpclient.close()
+    responses = ResponseTimes()
+    responses.attach(evcc)
+    host, tcp_port, tls_port = secc
+    start = time.perf_counter()
+    error = None
+    try:
+        await asyncio.wait_for(
+            aio_transport.run_evcc(evcc, (host, tls_port if evcc.tls else tcp_port)), timeout)
+        if 'SessionStopRes' not in responses.samples:
+            error = 'incomplete in %s' % evcc.statemachine.state
+    except asyncio.TimeoutError:
+        error = 'session timeout'
+    except Exception as exception:  # pylint: disable=broad-except
+        error = type(exception).__name__
+        logger.debug("Vehicle %d failed", vehicle.number, exc_info=True)
+    return SessionResult(vehicle, error is None, error, time.perf_counter() - start,
+                         responses.samples)
+
+
+async def run_fleet(vehicles, secc, concurrency, timeout, start_at, fleet=False):
+    """Starts every vehicle at start_at + arrival (time.time()), at most
+    ``concurrency`` sessions at once. With ``fleet`` the vehicles share an
+    EVFleetController
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    controllers = [None] * len(vehicles)
+    if fleet:
+        from evcc.fleetcontroller import EVFleetController
+        batteries = EVFleetController([vehicle.mode == 'dc' for vehicle in vehicles],
+                                      soc=[vehicle.soc for vehicle in vehicles])
+        controllers = [batteries.vehicle(index) for index in range(len(vehicles))]
+
+    async def arrive(vehicle, controller):
+        await asyncio.sleep(max(0.0, start_at + vehicle.arrival - time.time()))
+        async with semaphore:
+            return await run_session(vehicle, secc, timeout, controller)
+
+    return await asyncio.gather(*(arrive(vehicle, controller)
+                                  for vehicle, controller in zip(vehicles, controllers)))
+
+
+def run_worker(vehicles, secc, concurrency, timeout, start_at, fleet, settings):
+    """Entry point of a worker process, returns its SessionResults"""
+    configure(**settings)
+    return asyncio.run(run_fleet(vehicles, secc, concurrency, timeout, start_at, fleet))
+
+
+def summarize(results, seconds):
+    """Report dict of the session results of all workers"""
+    completed = [result for result in results if result.ok]
+    errors = collections.Counter(result.error for result in results if not result.ok)
+    responses = {}
+    for result in results:
+        for message_type, samples in result.responses.items():
+            responses.setdefault(message_type, []).extend(samples)
+    scenarios = collections.defaultdict(lambda: {'sessions': 0, 'failures': 0})
+    for result in results:
+        vehicle = result.vehicle
+        scenario = scenarios['%s-%s-%s' % (vehicle.transport, vehicle.mode, vehicle.payment)]
+        scenario['sessions'] += 1
+        scenario['failures'] += not result.ok
+    return {
+        'sessions': len(results),
+        'completed': len(completed),
+        'error_rate': round(1 - len(completed) / len(results), 4) if results else 0.0,
+        'errors': dict(errors),
+        'seconds': round(seconds, 3),
+        'sessions_per_second': round(len(completed) / seconds, 2) if seconds else 0.0,
+        'session_duration': distribution([result.seconds for result in completed]),
+        'responses': {message_type: distribution(samples)
+                      for message_type, samples in sorted(responses.items())},
+        'scenarios': dict(sorted(scenarios.items())),
+    }
+
+
+def print_report(report):
+    print('sessions {sessions}, completed {completed}, error rate {error_rate:.2%}, '
+          '{sessions_per_second} sessions/s in {seconds} s'.format(**report))
+    for error, count in sorted(report['errors'].items()):
+        print('    {:<40} {:>6}'.format(error, count))
+    print('{:<30} {:>7} {:>10} {:>10} {:>10} {:>10}'.format(
+        '', 'count', 'p50 [ms]', 'p95 [ms]', 'p99 [ms]', 'max [ms]'))
+    rows = [('session', report['session_duration'])] + list(report['responses'].items())
+    for name, stats in rows:
+        if stats['count']:
+            print('{:<30} {:>7} {:>10.2f} {:>10.2f} {:>10.2f} {:>10.2f}'.format(
+                name, stats['count'], stats['p50_ms'], stats['p95_ms'], stats['p99_ms'],
+                stats['max_ms']))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--secc', default='127.0.0.1', help='address of the SECC')
+    parser.add_argument('--port', type=int, default=secc_config.TCP_PORT)
+    parser.add_argument('--tls-port', type=int, default=secc_config.TLS_PORT)
+    parser.add_argument('--vehicles', type=int, default=100)
+    parser.add_argument('--rate', type=float, default=10.0,
+                        help='mean arrivals per second, 0 starts all vehicles at once')
+    parser.add_argument('--concurrency', type=int, default=100,
+                        help='sessions at once, shared by the processes')
+    parser.add_argument('--processes', type=int, default=1,
+                        help='worker processes, 1 runs the fleet in this process')
+    parser.add_argument('--transport', nargs='+', choices=TRANSPORTS, default=['tcp'])
+    parser.add_argument('--mode', nargs='+', choices=sorted(MODES), default=sorted(MODES))
+    parser.add_argument('--payment', nargs='+', choices=sorted(PAYMENTS),
+                        default=sorted(PAYMENTS))
+    parser.add_argument('--fleet', action='store_true',
+                        help='charge the batteries along a CC/CV curve (needs NumPy)')
+    parser.add_argument('--timeout', type=float, default=60.0, help='seconds per session')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--java', action='store_true',
+                        help='use the Java codec instead of the Python codec')
+    parser.add_argument('--verify', action='store_true',
+                        help='verify the SECC certificate in the TLS handshake')
+    parser.add_argument('--output', help='write the report as JSON')
+    args = parser.parse_args()
+
+    settings = dict(java=args.java, verify=args.verify)
+    configure(**settings)
+    vehicles = schedule(args)
+    secc = (args.secc, args.port, args.tls_port)
+    processes = max(1, min(args.processes, len(vehicles)))
+    concurrency = max(1, args.concurrency // processes)
+    if processes == 1:
+        start_at = time.time()
+        results = asyncio.run(run_fleet(vehicles, secc, concurrency, args.timeout, start_at,
+                                        args.fleet))
+    else:
+        # The workers share the arrival timeline, it starts once they are up
+        start_at = time.time() + 1.0
+        with ProcessPoolExecutor(processes) as pool:
+            futures = [pool.submit(run_worker, vehicles[index::processes], secc, concurrency,
+                                   args.timeout, start_at, args.fleet, settings)
+                       for index in range(processes)]
+            results = [result for future in futures for result in future.result()]
+    report = summarize(results, time.time() - start_at)
+    print_report(report)
+    if args.output:
+        report.update(vehicles=args.vehicles, rate=args.rate, processes=processes,
+                      timestamp=time.strftime('%Y-%m-%dT%H:%M:%S'))
+        with open(args.output, 'w') as outfile:
+            json.dump(report, outfile, indent=2)
+    return 1 if report['completed'] < report['sessions'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
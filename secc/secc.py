@@ -6,21 +6,27 @@ the controller. The SECC object is capable of:
 3)Reacting to Messages
 4)Change States
 """
+import logging
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 # pylint: disable=import-error
 from secc import secc_states
 from secc import evsecontroller
 from secc import secc_config
 
-from common.exi_utils import exi_utils
 from common.network import network
-from common.XML import msgbody1, msgdatatypes1
+from common import log
+from common import timing
 from secc import secc_config
 from secc.secc_handler import SECCMessageHandler
-import cProfile
+from secc.secc_session import SECCSession, SessionRegistry
 
 from common.handlers import MessageHandler
+from common.security.ephemeral import ephemeral_keys
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -28,114 +34,111 @@ from common.handlers import MessageHandler
 # pylint: disable=no-member
 # pylint: disable=line-too-long
 class SECC():
-    """Class Repressenting SECC. Stores important attributes that simulate SECC behaviour
-    and enables the functionality to receive, process and send messages
+    """Class Repressenting SECC. Answers the SDP requests and accepts the TCP/TLS
+    connections of the EVCCs. Every connection is served by its own SECCSession
+    on a thread pool, so one slow vehicle does not block the others
     """
 
     def __init__(self):
         self.udp_port = 15118
 
         self.ipadress = secc_config.IP_ADRESS
-        self.tcp_port = 8081
-        self.tls_port = 8082
-        self.gen = None
-        self.contract_certificate = None
-        self.smart_meter_receipt_needed = None
-        self.smart_meter_receipt_done = False
-        self.udpserver, self.tcpserver = network.create_udp_tcp_serversocket()
+        self.tcp_port = secc_config.TCP_PORT
+        self.tls_port = secc_config.TLS_PORT
+        self.udpserver, self.tcp_listener = network.create_udp_tcp_serversocket()
+        self.tls_listener = network.create_tls_serversocket()
         self.tlstcp = None
-        self.evcc_client = None
         self.secc_key_path = secc_config.SECC_PRIVATEKEY_PATH
         self.secc_cert_chain = secc_config.SECC_CERTCHAIN_PATH
-        self.payment_option = None
-        self.controller = evsecontroller.EVSESimController()
-        # State Machine for SECC
-        res = secc_states.create_secc_state_machine()
-        self.statemachine = res[0]
-        #self.message_handler = SECCMessageHandler(self)
+        self.sessions = SessionRegistry()
+        self.executor = ThreadPoolExecutor(max_workers=secc_config.MAX_SESSIONS)
+        # Handles the SDP messages, V2G messages are handled by the sessions
         self.message_handler = MessageHandler(None, self)
+        # DHpublickey key pairs of the CertificateInstallationRes, generated ahead
+        ephemeral_keys.start()
 
-    def display_state(self):
-        """Used for logging Porpuses. Displays the state
+    @property
+    def tcpserver(self):
+        """Server socket announced in the SECCDiscoveryRes: the TLS server if
+        the EVCC asked for TLS, the plain TCP server otherwise
         """
-        print("New State: ", self.statemachine.state)
-
+        return self.tls_listener if self.tlstcp else self.tcp_listener
 
     def check_incoming_messages(self):
-        """Checks for the next incoming message. If the SECC State is WaitForSupportedAppProtocolReq
-        the UDP socket will wait for the SDP request message. If the TCP connection with the EVCC
-        is established, the method will wait for a V2G Message. After the message has been received
-        the process_message_and_react method will be called.
-
+        """Waits for SECCDiscoveryReq UDP messages and answers them. The TCP
+        and TLS connections are accepted on separate threads and handed to the
+        thread pool, see accept_connections
         """
+        for server, tls in ((self.tcp_listener, False), (self.tls_listener, True)):
+            threading.Thread(target=self.accept_connections, args=(server, tls),
+                             daemon=True).start()
         while True:
-            # Check For UDP Messages IF State is WaitForSupportedAppProtocolReq
-            if self.statemachine.state == "WaitForSupportedAppProtocolReq" and self.evcc_client is None:
-                print("Waiting For SECCDiscoveryReq UDP Message...")
-                seccdiscoveryreq_message, address = self.udpserver.recvfrom(1024)
-                #self.message_handler.process_message_and_react(seccdiscoveryreq_message, address)
-                self.message_handler.process_message_and_react(seccdiscoveryreq_message, False, address)
-
-            # Check For TCP Messages (AppProtocl or V2G)
-            elif self.evcc_client:
-
-                while True:
-                    data = network.recvall(self.evcc_client)
+            logger.info("Waiting For SECCDiscoveryReq UDP Message...")
+            seccdiscoveryreq_message, address = self.udpserver.recvfrom(1024)
+            self.message_handler.process_message_and_react(seccdiscoveryreq_message, False, address)
 
-                    if data:
-                        #self.message_handler.process_message_and_react(data)
-                        self.message_handler.process_message_and_react(data, False)
+    def accept_connections(self, server, tls):
+        """Accepts the EVCC connections of ``server`` and serves each one in its
+        own session
+        """
+        while True:
+            try:
+                client, address = server.accept()
+            except OSError as error:
+                logger.error("An exception occurred: %s", error)
+                continue
+            logger.info("3: Connected to %s", address, extra=log.RED)
+            future = self.executor.submit(self.start_session, client, address, tls)
+            future.add_done_callback(self.log_session_error)
+
+    @staticmethod
+    def log_session_error(future):
+        """Logs the exception a session ended with, the thread pool keeps it
+        in the future otherwise
+        """
+        error = future.exception()
+        if error is not None:
+            logger.error("Session failed: %r", error, exc_info=error)
 
-    def establish_secc_tcp_connection(self):
-        """Establishes TCP connection after sending SECCDiscoveryReq Message.
+    def start_session(self, client, address, tls):
+        """Runs on the thread pool: TLS handshake (for connections to the TLS
+        port) and the message loop of the session
+        """
+        if tls:
+            logger.info("Establish TLS Connection", extra=log.RED)
+            context = network.get_secc_ssl_context(
+                server_cert=secc_config.SECC_CERTCHAIN_PATH,
+                server_key=secc_config.SECC_PRIVATEKEY_PATH)
+            start = time.perf_counter()
+            try:
+                client = context.wrap_socket(client, server_side=True)
+            except OSError as error:
+                network.handshake_metrics.record_failure()
+                logger.warning("TLS handshake with %s failed: %s", address, error, extra=log.RED)
+                client.close()
+                return
+            network.handshake_metrics.record(time.perf_counter() - start, client.session_reused)
+            logger.info("SSL established, session resumed: %s", client.session_reused, extra=log.RED)
+        session = SECCSession(self, client, address)
+        self.sessions.add(session)
+        session.serve()
+
+    def establish_secc_tcp_connection(self, address=None):
+        """Called after sending the SECCDiscoveryRes. The connection is accepted
+        by accept_connections on the port announced for the requested security.
         IF TLS is used, the SECC will be authorized by the EVCC. For TLS handhsake, SECC
         will offer its SECC certificate chain that leads up to the V2G certificate. In order
         for the SECC to be verified, EVCC's installed V2G certificate has to match with the
         V2G certificate offered by the SECC
         """
-        exi_utils.print_colored_red("3: Starting TCP connection")
-        try:
-            client, address = self.tcpserver.accept()
-        except:
-            print("An exception occurred")
-        exi_utils.print_colored_red(f"3: Connected to {address}")
-        exi_utils.print_colored_red(self.tlstcp)
-        if self.tlstcp:
-            exi_utils.print_colored_red("Establish TLS Connection")
-
-            context = network.create_secc_sll_context(
-                server_cert=secc_config.SECC_CERTCHAIN_PATH,
-                server_key=secc_config.SECC_PRIVATEKEY_PATH)
-            self.evcc_client = context.wrap_socket(client, server_side=True)
-            exi_utils.print_colored_red("SSL established")
-
-
-    def parse_evse_status(self):
-        '''Parses the values of the EVSEStatus to the XML format'''
-        evsestatus = self.controller.get_evse_status()
-
-        if self.controller.is_DC_mode():
-            res =  msgbody1.DC_EVSEStatusType(
-            NotificationMaxDelay=evsestatus["NotificationMaxDelay"],
-            EVSENotification=evsestatus["EVSENotification"],
-            EVSEIsolationStatus=evsestatus["EVSEIsolationStatus"],
-            EVSEStatusCode=evsestatus["EVSEStatusCode"])
-            res.original_tagname_ = "DC_EVSEStatus"
-            return res
-        if self.controller.is_AC_mode():
-            res= msgdatatypes1.AC_EVSEStatusType(
-                NotificationMaxDelay=evsestatus["NotificationMaxDelay"],
-                EVSENotification=evsestatus["EVSENotification"],
-                RCD=evsestatus["RCD"]
-            )
-            res.original_tagname_= "AC_EVSEStatus"
-
+        logger.info("3: Starting TCP connection", extra=log.RED)
 
 
 if __name__ == '__main__':
+    log.configure()
+    timing.serve_metrics()
     t1_secc=time.time()
     secc = SECC()
-    print(f't1_sec = {time.time()-t1_secc}')
+    logger.info('t1_sec = %s', time.time()-t1_secc)
     secc.check_incoming_messages()
     #secc.prossecc()
-    #cProfile.run('establish_secc_tcp_connection(self)')
\ No newline at end of file
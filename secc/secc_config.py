@@ -28,6 +28,10 @@ slow_mode_custom = {
 UDP_PORT = 15118
 TCP_PORT = 8081
 TLS_PORT = 8082
+# Number of EVCC connections that are served at the same time
+MAX_SESSIONS = 16
+# V2G_SECC_Sequence_Timeout in seconds (ISO 15118-2, Table 109)
+SEQUENCE_TIMEOUT = 60
 # Interface that will be used adjust according to the name of the ethernet interface
 # e.g "eth0" (if ethernet connected)
 # IP_ADRESS = network.get_ip(interface = "enp4s0f1")
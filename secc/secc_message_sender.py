@@ -1,15 +1,25 @@
+import logging
 from datetime import datetime
-from common.XML import appprotocol1, msgbody1, msgdatatypes1, msgDef1
+from common import bindings
+from common import log
+from common import timing
 from secc import secc_config
 from common.exi_utils import exi_utils
 from common.security import securityutils
+from common.exi.template import TemplateCache
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class SECCMessageSender:
     def __init__(self, secc):
         self.secc = secc
         self.sessionid = None
+        self.current_demand_res_template = TemplateCache(
+            self.create_current_demand_res, exi_utils.v2g_to_EXI)
+        self.charging_status_res_template = TemplateCache(
+            self.create_charging_status_res, exi_utils.v2g_to_EXI)
 
     def send_secc_discovery_res(self, secc_discovery_req_msg, adress=None):
         """ Send SECCDiscoveryRes, a payload of 20 bytes, with the first 16 bytes denoting
@@ -19,7 +29,7 @@ class SECCMessageSender:
         Args:
             secc_discovery_req_msg (bytes): The previous SECCDiscoveryReq message
         """
-        print("2: Preparing SECCDiscoveryRes")
+        logger.debug("2: Preparing SECCDiscoveryRes")
 
         # ip adress 16bytes
         # ipadress = [int(x) for x in self.secc.ipadress.split(".")]
@@ -82,7 +92,7 @@ class SECCMessageSender:
 
         self.secc.udpserver.sendto(v2gmsg, adress)
 
-        print("2: SECCDiscoveryRes sent")
+        logger.info("2: SECCDiscoveryRes sent")
 
     def send_supported_app_protocol_res(self, supp_app_protocol_req_msg):
         """Send supportedAppProtocolRes message. Protocols supported by the SECC will
@@ -101,7 +111,7 @@ class SECCMessageSender:
         Args:
             supp_app_protocol_req_msg : The received supportedAppProtocolReq Message
         """
-        print("4: Preparing supportedAppProtocolRes")
+        logger.debug("4: Preparing supportedAppProtocolRes")
         appprotocols = supp_app_protocol_req_msg.get_AppProtocol()
 
         # Check if at least a protocol provided by EVCC match with protocols stored SECC
@@ -129,22 +139,24 @@ class SECCMessageSender:
                 response_code = "OK_SuccessfulNegotiationWithMinorDeviation"
             else:
                 response_code = "OK_SuccessfulNegotiation"
-            supappprres = appprotocol1.supportedAppProtocolRes(
+            supappprres = bindings.appprotocol1.supportedAppProtocolRes(
                 SchemaID=protocol_chosen.get_SchemaID(),
                 ResponseCode=response_code)
         else:
-            supappprres = appprotocol1.supportedAppProtocolRes(
-                ResponseCode=appprotocol1.responseCodeType.
+            supappprres = bindings.appprotocol1.supportedAppProtocolRes(
+                ResponseCode=bindings.appprotocol1.responseCodeType.
                 FAILED__NO_NEGOTIATION)
 
         supappprres.original_tagname_ = "supportedAppProtocolRes"
 
         # Transform to EXI
-        v2gtp = exi_utils.xml_to_v2gtp(supappprres, 'appprotres')
+        with timing.phase('encode'):
+            v2gtp = exi_utils.xml_to_v2gtp(supappprres, 'appprotres')
 
         exi_utils.display_before_send(supappprres, v2gtp)
-        self.secc.evcc_client.sendall(v2gtp)
-        print("4: supportedAppProtocolRes sent")
+        with timing.phase('send'):
+            self.secc.evcc_client.sendall(v2gtp)
+        logger.info("4: supportedAppProtocolRes sent")
 
     def send_session_setup_res(self):
         """By using the SessionSetupRes the SECC responds to a SessionSetupReq. With the SessionSetupRes the
@@ -156,12 +168,12 @@ class SECCMessageSender:
             -EVSETimeStamp: Timestamp of the current SECC time. Format is “Unix Time Stamp”. If there are no other
             means of synchronisation, EVCC will synchronise its time
         """
-        print("6: Preparing SessionSetupRes")
+        logger.debug("6: Preparing SessionSetupRes")
         self.sessionid = securityutils.generate_session_id()
 
-        responsecode = msgbody1.responseCodeType(
-            msgbody1.responseCodeType.OK__NEW_SESSION_ESTABLISHED)
-        sessionsetupres = msgbody1.SessionSetupResType(
+        responsecode = bindings.responseCodeType(
+            bindings.responseCodeType.OK__NEW_SESSION_ESTABLISHED)
+        sessionsetupres = bindings.SessionSetupResType(
             EVSEID=secc_config.EVSEID,
             EVSETimeStamp=datetime.timestamp(datetime.now()),
             ResponseCode=responsecode)
@@ -171,7 +183,7 @@ class SECCMessageSender:
             session_id=self.sessionid, body_element=sessionsetupres)
         self.send_v2g_message(session_setup_res_msg)
 
-        print("6: SessionSetupRes sent")
+        logger.info("6: SessionSetupRes sent")
 
     def send_service_discovery_res(self, message):
         """The SECC will respond in its ServiceDiscoveryRes with the mandatory ChargeSer-
@@ -193,10 +205,10 @@ class SECCMessageSender:
         Args:
             message: Last V2G Message
         """
-        print("8: Preparing ServiceDiscoveryRes")
+        logger.debug("8: Preparing ServiceDiscoveryRes")
 
-        responsecode = msgbody1.responseCodeType(msgbody1.responseCodeType.OK)
-        paymentoptionlist = msgbody1.PaymentOptionListType()
+        responsecode = bindings.responseCodeType(bindings.responseCodeType.OK)
+        paymentoptionlist = bindings.PaymentOptionListType()
 
         paymentoptions = secc_config.paymentoptions
         chargeservices = secc_config.chargeservices
@@ -209,23 +221,23 @@ class SECCMessageSender:
         # Charge Services
         for chargeservice in chargeservices:
             for id in chargeservice:
-                chargeService = msgbody1.ChargeServiceType(
+                chargeService = bindings.ChargeServiceType(
                     ServiceID=id,
                     ServiceName=chargeservice[id]["ServiceName"],
                     ServiceCategory=chargeservice[id]["ServiceCategory"],
                     FreeService=chargeservice[id]["FreeService"],
-                    SupportedEnergyTransferMode=msgdatatypes1.
+                    SupportedEnergyTransferMode=bindings.
                     SupportedEnergyTransferModeType())
                 for supportedenergytransfermode in (
                         chargeservice[id]["SupportedEnergyTransferMode"]):
                     chargeService.SupportedEnergyTransferMode.add_EnergyTransferMode(
                         supportedenergytransfermode)
 
-        serviceList = msgbody1.ServiceListType()
+        serviceList = bindings.ServiceListType()
         # ServiceList
         for service in servicelistfromfile:
             for id in service:
-                service = msgdatatypes1.ServiceType(
+                service = bindings.ServiceType(
                     ServiceID=id,
                     ServiceName=service[id]["ServiceName"],
                     ServiceCategory=service[id]["ServiceCategory"],
@@ -233,7 +245,7 @@ class SECCMessageSender:
                     FreeService=service[id]["FreeService"])
 
                 serviceList.add_Service(service)
-        servdiscres = msgbody1.ServiceDiscoveryResType(
+        servdiscres = bindings.ServiceDiscoveryResType(
             ResponseCode=responsecode,
             PaymentOptionList=paymentoptionlist,
             ChargeService=chargeService,
@@ -244,7 +256,7 @@ class SECCMessageSender:
             session_id=self.sessionid, body_element=servdiscres)
         self.send_v2g_message(session_setup_res_msg)
 
-        print("8: ServiceDiscoveryRes sent")
+        logger.info("8: ServiceDiscoveryRes sent")
 
     def send_service_detail_res(self, message):
         """After receiving the ServiceDetailReq message of an EVCC the SECC sends the ServiceDetailRes message
@@ -254,26 +266,26 @@ class SECCMessageSender:
         Args:
             message : The last V2G Message: ServiceDetailReq
         """
-        print("10: Preparing ServiceDetailRes")
+        logger.debug("10: Preparing ServiceDetailRes")
 
         service_id = message.get_Body().BodyElement.ServiceID
         servicelistfromfile = secc_config.servicelist
 
-        serparlist = msgbody1.ServiceParameterListType()
+        serparlist = bindings.ServiceParameterListType()
 
         for servicelistelement in servicelistfromfile:
             for key in servicelistelement:
                 if key == service_id:
                     for element in servicelistelement[key]["ParameterList"]:
-                        parametertype = msgdatatypes1.ParameterType()
+                        parametertype = bindings.ParameterType()
                         parametertype.stringValue = element[1]
                         parametertype.set_Name(element[2])
-                        parameterset = msgdatatypes1.ParameterSetType()
+                        parameterset = bindings.ParameterSetType()
                         parameterset.add_Parameter(parametertype)
                         parameterset.set_ParameterSetID(element[0])
                         serparlist.add_ParameterSet(parameterset)
-        servdetres = msgbody1.ServiceDetailResType(
-            ResponseCode=msgdatatypes1.responseCodeType.OK,
+        servdetres = bindings.ServiceDetailResType(
+            ResponseCode=bindings.responseCodeType.OK,
             ServiceID=service_id,
             ServiceParameterList=serparlist)
         servdetres.original_tagname_ = "ServiceDetailRes"
@@ -281,7 +293,7 @@ class SECCMessageSender:
         session_setup_res_msg = self.create_v2g_message(
             session_id=self.sessionid, body_element=servdetres)
         self.send_v2g_message(session_setup_res_msg)
-        print("10: ServiceDetailRes sent")
+        logger.info("10: ServiceDetailRes sent")
 
     def send_payment_service_selection_res(self, message):
         """Aknowledges the services selected by the EVCC and the payment option.
@@ -289,12 +301,12 @@ class SECCMessageSender:
         Args:
             message : The last V2G Message
         """
-        print("12: Preparing PaymentServiceSelectionRes")
+        logger.debug("12: Preparing PaymentServiceSelectionRes")
 
         ############################################
 
-        payserselres = msgbody1.PaymentServiceSelectionResType(
-            ResponseCode=msgbody1.responseCodeType.OK)
+        payserselres = bindings.PaymentServiceSelectionResType(
+            ResponseCode=bindings.responseCodeType.OK)
         payserselres.original_tagname_ = "PaymentServiceSelectionRes"
 
         ############################################
@@ -302,7 +314,7 @@ class SECCMessageSender:
         session_setup_res_msg = self.create_v2g_message(
             session_id=self.sessionid, body_element=payserselres)
         self.send_v2g_message(session_setup_res_msg)
-        print("12: PaymentServiceSelectionRes sent")
+        logger.info("12: PaymentServiceSelectionRes sent")
 
     def send_certificate_installation_res(self, message):
         """Send CertificateInstallRes message which contains the Contract Certificate chain,
@@ -313,7 +325,7 @@ class SECCMessageSender:
         Args:
             message : Last message received
         """
-        print("14: Preparing CertificateInstallationRes")
+        logger.debug("14: Preparing CertificateInstallationRes")
 
         # Create CertificateInstallationResponse Template
         certinstres = securityutils.generate_certificate_installation_res_body(
@@ -350,10 +362,10 @@ class SECCMessageSender:
         Args:
             message : PaymentDetailsReq message
         """
-        print("16: Preparing PaymentDetailsRes")
+        logger.debug("16: Preparing PaymentDetailsRes")
 
-        paydetres = msgbody1.PaymentDetailsResType()
-        paydetres.ResponseCode = msgbody1.responseCodeType.OK
+        paydetres = bindings.PaymentDetailsResType()
+        paydetres.ResponseCode = bindings.responseCodeType.OK
         self.secc.gen = securityutils.generate_gen_challenge()
         paydetres.GenChallenge = self.secc.gen
         paydetres.EVSETimeStamp = int(time.time())
@@ -364,7 +376,7 @@ class SECCMessageSender:
                                                   body_element=paydetres)
         self.send_v2g_message(pay_det_res_msg)
 
-        print("16: PaymentDetailsRes Sent")
+        logger.info("16: PaymentDetailsRes Sent")
 
     def send_authorization_res(self, message):
         """the SECC verifies the challenge signature (and the certificate with
@@ -381,16 +393,15 @@ class SECCMessageSender:
         Args:
             message : The last AuthorizationReq message
         """
-        print("18: Preparing AuthorizationRes")
+        logger.debug("18: Preparing AuthorizationRes")
 
         # Verifying the Genchallenge Value with the previous one
         if not message.get_Body().BodyElement._hasContent():
-            exi_utils.print_colored_red("EIM Authorization")
+            logger.info("EIM Authorization", extra=log.RED)
 
         # Check to see if EIM was used
         elif message.get_Body().BodyElement.GenChallenge != self.secc.gen:
-            exi_utils.print_colored_red(
-                "GenChallenge value does not match with PaymentDetailsRes ")
+            logger.info("GenChallenge value does not match with PaymentDetailsRes", extra=log.RED)
 
         # In case of PnC
         else:
@@ -399,8 +410,8 @@ class SECCMessageSender:
             securityutils.verify_authorization_req(
                 message, self.secc.contract_certificate)
 
-        autres = msgbody1.AuthorizationResType()
-        autres.ResponseCode = msgbody1.responseCodeType.OK
+        autres = bindings.AuthorizationResType()
+        autres.ResponseCode = bindings.responseCodeType.OK
 
         autres.EVSEProcessing = "Finished"
         autres.original_tagname_ = "AuthorizationRes"
@@ -414,7 +425,7 @@ class SECCMessageSender:
         else:
             self.secc.statemachine.send_AuthorizationResOngoing()
 
-        print("18: AuthorizationRes Sent")
+        logger.info("18: AuthorizationRes Sent")
 
     def send_charge_parameter_discovery_res(self, message):
         """With the ChargeParameterDiscoveryRes message the SECC provides applicable
@@ -434,11 +445,11 @@ class SECCMessageSender:
         Args:
             message : Last ChargeParameterDiscoveryReq message
         """
-        print("20: Preparing ChargeParameterDiscoveryRes")
+        logger.debug("20: Preparing ChargeParameterDiscoveryRes")
 
-        charparamdisres = msgbody1.ChargeParameterDiscoveryResType()
+        charparamdisres = bindings.ChargeParameterDiscoveryResType()
         charparamdisres.original_tagname_ = "ChargeParameterDiscoveryRes"
-        charparamdisres.ResponseCode = msgbody1.responseCodeType.OK
+        charparamdisres.ResponseCode = bindings.responseCodeType.OK
 
         charparamdisres.EVSEProcessing = self.secc.controller.get_evse_processing(
             "ChargeParameterDiscoveryRes")
@@ -447,25 +458,25 @@ class SECCMessageSender:
         if charparamdisres.EVSEProcessing == "Finished":
 
             # PmaxSchedule
-            pmaxschedule = msgdatatypes1.PMaxScheduleType()
+            pmaxschedule = bindings.PMaxScheduleType()
 
             # PmaxscheduleEntry
-            pmaxschedulentry1 = msgdatatypes1.PMaxScheduleEntryType(
-                TimeInterval=msgdatatypes1.RelativeTimeIntervalType(0),
-                PMax=msgdatatypes1.PhysicalValueType(3, 'W', 25))
+            pmaxschedulentry1 = bindings.PMaxScheduleEntryType(
+                TimeInterval=bindings.RelativeTimeIntervalType(0),
+                PMax=bindings.PhysicalValueType(3, 'W', 25))
             pmaxschedule.add_PMaxScheduleEntry(pmaxschedulentry1)
 
-            pmaxschedulentry1 = msgdatatypes1.PMaxScheduleEntryType(
-                TimeInterval=msgdatatypes1.RelativeTimeIntervalType(600),
-                PMax=msgdatatypes1.PhysicalValueType(3, 'W', 50))
+            pmaxschedulentry1 = bindings.PMaxScheduleEntryType(
+                TimeInterval=bindings.RelativeTimeIntervalType(600),
+                PMax=bindings.PhysicalValueType(3, 'W', 50))
             pmaxschedule.add_PMaxScheduleEntry(pmaxschedulentry1)
 
             # SAScheduleTuple
-            sascheduletuple = msgdatatypes1.SAScheduleTupleType(
+            sascheduletuple = bindings.SAScheduleTupleType(
                 SAScheduleTupleID=1, PMaxSchedule=pmaxschedule)
 
             # SAScheduleList
-            sasschelist = msgdatatypes1.SAScheduleListType()
+            sasschelist = bindings.SAScheduleListType()
             sasschelist.original_tagname_ = "SAScheduleList"
 
             sasschelist.add_SAScheduleTuple(sascheduletuple)
@@ -476,54 +487,54 @@ class SECCMessageSender:
         if self.secc.controller.is_DC_mode():
 
             # DC_EVSEChargeParameter
-            dcevchargeparameter = msgdatatypes1.DC_EVSEChargeParameterType()
+            dcevchargeparameter = bindings.DC_EVSEChargeParameterType()
             dcevchargeparameter.original_tagname_ = "DC_EVSEChargeParameter"
 
             dcevchargeparameter.DC_EVSEStatus = self.secc.parse_evse_status()
 
-            dcevchargeparameter.EVSEMaximumCurrentLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEMaximumCurrentLimit = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.A,
+                Unit=bindings.unitSymbolType.A,
                 Value=self.secc.controller.evse_maximum_current_limit)
-            dcevchargeparameter.EVSEMaximumPowerLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEMaximumPowerLimit = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.W,
+                Unit=bindings.unitSymbolType.W,
                 Value=self.secc.controller.evse_maximum_power_limit)
-            dcevchargeparameter.EVSEMaximumVoltageLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEMaximumVoltageLimit = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.V,
+                Unit=bindings.unitSymbolType.V,
                 Value=self.secc.controller.evse_maximum_voltage_limit)
-            dcevchargeparameter.EVSEMinimumCurrentLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEMinimumCurrentLimit = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.A,
+                Unit=bindings.unitSymbolType.A,
                 Value=self.secc.controller.evse_minimum_current_limit)
-            dcevchargeparameter.EVSEMinimumVoltageLimit = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEMinimumVoltageLimit = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.V,
+                Unit=bindings.unitSymbolType.V,
                 Value=self.secc.controller.evse_minimum_voltage_limit)
-            dcevchargeparameter.EVSEPeakCurrentRipple = msgdatatypes1.PhysicalValueType(
+            dcevchargeparameter.EVSEPeakCurrentRipple = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgbody1.unitSymbolType.A,
+                Unit=bindings.unitSymbolType.A,
                 Value=self.secc.controller.evse_peak_current_ripple)
 
             charparamdisres.EVSEChargeParameter = dcevchargeparameter
         else:
 
-            acevchargeparameter = msgdatatypes1.AC_EVSEChargeParameterType()
+            acevchargeparameter = bindings.AC_EVSEChargeParameterType()
             acevchargeparameter.original_tagname_ = "AC_EVSEChargeParameter"
 
             # AC_EVSEstatus
 
             acevchargeparameter.AC_EVSEStatus = self.secc.parse_evse_status()
 
-            acevchargeparameter.EVSENominalVoltage = msgdatatypes1.PhysicalValueType(
+            acevchargeparameter.EVSENominalVoltage = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.V,
+                Unit=bindings.unitSymbolType.V,
                 Value=self.secc.controller.evse_nominal_voltage)
 
-            acevchargeparameter.EVSEMaxCurrent = msgdatatypes1.PhysicalValueType(
+            acevchargeparameter.EVSEMaxCurrent = bindings.PhysicalValueType(
                 Multiplier=0,
-                Unit=msgdatatypes1.unitSymbolType.V,
+                Unit=bindings.unitSymbolType.V,
                 Value=self.secc.controller.evse_max_current)
 
             charparamdisres.EVSEChargeParameter = acevchargeparameter
@@ -542,7 +553,7 @@ class SECCMessageSender:
         ):
             self.secc.statemachine.send_ChargeParameterDiscoveryResFinishedAC()
         self.secc.display_state()
-        print("20: ChargeParameterDiscoveryRes Sent")
+        logger.info("20: ChargeParameterDiscoveryRes Sent")
 
     def send_cable_check_res(self, message):
         """As soon as the high-voltage system isolation status check is finished, the CableCheckRes
@@ -553,11 +564,11 @@ class SECCMessageSender:
         Args:
             message : CableCheckReq message
         """
-        print("22: Preparing CableCheckRes")
+        logger.debug("22: Preparing CableCheckRes")
 
-        cablecheckres = msgbody1.CableCheckResType()
+        cablecheckres = bindings.CableCheckResType()
 
-        cablecheckres.ResponseCode = msgbody1.responseCodeType.OK
+        cablecheckres.ResponseCode = bindings.responseCodeType.OK
         # Get DC_EVSEStatus
         cablecheckres.DC_EVSEStatus = self.secc.parse_evse_status()
         evseprocessing = self.secc.controller.get_evse_processing(
@@ -575,20 +586,20 @@ class SECCMessageSender:
         else:
             self.secc.statemachine.send_CableCheckResFinished()
 
-        print("22: CableCheckRes Sent")
+        logger.info("22: CableCheckRes Sent")
 
     def send_pre_charge_res(self, message):
         """The Precharge Loop will end when EVSEPresentVoltage==EVTargetVoltage
         """
-        print("24: Preparing PreChargeRes")
+        logger.debug("24: Preparing PreChargeRes")
 
-        prechares = msgbody1.PreChargeResType(
-            ResponseCode=msgbody1.responseCodeType.OK)
+        prechares = bindings.PreChargeResType(
+            ResponseCode=bindings.responseCodeType.OK)
         prechares.DC_EVSEStatus = self.secc.parse_evse_status()
 
-        prechares.EVSEPresentVoltage = msgdatatypes1.PhysicalValueType(
+        prechares.EVSEPresentVoltage = bindings.PhysicalValueType(
             Multiplier=0,
-            Unit=msgdatatypes1.unitSymbolType.V,
+            Unit=bindings.unitSymbolType.V,
             Value=self.secc.controller.evse_present_voltage)
 
         prechares.original_tagname_ = "PreChargeRes"
@@ -597,16 +608,16 @@ class SECCMessageSender:
                                                    body_element=prechares)
         self.send_v2g_message(pre_char_res_msg)
 
-        print("24: PreChargeRes Sent")
+        logger.info("24: PreChargeRes Sent")
 
     def send_power_delivery_res(self, message):
-        print("26: Preparing PowerDeliveryRes")
+        logger.debug("26: Preparing PowerDeliveryRes")
 
-        powdelres = msgbody1.PowerDeliveryResType()
+        powdelres = bindings.PowerDeliveryResType()
 
         powdelres.original_tagname_ = "PowerDeliveryRes"
 
-        powdelres.ResponseCode = msgbody1.responseCodeType.OK
+        powdelres.ResponseCode = bindings.responseCodeType.OK
 
         powdelres.EVSEStatus = self.secc.parse_evse_status()
 
@@ -614,83 +625,157 @@ class SECCMessageSender:
             session_id=self.sessionid, body_element=powdelres)
         self.send_v2g_message(power_delivery_res_msg)
 
-        print("26: PowerDeliveryRes Sent")
+        logger.info("26: PowerDeliveryRes Sent")
 
     def send_current_demand_res(self, message):
-        print("28: Preparing CurrentDemandRes")
-
-        curdemres = msgbody1.CurrentDemandResType()
-
-        curdemres.ResponseCode = msgbody1.responseCodeType.OK
-        curdemres.DC_EVSEStatus = self.secc.parse_evse_status()
-
-        curdemres.EVSEPresentVoltage = msgdatatypes1.PhysicalValueType(
-            0, 'V', self.secc.controller.evse_present_voltage)
-        curdemres.EVSEPresentCurrent = msgdatatypes1.PhysicalValueType(
-            0, 'A', self.secc.controller.evse_present_current)
-        curdemres.EVSECurrentLimitAchieved = self.secc.controller.get_evse_current_limit_achieved()
-        curdemres.EVSEVoltageLimitAchieved = self.secc.controller.get_evse_voltage_limit_achieved()
-        curdemres.EVSEPowerLimitAchieved = self.secc.controller.get_evse_power_limit_achieved()
-        curdemres.EVSEMaximumVoltageLimit = msgdatatypes1.PhysicalValueType(
-            0, 'A', self.secc.controller.evse_maximum_voltage_limit)
-        curdemres.EVSEMaximumCurrentLimit = msgdatatypes1.PhysicalValueType(
-            0, 'A', self.secc.controller.evse_maximum_current_limit)
-        curdemres.EVSEMaximumPowerLimit = msgdatatypes1.PhysicalValueType(
-            3, 'W', self.secc.controller.evse_maximum_power_limit)
+        logger.debug("28: Preparing CurrentDemandRes")
+        values = self.current_demand_res_values(message)
+        if exi_utils.use_message_templates("CurrentDemandRes"):
+            with timing.phase('encode'):
+                exi = self.current_demand_res_template.render(values)
+            self.send_exi(exi)
+        else:
+            self.send_v2g_message(self.create_current_demand_res(values))
+        logger.info("28: CurrentDemandRes Sent")
+
+    def current_demand_res_values(self, message):
+        """Values of the CurrentDemandRes that change from loop to loop. The
+        MeterInfo values are None unless the EV reports ChargingComplete
+        """
+        controller = self.secc.controller
+        evsestatus = controller.get_evse_status()
+        #If ChargingComplete==True then add receiptRequired=True
+        charging_complete = bool(message.get_Body().BodyElement.ChargingComplete)
+        receipt_required = self.receipt_required(message)
+        return {
+            "SessionID": self.sessionid,
+            "NotificationMaxDelay": evsestatus["NotificationMaxDelay"],
+            "EVSENotification": evsestatus["EVSENotification"],
+            "EVSEIsolationStatus": evsestatus["EVSEIsolationStatus"],
+            "EVSEStatusCode": evsestatus["EVSEStatusCode"],
+            "EVSEPresentVoltage": controller.evse_present_voltage,
+            "EVSEPresentCurrent": controller.evse_present_current,
+            "EVSECurrentLimitAchieved": controller.get_evse_current_limit_achieved(),
+            "EVSEVoltageLimitAchieved": controller.get_evse_voltage_limit_achieved(),
+            "EVSEPowerLimitAchieved": controller.get_evse_power_limit_achieved(),
+            "EVSEMaximumVoltageLimit": controller.evse_maximum_voltage_limit,
+            "EVSEMaximumCurrentLimit": controller.evse_maximum_current_limit,
+            "EVSEMaximumPowerLimit": controller.evse_maximum_power_limit,
+            "MeterID": "V2G-CLARITY-METER-12345" if charging_complete else None,
+            "MeterReading": 2914 if charging_complete else None,
+            "TMeter": 1480345690 if charging_complete else None,
+            "ReceiptRequired": receipt_required,
+        }
+
+    def receipt_required(self, message):
+        """True if the EVCC has to sign a MeteringReceiptReq after the
+        CurrentDemandRes to ``message``: the EV completed charging with
+        Contract (PnC) payment
+        """
+        return (bool(message.get_Body().BodyElement.ChargingComplete)
+                and self.secc.payment_option == "Contract")
+
+    def create_current_demand_res(self, values):
+        """CurrentDemandRes message from current_demand_res_values(), or from
+        template Fields
+        """
+        curdemres = bindings.CurrentDemandResType()
+
+        curdemres.ResponseCode = bindings.responseCodeType.OK
+        curdemres.DC_EVSEStatus = bindings.DC_EVSEStatusType(
+            NotificationMaxDelay=values["NotificationMaxDelay"],
+            EVSENotification=values["EVSENotification"],
+            EVSEIsolationStatus=values["EVSEIsolationStatus"],
+            EVSEStatusCode=values["EVSEStatusCode"])
+        curdemres.DC_EVSEStatus.original_tagname_ = "DC_EVSEStatus"
+
+        curdemres.EVSEPresentVoltage = bindings.PhysicalValueType(
+            0, 'V', values["EVSEPresentVoltage"])
+        curdemres.EVSEPresentCurrent = bindings.PhysicalValueType(
+            0, 'A', values["EVSEPresentCurrent"])
+        curdemres.EVSECurrentLimitAchieved = values["EVSECurrentLimitAchieved"]
+        curdemres.EVSEVoltageLimitAchieved = values["EVSEVoltageLimitAchieved"]
+        curdemres.EVSEPowerLimitAchieved = values["EVSEPowerLimitAchieved"]
+        curdemres.EVSEMaximumVoltageLimit = bindings.PhysicalValueType(
+            0, 'A', values["EVSEMaximumVoltageLimit"])
+        curdemres.EVSEMaximumCurrentLimit = bindings.PhysicalValueType(
+            0, 'A', values["EVSEMaximumCurrentLimit"])
+        curdemres.EVSEMaximumPowerLimit = bindings.PhysicalValueType(
+            3, 'W', values["EVSEMaximumPowerLimit"])
         curdemres.EVSEID = secc_config.EVSEID
         curdemres.SAScheduleTupleID = 1
 
-        #If ChargingComplete==True then add receiptRequired=True
-        if message.get_Body().BodyElement.ChargingComplete:
-            curdemres.MeterInfo = msgbody1.MeterInfoType(
-                MeterID="V2G-CLARITY-METER-12345",
-                MeterReading=2914,
-                TMeter=1480345690)
-            curdemres.ReceiptRequired = True
-        else:
-            curdemres.ReceiptRequired = False
+        if values["MeterID"] is not None:
+            curdemres.MeterInfo = bindings.MeterInfoType(
+                MeterID=values["MeterID"],
+                MeterReading=values["MeterReading"],
+                TMeter=values["TMeter"])
+        curdemres.ReceiptRequired = values["ReceiptRequired"]
 
         curdemres.original_tagname_ = "CurrentDemandRes"
 
-        cur_dem_res_msg = self.create_v2g_message(session_id=self.sessionid,
-                                                  body_element=curdemres)
-        self.send_v2g_message(cur_dem_res_msg)
-        print("28: CurrentDemandRes Sent")
+        return self.create_v2g_message(session_id=values["SessionID"],
+                                       body_element=curdemres)
 
     def send_charging_status_res(self, message):
-        print("Preparing ChargingStatusRes")
-
-        chastares = msgbody1.ChargingStatusResType()
+        logger.debug("Preparing ChargingStatusRes")
+        values = self.charging_status_res_values()
+        if exi_utils.use_message_templates("ChargingStatusRes"):
+            with timing.phase('encode'):
+                exi = self.charging_status_res_template.render(values)
+            self.send_exi(exi)
+        else:
+            self.send_v2g_message(self.create_charging_status_res(values))
+        logger.info("28: ChargingStatusRes Sent")
+
+    def charging_status_res_values(self):
+        """Values of the ChargingStatusRes that change from loop to loop"""
+        evsestatus = self.secc.controller.get_evse_status()
+        return {
+            "SessionID": self.sessionid,
+            "EVSEMaxCurrent": self.secc.controller.evse_max_current,
+            "NotificationMaxDelay": evsestatus["NotificationMaxDelay"],
+            "EVSENotification": evsestatus["EVSENotification"],
+            "RCD": evsestatus["RCD"],
+        }
+
+    def create_charging_status_res(self, values):
+        """ChargingStatusRes message from charging_status_res_values(), or
+        from template Fields
+        """
+        chastares = bindings.ChargingStatusResType()
         chastares.ResponseCode = "OK"
         chastares.EVSEID = secc_config.EVSEID
         chastares.SAScheduleTupleID = 1
-        chastares.EVSEMaxCurrent = msgdatatypes1.PhysicalValueType(
-            0, 'A', self.secc.controller.evse_max_current)
-        chastares.AC_EVSEStatus = self.secc.parse_evse_status()
+        chastares.EVSEMaxCurrent = bindings.PhysicalValueType(
+            0, 'A', values["EVSEMaxCurrent"])
+        chastares.AC_EVSEStatus = bindings.AC_EVSEStatusType(
+            NotificationMaxDelay=values["NotificationMaxDelay"],
+            EVSENotification=values["EVSENotification"],
+            RCD=values["RCD"])
+        chastares.AC_EVSEStatus.original_tagname_ = "AC_EVSEStatus"
         chastares.original_tagname_ = "ChargingStatusRes"
 
-        cur_dem_res_msg = self.create_v2g_message(session_id=self.sessionid,
-                                                  body_element=chastares)
-        self.send_v2g_message(cur_dem_res_msg)
-        print("28: ChargingStatusRes Sent")
+        return self.create_v2g_message(session_id=values["SessionID"],
+                                       body_element=chastares)
 
     def send_metering_receipt_res(self, message):
-        print("30: Preparing MeteringReceiptRes")
+        logger.debug("30: Preparing MeteringReceiptRes")
         metering_rec_req_verified = securityutils.verify_metering_receipt_req(
             message, self.secc.contract_certificate)
 
-        metrecres = msgbody1.MeteringReceiptResType()
+        metrecres = bindings.MeteringReceiptResType()
 
         if metering_rec_req_verified:
-            metrecres.ResponseCode = msgbody1.responseCodeType.OK
+            metrecres.ResponseCode = bindings.responseCodeType.OK
         else:
-            metrecres.ResponseCode = msgbody1.responseCodeType.FAILED__METERING_SIGNATURE_NOT_VALID
+            metrecres.ResponseCode = bindings.responseCodeType.FAILED__METERING_SIGNATURE_NOT_VALID
 
-        metrecres.EVSEStatus = msgdatatypes1.DC_EVSEStatusType(
+        metrecres.EVSEStatus = bindings.DC_EVSEStatusType(
             NotificationMaxDelay=0,
-            EVSENotification=msgdatatypes1.EVSENotificationType.NONE,
-            EVSEIsolationStatus=msgdatatypes1.isolationLevelType.VALID,
-            EVSEStatusCode=msgdatatypes1.DC_EVSEStatusCodeType.EVSE__READY)
+            EVSENotification=bindings.EVSENotificationType.NONE,
+            EVSEIsolationStatus=bindings.isolationLevelType.VALID,
+            EVSEStatusCode=bindings.DC_EVSEStatusCodeType.EVSE__READY)
 
         metrecres.EVSEStatus.original_tagname_ = "DC_EVSEStatus"
 
@@ -700,27 +785,28 @@ class SECCMessageSender:
                                                   body_element=metrecres)
         self.send_v2g_message(met_rec_res_msg)
 
-        print("30: MeteringReceiptRes Sent")
+        logger.info("30: MeteringReceiptRes Sent")
 
     def send_welding_detection_res(self, message):
-        print("Preparing WeldingDetectionRes")
+        logger.debug("Preparing WeldingDetectionRes")
 
-        weldetres = msgbody1.WeldingDetectionResType()
+        weldetres = bindings.WeldingDetectionResType()
+        weldetres.ResponseCode = bindings.responseCodeType.OK
         weldetres.DC_EVSEStatus = self.secc.parse_evse_status()
-        weldetres.EVSEPresentVoltage = msgdatatypes1.PhysicalValueType(
+        weldetres.EVSEPresentVoltage = bindings.PhysicalValueType(
             Multiplier=0, Unit='V', Value=0)
         weldetres.original_tagname_ = "WeldingDetectionRes"
 
         wel_det_res_msg = self.create_v2g_message(session_id=self.sessionid,
                                                   body_element=weldetres)
         self.send_v2g_message(wel_det_res_msg)
-        print("WeldingDetectionRes Semt")
+        logger.info("WeldingDetectionRes Sent")
 
     def send_session_stop_res(self, message):
-        print("32: Preparing SessionStopRes")
+        logger.debug("32: Preparing SessionStopRes")
 
-        sesstopres = msgbody1.SessionStopResType()
-        sesstopres.ResponseCode = msgbody1.responseCodeType.OK
+        sesstopres = bindings.SessionStopResType()
+        sesstopres.ResponseCode = bindings.responseCodeType.OK
 
         sesstopres.original_tagname_ = "SessionStopRes"
 
@@ -728,15 +814,22 @@ class SECCMessageSender:
                                                   body_element=sesstopres)
         self.send_v2g_message(wel_det_res_msg)
 
-        print("32: SessionStopRes Sent")
+        logger.info("32: SessionStopRes Sent")
 
     def create_v2g_message(self, session_id, body_element):
-        header = msgDef1.MessageHeaderType(SessionID=session_id)
-        body = msgDef1.BodyType(body_element)
-        return msgDef1.V2G_Message(Header=header, Body=body)
+        header = bindings.MessageHeaderType(SessionID=session_id)
+        body = bindings.BodyType(body_element)
+        return bindings.V2G_Message(Header=header, Body=body)
 
     def send_v2g_message(self, v2g_message):
-        v2gmsg = exi_utils.v2g_to_EXI(v2g_message)
-        v2gpmsg = exi_utils.add_Header_v2gEXI(v2gmsg, "v2g")
+        with timing.phase('encode'):
+            v2gmsg = exi_utils.v2g_to_EXI(v2g_message)
+            v2gpmsg = exi_utils.add_Header_v2gEXI(v2gmsg, "v2g")
         exi_utils.display_before_send(v2g_message, v2gpmsg)
-        self.secc.evcc_client.sendall(v2gpmsg)
\ No newline at end of file
+        with timing.phase('send'):
+            self.secc.evcc_client.sendall(v2gpmsg)
+
+    def send_exi(self, v2gmsg):
+        """Sends a V2G message that is already EXI encoded"""
+        with timing.phase('send'):
+            self.secc.evcc_client.sendall(exi_utils.add_Header_v2gEXI(v2gmsg, "v2g"))
\ No newline at end of file
@@ -0,0 +1,133 @@
+"""Per connection state of the SECC. Every EVCC that connects gets its own
+SECCSession with a state machine, message handler/sender and EVSE controller,
+so one SECC process can serve several charging outlets at once. The
+SessionRegistry keeps track of the open sessions by connection and SessionID.
+"""
+import logging
+import threading
+
+# pylint: disable=import-error
+from secc import secc_states
+from secc import evsecontroller
+
+from common.network import network
+from common import bindings
+from common import log
+from common.handlers import MessageHandler
+
+logger = logging.getLogger(__name__)
+
+
+# pylint: disable=no-member
+class SECCSession():
+    """State of one V2G communication session (one TCP/TLS connection). Server
+    wide attributes (sockets, IP address, key paths) are taken from the SECC
+    """
+
+    def __init__(self, secc, evcc_client, address):
+        self.secc = secc
+        self.evcc_client = evcc_client
+        self.address = address
+        self.gen = None
+        self.contract_certificate = None
+        self.smart_meter_receipt_needed = None
+        self.smart_meter_receipt_done = False
+        self.payment_option = None
+        self.controller = evsecontroller.EVSESimController()
+        # State Machine for this session
+        res = secc_states.create_secc_state_machine()
+        self.statemachine = res[0]
+        self.message_handler = MessageHandler(None, self)
+
+    def __getattr__(self, name):
+        return getattr(self.secc, name)
+
+    @property
+    def sessionid(self):
+        """SessionID assigned in the SessionSetupRes, None before"""
+        return self.message_handler.message_sender_secc.sessionid
+
+    def display_state(self):
+        """Used for logging Porpuses. Displays the state
+        """
+        logger.info("%s New State: %s", self.address, self.statemachine.state)
+
+    def serve(self):
+        """Receives and processes the messages of this connection until the
+        EVCC closes it
+        """
+        reader = network.V2GTPReader(self.evcc_client)
+        try:
+            while True:
+                data = reader.read_message()
+                if data is None:
+                    break
+                self.message_handler.process_message_and_react(data, False)
+                self.secc.sessions.bind(self)
+        except (OSError, network.V2GTPError) as error:
+            logger.warning("Connection %s failed: %s", self.address, error, extra=log.RED)
+        finally:
+            self.secc.sessions.remove(self)
+            self.evcc_client.close()
+            logger.info("Connection %s closed", self.address, extra=log.RED)
+
+    def parse_evse_status(self):
+        '''Parses the values of the EVSEStatus to the XML format'''
+        evsestatus = self.controller.get_evse_status()
+
+        if self.controller.is_DC_mode():
+            res = bindings.DC_EVSEStatusType(
+                NotificationMaxDelay=evsestatus["NotificationMaxDelay"],
+                EVSENotification=evsestatus["EVSENotification"],
+                EVSEIsolationStatus=evsestatus["EVSEIsolationStatus"],
+                EVSEStatusCode=evsestatus["EVSEStatusCode"])
+            res.original_tagname_ = "DC_EVSEStatus"
+            return res
+        if self.controller.is_AC_mode():
+            res = bindings.AC_EVSEStatusType(
+                NotificationMaxDelay=evsestatus["NotificationMaxDelay"],
+                EVSENotification=evsestatus["EVSENotification"],
+                RCD=evsestatus["RCD"]
+            )
+            res.original_tagname_ = "AC_EVSEStatus"
+            return res
+        return None
+
+
+class SessionRegistry():
+    """Open sessions by connection (peer address) and by SessionID"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.by_connection = {}
+        self.by_sessionid = {}
+
+    def add(self, session):
+        with self.lock:
+            self.by_connection[session.address] = session
+
+    def bind(self, session):
+        """Indexes the session by its SessionID once the SECC assigned one"""
+        sessionid = session.sessionid
+        if sessionid is None:
+            return
+        with self.lock:
+            self.by_sessionid[sessionid] = session
+
+    def remove(self, session):
+        with self.lock:
+            self.by_connection.pop(session.address, None)
+            if self.by_sessionid.get(session.sessionid) is session:
+                del self.by_sessionid[session.sessionid]
+
+    def get(self, address):
+        with self.lock:
+            return self.by_connection.get(address)
+
+    def get_by_sessionid(self, sessionid):
+        with self.lock:
+            return self.by_sessionid.get(sessionid)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.by_connection)